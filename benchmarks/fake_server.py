@@ -0,0 +1,145 @@
+"""Local stand-in for a LibreTranslate server, ex:
+
+    python benchmarks/fake_server.py --port 5000 --latency 0.05 --jitter 0.02 --error-rate 0.01
+
+Translations are the input with the target code prepended and detection
+always answers the first language. Every response takes latency + a random
+jitter + the time to process the characters at chars_per_second. A share
+of the translate requests fails with HTTP 500.
+"""
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+LANGUAGES = [
+    {"code": "en", "name": "English", "targets": ["de", "es", "fr", "pt"]},
+    {"code": "de", "name": "German", "targets": ["en", "es", "fr"]},
+    {"code": "es", "name": "Spanish", "targets": ["en", "de", "fr", "pt"]},
+    {"code": "fr", "name": "French", "targets": ["en", "de", "es"]},
+    {"code": "pt", "name": "Portuguese", "targets": ["en", "es"]},
+]
+
+
+class FakeLibreTranslateHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, like a real server behind a proxy
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if urlsplit(self.path).path != "/languages":
+            return self._send(404, {"error": "Not Found"})
+        body = json.dumps(self.server.languages).encode()
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self._send(200, self.server.languages, {"ETag": etag})
+
+    def do_POST(self):
+        params = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        path = urlsplit(self.path).path
+        if path == "/detect":
+            self.server.simulate_work(len(params.get("q", "")))
+            with self.server.lock:
+                self.server.detections += 1
+            return self._send(200, [{"confidence": 90.0, "language": self.server.languages[0]["code"]}])
+        if path != "/translate":
+            return self._send(404, {"error": "Not Found"})
+        texts = params.get("q", "")
+        self.server.simulate_work(sum(map(len, texts)) if isinstance(texts, list) else len(texts))
+        if self.server.should_fail():
+            return self._send(500, {"error": "Simulated failure"})
+        target = params.get("target", "")
+        if isinstance(texts, list):
+            translated = [f"{target}:{text}" for text in texts]
+        else:
+            translated = f"{target}:{texts}"
+        self._send(200, {"translatedText": translated})
+
+    def _send(self, status, result, headers=None):
+        data = json.dumps(result).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class FakeLibreTranslate(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port=0, latency=0.0, jitter=0.0, error_rate=0.0, chars_per_second=None, seed=None):
+        """Args:
+        port (int): 0 picks a free port, see url
+        latency (float): Seconds every request takes
+        jitter (float): Up to this many seconds are randomly added
+        error_rate (float): Share of the translate requests failing
+        chars_per_second (int): Translation throughput, None for instant
+        """
+        super().__init__(("127.0.0.1", port), FakeLibreTranslateHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.chars_per_second = chars_per_second
+        self.languages = LANGUAGES
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.chars = 0
+        self.detections = 0
+        self.thread = None
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/"
+
+    def simulate_work(self, chars):
+        with self.lock:
+            self.requests += 1
+            self.chars += chars
+            jitter = self.random.uniform(0, self.jitter)
+        time.sleep(self.latency + jitter + (chars / self.chars_per_second if self.chars_per_second else 0))
+
+    def should_fail(self):
+        with self.lock:
+            return self.random.random() < self.error_rate
+
+    def start(self):
+        self.thread = threading.Thread(target=self.serve_forever, name="fake-libretranslate", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a fake LibreTranslate server.")
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random extra seconds per request, at most")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of failing requests, 0 to 1")
+    parser.add_argument("--chars-per-second", type=int, help="translation throughput, unlimited by default")
+    args = parser.parse_args()
+    server = FakeLibreTranslate(args.port, args.latency, args.jitter, args.error_rate, args.chars_per_second)
+    print(f"Serving on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
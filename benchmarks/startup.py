@@ -0,0 +1,114 @@
+"""Startup benchmark, ex:
+
+    python benchmarks/startup.py
+    python benchmarks/startup.py --runs 10 --top 25
+
+Every run starts a fresh interpreter with an empty data directory, so the
+numbers are those of a cold launch. Reports:
+
+- the slowest imports of main.py, from python -X importtime
+- the time until the main window has painted its first frame
+- the time of the headless command, which must not load Qt widgets
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Runs inside the child interpreter, prints its timings as JSON
+FIRST_FRAME = """
+import json, time
+start = time.perf_counter()
+import main
+from PySide6.QtCore import QTimer
+imported = time.perf_counter()
+gui = main.GUIApplication()
+constructed = time.perf_counter()
+# Quits on the first turn of the event loop, once the window has painted
+QTimer.singleShot(0, gui.app.quit)
+gui.run()
+shown = time.perf_counter()
+print(json.dumps({"import": imported - start, "construct": constructed - imported, "first_frame": shown - start}))
+"""
+
+HEADLESS = """
+import json, runpy, sys, time
+start = time.perf_counter()
+sys.argv = ["main.py", "translate", "--help"]
+try:
+    runpy.run_path("main.py", run_name="__main__")
+except SystemExit:
+    pass
+print(json.dumps({"headless": time.perf_counter() - start, "qt_widgets": "PySide6.QtWidgets" in sys.modules}),
+      file=sys.stderr)
+"""
+
+
+def run_python(code, *options):
+    """Runs code in a fresh interpreter with its own empty data directory"""
+    with tempfile.TemporaryDirectory() as home:
+        env = dict(os.environ, HOME=home, APPDATA=home)
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+        return subprocess.run(
+            [sys.executable, *options, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True, check=True
+        )
+
+
+def import_times(top):
+    """The slowest imports as (cumulative microseconds, self microseconds, module)"""
+    stderr = run_python("import main", "-X", "importtime").stderr
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        own, cumulative, module = line[len("import time:"):].split("|")
+        imports.append((int(cumulative), int(own), module.rstrip()))
+    total = sum(cumulative for cumulative, _, module in imports if not module.startswith("  "))
+    return total, sorted(imports, reverse=True)[:top]
+
+
+def timings(code, runs, stream):
+    results = []
+    for _ in range(runs):
+        process = run_python(code)
+        results.append(json.loads((process.stdout if stream == "stdout" else process.stderr).strip().splitlines()[-1]))
+    return results
+
+
+def summary(values):
+    values = [value * 1000 for value in values]
+    return f"median {statistics.median(values):7.1f} ms  min {min(values):7.1f} ms  max {max(values):7.1f} ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the cold startup of the GUI.")
+    parser.add_argument("--runs", type=int, default=5, help="launches measured per scenario")
+    parser.add_argument("--top", type=int, default=15, help="number of imports listed")
+    args = parser.parse_args()
+
+    total, slowest = import_times(args.top)
+    print(f"Imports of main.py: {total / 1000:.1f} ms")
+    print(f"{'cumulative':>12} {'self':>10}  module")
+    for cumulative, own, module in slowest:
+        print(f"{cumulative / 1000:9.1f} ms {own / 1000:7.1f} ms  {module}")
+    print()
+
+    frames = timings(FIRST_FRAME, args.runs, "stdout")
+    print(f"Import main       {summary([result['import'] for result in frames])}")
+    print(f"Build the window  {summary([result['construct'] for result in frames])}")
+    print(f"First frame       {summary([result['first_frame'] for result in frames])}")
+
+    headless = timings(HEADLESS, args.runs, "stderr")
+    print(f"Headless command  {summary([result['headless'] for result in headless])}")
+    if any(result["qt_widgets"] for result in headless):
+        print("Warning: the headless command imported PySide6.QtWidgets")
+
+
+if __name__ == "__main__":
+    main()
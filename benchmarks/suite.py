@@ -0,0 +1,272 @@
+"""Offline benchmarks of the hot paths, ex:
+
+    python benchmarks/suite.py
+    python benchmarks/suite.py --sizes 1000 100000 --history-sizes 10000 --latency 0.1 --json results.json
+    python benchmarks/suite.py --servers 3 --error-rate 0.05
+
+Runs against fake LibreTranslate servers on localhost and the offscreen Qt
+platform, in a fresh data directory per scenario, so nothing but this
+machine is involved. Scenarios:
+
+- translation: a document translated from scratch, again after editing one
+  paragraph, and again fully cached, through the GUI window
+- languages: loading the languages from the server and from the cache
+- history: writing entries, reading pages and searching, per history size
+- history window: time until the first page is shown, per history size
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from PySide6.QtCore import QEventLoop  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from fake_server import FakeLibreTranslate  # noqa: E402
+from main import GUIWindow  # noqa: E402
+from metrics import metrics  # noqa: E402
+from orm import MiniORM  # noqa: E402
+
+WORDS = (
+    "the quick brown fox jumps over lazy dog translation server latency history window segment "
+    "paragraph document cache request worker queue endpoint language sentence character"
+).split()
+
+
+def make_text(rng, chars):
+    """Paragraphs of sentences made of random words, about chars long"""
+    paragraphs = []
+    size = 0
+    while size < chars:
+        sentences = []
+        for _ in range(rng.randint(1, 6)):
+            words = [rng.choice(WORDS) for _ in range(rng.randint(4, 18))]
+            sentences.append(" ".join(words).capitalize() + ".")
+        paragraphs.append(" ".join(sentences))
+        size += len(paragraphs[-1]) + 2
+    return "\n\n".join(paragraphs)[:chars]
+
+
+def wait_until(app, predicate, timeout=120):
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        if time.perf_counter() > deadline:
+            raise TimeoutError("the benchmark step took longer than its timeout")
+        app.processEvents(QEventLoop.ProcessEventsFlag.AllEvents, 10)
+        time.sleep(0.0005)
+
+
+def timed(function, repeat=5):
+    """Median seconds of function over repeat runs"""
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - started)
+    return statistics.median(durations)
+
+
+class Benchmarks:
+    def __init__(self, app, args):
+        self.app = app
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.servers = [
+            FakeLibreTranslate(
+                latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                chars_per_second=args.chars_per_second, seed=args.seed + i,
+            ).start()
+            for i in range(args.servers)
+        ]
+        self.results = {}
+        self.temporary_dirs = []
+
+    def data_dir(self):
+        directory = tempfile.TemporaryDirectory(prefix="translategui-benchmark-")
+        self.temporary_dirs.append(directory)
+        return Path(directory.name)
+
+    def run(self):
+        try:
+            self.results["translation"] = [self.translation(size) for size in self.args.sizes]
+            self.results["languages"] = self.languages()
+            self.results["history"] = [self.history(size) for size in self.args.history_sizes]
+        finally:
+            for server in self.servers:
+                server.stop()
+            for directory in self.temporary_dirs:
+                directory.cleanup()
+        self.results["metrics"] = json.loads(metrics.to_json())
+        return self.results
+
+    def configured_window(self, data_dir):
+        orm = MiniORM(data_dir)
+        orm.save_api_endpoints(
+            [{"api_url": server.url, "api_key": "", "weight": 1} for server in self.servers],
+            self.args.max_concurrency, self.args.chunk_size,
+        )
+        orm.close()
+        window = GUIWindow(data_dir)
+        wait_until(self.app, lambda: len(window.registry) > 0)
+        window.left_language_combo.setCurrentIndex(window.left_language_combo.findText("English"))
+        window.right_language_combo.setCurrentIndex(window.right_language_combo.findText("German"))
+        return window
+
+    @staticmethod
+    def close_window(window):
+        window.translation_scheduler.shutdown()
+        window.lt.stop()
+        window.orm.close()
+        window.deleteLater()
+
+    def translate_and_wait(self, window, text):
+        window.left_textEdit.blockSignals(True)
+        window.left_textEdit.setPlainText(text)
+        window.left_textEdit.blockSignals(False)
+        started = time.perf_counter()
+        window.translate()
+        wait_until(self.app, lambda: window.current_translation is None)
+        seconds = time.perf_counter() - started
+        return seconds, window.right_textEdit.toPlainText().startswith("Translation failed")
+
+    def translation(self, size):
+        window = self.configured_window(self.data_dir())
+        text = make_text(self.rng, size)
+        requests_before = sum(server.requests for server in self.servers)
+        cold, cold_failed = self.translate_and_wait(window, text)
+        requests = sum(server.requests for server in self.servers) - requests_before
+
+        paragraphs = text.split("\n\n")
+        paragraphs[len(paragraphs) // 2] = make_text(self.rng, 200).replace("\n\n", " ")
+        edited, edited_failed = self.translate_and_wait(window, "\n\n".join(paragraphs))
+        cached, _ = self.translate_and_wait(window, text)
+        self.close_window(window)
+        return {
+            "chars": size,
+            "requests": requests,
+            "cold_seconds": cold,
+            "cold_chars_per_second": size / cold if cold else None,
+            "edited_seconds": edited,
+            "cached_seconds": cached,
+            "failed": cold_failed or edited_failed,
+        }
+
+    def languages(self):
+        data_dir = self.data_dir()
+        started = time.perf_counter()
+        window = self.configured_window(data_dir)
+        from_server = time.perf_counter() - started
+        self.close_window(window)
+        started = time.perf_counter()
+        window = GUIWindow(data_dir)
+        from_cache = time.perf_counter() - started
+        loaded = len(window.registry) > 0
+        self.close_window(window)
+        return {"from_server_seconds": from_server, "from_cache_seconds": from_cache, "cached_loaded": loaded}
+
+    def history(self, size):
+        from history_window import HistoryWindow
+
+        orm = MiniORM(self.data_dir())
+        languages = [("English", "German"), ("English", "Spanish"), ("French", "English")]
+        entries = [
+            (*languages[i % len(languages)], make_text(self.rng, self.rng.choice((80, 300, 2000))))
+            for i in range(size)
+        ]
+        started = time.perf_counter()
+        for source, target, input_text in entries:
+            orm.add_translation_history(source, target, input_text, input_text.upper())
+        orm.flush_translation_history()
+        write = time.perf_counter() - started
+
+        first_page = orm.get_translation_history_page(limit=100, preview_length=200)
+        last = first_page[-1]
+        result = {
+            "entries": size,
+            "write_entries_per_second": size / write if write else None,
+            "first_page_seconds": timed(lambda: orm.get_translation_history_page(limit=100, preview_length=200)),
+            "next_page_seconds": timed(lambda: orm.get_translation_history_page(
+                last["id"], limit=100, preview_length=200
+            )),
+            "search_common_seconds": timed(lambda: orm.get_translation_history_page(
+                limit=100, preview_length=200, search="translation"
+            )),
+            "search_missing_seconds": timed(lambda: orm.get_translation_history_page(
+                limit=100, preview_length=200, search="zzzz"
+            )),
+            "language_filter_seconds": timed(lambda: orm.get_translation_history_page(
+                limit=100, preview_length=200, source_language="French"
+            )),
+        }
+
+        def open_window():
+            window = HistoryWindow(orm)
+            window.show()
+            wait_until(self.app, lambda: window.history_model.rowCount() > 0)
+            window.close()
+            window.deleteLater()
+        result["window_first_page_seconds"] = timed(open_window, repeat=3)
+        orm.close()
+        return result
+
+
+def print_results(results):
+    def ms(seconds):
+        return f"{seconds * 1000:9.1f} ms"
+
+    print("Translation through the GUI window")
+    for row in results["translation"]:
+        failed = "  (failed)" if row["failed"] else ""
+        print(
+            f"  {row['chars']:>8} chars  {row['requests']:>4} requests  cold {ms(row['cold_seconds'])} "
+            f"({row['cold_chars_per_second']:.0f} chars/s)  one paragraph edited {ms(row['edited_seconds'])}  "
+            f"cached {ms(row['cached_seconds'])}{failed}"
+        )
+    languages = results["languages"]
+    print("Languages")
+    print(f"  from the server {ms(languages['from_server_seconds'])}  from the cache {ms(languages['from_cache_seconds'])}")
+    print("History")
+    for row in results["history"]:
+        print(
+            f"  {row['entries']:>8} entries  {row['write_entries_per_second']:8.0f} writes/s  "
+            f"first page {ms(row['first_page_seconds'])}  next page {ms(row['next_page_seconds'])}  "
+            f"search {ms(row['search_common_seconds'])} / {ms(row['search_missing_seconds'])} (no match)  "
+            f"language filter {ms(row['language_filter_seconds'])}  window {ms(row['window_first_page_seconds'])}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the translation path, languages and history offline.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000],
+                        help="document sizes in characters")
+    parser.add_argument("--history-sizes", type=int, nargs="+", default=[1_000, 10_000],
+                        help="number of history entries")
+    parser.add_argument("--servers", type=int, default=1, help="fake servers the requests are spread over")
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds per request")
+    parser.add_argument("--jitter", type=float, default=0.01, help="random extra seconds per request, at most")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of failing requests, 0 to 1")
+    parser.add_argument("--chars-per-second", type=int, default=200_000, help="throughput of every server")
+    parser.add_argument("--max-concurrency", type=int, default=4, help="simultaneous requests per server")
+    parser.add_argument("--chunk-size", type=int, default=2000, help="characters per request")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", type=Path, help="also write the results and timings to this file")
+    args = parser.parse_args()
+
+    app = QApplication([])
+    results = Benchmarks(app, args).run()
+    print_results(results)
+    if args.json is not None:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,7 +16,6 @@ else
     DATA_DIR="$HOME/.local/share/$APP_NAME"
 fi
 ICON_PATH="$DATA_DIR/icon.png"
-ICON_URL="https://raw.githubusercontent.com/MrChuw/TranslateGui/refs/heads/main/img/icon.png"
 
 
 # Step 1: Check if the required Python version is installed
@@ -92,14 +91,11 @@ if [ ! -d "$DATA_DIR" ]; then
     mkdir -p "$DATA_DIR"
 fi
 
-# Download the icon if it does not exist
+# Copy the icon used by the desktop file, the app itself uses the one
+# bundled in resources_rc.py
 if [ ! -f "$ICON_PATH" ]; then
-    echo "Downloading icon from $ICON_URL..."
-    curl -o "$ICON_PATH" -L "$ICON_URL"
-    if [ $? -ne 0 ]; then
-        echo "Failed to download the icon. Please check the URL or your internet connection."
-        exit 1
-    fi
+    echo "Copying icon to $ICON_PATH..."
+    cp "img/icon.png" "$ICON_PATH"
 fi
 
 # Step 7: Final checks
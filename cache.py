@@ -0,0 +1,100 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+from orm import MiniORM
+
+
+class TranslationCache:
+    """LRU cache of the segments translated by the server, looked up before
+    they are sent to it.
+
+    Recently used translations are kept in memory, everything else lives in
+    the translation_cache table so hits survive restarts. Safe to share
+    between threads. The hits and misses are shown in the Performance window.
+    """
+
+    def __init__(self, orm: MiniORM, max_entries=512, max_rows=20000, max_age_days=30):
+        self.orm = orm
+        self.max_entries = max_entries
+        self.max_rows = max_rows
+        self.max_age_days = max_age_days
+        self.entries: OrderedDict[str, str] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.RLock()
+
+    @staticmethod
+    def make_key(source, target, text):
+        return hashlib.sha256(f"{source}\0{target}\0{text}".encode()).hexdigest()
+
+    def get(self, source, target, text):
+        with self.lock:
+            key = self.make_key(source, target, text)
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+            translation = self.orm.get_cached_translation(key)
+            if translation is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, translation)
+            return translation
+
+    def get_many(self, source, target, texts):
+        """Returns {text: translation} for the texts found, reading the
+        database once for all of the texts not in memory
+        """
+        with self.lock:
+            found = {}
+            missing_keys = {}
+            for text in texts:
+                key = self.make_key(source, target, text)
+                if key in self.entries:
+                    self.entries.move_to_end(key)
+                    found[text] = self.entries[key]
+                else:
+                    missing_keys[key] = text
+            if missing_keys:
+                for key, translation in self.orm.get_cached_translations(list(missing_keys)).items():
+                    self._remember(key, translation)
+                    found[missing_keys[key]] = translation
+            self.hits += len(found)
+            self.misses += len(texts) - len(found)
+            return found
+
+    def put(self, source, target, text, translation):
+        with self.lock:
+            key = self.make_key(source, target, text)
+            if self.entries.get(key) == translation:
+                self.entries.move_to_end(key)
+                return
+            self._remember(key, translation)
+            self.orm.save_cached_translation(key, translation)
+
+    def prune(self):
+        """Drops persisted entries that are too old or past the row limit"""
+        self.orm.prune_translation_cache(self.max_rows, self.max_age_days)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.orm.clear_translation_cache()
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "memory_entries": len(self.entries),
+            }
+
+    def _remember(self, key, translation):
+        self.entries[key] = translation
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
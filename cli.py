@@ -0,0 +1,330 @@
+"""Headless translation, ex:
+
+    python main.py translate --from en --to de notes.txt docs/
+    cat notes.txt | python main.py translate --to de > notes.de.txt
+
+When the GUI is running, file translations are handed to it and run there
+with its warm connections and caches, unless --standalone is given.
+Input from stdin is always streamed here.
+"""
+import argparse
+import io
+import os
+import sys
+import threading
+from collections import deque
+from contextlib import redirect_stderr
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from cache import TranslationCache
+from memory import TranslationMemory
+from detection import LanguageDetector, guess_language
+from endpoints import EndpointPool
+from instance import FORWARD_TIMEOUT, connect, request
+from metrics import metrics
+from models import LanguageRegistry
+from orm import MiniORM, default_data_dir
+from segments import chunk_texts, join_segments, split_long_segment, split_segments, unique_segments
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="main.py translate", description="Translate files or stdin without the GUI.")
+    parser.add_argument("--from", dest="source", default="auto", help="source language code (default: auto)")
+    parser.add_argument("--to", dest="target", required=True, help="target language code")
+    parser.add_argument("paths", nargs="*", help="files or directories to translate, stdin when omitted or '-'")
+    parser.add_argument("-o", "--output-dir", type=Path, help="where translated files are written (default: next to the source)")
+    parser.add_argument("-r", "--recursive", action="store_true", help="also translate files in subdirectories")
+    parser.add_argument("-j", "--jobs", type=int, default=2, help="number of files translated at the same time")
+    parser.add_argument("--no-history", action="store_true", help="don't add the translations to the history")
+    parser.add_argument("--metrics", type=Path,
+                        help="write the timings to this file, as JSON for .json files, Prometheus text otherwise")
+    parser.add_argument("--standalone", action="store_true", help="translate here even when the GUI is running")
+    return parser.parse_args(argv)
+
+
+class FileTranslator:
+    """Translates text streams a window of lines at a time.
+
+    Only one window per stream is held in memory. Its segments are looked up
+    in the translation cache and memory and the missing ones are sent in chunks through
+    a pool shared by every stream, bounded by max_concurrency for every endpoint.
+    With the auto source the language of a stream is detected once, from
+    its first window, and named in every request.
+    """
+
+    def __init__(self, orm: MiniORM, client, registry: LanguageRegistry, source, target, max_concurrency, chunk_size,
+                 save_history=True, cache=None, memory=None, requests=None):
+        self.orm = orm
+        self.client = client
+        self.source = source
+        self.target = target
+        self.chunk_size = chunk_size
+        # A window gives every request worker one chunk to translate
+        self.window_size = chunk_size * max_concurrency
+        # The GUI passes its own, already warm
+        self.cache = cache or TranslationCache(orm)
+        self.memory = memory
+        if memory is None:
+            self.memory = TranslationMemory(orm)
+            # Once, so the history of older versions is reused from the first run
+            if (imported := self.memory.import_history()) is not None:
+                imported.result()
+        # The GUI passes the pool of TranslationPools, kept between requests
+        self.shared_requests = requests is not None
+        self.requests = requests or ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="translation")
+        self.save_history = save_history
+        self.registry = registry
+        self.detector = LanguageDetector()
+        self.target_name = self.language_name(target)
+
+    def language_name(self, code):
+        return self.registry.get(code).name if self.registry.get(code) else code
+
+    def translate_stream(self, lines, write):
+        source = self.source
+        window = []
+        size = 0
+        for line in lines:
+            window.append(line)
+            size += len(line)
+            if size >= self.window_size:
+                if source == "auto":
+                    source = self.detect_source("".join(window))
+                write(self.translate_window("".join(window), source))
+                window = []
+                size = 0
+        if window:
+            if source == "auto":
+                source = self.detect_source("".join(window))
+            write(self.translate_window("".join(window), source))
+
+    def detect_source(self, text):
+        """The language of text, auto when it can't be told or translated"""
+        code = guess_language(text, set(self.registry.by_code) or None) \
+            if len(text) <= self.detector.SHORT_TEXT else None
+        if code is None:
+            try:
+                code = self.detector.from_detections(self.client.detect(self.detector.sample(text)))
+            except Exception:
+                # The server detects it on every request instead
+                code = None
+        if code is None or (len(self.registry) and not self.registry.supports(code, self.target)):
+            return "auto"
+        return code
+
+    @metrics.timed("cli_window")
+    def translate_window(self, text, source):
+        pieces = split_segments(text)
+        segments = unique_segments(pieces)
+        translations = self.cache.get_many(source, self.target, segments)
+        missing = [segment for segment in segments if segment not in translations]
+        if missing and source != "auto":
+            remembered, _ = self.memory.lookup(self.language_name(source), self.target_name, missing, fuzzy=False)
+            translations.update(remembered)
+            missing = [segment for segment in missing if segment not in remembered]
+        if missing:
+            translated = self.translate_segments(missing, source)
+            translations.update(translated)
+            if source != "auto":
+                self.memory.add(self.language_name(source), self.target_name, translated)
+        translation = join_segments(pieces, translations)
+        if self.save_history and translation.strip():
+            self.orm.add_translation_history(self.language_name(source), self.target_name, text, translation)
+        return translation
+
+    def translate_segments(self, segments, source):
+        parts = {segment: split_long_segment(segment, self.chunk_size) for segment in segments}
+        texts = list(dict.fromkeys(text for segment_parts in parts.values() for text in segment_parts))
+        translated_texts = {}
+        for chunk, translated in zip(
+            chunks := chunk_texts(texts, self.chunk_size),
+            self.requests.map(lambda chunk: self.client.translate_batch(chunk, source, self.target), chunks),
+        ):
+            translated_texts.update(zip(chunk, translated))
+        translations = {}
+        for segment, segment_parts in parts.items():
+            translations[segment] = " ".join(translated_texts[text] for text in segment_parts)
+            self.cache.put(source, self.target, segment, translations[segment])
+        return translations
+
+    def close(self):
+        if not self.shared_requests:
+            self.requests.shutdown()
+
+
+class TranslationPools:
+    """The thread pools of the translations the GUI runs for later launches.
+
+    They live as long as the GUI, so their threads, with the database and
+    keep-alive connections they opened, serve every request instead of
+    being started again for each one.
+    """
+    # Enough for several endpoints, EndpointPool caps what each one gets
+    REQUEST_WORKERS = 32
+    FILE_WORKERS = 4
+
+    def __init__(self):
+        self.requests = ThreadPoolExecutor(max_workers=self.REQUEST_WORKERS, thread_name_prefix="forwarded-translation")
+        self.files = ThreadPoolExecutor(max_workers=self.FILE_WORKERS, thread_name_prefix="forwarded-file")
+
+    def shutdown(self):
+        self.requests.shutdown(wait=False, cancel_futures=True)
+        self.files.shutdown(wait=False, cancel_futures=True)
+
+
+def collect_files(paths, recursive, target):
+    """The files of paths, with the base their output path is relative to.
+    Files in directories that are already translations to target, ex.
+    a.de.txt, are skipped.
+    """
+    for path in map(Path, paths):
+        if path.is_dir():
+            yield from sorted(
+                (path, file) for file in (path.rglob("*") if recursive else path.iterdir())
+                if file.is_file() and not file.stem.endswith(f".{target}")
+            )
+        else:
+            yield path.parent, path
+
+
+def output_path(base, file, target, output_dir):
+    name = f"{file.stem}.{target}{file.suffix}"
+    if output_dir is None:
+        return file.with_name(name)
+    return output_dir / file.relative_to(base).with_name(name)
+
+
+def translate_file(translator, base, file, args):
+    destination = output_path(base, file, args.target, args.output_dir)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    # Renamed once translated, a failure doesn't leave a partial output.
+    # Named like the outputs, so directories listed meanwhile skip it too.
+    partial_path = destination.with_name(
+        f".{destination.stem}.{os.getpid()}-{threading.get_ident()}.{args.target}{destination.suffix}"
+    )
+    try:
+        with open(file, encoding="utf-8", newline="") as source, \
+                open(partial_path, "w", encoding="utf-8", newline="") as output:
+            translator.translate_stream(source, output.write)
+        os.replace(partial_path, destination)
+    except BaseException:
+        partial_path.unlink(missing_ok=True)
+        raise
+    return destination
+
+
+def run(argv):
+    args = parse_args(argv)
+    data_dir = default_data_dir()
+    # Piped input is streamed here, through the GUI it would be held in
+    # memory whole, twice
+    if not args.standalone and not reads_stdin(args) and (connection := connect(data_dir)) is not None:
+        # A running GUI already has its connections open and caches warm
+        reply = request(connection, {"command": "translate", "argv": argv, "cwd": os.getcwd()}, FORWARD_TIMEOUT)
+        if reply is not None:
+            sys.stdout.write(reply["stdout"])
+            sys.stderr.write(reply["stderr"])
+            return reply["status"]
+        print("The running GUI didn't answer, translating without it.", file=sys.stderr)
+    orm = MiniORM(data_dir)
+    endpoints = orm.get_api_endpoints()
+    max_concurrency = orm.get_api_settings()["max_concurrency"]
+    client = EndpointPool(endpoints, max_concurrency=max_concurrency) if endpoints else None
+    cached = orm.get_cached_languages(client.url) if client else None
+    registry = LanguageRegistry.from_dicts(cached["languages"] if cached else [])
+    try:
+        return translate_args(args, orm, client, registry, sys.stdin, sys.stdout, sys.stderr)
+    finally:
+        if client is not None:
+            client.stop()
+        # Commits the queued history and cache entries
+        orm.close()
+        write_metrics(args.metrics)
+
+
+def run_forwarded(message, orm, client, registry, cache=None, memory=None, pools=None):
+    """Runs a translate request sent by a later launch in the running GUI,
+    returns the reply with the exit status and the output
+    """
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    try:
+        with redirect_stderr(stderr):
+            args = parse_args(message["argv"])
+    except SystemExit as e:
+        return {"status": e.code, "stdout": "", "stderr": stderr.getvalue()}
+    if reads_stdin(args):
+        return {"status": 1, "stdout": "", "stderr": "Input from stdin is translated without the GUI.\n"}
+    # Relative to where the command was typed, not to the GUI
+    cwd = Path(message["cwd"])
+    args.paths = [path if path == "-" else str(cwd / path) for path in args.paths]
+    args.output_dir = cwd / args.output_dir if args.output_dir is not None else None
+    status = translate_args(args, orm, client, registry, None, stdout, stderr, cache, memory, pools)
+    if args.metrics is not None:
+        write_metrics(cwd / args.metrics)
+    return {"status": status, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+
+def reads_stdin(args):
+    return not args.paths or args.paths == ["-"]
+
+
+def translate_args(args, orm, client, registry, stdin, stdout, stderr, cache=None, memory=None, pools=None):
+    """Translates what args asks for, returns the exit status. pools, a
+    TranslationPools, runs the files and requests instead of pools of their own.
+    """
+    if client is None:
+        print("No API url configured, set one with 'Edit API and Key' in the GUI.", file=stderr)
+        return 1
+    if len(registry) and not registry.supports(args.source, args.target):
+        # Known to fail, no need to ask the server
+        print(f"The server can't translate from '{args.source}' to '{args.target}'.", file=stderr)
+        return 1
+    settings = orm.get_api_settings()
+    translator = FileTranslator(
+        orm, client, registry, args.source, args.target, settings["max_concurrency"] * len(orm.get_api_endpoints()),
+        settings["chunk_size"], save_history=not args.no_history, cache=cache, memory=memory,
+        requests=pools.requests if pools else None,
+    )
+    failed = False
+    try:
+        if reads_stdin(args):
+            try:
+                translator.translate_stream(stdin, stdout.write)
+            except Exception as e:
+                print(f"Translation failed: {e}", file=stderr)
+                return 1
+            return 0
+        jobs = max(args.jobs, 1)
+        files = pools.files if pools else ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="file")
+        # At most jobs files at once, also on the shared pool, reported in order
+        running = deque()
+        try:
+            for base, file in collect_files(args.paths, args.recursive, args.target):
+                if len(running) == jobs:
+                    failed |= not report(*running.popleft(), stderr)
+                running.append((files.submit(translate_file, translator, base, file, args), file))
+            while running:
+                failed |= not report(*running.popleft(), stderr)
+        finally:
+            if pools is None:
+                files.shutdown()
+    finally:
+        translator.close()
+    return 1 if failed else 0
+
+
+def report(future, file, stderr):
+    """Prints where file was translated to, returns False when it failed"""
+    try:
+        print(f"{file} -> {future.result()}", file=stderr)
+    except Exception as e:
+        print(f"{file}: {e}", file=stderr)
+        return False
+    return True
+
+
+def write_metrics(path):
+    if path is not None:
+        path.write_text(metrics.to_json() if path.suffix == ".json" else metrics.to_prometheus(), encoding="utf-8")
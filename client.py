@@ -0,0 +1,140 @@
+import http.client
+import json
+import threading
+from urllib.parse import urlencode, urlsplit
+
+
+class LibreTranslateError(Exception):
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        # HTTP status of the response, None when it couldn't be read
+        self.status = status
+
+
+class LibreTranslateClient:
+    """Talks to a LibreTranslate server over keep-alive HTTP connections.
+
+    Unlike libretranslatepy, which opens a new connection per request, every
+    thread using the client reuses its own persistent connection, so a
+    bounded worker pool is also a bounded connection pool.
+    """
+
+    # Errors raised when the server closed an idle keep-alive connection
+    STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+
+    def __init__(self, url, api_key=None, timeout=30):
+        """Args:
+        url (str): The url of the LibreTranslate endpoint
+        api_key (str): The API key, empty or None if the server doesn't need one
+        timeout (int): Request timeout in seconds
+        """
+        self.url = url if url.endswith("/") else url + "/"
+        self.api_key = api_key or None
+        self.timeout = timeout
+        parts = urlsplit(self.url)
+        self.scheme = parts.scheme or "http"
+        self.netloc = parts.netloc
+        self.base_path = parts.path or "/"
+        self.local = threading.local()
+
+    def translate(self, q, source="en", target="es"):
+        """Translates a single string"""
+        return self._post("translate", {"q": q, "source": source, "target": target, "format": "text"})["translatedText"]
+
+    def translate_batch(self, texts, source="en", target="es"):
+        """Translates a list of strings in a single request, in order"""
+        if len(texts) == 1:
+            return [self.translate(texts[0], source, target)]
+        response = self._post("translate", {"q": texts, "source": source, "target": target, "format": "text"})
+        translations = response["translatedText"]
+        if not isinstance(translations, list) or len(translations) != len(texts):
+            # Servers without batch support translate the list as one string
+            return [self.translate(text, source, target) for text in texts]
+        return translations
+
+    def detect(self, q):
+        """Detected languages of q, ex: [{"confidence": 90.0, "language": "en"}]"""
+        return self._post("detect", {"q": q})
+
+    def languages(self):
+        """A list of available languages ex: [{"code":"en", "name":"English", "targets": [...]}]"""
+        return self.fetch_languages()[0]
+
+    def fetch_languages(self, etag=None):
+        """Like languages, but skips the download when etag is still current.
+
+        Returns:
+            tuple: (languages, etag), languages is None if the server
+            answered 304 Not Modified
+        """
+        query = urlencode({"api_key": self.api_key}) if self.api_key else ""
+        headers = {"If-None-Match": etag} if etag else {}
+        status, response_headers, data = self._send("GET", "languages" + (f"?{query}" if query else ""), None, headers)
+        new_etag = response_headers.get("ETag", etag)
+        if status == 304:
+            return None, new_etag
+        return self._parse(status, data), new_etag
+
+    def connect(self):
+        """Opens the connection of the calling thread ahead of its first request"""
+        connection = self._connection()
+        if connection.sock is None:
+            try:
+                connection.connect()
+            except Exception:
+                self.close()
+                raise
+
+    def close(self):
+        connection = getattr(self.local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self.local.connection = None
+
+    def _post(self, endpoint, params):
+        if self.api_key:
+            params = params | {"api_key": self.api_key}
+        return self._request("POST", endpoint, json.dumps(params).encode())
+
+    def _connection(self):
+        connection = getattr(self.local, "connection", None)
+        if connection is None:
+            connection_class = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+            connection = connection_class(self.netloc, timeout=self.timeout)
+            self.local.connection = connection
+        return connection
+
+    def _request(self, method, endpoint, body=None):
+        status, _, data = self._send(method, endpoint, body)
+        return self._parse(status, data)
+
+    def _send(self, method, endpoint, body, extra_headers=None):
+        headers = {"Accept": "application/json"}
+        if body is not None:
+            headers["Content-Type"] = "application/json"
+        if extra_headers:
+            headers.update(extra_headers)
+        for attempt in range(2):
+            connection = self._connection()
+            try:
+                connection.request(method, self.base_path + endpoint, body=body, headers=headers)
+                response = connection.getresponse()
+                return response.status, response.headers, response.read()
+            except self.STALE_CONNECTION_ERRORS:
+                self.close()
+                if attempt:
+                    raise
+            except Exception:
+                self.close()
+                raise
+
+    @staticmethod
+    def _parse(status, data):
+        try:
+            result = json.loads(data.decode())
+        except ValueError:
+            raise LibreTranslateError(f"HTTP {status}: invalid response from server", status)
+        if status != 200:
+            error = result.get("error") if isinstance(result, dict) else None
+            raise LibreTranslateError(f"HTTP {status}: {error or 'request failed'}", status)
+        return result
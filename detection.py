@@ -0,0 +1,138 @@
+"""Source language detection for the Auto source, ex:
+
+    detector = LanguageDetector()
+    code = detector.cached(text) or guess_language(text, codes)
+
+Detecting once per document lets every later request name its source
+language, so the server doesn't detect it again on every keystroke.
+"""
+import hashlib
+import re
+from collections import OrderedDict
+
+from orm import is_draft
+
+# Scripts used by a single language, or a few told apart by their letters
+SCRIPTS = (
+    (re.compile(r"[\u3040-\u30ff]"), "ja"),  # Kana before Han, Japanese mixes both
+    (re.compile(r"[\uac00-\ud7af]"), "ko"),
+    (re.compile(r"[\u4e00-\u9fff]"), "zh"),
+    (re.compile(r"[\u0e00-\u0e7f]"), "th"),
+    (re.compile(r"[\u0590-\u05ff]"), "he"),
+    (re.compile(r"[\u0600-\u06ff]"), "ar"),
+    (re.compile(r"[\u0900-\u097f]"), "hi"),
+    (re.compile(r"[\u0370-\u03ff]"), "el"),
+    (re.compile(r"[\u0491\u0454\u0456\u0457]", re.IGNORECASE), "uk"),  # ґ є і ї
+    (re.compile(r"[\u0400-\u04ff]"), "ru"),
+)
+
+# The most frequent short words of the Latin script languages
+STOPWORDS = {
+    "en": {"the", "and", "is", "are", "of", "to", "in", "it", "you", "that", "this", "with", "for", "was", "not"},
+    "de": {"der", "die", "das", "und", "ist", "nicht", "ich", "zu", "ein", "eine", "mit", "sie", "es", "auf", "den"},
+    "es": {"el", "la", "los", "las", "y", "es", "de", "que", "en", "un", "una", "por", "con", "no", "para"},
+    "fr": {"le", "la", "les", "et", "est", "de", "des", "que", "un", "une", "pas", "je", "vous", "pour", "dans"},
+    "pt": {"o", "a", "os", "as", "e", "é", "de", "que", "um", "uma", "não", "com", "para", "em", "do"},
+    "it": {"il", "lo", "la", "gli", "e", "è", "di", "che", "un", "una", "non", "per", "con", "sono", "del"},
+    "nl": {"de", "het", "een", "en", "is", "van", "niet", "ik", "je", "dat", "op", "te", "met", "zijn", "voor"},
+}
+WORD = re.compile(r"[^\W\d_]+")
+
+
+def fingerprint(text):
+    return hashlib.sha1(" ".join(text.split()).encode()).hexdigest()
+
+
+def guess_language(text, codes=None):
+    """Cheap local guess, None when the text doesn't tell.
+
+    Args:
+        codes (set): Only these languages are returned, the server's
+    """
+    for pattern, code in SCRIPTS:
+        if pattern.search(text):
+            return code if codes is None or code in codes else None
+    words = WORD.findall(text.lower())
+    if not words:
+        return None
+    scores = {
+        code: sum(word in stopwords for word in words)
+        for code, stopwords in STOPWORDS.items()
+        if codes is None or code in codes
+    }
+    ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+    if not ranked or ranked[0][1] == 0:
+        return None
+    # Only a clear winner, many short words are shared by several languages
+    if len(ranked) > 1 and ranked[0][1] < 2 * ranked[1][1]:
+        return None
+    return ranked[0][0]
+
+
+class LanguageDetector:
+    """Remembers the detected language of the documents of a session.
+
+    A text is known when it was detected before, by fingerprint, or when it
+    is an edit of the current document that didn't grow much since it was
+    detected, so typing doesn't trigger new detections. Both only look at
+    the sample of the text, all /detect sees, so large documents are cheap.
+    """
+    MAX_ENTRIES = 256
+    # Above this many characters the server detects, below it the local
+    # guess is used
+    SHORT_TEXT = 60
+    # A document this many times larger than when detected is detected again
+    REGROW_FACTOR = 2
+    SAMPLE_LENGTH = 1000
+    MIN_CONFIDENCE = 50  # In percent, as reported by /detect
+
+    def __init__(self):
+        self.fingerprints: OrderedDict[str, str] = OrderedDict()
+        # The sample and length of the current document
+        self.document = None
+        self.document_length = 0
+        self.language = None
+
+    def cached(self, text):
+        """The language remembered for text, None when it must be detected"""
+        sample = self.sample(text)
+        key = fingerprint(sample)
+        if key in self.fingerprints:
+            self.fingerprints.move_to_end(key)
+            return self.fingerprints[key]
+        if self.document is None or len(text) > self.document_length * self.REGROW_FACTOR:
+            return None
+        # The part of text the sample became, if it was edited, shifted by
+        # what was typed or deleted
+        edited = text[:max(len(self.document) + len(text) - self.document_length, 0)]
+        return self.language if is_draft(self.document, edited) else None
+
+    def remember(self, text, language):
+        sample = self.sample(text)
+        key = fingerprint(sample)
+        self.fingerprints[key] = language
+        self.fingerprints.move_to_end(key)
+        while len(self.fingerprints) > self.MAX_ENTRIES:
+            self.fingerprints.popitem(last=False)
+        self.document = sample
+        self.document_length = len(text)
+        self.language = language
+
+    def guess(self, text, codes=None):
+        """Local guess for short texts, remembered when it succeeds"""
+        if len(text) > self.SHORT_TEXT:
+            return None
+        if language := guess_language(text, codes):
+            self.remember(text, language)
+        return language
+
+    def sample(self, text):
+        """The part of text sent to /detect"""
+        return text[:self.SAMPLE_LENGTH]
+
+    def from_detections(self, detections):
+        """The language of a /detect response, None below MIN_CONFIDENCE"""
+        if not detections:
+            return None
+        best = max(detections, key=lambda detection: detection.get("confidence", 0))
+        return best.get("language") if best.get("confidence", 0) >= self.MIN_CONFIDENCE else None
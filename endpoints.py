@@ -0,0 +1,283 @@
+import http.client
+import threading
+import time
+
+from client import LibreTranslateClient, LibreTranslateError
+from latency import LatencyEstimator
+from metrics import metrics
+
+# 4xx statuses that depend on the endpoint rather than the request:
+# unauthorized, forbidden, not found and rate limited
+ENDPOINT_STATUSES = {401, 403, 404, 429}
+
+
+def is_endpoint_failure(error):
+    """Whether error means the endpoint is unhealthy rather than the request invalid"""
+    if isinstance(error, LibreTranslateError):
+        # Other 4xx answers would be the same on every endpoint. Keys and
+        # urls are per endpoint, a rejected key or a wrong path isn't.
+        return error.status is None or error.status in ENDPOINT_STATUSES or not 400 <= error.status < 500
+    return isinstance(error, (OSError, http.client.HTTPException))
+
+
+class CircuitBreaker:
+    """Stops sending requests to an endpoint after repeated failures.
+
+    Once FAILURE_THRESHOLD requests in a row have failed the circuit opens
+    and the endpoint is skipped for a cooldown that doubles on every new
+    failure. After the cooldown a single trial request is let through, its
+    result closes the circuit again or reopens it.
+    """
+    FAILURE_THRESHOLD = 3
+    MIN_COOLDOWN = 5  # In seconds
+    MAX_COOLDOWN = 120  # In seconds
+
+    def __init__(self):
+        self.failures = 0
+        self.cooldown = self.MIN_COOLDOWN
+        self.open_until = None
+        self.trial_running = False
+
+    @property
+    def state(self):
+        if self.open_until is None:
+            return "closed"
+        return "half-open" if time.monotonic() >= self.open_until else "open"
+
+    def allows_request(self):
+        state = self.state
+        return state == "closed" or (state == "half-open" and not self.trial_running)
+
+    def record_success(self):
+        self.failures = 0
+        self.cooldown = self.MIN_COOLDOWN
+        self.open_until = None
+        self.trial_running = False
+
+    def record_failure(self):
+        self.failures += 1
+        if self.open_until is not None:
+            # The trial request failed
+            self.cooldown = min(self.cooldown * 2, self.MAX_COOLDOWN)
+        if self.open_until is not None or self.failures >= self.FAILURE_THRESHOLD:
+            self.open_until = time.monotonic() + self.cooldown
+        self.trial_running = False
+
+
+class Endpoint:
+    """One LibreTranslate server of an EndpointPool"""
+
+    def __init__(self, url, api_key=None, weight=1, timeout=30):
+        self.client = LibreTranslateClient(url, api_key, timeout)
+        self.weight = max(weight, 1)
+        self.breaker = CircuitBreaker()
+        self.latency_estimator = LatencyEstimator()
+        self.in_flight = 0
+        self.last_error = None
+
+    @property
+    def url(self):
+        return self.client.url
+
+    def stats(self):
+        return {
+            "url": self.url,
+            "weight": self.weight,
+            "state": self.breaker.state,
+            "in_flight": self.in_flight,
+            "last_error": self.last_error,
+        } | self.latency_estimator.stats()
+
+
+class EndpointPool:
+    """Spreads requests over several LibreTranslate servers.
+
+    Has the interface of LibreTranslateClient, so the scheduler and the
+    headless command use it the same way. Every request goes to the
+    endpoint expected to answer first, from its measured latency, the
+    requests it already has in flight and its weight. Failing endpoints are
+    skipped by their circuit breaker and the request is retried on the next
+    one, and a background thread checks the endpoints whose circuit is open
+    so they come back as soon as they are healthy again. No endpoint gets
+    more than max_concurrency requests at once, further requests wait for
+    one of them to finish.
+    """
+    HEALTH_CHECK_INTERVAL = 15  # In seconds
+    HEALTH_CHECK_TIMEOUT = 5  # In seconds
+
+    def __init__(self, endpoints, timeout=30, max_concurrency=None):
+        """Args:
+        endpoints (list): dicts with api_url, api_key and weight, as
+            returned by MiniORM.get_api_endpoints
+        timeout (int): Request timeout in seconds
+        max_concurrency (int): Requests in flight per endpoint, unlimited when None
+        """
+        if not endpoints:
+            raise ValueError("at least one endpoint is needed")
+        self.endpoints = [
+            Endpoint(endpoint["api_url"], endpoint["api_key"], endpoint.get("weight", 1), timeout)
+            for endpoint in endpoints
+        ]
+        self.max_concurrency = max_concurrency
+        self.lock = threading.Lock()
+        # Notified when a request finishes or a circuit closes
+        self.slot_freed = threading.Condition(self.lock)
+        self.stopped = threading.Event()
+        self.health_thread = None
+        if len(self.endpoints) > 1:
+            self.health_thread = threading.Thread(target=self._check_health, name="endpoint-health", daemon=True)
+            self.health_thread.start()
+
+    @property
+    def url(self):
+        """The first endpoint, languages and latency are kept under its url"""
+        return self.endpoints[0].url
+
+    def translate(self, q, source="en", target="es"):
+        return self._call(len(q), lambda client: client.translate(q, source, target))
+
+    def translate_batch(self, texts, source="en", target="es"):
+        return self._call(sum(map(len, texts)), lambda client: client.translate_batch(texts, source, target))
+
+    def detect(self, q):
+        return self._call(len(q), lambda client: client.detect(q))
+
+    def languages(self):
+        return self.fetch_languages()[0]
+
+    def fetch_languages(self, etag=None):
+        return self._call(0, lambda client: client.fetch_languages(etag))
+
+    def connect(self):
+        """Opens the connections of the calling thread to the endpoints in
+        use, failures are left to the requests
+        """
+        for endpoint in self.endpoints:
+            with self.lock:
+                if not endpoint.breaker.allows_request():
+                    continue
+            try:
+                endpoint.client.connect()
+            except Exception:
+                pass
+
+    def close(self):
+        """Closes the connections of the calling thread"""
+        for endpoint in self.endpoints:
+            endpoint.client.close()
+
+    def stop(self):
+        """Stops the health checks, the pool isn't used anymore"""
+        self.stopped.set()
+
+    def stats(self):
+        with self.lock:
+            return [endpoint.stats() for endpoint in self.endpoints]
+
+    def _call(self, chars, request):
+        tried = set()
+        error = None
+        while True:
+            endpoint = self._acquire(chars, tried)
+            if endpoint is None:
+                raise error
+            tried.add(endpoint)
+            started = time.perf_counter()
+            try:
+                result = request(endpoint.client)
+            except Exception as e:
+                metrics.observe("endpoint_request", time.perf_counter() - started, url=endpoint.url, outcome="error")
+                failure = is_endpoint_failure(e)
+                self._release(endpoint, failure, e)
+                if not failure:
+                    raise
+                error = e
+                continue
+            seconds = time.perf_counter() - started
+            metrics.observe("endpoint_request", seconds, url=endpoint.url, outcome="ok")
+            if chars:
+                endpoint.latency_estimator.record(chars, seconds)
+            self._release(endpoint, False)
+            return result
+
+    def _acquire(self, chars, tried):
+        """Picks the endpoint expected to answer first, None when all were
+        tried. Waits while the ones to pick from have max_concurrency requests
+        in flight.
+        """
+        with self.slot_freed:
+            while True:
+                candidates = [endpoint for endpoint in self.endpoints if endpoint not in tried]
+                if not candidates:
+                    return None
+                available = [endpoint for endpoint in candidates if endpoint.breaker.allows_request()]
+                free = [endpoint for endpoint in available or candidates if self._has_slot(endpoint)]
+                if free:
+                    break
+                # An open circuit may let a request through before a slot frees
+                reopening = [
+                    endpoint.breaker.open_until - time.monotonic() for endpoint in candidates
+                    if endpoint.breaker.state == "open"
+                ]
+                self.slot_freed.wait(min(reopening, default=None))
+            if available:
+                endpoint = min(free, key=lambda endpoint: self._expected_wait(endpoint, chars))
+            else:
+                # Every circuit is open, trying is still better than failing
+                endpoint = min(free, key=lambda endpoint: endpoint.breaker.open_until)
+            if endpoint.breaker.state == "half-open":
+                endpoint.breaker.trial_running = True
+            endpoint.in_flight += 1
+            return endpoint
+
+    def _has_slot(self, endpoint):
+        return self.max_concurrency is None or endpoint.in_flight < self.max_concurrency
+
+    def _release(self, endpoint, failed, error=None):
+        with self.lock:
+            endpoint.in_flight -= 1
+            if failed:
+                endpoint.breaker.record_failure()
+                endpoint.last_error = str(error)
+            else:
+                endpoint.breaker.record_success()
+            self.slot_freed.notify_all()
+
+    def _expected_wait(self, endpoint, chars):
+        # Endpoints without measurements yet are assumed to be as fast as
+        # the fastest, so they get requests and are measured
+        latency = endpoint.latency_estimator.predict(chars)
+        if latency is None:
+            known = [
+                other.latency_estimator.predict(chars) for other in self.endpoints
+                if other.latency_estimator.predict(chars) is not None
+            ]
+            latency = min(known, default=1.0)
+        return (endpoint.in_flight + 1) * latency / endpoint.weight
+
+    def _check_health(self):
+        clients = {
+            endpoint: LibreTranslateClient(endpoint.client.url, endpoint.client.api_key, self.HEALTH_CHECK_TIMEOUT)
+            for endpoint in self.endpoints
+        }
+        etags = {}
+        while not self.stopped.wait(self.HEALTH_CHECK_INTERVAL):
+            for endpoint, client in clients.items():
+                with self.lock:
+                    if endpoint.breaker.state != "half-open" or endpoint.breaker.trial_running:
+                        continue
+                    endpoint.breaker.trial_running = True
+                try:
+                    _, etags[endpoint] = client.fetch_languages(etags.get(endpoint))
+                    failed, error = False, None
+                except Exception as e:
+                    failed, error = True, e
+                with self.lock:
+                    if failed:
+                        endpoint.breaker.record_failure()
+                        endpoint.last_error = str(error)
+                    else:
+                        endpoint.breaker.record_success()
+                        self.slot_freed.notify_all()
+        for client in clients.values():
+            client.close()
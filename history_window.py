@@ -0,0 +1,386 @@
+"""History window, imported the first time the history is opened"""
+import queue
+from concurrent.futures import CancelledError
+from datetime import datetime, timedelta, timezone
+
+from PySide6.QtCore import QThread, Signal, QTimer, Qt, QSize, QAbstractListModel, QModelIndex
+from PySide6.QtGui import QIcon, QAction, QColor
+from PySide6.QtWidgets import (
+    QApplication,
+    QDialog,
+    QDialogButtonBox,
+    QFormLayout,
+    QSpinBox,
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QPushButton,
+    QComboBox,
+    QMessageBox,
+    QMainWindow,
+    QLineEdit,
+    QMenu,
+    QListView,
+    QStyledItemDelegate,
+)
+
+from orm import MiniORM
+
+
+class HistoryModel(QAbstractListModel):
+    """Translation history, loaded a page at a time as the view scrolls"""
+    PAGE_SIZE = 100
+    # Only this many characters of each text are kept in memory, the full
+    # text is read from the database when it is copied
+    PREVIEW_LENGTH = 200
+    EntryRole = Qt.ItemDataRole.UserRole
+
+    def __init__(self, orm: MiniORM):
+        super().__init__()
+        self.orm = orm
+        self.entries = []
+        self.exhausted = False
+        # Keyword arguments of get_translation_history_page
+        self.filters = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.entries)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self.entries[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"From: {entry['source_language']} To: {entry['target_language']}\n" \
+                   f"Input: {self._preview(entry['input_text'])}\nOutput: {self._preview(entry['output_text'])}\n" \
+                   f"Timestamp: {self._convert_timestamp(entry['timestamp'])}"
+        if role == self.EntryRole:
+            return entry
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self.exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        # Keyset pagination, the next page starts after the last loaded entry
+        after = self.entries[-1]["id"] if self.entries else None
+        page = self.orm.get_translation_history_page(after, self.PAGE_SIZE, self.PREVIEW_LENGTH, **self.filters)
+        self.exhausted = len(page) < self.PAGE_SIZE
+        if not page:
+            return
+        self.beginInsertRows(QModelIndex(), len(self.entries), len(self.entries) + len(page) - 1)
+        self.entries.extend(page)
+        self.endInsertRows()
+
+    def reload(self):
+        self.beginResetModel()
+        self.entries = []
+        self.exhausted = False
+        self.endResetModel()
+
+    def set_first_page(self, filters, page):
+        """Shows the first page of a query that ran on another thread"""
+        self.beginResetModel()
+        self.filters = filters
+        self.entries = page
+        self.exhausted = len(page) < self.PAGE_SIZE
+        self.endResetModel()
+
+    def _preview(self, text):
+        # Kept to one line so every item has the same height
+        text = " ".join(text.split())
+        return text if len(text) < self.PREVIEW_LENGTH else text[:self.PREVIEW_LENGTH - 1] + "…"
+
+    def _convert_timestamp(self, timestamp):
+        utc_datetime = datetime.strptime(timestamp, '%Y-%m-%d %H:%M:%S')
+        utc_datetime = utc_datetime.replace(tzinfo=timezone.utc)  # Make sure it's timezone-aware
+        local_datetime = utc_datetime.astimezone(None)  # Convert UTC to local time
+        return local_datetime.strftime('%Y-%m-%d %H:%M:%S')
+
+
+class HistoryItemDelegate(QStyledItemDelegate):
+    """Draws a separator under every history entry"""
+    SEPARATOR_HEIGHT = 5
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        rect = option.rect
+        painter.fillRect(
+            rect.left(), rect.bottom() - self.SEPARATOR_HEIGHT + 1, rect.width(), self.SEPARATOR_HEIGHT,
+            QColor(220, 220, 220, 100)  # Light grey color for separator
+        )
+
+    def sizeHint(self, option, index):
+        size = super().sizeHint(option, index)
+        return QSize(size.width(), size.height() + self.SEPARATOR_HEIGHT)
+
+
+class HistorySearchThread(QThread):
+    """Runs history searches off the GUI thread.
+
+    Only the newest pending search is run, searches typed in the meantime
+    are skipped. The queries go through the reader pool of the ORM, so this
+    thread doesn't open a database connection of its own.
+    """
+    send_results = Signal(object, object)  # filters, first page
+
+    def __init__(self, orm: MiniORM):
+        super().__init__()
+        self.orm = orm
+        self.searches = queue.Queue()
+
+    def search(self, filters):
+        self.searches.put(filters)
+
+    def stop(self):
+        self.searches.put(None)
+        self.wait()
+
+    def run(self):
+        while True:
+            filters = self.searches.get()
+            while not self.searches.empty():
+                filters = self.searches.get()
+            if filters is None:
+                break
+            try:
+                page = self.orm.submit_read(
+                    self.orm.get_translation_history_page,
+                    limit=HistoryModel.PAGE_SIZE, preview_length=HistoryModel.PREVIEW_LENGTH, **filters
+                ).result()
+            except (RuntimeError, CancelledError):
+                # The database was closed while quitting
+                break
+            self.send_results.emit(filters, page)
+
+
+class HistoryLimitsDialog(QDialog):
+    """Edits the history limits, older entries past them are deleted in the background"""
+    MEGABYTE = 1024 * 1024
+
+    def __init__(self, orm: MiniORM, parent=None):
+        super().__init__(parent)
+        self.orm = orm
+        self.setWindowTitle("History Limits")
+        retention = orm.get_history_retention()
+
+        self.max_rows_edit = self._spin_box(1_000_000, 1000, retention["max_rows"], " entries")
+        self.max_age_edit = self._spin_box(3650, 1, retention["max_age_days"], " days")
+        max_bytes = retention["max_bytes"]
+        self.max_size_edit = self._spin_box(
+            100_000, 10, max_bytes and max(max_bytes // self.MEGABYTE, 1), " MB"
+        )
+        self.buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        self.buttons.accepted.connect(self.accept)
+        self.buttons.rejected.connect(self.reject)
+
+        self.layout = QFormLayout()
+        self.layout.addRow("Keep at most:", self.max_rows_edit)
+        self.layout.addRow("Delete after:", self.max_age_edit)
+        self.layout.addRow("Total size up to:", self.max_size_edit)
+        self.layout.addRow(self.buttons)
+        self.setLayout(self.layout)
+
+    @staticmethod
+    def _spin_box(maximum, step, value, suffix):
+        # 0 is shown as Unlimited
+        spin_box = QSpinBox()
+        spin_box.setRange(0, maximum)
+        spin_box.setSingleStep(step)
+        spin_box.setSuffix(suffix)
+        spin_box.setSpecialValueText("Unlimited")
+        spin_box.setValue(value or 0)
+        return spin_box
+
+    def accept(self):
+        self.orm.save_history_retention(
+            self.max_rows_edit.value(), self.max_age_edit.value(), self.max_size_edit.value() * self.MEGABYTE
+        )
+        super().accept()
+
+
+class HistoryWindow(QMainWindow):
+    SEARCH_DELAY = 150  # In milliseconds
+    # Label and number of days of the date filter
+    PERIODS = (("Any time", None), ("Today", 1), ("Last 7 days", 7), ("Last 30 days", 30), ("Last year", 365))
+
+    def __init__(self, orm: MiniORM):
+        super().__init__()
+        self.orm = orm
+        self.setWindowIcon(QIcon(":/img/icon.png"))
+        self.resize(460, 350)
+
+
+        # Menu
+        self.menu = self.menuBar()
+        self.refresh_action = self.menu.addAction("Refresh")
+        self.refresh_action.triggered.connect(self.refresh)
+
+        self.clean_history_action = self.menu.addAction("Clean History")
+        self.clean_history_action.triggered.connect(self.are_you_sure)
+        self.clean_history_action.toolTip = "This will delete all history entries."
+
+        self.limits_action = self.menu.addAction("Limits")
+        self.limits_action.triggered.connect(lambda: HistoryLimitsDialog(self.orm, self).exec())
+
+
+        # Create central widget
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+
+        # Create layout for central widget
+        self.layout = QVBoxLayout()
+        central_widget.setLayout(self.layout)
+
+        # Search and filters
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Search")
+        self.search_edit.setClearButtonEnabled(True)
+        self.source_filter_combo = QComboBox()
+        self.target_filter_combo = QComboBox()
+        self.period_filter_combo = QComboBox()
+        self.period_filter_combo.addItems([label for label, _ in self.PERIODS])
+        self.load_language_filters()
+        self.filter_layout = QHBoxLayout()
+        self.filter_layout.addWidget(self.source_filter_combo)
+        self.filter_layout.addWidget(self.target_filter_combo)
+        self.filter_layout.addWidget(self.period_filter_combo)
+        self.layout.addWidget(self.search_edit)
+        self.layout.addLayout(self.filter_layout)
+
+        self.search_timer = QTimer()
+        self.search_timer.setSingleShot(True)
+        self.search_timer.timeout.connect(self.search)
+        self.search_edit.textChanged.connect(lambda: self.search_timer.start(self.SEARCH_DELAY))
+        self.source_filter_combo.currentIndexChanged.connect(self.search)
+        self.target_filter_combo.currentIndexChanged.connect(self.search)
+        self.period_filter_combo.currentIndexChanged.connect(self.search)
+
+        self.latest_filters = {}
+        self.search_thread = HistorySearchThread(self.orm)
+        self.search_thread.send_results.connect(self.show_search_results)
+        QApplication.instance().aboutToQuit.connect(self.search_thread.stop)
+        self.search_thread.start()
+
+        # History list, entries are fetched from the database while scrolling
+        self.history_model = HistoryModel(self.orm)
+        self.history_list = QListView()
+        self.history_list.setUniformItemSizes(True)
+        self.history_list.setItemDelegate(HistoryItemDelegate(self.history_list))
+        self.history_list.setModel(self.history_model)
+        self.layout.addWidget(self.history_list)
+
+        # Close button
+        self.close_button = QPushButton("Close")
+        self.layout.addWidget(self.close_button)
+        self.close_button.clicked.connect(self.close)
+
+        # Set window title
+        self.setWindowTitle("History")
+
+        # Add context menu to the list widget
+        self.history_list.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.history_list.customContextMenuRequested.connect(self.show_context_menu)
+
+    def show_context_menu(self, position):
+        # Create context menu
+        context_menu = QMenu()
+
+        # Add actions to copy input or output
+        copy_input_action = QAction("Copy Input", self)
+        copy_input_action.triggered.connect(self.copy_input_text)
+        context_menu.addAction(copy_input_action)
+
+        copy_output_action = QAction("Copy Output", self)
+        copy_output_action.triggered.connect(self.copy_output_text)
+        context_menu.addAction(copy_output_action)
+
+        # Show context menu at the current position
+        context_menu.exec(self.history_list.mapToGlobal(position))
+
+    def copy_input_text(self):
+        self.copy_entry_text("input_text", "Input text not found.")
+
+    def copy_output_text(self):
+        self.copy_entry_text("output_text", "Output text not found.")
+
+    def copy_entry_text(self, column, not_found_message):
+        # Get the selected entry from the list
+        index = self.history_list.currentIndex()
+        if not index.isValid():
+            return
+        # The model only holds a preview, read the full text
+        entry = self.orm.get_translation_history_entry(index.data(HistoryModel.EntryRole)["id"])
+        if entry and entry[column]:
+            clipboard = QApplication.clipboard()
+            clipboard.setText(entry[column])
+        else:
+            self.show_message("Error", not_found_message)
+
+    def show_message(self, title, message):
+        # Show a message box with the provided title and message
+        msg_box = QMessageBox(self)
+        msg_box.setWindowTitle(title)
+        msg_box.setText(message)
+        msg_box.exec()
+
+    def load_language_filters(self):
+        sources, targets = self.orm.get_history_languages()
+        for combo, languages, any_label in (
+            (self.source_filter_combo, sources, "Any source"),
+            (self.target_filter_combo, targets, "Any target"),
+        ):
+            selected = combo.currentData()
+            combo.blockSignals(True)
+            combo.clear()
+            combo.addItem(any_label, None)
+            for language in languages:
+                combo.addItem(language, language)
+            combo.setCurrentIndex(max(combo.findData(selected), 0))
+            combo.blockSignals(False)
+
+    def current_filters(self):
+        filters = {}
+        if search := self.search_edit.text().strip():
+            filters["search"] = search
+        if source_language := self.source_filter_combo.currentData():
+            filters["source_language"] = source_language
+        if target_language := self.target_filter_combo.currentData():
+            filters["target_language"] = target_language
+        if days := self.PERIODS[self.period_filter_combo.currentIndex()][1]:
+            since = datetime.now(timezone.utc) - timedelta(days=days)
+            filters["since"] = since.strftime('%Y-%m-%d %H:%M:%S')
+        return filters
+
+    def search(self):
+        self.search_timer.stop()
+        self.latest_filters = self.current_filters()
+        self.search_thread.search(self.latest_filters)
+
+    def show_search_results(self, filters, page):
+        # Drop results of searches the user has already typed past
+        if filters is self.latest_filters:
+            self.history_model.set_first_page(filters, page)
+
+    def refresh(self):
+        self.orm.flush_translation_history()
+        self.load_language_filters()
+        self.search()
+
+    def closeEvent(self, event):
+        self.search_thread.stop()
+        super().closeEvent(event)
+
+    def are_you_sure(self):
+        msg_box = QMessageBox(self)
+        msg_box.setWindowTitle("Are you sure?")
+        msg_box.setText("Are you sure you want to clear the history?")
+        msg_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+        msg_box.setDefaultButton(QMessageBox.No)
+        result = msg_box.exec()
+        if result == QMessageBox.Yes:
+            self.orm.clear_translation_history()
+            self.refresh()
+        return result
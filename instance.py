@@ -0,0 +1,125 @@
+"""Single instance: later launches hand their request to the running GUI, ex:
+
+    reply = send_request(data_dir, {"command": "show", "text": ""})
+    if reply is None:
+        ...  # Nothing running, start the GUI, which serves the next launches
+
+Requests and replies are one line of JSON each, over a local socket: a
+Unix socket in the data directory, or a named pipe on Windows. Until it
+replies, the GUI sends a heartbeat line every HEARTBEAT_INTERVAL, so a
+long request can be told from a GUI that stopped responding. Nothing
+here imports Qt, so forwarding doesn't pay for loading it.
+"""
+import argparse
+import getpass
+import json
+import os
+import queue
+import socket
+import sys
+import threading
+
+CONNECT_TIMEOUT = 0.5  # In seconds
+# Showing the window is quick, a running GUI that doesn't answer by then is stuck
+SHOW_TIMEOUT = 5.0  # In seconds
+HEARTBEAT_INTERVAL = 2.0  # In seconds
+# A GUI that sends no heartbeat for this long is stuck, whatever it runs
+FORWARD_TIMEOUT = 10.0  # In seconds
+HEARTBEAT = {"heartbeat": True}
+
+
+def server_name(data_dir):
+    """The name the GUI listens on with QLocalServer"""
+    if sys.platform == "win32":
+        return f"LibreTranslateGUI-{getpass.getuser()}"
+    return os.path.join(data_dir, "instance.sock")
+
+
+def connect(data_dir):
+    """A connection to the running GUI, a socket or the pipe file, None
+    when there is none
+    """
+    name = server_name(data_dir)
+    if sys.platform == "win32":
+        try:
+            return open(rf"\\.\pipe\{name}", "r+b", buffering=0)
+        except OSError:
+            return None
+    connection = socket.socket(socket.AF_UNIX)
+    try:
+        connection.settimeout(CONNECT_TIMEOUT)
+        connection.connect(name)
+    except OSError:
+        connection.close()
+        return None
+    return connection
+
+
+def request(connection, message, timeout=None):
+    """Sends message on connection and closes it, returns the reply, None
+    when the GUI went away or sent nothing, not even a heartbeat, for
+    timeout seconds
+    """
+    data = (json.dumps(message) + "\n").encode()
+    if not isinstance(connection, socket.socket):
+        return request_pipe(connection, data, timeout)
+    with connection:
+        try:
+            connection.settimeout(timeout)
+            connection.sendall(data)
+            reply = connection.makefile("rb")
+            while (line := reply.readline()) and (result := json.loads(line)) == HEARTBEAT:
+                pass
+            return result if line else None
+        except (OSError, ValueError):
+            return None
+
+
+def request_pipe(pipe, data, timeout):
+    """request on the Windows pipe file, which can't time out. A helper
+    thread writes and reads it, and closes it once the GUI answers or goes
+    away, so a stuck GUI only holds up that thread.
+    """
+    lines = queue.Queue()
+
+    def exchange():
+        with pipe:
+            try:
+                pipe.write(data)
+                while line := pipe.readline():
+                    lines.put(line)
+            except OSError:
+                pass
+        lines.put(b"")
+
+    threading.Thread(target=exchange, name="instance-request", daemon=True).start()
+    while True:
+        try:
+            line = lines.get(timeout=timeout)
+            result = json.loads(line) if line else None
+        except (queue.Empty, ValueError):
+            return None
+        if result != HEARTBEAT:
+            return result
+
+
+def send_request(data_dir, message, timeout=None):
+    """Sends message to the running GUI, returns its reply, None when there is none"""
+    connection = connect(data_dir)
+    return None if connection is None else request(connection, message, timeout)
+
+
+def parse_launch_args(argv):
+    parser = argparse.ArgumentParser(prog="main.py", description="LibreTranslate GUI.")
+    parser.add_argument("text", nargs="*", help="text to translate in the window")
+    parser.add_argument("--new-instance", action="store_true", help="start a new window instead of reusing the running one")
+    return parser.parse_args(argv)
+
+
+def forward_launch(args, data_dir):
+    """Shows the running GUI, with args.text when given. Returns False when
+    there is no running GUI to take the launch.
+    """
+    if args.new_instance:
+        return False
+    return send_request(data_dir, {"command": "show", "text": " ".join(args.text)}, SHOW_TIMEOUT) is not None
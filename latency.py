@@ -0,0 +1,56 @@
+import threading
+from collections import deque
+
+
+class LatencyEstimator:
+    """Rolling estimate of how long an endpoint takes to translate n characters.
+
+    Fits latency = overhead + chars * per_char over the most recent requests,
+    so both the fixed round-trip cost and the throughput of the server are
+    known.
+    """
+
+    def __init__(self, window=50):
+        self.samples = deque(maxlen=window)
+        self.lock = threading.Lock()
+
+    def record(self, chars, seconds):
+        with self.lock:
+            self.samples.append((chars, seconds))
+
+    def model(self):
+        """Returns (overhead seconds, seconds per character), None without samples"""
+        with self.lock:
+            samples = list(self.samples)
+        if not samples:
+            return None
+        count = len(samples)
+        mean_chars = sum(chars for chars, _ in samples) / count
+        mean_seconds = sum(seconds for _, seconds in samples) / count
+        variance = sum((chars - mean_chars) ** 2 for chars, _ in samples)
+        if variance == 0:
+            return mean_seconds, 0.0
+        per_char = sum((chars - mean_chars) * (seconds - mean_seconds) for chars, seconds in samples) / variance
+        per_char = max(per_char, 0.0)
+        overhead = max(mean_seconds - per_char * mean_chars, 0.0)
+        return overhead, per_char
+
+    def predict(self, chars):
+        """Expected seconds to translate chars characters, None without samples"""
+        model = self.model()
+        if model is None:
+            return None
+        overhead, per_char = model
+        return overhead + per_char * chars
+
+    def stats(self):
+        model = self.model()
+        if model is None:
+            return {"samples": 0}
+        overhead, per_char = model
+        return {
+            "samples": len(self.samples),
+            "overhead_ms": overhead * 1000,
+            "ms_per_char": per_char * 1000,
+            "chars_per_second": 1 / per_char if per_char else None,
+        }
@@ -1,25 +1,45 @@
-import os
-import platform
-import urllib.request
+import sys
+
+if __name__ == "__main__":
+    # The headless command needs none of Qt, dispatch it before the GUI imports
+    if sys.argv[1:2] == ["translate"]:
+        from cli import run
+        sys.exit(run(sys.argv[2:]))
+    # Nor does handing the launch to the GUI already running
+    from instance import forward_launch, parse_launch_args
+    from orm import default_data_dir
+    if forward_launch(parse_launch_args(sys.argv[1:]), default_data_dir()):
+        sys.exit(0)
+
+import json
+import time
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
 from functools import partial
+from dataclasses import dataclass, field
 from pathlib import Path
-from logging import Logger
-from orm import MiniORM
-from datetime import datetime, timezone
+from orm import MiniORM, default_data_dir
+from cache import TranslationCache
+from memory import TranslationMemory
+from detection import LanguageDetector
+from segments import split_segments, splice_segments, unique_segments, translate_pieces
+from scheduler import PRIORITY_BACKGROUND, TranslationScheduler
+from latency import LatencyEstimator
+from metrics import metrics
 from PySide6.QtCore import (
+    QObject,
+    QPoint,
     QThread,
     Signal,
     QTimer,
     Qt,
-    QSize,
 )
 
 from PySide6.QtGui import (
     QIcon,
     QAction,
-    QColor,
-    
-    
+    QTextCursor,
 )
 
 from PySide6.QtWidgets import (
@@ -28,59 +48,143 @@ from PySide6.QtWidgets import (
     QVBoxLayout, 
     QHBoxLayout, 
     QPushButton, 
-    QTextEdit, 
+    QPlainTextEdit,
     QLabel, 
     QComboBox, 
     QMessageBox,
     QMainWindow,
-    QLineEdit,
     QSystemTrayIcon,
     QMenu,
-    QListWidget,
-    QListWidgetItem,
-    
-    
+    QSpinBox,
+    QCheckBox,
+    QTableWidget,
+    QTableWidgetItem,
+    QHeaderView,
 )
-from libretranslatepy import LibreTranslateAPI
+from PySide6.QtNetwork import QLocalServer, QLocalSocket
 
-from models import libretranslate_languages_from_dict, LibretranslateLanguage
+from endpoints import EndpointPool
+from instance import HEARTBEAT, HEARTBEAT_INTERVAL, parse_launch_args, server_name
+
+from models import libretranslate_languages_from_dict, LibretranslateLanguage, LanguageRegistry, AUTO_LANGUAGE
+import resources_rc  # noqa: F401, registers the :/img/icon.png resource
+
+ICON_PATH = ":/img/icon.png"
+
+
+def qt_text_length(text):
+    """Length of text as counted by Qt, which uses UTF-16 code units"""
+    return len(text.encode("utf-16-le")) // 2
 
 
 class ApiKeyGui(QWidget):
+    """Edits the LibreTranslate servers, requests are spread over all of them"""
+    COLUMNS = ("API url", "API key", "Weight")
+
     def __init__(self, orm: MiniORM):
         super().__init__()
-        self.url = None
-        self.api_key = None
+        self.max_concurrency = 4
+        self.chunk_size = 2000
 
         self.orm = orm
+        self.setWindowTitle("API endpoints")
+        self.resize(520, 320)
 
         self.layout = QVBoxLayout()
         self.setLayout(self.layout)
 
-        self.url_label = QLabel("API url:")
-        self.url_edit = QLineEdit()
-        self.layout.addWidget(self.url_label)
-        self.layout.addWidget(self.url_edit)
-
-        self.api_key_label = QLabel("API key:")
-        self.api_key_edit = QLineEdit()
-        self.layout.addWidget(self.api_key_label)
-        self.layout.addWidget(self.api_key_edit)
+        self.endpoints_label = QLabel("Endpoints, a higher weight gets more requests:")
+        self.endpoints_table = QTableWidget(0, len(self.COLUMNS))
+        self.endpoints_table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.endpoints_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.endpoints_table.verticalHeader().setVisible(False)
+        self.layout.addWidget(self.endpoints_label)
+        self.layout.addWidget(self.endpoints_table)
+
+        self.add_button = QPushButton("Add")
+        self.add_button.clicked.connect(lambda: self.add_endpoint({"api_url": "", "api_key": "", "weight": 1}))
+        self.remove_button = QPushButton("Remove")
+        self.remove_button.clicked.connect(self.remove_endpoint)
+        self.endpoint_buttons_layout = QHBoxLayout()
+        self.endpoint_buttons_layout.addWidget(self.add_button)
+        self.endpoint_buttons_layout.addWidget(self.remove_button)
+        self.endpoint_buttons_layout.addStretch()
+        self.layout.addLayout(self.endpoint_buttons_layout)
+
+        self.max_concurrency_label = QLabel("Simultaneous requests per endpoint:")
+        self.max_concurrency_edit = QSpinBox()
+        self.max_concurrency_edit.setRange(1, 32)
+        self.max_concurrency_edit.setValue(self.max_concurrency)
+        self.layout.addWidget(self.max_concurrency_label)
+        self.layout.addWidget(self.max_concurrency_edit)
+
+        self.chunk_size_label = QLabel("Characters per request:")
+        self.chunk_size_edit = QSpinBox()
+        self.chunk_size_edit.setRange(100, 100000)
+        self.chunk_size_edit.setSingleStep(100)
+        self.chunk_size_edit.setValue(self.chunk_size)
+        self.layout.addWidget(self.chunk_size_label)
+        self.layout.addWidget(self.chunk_size_edit)
+
+        self.pretranslate_checkbox = QCheckBox("Translate ahead into the languages used most, while idle")
+        self.pretranslate_checkbox.setChecked(self.orm.get_setting("pretranslate", "1") == "1")
+        self.layout.addWidget(self.pretranslate_checkbox)
 
         self.ok_button = QPushButton("OK")
         self.layout.addWidget(self.ok_button)
         self.ok_button.clicked.connect(self.ok)
 
 
+    def load_settings(self, url_key, endpoints):
+        self.max_concurrency = url_key["max_concurrency"]
+        self.chunk_size = url_key["chunk_size"]
+        self.max_concurrency_edit.setValue(self.max_concurrency)
+        self.chunk_size_edit.setValue(self.chunk_size)
+        self.endpoints_table.setRowCount(0)
+        for endpoint in endpoints:
+            self.add_endpoint(endpoint)
+
+    def add_endpoint(self, endpoint):
+        row = self.endpoints_table.rowCount()
+        self.endpoints_table.insertRow(row)
+        self.endpoints_table.setItem(row, 0, QTableWidgetItem(endpoint["api_url"]))
+        self.endpoints_table.setItem(row, 1, QTableWidgetItem(endpoint["api_key"]))
+        weight_edit = QSpinBox()
+        weight_edit.setRange(1, 100)
+        weight_edit.setValue(endpoint["weight"])
+        self.endpoints_table.setCellWidget(row, 2, weight_edit)
+
+    def remove_endpoint(self):
+        if (row := self.endpoints_table.currentRow()) >= 0:
+            self.endpoints_table.removeRow(row)
+
+    def endpoints(self):
+        endpoints = []
+        for row in range(self.endpoints_table.rowCount()):
+            url = self.endpoints_table.item(row, 0).text().strip()
+            if not url:
+                continue
+            endpoints.append({
+                "api_url": url,
+                "api_key": self.endpoints_table.item(row, 1).text().strip(),
+                "weight": self.endpoints_table.cellWidget(row, 2).value(),
+            })
+        return endpoints
+
     def ok(self):
-        self.url = self.url_edit.text()
-        self.api_key = self.api_key_edit.text()
-        self.orm.save_api_settings(self.url, self.api_key)
+        self.max_concurrency = self.max_concurrency_edit.value()
+        self.chunk_size = self.chunk_size_edit.value()
+        self.orm.save_api_endpoints(self.endpoints(), self.max_concurrency, self.chunk_size)
+        self.orm.save_setting("pretranslate", int(self.pretranslate_checkbox.isChecked()))
         self.close()
 
 
-class PlainPasteTextEdit(QTextEdit):
-    """Forces pasted text to have formatting cleared"""
+class PlainPasteTextEdit(QPlainTextEdit):
+    """Forces pasted text to have formatting cleared.
+
+    Plain text edits lay out only the blocks shown, so multi-megabyte
+    documents stay quick to edit and scroll.
+    """
     def insertFromMimeData(self, source):
         # Get plain text and insert it
         self.insertPlainText(source.text())
@@ -88,6 +192,8 @@ class PlainPasteTextEdit(QTextEdit):
 
 class WorkerThread(QThread):
     """Runs a bound function on a thread"""
+    send_result = Signal(object)
+    send_error = Signal(str)
 
     def __init__(self, bound_worker_function):
         """Args:
@@ -98,205 +204,281 @@ class WorkerThread(QThread):
         self.finished.connect(self.deleteLater)
 
     def run(self):
-        self.bound_worker_function()
-
-
-class TranslationThread(QThread):
-    send_text_update = Signal(str)
+        try:
+            result = self.bound_worker_function()
+        except Exception as e:
+            self.send_error.emit(str(e))
+            return
+        self.send_result.emit(result)
 
-    def __init__(self, translation_function, show_loading_message):
-        super().__init__()
-        self.translation_function = translation_function
-        self.show_loading_message = show_loading_message
 
-    def run(self):
-        if self.show_loading_message:
-            self.send_text_update.emit("Loading...")
-        translated_text = self.translation_function()
-        self.send_text_update.emit(translated_text)
+class InstanceServer(QObject):
+    """Takes the requests of later launches, see instance.send_request.
 
+    request_received is emitted with the message and a function sending
+    the reply, which may be called later. Heartbeats are sent until then.
+    """
+    request_received = Signal(object, object)
 
-class HistoryWindow(QMainWindow):
-    def __init__(self, history, orm: MiniORM):
+    def __init__(self, name):
         super().__init__()
-        self.history = history
-        self.orm = orm
-        self.setWindowIcon(QIcon(str(Path(__file__).parent / "icon.png")))
-        self.resize(460, 350)
-
-
-        # Menu
-        self.menu = self.menuBar()
-        self.refresh_action = self.menu.addAction("Refresh")
-        self.refresh_action.triggered.connect(self.refresh)
+        self.server = QLocalServer(self)
+        self.server.setSocketOptions(QLocalServer.SocketOption.UserAccessOption)
+        self.server.newConnection.connect(self.accept)
+        # Left behind by a process that didn't exit cleanly, nothing
+        # answered on it or this launch would have been handed over
+        QLocalServer.removeServer(name)
+        if not self.server.listen(name):
+            print(f"Not reachable by later launches: {self.server.errorString()}", file=sys.stderr)
+
+    def accept(self):
+        while (connection := self.server.nextPendingConnection()) is not None:
+            connection.readyRead.connect(partial(self.read, connection, bytearray()))
+
+    def read(self, connection, buffer):
+        buffer += connection.readAll().data()
+        if b"\n" not in buffer:
+            return
+        connection.readyRead.disconnect()
+        try:
+            message = json.loads(buffer[:buffer.index(b"\n")])
+        except ValueError:
+            connection.disconnectFromServer()
+            connection.deleteLater()
+            return
+        # Sent by the GUI thread, so they stop when it is stuck
+        heartbeat = QTimer(connection)
+        heartbeat.timeout.connect(partial(self.send, connection, HEARTBEAT))
+        heartbeat.start(int(HEARTBEAT_INTERVAL * 1000))
+        self.request_received.emit(message, partial(self.reply, connection, heartbeat))
+
+    @staticmethod
+    def send(connection, message):
+        if connection.state() == QLocalSocket.LocalSocketState.ConnectedState:
+            connection.write((json.dumps(message) + "\n").encode())
+
+    def reply(self, connection, heartbeat, result):
+        heartbeat.stop()
+        if connection.state() != QLocalSocket.LocalSocketState.ConnectedState:
+            # The launch gave up waiting
+            connection.deleteLater()
+            return
+        connection.disconnected.connect(connection.deleteLater)
+        self.send(connection, result)
+        # Only disconnects once the reply is written
+        connection.disconnectFromServer()
 
-        self.clean_history_action = self.menu.addAction("Clean History")
-        self.clean_history_action.triggered.connect(self.are_you_sure)
-        self.clean_history_action.toolTip = "This will delete all history entries."
 
+class ForwardedTranslations(QObject):
+    """Runs the translate requests of later launches, see cli.run_forwarded.
 
-        # Create central widget
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
+    The requests, and the files and server requests they make, run on
+    pools that live as long as the GUI, so the connections their threads
+    opened are reused by the next request.
+    """
+    RUN_WORKERS = 4
+    send_reply = Signal(object, object)  # reply function, reply
 
-        # Create layout for central widget
-        self.layout = QVBoxLayout()
-        central_widget.setLayout(self.layout)
-
-        # History list widget
-        self.history_list = QListWidget()
-        
-        # Add items to the list widget
-        for entry in self.history:
-            item = f"From: {entry['source_language']} To: {entry['target_language']}\n" \
-                   f"Input: {entry['input_text']}\nOutput: {entry['output_text']}\n" \
-                   f"Timestamp: {self._convert_timestamp(entry['timestamp'])}"
-            self.history_list.addItem(item)
-            self.add_separator()
-
-        self.layout.addWidget(self.history_list)
-
-        # Close button
-        self.close_button = QPushButton("Close")
-        self.layout.addWidget(self.close_button)
-        self.close_button.clicked.connect(self.close)
-
-        # Set window title
-        self.setWindowTitle("History")
-
-        # Add context menu to the list widget
-        self.history_list.setContextMenuPolicy(Qt.CustomContextMenu)
-        self.history_list.customContextMenuRequested.connect(self.show_context_menu)
-
-    def show_context_menu(self, position):
-        # Create context menu
-        context_menu = QMenu()
-
-        # Add actions to copy input or output
-        copy_input_action = QAction("Copy Input", self)
-        copy_input_action.triggered.connect(self.copy_input_text)
-        context_menu.addAction(copy_input_action)
-
-        copy_output_action = QAction("Copy Output", self)
-        copy_output_action.triggered.connect(self.copy_output_text)
-        context_menu.addAction(copy_output_action)
-
-        # Show context menu at the current position
-        context_menu.exec(self.history_list.mapToGlobal(position))
-
-    def copy_input_text(self):
-        # Get the selected item from the list
-        selected_item = self.history_list.currentItem()
-        if selected_item:
-            # Extract the input text from the item and copy it to the clipboard
-            input_text = self.extract_input_output_text(selected_item.text(), "Input")
-            if input_text:
-                clipboard = QApplication.clipboard()
-                clipboard.setText(input_text)
-            else:
-                self.show_message("Error", "Input text not found.")
-
-    def copy_output_text(self):
-        # Get the selected item from the list
-        selected_item = self.history_list.currentItem()
-        if selected_item:
-            # Extract the output text from the item and copy it to the clipboard
-            output_text = self.extract_input_output_text(selected_item.text(), "Output")
-            if output_text:
-                clipboard = QApplication.clipboard()
-                clipboard.setText(output_text)
+    def __init__(self, window):
+        super().__init__()
+        from cli import TranslationPools
+        self.window = window
+        self.pools = TranslationPools()
+        self.runs = ThreadPoolExecutor(max_workers=self.RUN_WORKERS, thread_name_prefix="forwarded")
+        self.send_reply.connect(self.reply)
+
+    def submit(self, message, reply):
+        from cli import run_forwarded
+        window = self.window
+        future = self.runs.submit(
+            run_forwarded, message, window.orm, window.lt, window.registry,
+            window.translation_cache, window.translation_memory, self.pools,
+        )
+        future.add_done_callback(partial(self.finished, reply))
+
+    def finished(self, reply, future):
+        # On a pool thread, the reply is sent by the GUI thread
+        try:
+            result = future.result()
+        except Exception as e:
+            result = {"status": 1, "stdout": "", "stderr": f"{e}\n"}
+        self.send_reply.emit(reply, result)
+
+    def reply(self, reply, result):
+        reply(result)
+
+    def shutdown(self):
+        self.runs.shutdown(wait=False, cancel_futures=True)
+        self.pools.shutdown()
+
+
+@dataclass
+class TranslationRequest:
+    """The document in the source pane and its translation, kept across
+    edits so only the pieces that changed are looked up and rebuilt
+    """
+    job: object
+    input_language: LibretranslateLanguage
+    output_language: LibretranslateLanguage
+    input_text: str
+    pieces: list[str]
+    translations: dict[str, str] = field(default_factory=dict)
+    # Shown for the segments still being translated
+    suggestions: dict[str, str] = field(default_factory=dict)
+
+    def __post_init__(self):
+        # What the target pane shows for every piece, only the pieces of
+        # completed segments are replaced, so large documents aren't
+        # rebuilt on every chunk
+        self.output = translate_pieces(self.pieces, self.suggestions | self.translations)
+        # Where every piece starts in input_text
+        self.offsets = list(accumulate(map(len, self.pieces), initial=0))[:-1]
+        # The pieces of every segment without a translation yet
+        self.indexes: dict[str, list[int]] = {}
+        self._index(range(len(self.pieces)))
+
+    @property
+    def missing(self):
+        """The segments without a translation yet"""
+        return list(self.indexes)
+
+    def output_text(self):
+        return "".join(self.output)
+
+    def splice(self, input_text):
+        """The pieces of input_text that changed, see splice_segments"""
+        return splice_segments(self.input_text, input_text, self.pieces, self.offsets)
+
+    def edit(self, input_text, start, end, pieces, translations, suggestions):
+        """Replaces pieces[start:end] with pieces, input_text being the new text"""
+        self.translations.update(translations)
+        self.suggestions.update(suggestions)
+        shift = len(pieces) - (end - start)
+        for segment, indexes in list(self.indexes.items()):
+            indexes = [index + shift if index >= end else index for index in indexes if not start <= index < end]
+            if indexes:
+                self.indexes[segment] = indexes
             else:
-                self.show_message("Error", "Output text not found.")
-
-    def extract_input_output_text(self, item_text, text_type):
-        # Extract either input or output text from the item text based on the type
-        lines = item_text.split("\n")
-        for line in lines:
-            if line.startswith(f"{text_type}:"):
-                # Return the part after "Input:" or "Output:"
-                return line.split(":")[1].strip()
-        return None
-
-    def show_message(self, title, message):
-        # Show a message box with the provided title and message
-        msg_box = QMessageBox(self)
-        msg_box.setWindowTitle(title)
-        msg_box.setText(message)
-        msg_box.exec()
-
-    def add_separator(self):
-        # Create a separator item (no text, but can style it)
-        separator_item = QListWidgetItem("")
-        separator_item.setFlags(Qt.ItemFlags())  # Disable selection of the separator item
-        separator_item.setBackground(QColor(220, 220, 220, 100))  # Light grey color for separator
-        separator_item.setSizeHint(QSize(0, 5))
-        self.history_list.addItem(separator_item)
-
-    def refresh(self):
-        history = self.orm.get_translation_history()
-        self.history_list.clear()
-        for entry in history:
-            item = f"From: {entry['source_language']} To: {entry['target_language']}\n" \
-                   f"Input: {entry['input_text']}\nOutput: {entry['output_text']}\n" \
-                   f"Timestamp: {self._convert_timestamp(entry['timestamp'])}"
-            self.history_list.addItem(item)
-            self.add_separator()
-
-    def are_you_sure(self):
-        msg_box = QMessageBox(self)
-        msg_box.setWindowTitle("Are you sure?")
-        msg_box.setText("Are you sure you want to clear the history?")
-        msg_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
-        msg_box.setDefaultButton(QMessageBox.No)
-        result = msg_box.exec()
-        if result == QMessageBox.Yes:
-            self.orm.clear_translation_history()
-            self.refresh()
-        return result
-
-    def _convert_timestamp(self, timestamp):
-        utc_datetime = datetime.strptime(timestamp, '%Y-%m-%d %H:%M:%S')
-        utc_datetime = utc_datetime.replace(tzinfo=timezone.utc)  # Make sure it's timezone-aware
-        local_datetime = utc_datetime.astimezone(None)  # Convert UTC to local time
-        return local_datetime.strftime('%Y-%m-%d %H:%M:%S')
+                del self.indexes[segment]
+
+        delta = len(input_text) - len(self.input_text)
+        text_start = self.offsets[start] if start < len(self.offsets) else len(self.input_text)
+        self.offsets[start:end] = list(accumulate(map(len, pieces), initial=text_start))[:-1]
+        if delta:
+            after = start + len(pieces)
+            self.offsets[after:] = [offset + delta for offset in self.offsets[after:]]
+        self.pieces[start:end] = pieces
+        shown = {
+            segment: translation for piece in pieces
+            if (segment := piece.strip()) and (translation := self.translations.get(segment, self.suggestions.get(segment)))
+        }
+        self.output[start:end] = translate_pieces(pieces, shown)
+        self.input_text = input_text
+        self._index(range(start, start + len(pieces)))
+        # Segments elsewhere in the text may have gotten a translation
+        self.update({segment: self.translations[segment] for segment in self.indexes if segment in self.translations})
+
+    def update(self, completed):
+        for segment, translation in completed.items():
+            # Segments without a translation are requested again with the next edit
+            if translation:
+                self.translations[segment] = translation
+                for index in self.indexes.pop(segment, ()):
+                    self.output[index] = translate_pieces([self.pieces[index]], {segment: translation})[0]
+
+    def _index(self, indexes):
+        for index in indexes:
+            if (segment := self.pieces[index].strip()) and segment not in self.translations:
+                self.indexes.setdefault(segment, []).append(index)
 
 
 class GUIWindow(QMainWindow):
     # Above this number of characters in the input text will show a
     # message in the output text while the translation
-    # is happening
+    # is happening. Once the server latency has been measured,
+    # the expected translation time is used instead.
     SHOW_LOADING_THRESHOLD = 300
+    SHOW_LOADING_LATENCY = 1.0  # In seconds
+    # Used until the server latency has been measured, after that the
+    # delay follows the expected translation time, within the bounds
     TYPING_DELAY = 500  # In milliseconds
+    MIN_TYPING_DELAY = 50  # In milliseconds
+    MAX_TYPING_DELAY = 2000  # In milliseconds
+    LANGUAGES_TTL = 24 * 60 * 60  # In seconds
+    # Above this number of characters, the progress of a translation is
+    # shown at most every RENDER_INTERVAL instead of after every chunk
+    LARGE_DOCUMENT = 100_000
+    RENDER_INTERVAL = 200  # In milliseconds
+    CACHE_PRUNE_DELAY = 10 * 1000  # In milliseconds
+    # Once idle this long after a translation, the connections are opened,
+    # the translation memory of the pairs used most is loaded and the text
+    # is translated ahead for a swap and the other targets used most
+    WARM_UP_DELAY = 3 * 1000  # In milliseconds
+    WARM_UP_PAIRS = 3
+    # Longer texts aren't translated ahead, that is too much server time
+    # spent on a guess
+    PRETRANSLATE_MAX_CHARS = 20_000
 
     def __init__(self, data_dir: Path):
         super().__init__()
-        self.setWindowIcon(QIcon(str(data_dir / "icon.png")))  # Set the window icon
+        self.setWindowIcon(QIcon(ICON_PATH))  # Set the window icon
 
         # Set the tray icon attribute
         self.tray_icon = None
 
         self.loading = True
         self.orm = MiniORM(data_dir=data_dir)
+        self.translation_cache = TranslationCache(self.orm)
+        # Not needed to show the window, done once startup has settled
+        QTimer.singleShot(self.CACHE_PRUNE_DELAY, self.translation_cache.prune)
+        self.translation_memory = TranslationMemory(self.orm)
+        QTimer.singleShot(self.CACHE_PRUNE_DELAY, self.translation_memory.prune)
+        QTimer.singleShot(self.CACHE_PRUNE_DELAY, self.translation_memory.import_history)
+        # Built when they are opened
+        self.api_window = None
+        self.history_window = None
+        self.performance_window = None
 
 
         self.translation_timer = QTimer()
         self.translation_timer.setSingleShot(True)
         self.translation_timer.timeout.connect(self.translate)
 
-        # Threading
-        self.worker_thread = None
+        self.warm_up_timer = QTimer()
+        self.warm_up_timer.setSingleShot(True)
+        self.warm_up_timer.timeout.connect(self.warm_up)
+        # Background jobs started by the last warm up
+        self.warm_up_jobs = []
+        # (source language, target language, input text, translation) of the
+        # last translation shown
+        self.last_translation = None
 
-        # This is an instance of TranslationThread to run after
-        # the currently running TranslationThread finishes.
-        # None if there is no waiting TranslationThread.
-        self.queued_translation = None
+        # Threading
+        self.translation_scheduler = None
+        self.languages_thread = None
+        self.detection_thread = None
+        self.detecting = False
+        self.lt = None
+        # With Auto selected, the source language of the document is
+        # detected once and named in the requests
+        self.language_detector = LanguageDetector()
+        # One per API url, survives refreshing the languages
+        self.latency_estimators: dict[str, LatencyEstimator] = {}
+
+        # The request whose results go to the target pane, results of any
+        # other job are only cached
+        self.current_translation = None
+        # The last document translated, the next translation only redoes
+        # the pieces that changed since
+        self.document = None
+        self.registry = LanguageRegistry([])
 
         # Language selection
         self.left_language_combo = QComboBox()
         self.language_swap_button = QPushButton()
         self.language_swap_button.setIcon(QIcon().fromTheme("object-flip-horizontal"))
         self.right_language_combo = QComboBox()
-        self.left_language_combo.currentIndexChanged.connect(self.translate)
+        self.left_language_combo.currentIndexChanged.connect(self.source_language_changed)
         self.right_language_combo.currentIndexChanged.connect(self.translate)
         self.language_swap_button.clicked.connect(self.swap_languages_button_clicked)
         self.language_selection_layout = QHBoxLayout()
@@ -307,7 +489,6 @@ class GUIWindow(QMainWindow):
         self.language_selection_layout.addStretch()
         self.language_selection_layout.addWidget(self.right_language_combo)
         self.language_selection_layout.addStretch()
-        self.left_language_combo.currentIndexChanged.connect(self.save_language_selected)
         self.right_language_combo.currentIndexChanged.connect(self.save_language_selected)
 
         # Initialize the text edits
@@ -319,6 +500,26 @@ class GUIWindow(QMainWindow):
         self.right_textEdit = PlainPasteTextEdit()
         self.right_textEdit.setPlaceholderText("Target")
         self.right_textEdit.setReadOnly(True)
+        self.right_textEdit.setUndoRedoEnabled(False)
+        # Scrolling either pane shows the same segment in the other one
+        for edit, other in ((self.left_textEdit, self.right_textEdit), (self.right_textEdit, self.left_textEdit)):
+            # Only user scrolls, the value isn't updated yet when the action is triggered
+            edit.verticalScrollBar().actionTriggered.connect(
+                lambda _, edit=edit, other=other: QTimer.singleShot(0, partial(self.sync_scroll, edit, other))
+            )
+
+        # What the target pane currently shows, one entry per piece of the
+        # source text, so updates can replace only the pieces that changed
+        self.output_pieces: list[str] = []
+        # Their lengths in UTF-16 code units, the positions of the pane
+        self.output_lengths: list[int] = []
+        # The pieces of the source text they were translated from
+        self.source_pieces: list[str] = []
+        self.source_lengths = None
+
+        self.render_timer = QTimer()
+        self.render_timer.setSingleShot(True)
+        self.render_timer.timeout.connect(lambda: self.render_translation(self.current_translation))
 
         # Layout for text edits
         self.textEdit_layout = QHBoxLayout()
@@ -331,11 +532,14 @@ class GUIWindow(QMainWindow):
         self.manage_packages_action.triggered.connect(self.manage_packages_action_triggered)
 
         self.manage_packages_action = self.menu.addAction("Refresh Languages")
-        self.manage_packages_action.triggered.connect(self.load_languages)
+        self.manage_packages_action.triggered.connect(lambda: self.load_languages(force_refresh=True))
 
         self.history_action = self.menu.addAction("History")
         self.history_action.triggered.connect(self.history_action_triggered)
 
+        self.performance_action = self.menu.addAction("Performance")
+        self.performance_action.triggered.connect(self.performance_action_triggered)
+
         self.about_action = self.menu.addAction("About")
         self.about_action.triggered.connect(self.about_action_triggered)
         self.menu.setNativeMenuBar(False)
@@ -353,41 +557,110 @@ class GUIWindow(QMainWindow):
         # Set focus to the left_textEdit when the window opens
         self.left_textEdit.setFocus()
 
-        if url_key := self.orm.get_api_settings():
-            self.api_window = ApiKeyGui(self.orm)
-            self.api_window.url_edit.setText(url_key["api_url"])
-            self.api_window.url = url_key["api_url"]
-            self.api_window.api_key_edit.setText(url_key["api_key"])
-            self.api_window.api_key = url_key["api_key"]
+        if self.orm.get_api_endpoints():
             self.load_languages()
 
     def on_text_changed(self):
         """Called when the text in the left text edit changes."""
         # Reset the timer to start a new translation
-        self.translation_timer.start(self.TYPING_DELAY)
+        self.translation_timer.start(self.typing_delay(self.left_textEdit.document().characterCount()))
+        self.warm_up_timer.stop()
+        if not self.loading:
+            # Translating ahead an outdated text only costs server time, a
+            # swap replaces the text with the one translated ahead
+            self.cancel_warm_up()
+
+    def typing_delay(self, text_length):
+        """Debounce in milliseconds, shorter when the server answers quickly.
+
+        Waiting roughly as long as a request would take avoids sending
+        requests that the next keystroke makes obsolete.
+        """
+        estimate = self.translation_scheduler.estimate(text_length) if self.translation_scheduler else None
+        if estimate is None:
+            return self.TYPING_DELAY
+        return int(min(max(estimate * 1000, self.MIN_TYPING_DELAY), self.MAX_TYPING_DELAY))
+
+    def should_show_loading_message(self, text_length):
+        estimate = self.translation_scheduler.estimate(text_length)
+        if estimate is None:
+            return text_length > self.SHOW_LOADING_THRESHOLD
+        return estimate > self.SHOW_LOADING_LATENCY
+
+    def show_latency_stats(self):
+        stats = self.translation_scheduler.latency_estimator.stats()
+        if not stats["samples"]:
+            return
+        throughput = f"{stats['chars_per_second']:.0f} chars/s" if stats["chars_per_second"] else "n/a"
+        message = f"Server: {stats['overhead_ms']:.0f} ms + {stats['ms_per_char']:.2f} ms/char ({throughput}), " \
+                  f"typing delay {self.typing_delay(self.left_textEdit.document().characterCount())} ms"
+        endpoints = self.lt.stats()
+        if len(endpoints) > 1:
+            up = sum(endpoint["state"] != "open" for endpoint in endpoints)
+            message += f", {up}/{len(endpoints)} endpoints up"
+        self.statusBar().showMessage(message)
 
     def save_language_selected(self):  # DONE
-        left = self.left_language_combo.currentIndex()
-        right = self.right_language_combo.currentIndex()
-        if self.loading:
+        # Saved by code, combo indexes change with the server's language list
+        left = self.left_language_combo.currentData()
+        right = self.right_language_combo.currentData()
+        if self.loading or left is None or right is None:
             return
         saved = self.orm.get_language_settings()
-        if saved and int(saved["left_language"]) == left and int(saved["right_language"]) == right:
+        if saved and saved["left_language"] == left and saved["right_language"] == right:
             return
         self.orm.save_language_settings(left, right)
+        self.orm.record_language_pair(left, right)
+
+    def saved_language_codes(self):
+        """Returns the saved (source code, target code), None when unknown"""
+        saved = self.orm.get_language_settings()
+        if not saved:
+            return None, None
+        left, right = str(saved["left_language"]), str(saved["right_language"])
+        if left.isdigit() and right.isdigit():
+            # Older versions saved the combo indexes
+            sources = self.registry.sources()
+            left = sources[int(left)].code if int(left) < len(sources) else None
+            right = self.registry.languages[int(right)].code if int(right) < len(self.registry) else None
+        return left, right
+
+    def source_language_changed(self):
+        if self.loading:
+            return
+        self.update_target_languages()
+        self.save_language_selected()
+        self.translate()
+
+    def update_target_languages(self, preferred_code=None):
+        """Fills the target combo with the languages the source translates to"""
+        preferred_code = preferred_code or self.right_language_combo.currentData()
+        self.right_language_combo.blockSignals(True)
+        self.right_language_combo.clear()
+        for language in self.registry.targets(self.left_language_combo.currentData()):
+            self.right_language_combo.addItem(language.name, language.code)
+        self.right_language_combo.setCurrentIndex(max(self.right_language_combo.findData(preferred_code), 0))
+        self.right_language_combo.blockSignals(False)
 
     def swap_languages_button_clicked(self):  # DONE
-        left_index = self.left_language_combo.currentIndex()
+        left_code = self.left_language_combo.currentData()
         left_text = self.left_textEdit.toPlainText()
-        right_index = self.right_language_combo.currentIndex()
+        right_code = self.right_language_combo.currentData()
         right_text = self.right_textEdit.toPlainText()
-        if left_index == 0:
-            self.right_textEdit.setPlainText(f"Unable to swap Auto with {self.languages[right_index + 1].name}")
+        if left_code is None or right_code is None:
+            return
+        if left_code == "auto":
+            self.set_output_text(f"Unable to swap Auto with {self.registry.get(right_code).name}")
+            return
 
+        self.loading = True
         self.left_textEdit.setPlainText(right_text)
-        self.left_language_combo.setCurrentIndex(right_index + 1)
-        self.right_textEdit.setPlainText(left_text)
-        self.right_language_combo.setCurrentIndex(left_index - 1)
+        self.left_language_combo.setCurrentIndex(self.left_language_combo.findData(right_code))
+        self.update_target_languages(left_code)
+        self.set_output_text(left_text)
+        self.loading = False
+        self.save_language_selected()
+        self.translate()
 
     def about_action_triggered(self):
         about_message_box = QMessageBox()
@@ -401,158 +674,515 @@ class GUIWindow(QMainWindow):
         about_message_box.exec()
 
     def manage_packages_action_triggered(self):  # DONE
-        self.api_window = ApiKeyGui(self.orm)
+        if self.api_window is None:
+            self.api_window = ApiKeyGui(self.orm)
         url_key = self.orm.get_api_settings()
         if url_key:
-            self.api_window.url_edit.setText(url_key["api_url"])
-            self.api_window.api_key_edit.setText(url_key["api_key"])
+            self.api_window.load_settings(url_key, self.orm.get_api_endpoints())
+        elif self.api_window.endpoints_table.rowCount() == 0:
+            self.api_window.add_endpoint({"api_url": "", "api_key": "", "weight": 1})
         self.api_window.show()
 
-    def load_languages(self):  # DONE
-        self.lt = LibreTranslateAPI(self.api_window.url, self.api_window.api_key)
-        self.languages: list[LibretranslateLanguage] = []
-        self.languages.append(LibretranslateLanguage("auto", "Auto"))
-        self.languages.extend(libretranslate_languages_from_dict(self.lt.languages()))
-        language_names = tuple([language.name for language in self.languages])
+    def load_languages(self, force_refresh=False):  # DONE
+        """Shows the cached language list right away and refreshes it in the
+        background when it is older than LANGUAGES_TTL or force_refresh is set.
+        """
+        settings = self.orm.get_api_settings()
+        endpoints = self.orm.get_api_endpoints()
+        if not endpoints:
+            return
+        if self.lt is not None:
+            self.lt.stop()
+        # Requests go to whichever endpoint is expected to answer first
+        self.lt = EndpointPool(endpoints, max_concurrency=settings["max_concurrency"])
+        # Long lived, so the keep-alive connection of every worker is reused
+        # across requests
+        if self.translation_scheduler is not None:
+            self.translation_scheduler.shutdown()
+        self.current_translation = None
+        self.translation_scheduler = TranslationScheduler(
+            self.lt,
+            settings["max_concurrency"] * len(endpoints),
+            settings["chunk_size"],
+            self.latency_estimators.setdefault(self.lt.url, LatencyEstimator()),
+        )
+        self.translation_scheduler.send_job_progress.connect(self.handle_job_progress)
+        self.translation_scheduler.send_job_finished.connect(self.handle_job_finished)
+        self.translation_scheduler.send_job_failed.connect(self.handle_job_failed)
+
+        cached = self.orm.get_cached_languages(self.lt.url)
+        if cached:
+            self.set_languages(cached["languages"])
+            if not force_refresh and cached["age"] < self.LANGUAGES_TTL:
+                return
+
+        self.languages_thread = WorkerThread(partial(self.lt.fetch_languages, cached["etag"] if cached else None))
+        self.languages_thread.send_result.connect(partial(self.handle_languages_fetched, self.lt.url))
+        self.languages_thread.send_error.connect(self.handle_languages_error)
+        self.languages_thread.start()
+
+    def handle_languages_fetched(self, api_url, result):
+        languages, etag = result
+        if api_url != self.lt.url:
+            # The API settings changed while the request was running
+            return
+        if languages is None:
+            self.orm.touch_cached_languages(api_url)
+            return
+        self.orm.save_cached_languages(api_url, languages, etag)
+        if libretranslate_languages_from_dict(languages) != self.registry.languages:
+            self.set_languages(languages)
+
+    def handle_languages_error(self, error):
+        if len(self.registry) < 1:
+            self.set_output_text(f"Unable to load languages: {error}")
+
+    def set_languages(self, language_dicts):
+        # Repopulating the combos fires currentIndexChanged, which must
+        # not overwrite the saved selection
+        self.loading = True
+        self.registry = LanguageRegistry.from_dicts(language_dicts)
+        left_code, right_code = self.saved_language_codes()
         self.left_language_combo.clear()
-        self.left_language_combo.addItems(language_names)
-        self.right_language_combo.clear()
-        without_auto = tuple([language.name for language in self.languages if language.name != "Auto"])
-        self.right_language_combo.addItems(without_auto)
-        languages = self.orm.get_language_settings()
-        if languages:
-            self.left_language_combo.setCurrentIndex(int(languages["left_language"]))
-            self.right_language_combo.setCurrentIndex(int(languages["right_language"]))
-        else:
-            if len(language_names) > 0:
-                self.left_language_combo.setCurrentIndex(0)
-            if len(language_names) > 1:
-                self.right_language_combo.setCurrentIndex(0)
+        for language in self.registry.sources():
+            self.left_language_combo.addItem(language.name, language.code)
+        self.left_language_combo.setCurrentIndex(max(self.left_language_combo.findData(left_code), 0))
+        self.update_target_languages(right_code)
         self.loading = False
+        # Also replaces selections saved as indexes by older versions
+        self.save_language_selected()
         self.translate()
 
-    def update_right_textEdit(self, text):
+    def handle_job_progress(self, job, completed):
+        # Results of superseded jobs are still valid translations
+        for segment, translation in completed.items():
+            if translation:
+                self.translation_cache.put(job.source, job.target, segment, translation)
+        source, target = self.registry.get(job.source), self.registry.get(job.target)
+        if source not in (None, AUTO_LANGUAGE) and target is not None:
+            self.translation_memory.add(source.name, target.name, completed)
+        request = self.current_translation
+        if request is None or request.job is not job:
+            return
+        request.update(completed)
+        if len(request.input_text) <= self.LARGE_DOCUMENT:
+            self.render_translation(request)
+        elif not self.render_timer.isActive():
+            self.render_timer.start(self.RENDER_INTERVAL)
+
+    def render_translation(self, request):
+        if request is None:
+            return
+        # Segments still in flight are shown with their suggestion, or untranslated
+        self.show_output_pieces(request.output)
+
+    def handle_job_finished(self, job):
+        metrics.observe("translation_job", time.perf_counter() - job.submitted_at)
+        self.show_latency_stats()
+        request = self.current_translation
+        if request is None or request.job is not job:
+            return
+        if self.render_timer.isActive():
+            self.render_timer.stop()
+            self.render_translation(request)
+        self.current_translation = None
+        if not all(job.translations.values()):
+            self.set_output_text("No translation available for this language pair")
+            return
+        translation = request.output_text()
+        self.translation_done(request.input_language, request.output_language, request.input_text, translation)
+
+    def translation_done(self, input_language, output_language, input_text, translation):
+        self.orm.add_translation_history(input_language.name, output_language.name, input_text, translation)
+        self.last_translation = (input_language, output_language, input_text, translation)
+        self.warm_up_timer.start(self.WARM_UP_DELAY)
+
+    def warm_up(self):
+        """Readies what the next translation likely needs, while the user is idle"""
+        if self.translation_scheduler is None or self.last_translation is None:
+            return
+        if self.current_translation is not None:
+            # Not idle yet
+            self.warm_up_timer.start(self.WARM_UP_DELAY)
+            return
+        self.translation_scheduler.warm_up()
+        for source_code, target_code in self.orm.get_frequent_language_pairs(limit=self.WARM_UP_PAIRS):
+            source, target = self.registry.get(source_code), self.registry.get(target_code)
+            if source not in (None, AUTO_LANGUAGE) and target is not None:
+                self.translation_memory.preload(source.name, target.name)
+
+        input_language, output_language, input_text, translation = self.last_translation
+        source_code = self.left_language_combo.currentData()
+        if self.orm.get_setting("pretranslate", "1") != "1" or input_text != self.left_textEdit.toPlainText() \
+                or output_language.code != self.right_language_combo.currentData():
+            return
+        self.cancel_warm_up()
+        # Auto can't be swapped
+        if source_code != AUTO_LANGUAGE.code and self.registry.supports(output_language.code, input_language.code):
+            self.translation_memory.preload(output_language.name, input_language.name)
+            self.pretranslate(translation, output_language, input_language)
+        # Usage is counted for the selected source, Auto included, the
+        # translations are cached for the language it was detected as
+        for _, target_code in self.orm.get_frequent_language_pairs(source_code, self.WARM_UP_PAIRS + 1):
+            target = self.registry.get(target_code)
+            if target not in (None, output_language) and self.registry.supports(input_language.code, target_code):
+                self.pretranslate(input_text, input_language, target)
+
+    def pretranslate(self, text, source, target):
+        """Translates text in the background, the results are only cached"""
+        if len(text) > self.PRETRANSLATE_MAX_CHARS:
+            return
+        segments = unique_segments(split_segments(text))
+        known = self.translation_cache.get_many(source.code, target.code, segments)
+        missing = [segment for segment in segments if segment not in known]
+        if missing and source is not AUTO_LANGUAGE:
+            remembered, _ = self.translation_memory.lookup(source.name, target.name, missing, fuzzy=False)
+            for segment, translation in remembered.items():
+                self.translation_cache.put(source.code, target.code, segment, translation)
+            missing = [segment for segment in missing if segment not in remembered]
+        if missing:
+            self.warm_up_jobs.append(
+                self.translation_scheduler.submit(source.code, target.code, missing, PRIORITY_BACKGROUND)
+            )
+
+    def cancel_warm_up(self):
+        jobs, self.warm_up_jobs = self.warm_up_jobs, []
+        current = self.current_translation
+        for job in jobs:
+            # A translation asked for since may share the job
+            if current is None or current.job is not job:
+                self.translation_scheduler.cancel(job)
+
+    def set_output_text(self, text):
         self.right_textEdit.setPlainText(text)
+        self.output_pieces = [text]
+        self.output_lengths = [qt_text_length(text)]
+
+    @metrics.timed("gui_render")
+    def show_output_pieces(self, output_pieces):
+        """Replaces only the regions of the target pane that differ from output_pieces"""
+        old_pieces = self.output_pieces
+        if len(old_pieces) == len(output_pieces):
+            # Progress of the same text, every run of changed pieces is
+            # replaced on its own so the pieces between them are kept
+            regions = []
+            for index, (old_piece, piece) in enumerate(zip(old_pieces, output_pieces)):
+                if old_piece != piece:
+                    if regions and regions[-1][1] == index:
+                        regions[-1][1] = index + 1
+                    else:
+                        regions.append([index, index + 1])
+            regions = [(start, end, end) for start, end in regions]
+        else:
+            start = 0
+            while start < min(len(old_pieces), len(output_pieces)) and old_pieces[start] == output_pieces[start]:
+                start += 1
+            old_end = len(old_pieces)
+            new_end = len(output_pieces)
+            while old_end > start and new_end > start and old_pieces[old_end - 1] == output_pieces[new_end - 1]:
+                old_end -= 1
+                new_end -= 1
+            regions = [(start, old_end, new_end)] if (old_end, new_end) != (start, start) else []
+        self.output_pieces = list(output_pieces)
+        if not regions:
+            return
 
-    def handle_worker_thread_finished(self):  # DONE
-        self.worker_thread = None
-        if self.queued_translation is not None:
-            self.worker_thread = self.queued_translation
-            self.worker_thread.start()
-            self.queued_translation = None
+        # Qt positions count UTF-16 code units, not Python characters
+        positions = list(accumulate(self.output_lengths, initial=0))
+        cursor = QTextCursor(self.right_textEdit.document())
+        cursor.beginEditBlock()
+        # Last region first, the positions of the earlier ones don't move
+        for start, old_end, new_end in reversed(regions):
+            cursor.setPosition(positions[start])
+            cursor.setPosition(positions[old_end], QTextCursor.MoveMode.KeepAnchor)
+            cursor.insertText("".join(output_pieces[start:new_end]))
+            self.output_lengths[start:old_end] = [qt_text_length(piece) for piece in output_pieces[start:new_end]]
+        cursor.endEditBlock()
+
+    def sync_scroll(self, edit, other):
+        """Scrolls other to the segment shown at the top of edit"""
+        if len(self.source_pieces) != len(self.output_pieces):
+            # The target pane shows a message, or a translation of an older text
+            return
+        if self.source_lengths is None:
+            self.source_lengths = [qt_text_length(piece) for piece in self.source_pieces]
+        lengths, other_lengths = (self.source_lengths, self.output_lengths) if edit is self.left_textEdit \
+            else (self.output_lengths, self.source_lengths)
+        top = edit.cursorForPosition(QPoint(0, 0)).position()
+        index = bisect_right(list(accumulate(lengths)), top)
+        block = other.document().findBlock(sum(other_lengths[:index]))
+        # Set directly, actionTriggered isn't emitted so other doesn't sync back
+        other.verticalScrollBar().setValue(block.firstLineNumber())
+
+    def handle_job_failed(self, job, error):
+        request = self.current_translation
+        if request is None or request.job is not job:
+            return
+        self.current_translation = None
+        self.set_output_text(f"Translation failed: {error}")
 
     def translate(self):    # DONE
         """Try to translate based on languages selected."""
-        if len(self.languages) < 1:
+        with metrics.timer("gui_translate"):
+            self._translate()
+
+    def _translate(self):
+        if len(self.registry) < 1 or self.loading:
             return
         input_text = self.left_textEdit.toPlainText()
         if len(input_text) < 1:
             return
-        input_combo_value = self.left_language_combo.currentIndex()
-        input_language = self.languages[input_combo_value]
-        output_combo_value = self.right_language_combo.currentIndex()
-        output_language = self.languages[output_combo_value + 1]
-        if translation := self.lt.translate(input_text, input_language.code, output_language.code):
-            bound_translation_function = partial(lambda: translation)
-            show_loading_message = len(input_text) > self.SHOW_LOADING_THRESHOLD
-            new_worker_thread = TranslationThread(bound_translation_function, show_loading_message)
-            new_worker_thread.send_text_update.connect(self.update_right_textEdit)
-            new_worker_thread.finished.connect(self.handle_worker_thread_finished)
-            if self.worker_thread is None:
-                self.worker_thread = new_worker_thread
-                self.worker_thread.start()
-            else:
-                self.queued_translation = new_worker_thread
+        input_language = self.registry.get(self.left_language_combo.currentData())
+        output_language = self.registry.get(self.right_language_combo.currentData())
+        if input_language is None:
+            return
+        if output_language is None:
+            # Only pairs the server supports are offered, nothing to request
+            self.set_output_text(f"{input_language.name} can't be translated to any language on this server")
+            return
+        if input_language is AUTO_LANGUAGE:
+            input_language = self.detect_language(input_text, output_language)
+            if input_language is None:
+                # Translated again once the language is detected
+                return
+
+        # Only segments that changed since they were last translated
+        # need to go to the server, and with large documents only the
+        # pieces around the edit are split and looked up again
+        document = self.document
+        if document is not None and document.input_language is input_language \
+                and document.output_language is output_language:
+            start, end, pieces = document.splice(input_text)
+            if start == 0 and end == len(document.pieces):
+                # A new text, the translations of the old one aren't kept
+                document = None
+        else:
+            document = None
+            pieces = split_segments(input_text)
+        segments = unique_segments(pieces)
+        if document is not None:
+            segments = [segment for segment in segments if segment not in document.translations]
+        known_translations = self.translation_cache.get_many(input_language.code, output_language.code, segments)
+        missing_segments = [segment for segment in segments if segment not in known_translations]
+        suggestions = {}
+        if missing_segments and input_language is not AUTO_LANGUAGE:
+            remembered, suggestions = self.translation_memory.lookup(
+                input_language.name, output_language.name, missing_segments
+            )
+            for segment, translation in remembered.items():
+                self.translation_cache.put(input_language.code, output_language.code, segment, translation)
+            known_translations.update(remembered)
+            if remembered or suggestions:
+                self.statusBar().showMessage(
+                    f"Translation memory: {len(remembered)} segments reused, {len(suggestions)} suggested"
+                )
+        if document is None:
+            document = TranslationRequest(
+                None, input_language, output_language, input_text, pieces, known_translations, suggestions
+            )
+            self.document = document
         else:
-            Logger.error("No translation available for this language pair")
-            self.right_textEdit.setPlainText("No translation available for this language pair")
-        # Save History
-        if translation:
-            self.orm.add_translation_history(input_language.name, output_language.name, input_text, translation)
+            document.edit(input_text, start, end, pieces, known_translations, suggestions)
+        self.source_pieces = document.pieces
+        self.source_lengths = None
+        missing_segments = document.missing
+
+        previous_job = self.current_translation.job if self.current_translation else None
+        if not missing_segments:
+            self.current_translation = None
+            document.job = None
+            if previous_job is not None:
+                self.translation_scheduler.cancel(previous_job)
+            self.show_output_pieces(document.output)
+            self.translation_done(input_language, output_language, input_text, document.output_text())
+            return
+
+        # Identical pending work is shared instead of queued twice
+        job = self.translation_scheduler.submit(input_language.code, output_language.code, missing_segments)
+        if previous_job is not None and previous_job is not job:
+            self.translation_scheduler.cancel(previous_job)
+        document.job = job
+        self.current_translation = document
+        if job is previous_job or suggestions:
+            self.show_output_pieces(document.output)
+        elif self.should_show_loading_message(sum(map(len, missing_segments))):
+            self.set_output_text("Loading...")
+
+    def detect_language(self, text, output_language):
+        """The source language of text for the Auto source.
+
+        Returns None while the server detects it, or AUTO_LANGUAGE when
+        it can't be told, the server then detects it with every request.
+        """
+        detector = self.language_detector
+        code = detector.cached(text) or detector.guess(text, set(self.registry.by_code))
+        if code is None:
+            if len(text) <= detector.SHORT_TEXT:
+                code = AUTO_LANGUAGE.code
+            else:
+                self.start_language_detection(text)
+                return None
+        language = self.registry.get(code)
+        if language is None or not self.registry.supports(code, output_language.code):
+            language = AUTO_LANGUAGE
+        self.left_language_combo.setItemText(
+            0, AUTO_LANGUAGE.name if language is AUTO_LANGUAGE else f"{AUTO_LANGUAGE.name} ({language.name})"
+        )
+        return language
+
+    def start_language_detection(self, text):
+        if self.detecting:
+            # The text is translated again when the running detection ends
+            return
+        self.detecting = True
+        self.detection_thread = WorkerThread(partial(self.lt.detect, self.language_detector.sample(text)))
+        self.detection_thread.send_result.connect(partial(self.handle_language_detected, text))
+        self.detection_thread.send_error.connect(lambda _: self.handle_language_detected(text, None))
+        self.detection_thread.start()
+
+    def handle_language_detected(self, text, detections):
+        self.detecting = False
+        code = self.language_detector.from_detections(detections)
+        self.language_detector.remember(text, code or AUTO_LANGUAGE.code)
+        self.translate()
 
     def history_action_triggered(self):
-        history = self.orm.get_translation_history()
-        self.history_window = HistoryWindow(history, self.orm)
+        self.orm.flush_translation_history()
+        from history_window import HistoryWindow
+        self.history_window = HistoryWindow(self.orm)
         self.history_window.show()
 
+    def performance_action_triggered(self):
+        if self.performance_window is None:
+            from performance_window import PerformanceWindow
+            self.performance_window = PerformanceWindow(lambda: self.lt, self.translation_cache, self.translation_memory)
+        self.performance_window.show()
+        self.performance_window.raise_()
 
-class GUIApplication:
-    def __init__(self):
-        system = platform.system()
-        if system == "Linux" or system != "Windows":
-            data_dir = os.path.expanduser("~/.local/share/LibreTranslateGUI/")
-        else:
-            data_dir = os.path.join(os.getenv("APPDATA"), "LibreTranslateGUI")
-        if not os.path.exists(data_dir):
-            os.makedirs(data_dir)
 
-        data_dir = Path(data_dir)
-        self.guarantee_icon(data_dir)
+class GUIApplication:
+    def __init__(self, text="", single_instance=True):
+        """Args:
+        text (str): Shown in the source pane
+        single_instance (bool): Later launches are handed to this one
+        """
+        data_dir = Path(default_data_dir())
 
         self.app = QApplication([])
+        self.instance_server = None
+        # Created by the first forwarded translation
+        self.forwarded_translations = None
+        if single_instance:
+            self.instance_server = InstanceServer(server_name(str(data_dir)))
+            self.instance_server.request_received.connect(self.handle_instance_request)
 
-        # Icon
-        icon_path = Path(data_dir) / "icon.png"
-        qicon = QIcon(str(icon_path))
+        # Icon, bundled as a Qt resource
+        qicon = QIcon(ICON_PATH)
 
         self.main_window = GUIWindow(data_dir=data_dir)
         self.main_window.resize(650, 315)
         self.main_window.setWindowIcon(qicon)
         self.app.setWindowIcon(qicon)
         self.app.setDesktopFileName("LibreTranslateGUI")
+        self.tray_icon = None
+        # Created when quick translate is first turned on
+        self.quick_translator = None
+        self.position = None
+        if text:
+            self.main_window.left_textEdit.setPlainText(text)
+        self.main_window.show()
+        # The tray isn't needed to show the window, create it right after
+        QTimer.singleShot(0, self.create_tray)
 
+    def run(self):
+        self.app.exec()
+        if self.forwarded_translations is not None:
+            self.forwarded_translations.shutdown()
+        # Commits the history entries still queued
+        self.main_window.orm.close()
 
-        # Create the tray
+    def create_tray(self):
         self.tray_icon = QSystemTrayIcon()
-        self.tray_icon.setIcon(qicon)
+        self.tray_icon.setIcon(self.app.windowIcon())
         self.tray_icon.setVisible(True)
 
         # Create Show action
         menu = QMenu()
-        action = QAction("Show")
+        action = QAction("Show", menu)
         action.triggered.connect(self.show)
         menu.addAction(action)
 
         # Create Hide action
-        hide_action = QAction("Hide")
+        hide_action = QAction("Hide", menu)
         hide_action.triggered.connect(self.hide)
         menu.addAction(hide_action)
 
+        # Translates what is copied, without showing the window
+        quick_translate_action = QAction("Quick Translate Clipboard", menu)
+        quick_translate_action.setCheckable(True)
+        quick_translate_action.toggled.connect(self.set_quick_translate)
+        quick_translate_action.setChecked(self.main_window.orm.get_setting("quick_translate") == "1")
+        menu.addAction(quick_translate_action)
+
         # Add a Quit option to the menu.
-        quit_action = QAction("Quit")
+        quit_action = QAction("Quit", menu)
         quit_action.triggered.connect(self.app.quit)
         menu.addAction(quit_action)
 
         # Add the menu to the tray
+        self.tray_menu = menu
         self.tray_icon.setContextMenu(menu)
 
         # Set the tray icon attribute in the main window
         self.main_window.tray_icon = self.tray_icon
 
-        self.main_window.show()
-        self.app.exec()
+    def set_quick_translate(self, enabled):
+        if self.quick_translator is None:
+            if not enabled:
+                return
+            from quick_translate import ClipboardTranslator
+            self.quick_translator = ClipboardTranslator(self.main_window)
+            self.quick_translator.open_requested.connect(self.open_in_window)
+        self.quick_translator.set_enabled(enabled)
+        self.main_window.orm.save_setting("quick_translate", int(enabled))
+
+    def open_in_window(self, text):
+        self.main_window.left_textEdit.setPlainText(text)
+        self.show()
+        self.main_window.activateWindow()
+
+    def handle_instance_request(self, message, reply):
+        command = message.get("command")
+        if command == "show":
+            if message.get("text"):
+                self.open_in_window(message["text"])
+            else:
+                self.show()
+                self.main_window.raise_()
+                self.main_window.activateWindow()
+            reply({"status": 0})
+        elif command == "translate":
+            if self.forwarded_translations is None:
+                self.forwarded_translations = ForwardedTranslations(self.main_window)
+            self.forwarded_translations.submit(message, reply)
+        else:
+            reply({"status": 1, "stdout": "", "stderr": f"Unknown command: {command}\n"})
 
     def show(self):
         self.main_window.show()
-        self.main_window.move(self.position)  # Dont work on wayland.
+        if self.position is not None:
+            self.main_window.move(self.position)  # Dont work on wayland.
 
     def hide(self):
         self.position = self.main_window.pos()
         self.main_window.hide()
 
-    def guarantee_icon(self, data_path: Path):
-        if not (data_path / "icon.png").exists():
-            ICON_URL="https://raw.githubusercontent.com/MrChuw/TranslateGui/refs/heads/main/img/icon.png"
-            urllib.request.urlretrieve(ICON_URL, data_path / "icon.png")
-        if not (data_path / "icon.png").exists():
-            Logger.error("Unable to download icon from GitHub")
-            exit(1)
-
-
 
 def main():
-    app = GUIApplication()
+    args = parse_launch_args(sys.argv[1:])
+    GUIApplication(" ".join(args.text), single_instance=not args.new_instance).run()
 
 
-main()
+if __name__ == "__main__":
+    main()
 
@@ -0,0 +1,222 @@
+"""Translation memory built from the history, ex:
+
+    memory = TranslationMemory(orm)
+    exact, suggestions = memory.lookup("English", "German", segments)
+
+Segments translated before, give or take whitespace, are served without
+asking the server. Segments similar to one translated before get its
+translation as a suggestion, shown while the server translates them.
+Similarity is the Dice coefficient of the character trigrams.
+"""
+import math
+import threading
+import time
+from array import array
+from collections import Counter
+
+from orm import MiniORM
+from segments import normalize_segment
+
+
+def trigrams(segment):
+    padded = f"  {normalize_segment(segment).lower()} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def similarity(first, second):
+    """Dice coefficient of two trigram sets, 1 when identical"""
+    if not first or not second:
+        return 0.0
+    return 2 * len(first & second) / (len(first) + len(second))
+
+
+class MemoryIndex:
+    """The segments of one language pair, by normalized text and by trigram"""
+
+    def __init__(self, rows):
+        self.ids = []
+        self.segments = []
+        self.translations = []
+        self.sizes = array("I")
+        self.exact: dict[str, int] = {}
+        self.postings: dict[str, array] = {}
+        for entry_id, segment, translation in rows:
+            self.add(entry_id, segment, translation)
+
+    def __len__(self):
+        return len(self.segments)
+
+    def add(self, entry_id, segment, translation):
+        key = normalize_segment(segment)
+        if key in self.exact:
+            self.translations[self.exact[key]] = translation
+            return
+        index = len(self.segments)
+        self.exact[key] = index
+        self.ids.append(entry_id)
+        self.segments.append(key)
+        self.translations.append(translation)
+        grams = trigrams(key)
+        self.sizes.append(len(grams))
+        for gram in grams:
+            self.postings.setdefault(gram, array("I")).append(index)
+
+    def get(self, segment):
+        """(id, translation) of segment, None when it wasn't translated before"""
+        index = self.exact.get(normalize_segment(segment))
+        return None if index is None else (self.ids[index], self.translations[index])
+
+    def closest(self, segment, threshold, max_candidates):
+        """(translation, similarity) of the most similar segment at or above
+        threshold, None when there is none.
+
+        Any such segment shares at least threshold / (2 - threshold) of the
+        trigrams of segment, so it has one of the len - required + 1 rarest,
+        and only the segments listed under those are compared.
+        """
+        grams = trigrams(segment)
+        required = math.ceil(threshold * len(grams) / (2 - threshold))
+        rarest = sorted(grams, key=lambda gram: len(self.postings.get(gram, ())))[:len(grams) - required + 1]
+        min_size = len(grams) * threshold / (2 - threshold)
+        max_size = len(grams) * (2 - threshold) / threshold
+        candidates = Counter()
+        for gram in rarest:
+            candidates.update(self.postings.get(gram, ()))
+        best = None
+        for index, _ in candidates.most_common(max_candidates):
+            if not min_size <= self.sizes[index] <= max_size:
+                continue
+            score = similarity(grams, trigrams(self.segments[index]))
+            if score >= threshold and (best is None or score > best[1]):
+                best = (self.translations[index], score)
+        return best
+
+
+class TranslationMemory:
+    """Exact and fuzzy matches of segments translated before, per language
+    pair, kept in the translation_memory table.
+
+    The index of a pair is loaded on a reader thread the first time it is
+    looked up; until then exact matches are read from the database and
+    there are no suggestions. Safe to share between threads.
+    """
+    MAX_ROWS = 50000
+    MAX_INDEXED = 20000  # Per language pair
+    # Longer segments rarely come back, and only once edited
+    MAX_SEGMENT_LENGTH = 1000
+    FUZZY_THRESHOLD = 0.75
+    MIN_FUZZY_LENGTH = 20
+    MAX_CANDIDATES = 50
+    # Fuzzy matching stops after this long per lookup, the remaining
+    # segments get no suggestion
+    FUZZY_BUDGET = 0.02  # In seconds
+
+    def __init__(self, orm: MiniORM):
+        self.orm = orm
+        self.indexes: dict[tuple[str, str], MemoryIndex] = {}
+        self.loading = set()
+        self.generation = orm.memory_generation
+        self.hits = 0
+        self.misses = 0
+        self.suggested = 0
+        self.lock = threading.RLock()
+
+    def lookup(self, source_language, target_language, segments, fuzzy=True):
+        """Returns ({segment: translation} of the segments translated before,
+        {segment: translation} suggested for the similar ones). Without
+        fuzzy, only the exact matches are read and no index is loaded.
+        """
+        index = self._index(source_language, target_language) if fuzzy else None
+        if index is None:
+            rows = self.orm.get_translation_memory_matches(source_language, target_language, segments)
+            matches = {segment: rows[key] for segment in segments if (key := normalize_segment(segment)) in rows}
+        else:
+            with self.lock:
+                matches = {segment: match for segment in segments if (match := index.get(segment))}
+        if ids := [entry_id for entry_id, _ in matches.values() if entry_id is not None]:
+            self.orm.touch_translation_memory(ids)
+        found = {segment: translation for segment, (_, translation) in matches.items()}
+
+        suggestions = {}
+        if index is not None:
+            deadline = time.perf_counter() + self.FUZZY_BUDGET
+            with self.lock:
+                for segment in segments:
+                    if segment in found or len(segment) < self.MIN_FUZZY_LENGTH:
+                        continue
+                    if time.perf_counter() > deadline:
+                        break
+                    if match := index.closest(segment, self.FUZZY_THRESHOLD, self.MAX_CANDIDATES):
+                        suggestions[segment] = match[0]
+        with self.lock:
+            self.hits += len(found)
+            self.misses += len(segments) - len(found)
+            self.suggested += len(suggestions)
+        return found, suggestions
+
+    def add(self, source_language, target_language, translations):
+        """Remembers {segment: translation} translated by the server"""
+        entries = [
+            (source_language, target_language, segment, translation)
+            for segment, translation in translations.items()
+            if translation and len(segment) <= self.MAX_SEGMENT_LENGTH
+        ]
+        if not entries:
+            return
+        self.orm.save_translation_memory(entries)
+        with self.lock:
+            index = self.indexes.get((source_language, target_language))
+            if index is not None:
+                for _, _, segment, translation in entries:
+                    # The id is only known once written, last_used isn't
+                    # updated for these until the index is reloaded
+                    index.add(None, segment, translation)
+
+    def preload(self, source_language, target_language):
+        """Starts loading the index of a language pair, ex. once it is selected"""
+        self._index(source_language, target_language)
+
+    def import_history(self):
+        """Fills the memory from the history once, see MiniORM.import_history_into_memory"""
+        return self.orm.import_history_into_memory(self.MAX_SEGMENT_LENGTH)
+
+    def prune(self):
+        self.orm.prune_translation_memory(self.MAX_ROWS)
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "suggested": self.suggested,
+                "indexed": sum(map(len, self.indexes.values())),
+            }
+
+    def _index(self, source_language, target_language):
+        key = (source_language, target_language)
+        with self.lock:
+            if self.generation != self.orm.memory_generation:
+                # Cleared, pruned or imported since the indexes were loaded
+                self.generation = self.orm.memory_generation
+                self.indexes.clear()
+                self.loading.clear()
+            if key in self.indexes or key in self.loading:
+                return self.indexes.get(key)
+            self.loading.add(key)
+            generation = self.generation
+        future = self.orm.submit_read(self.orm.get_translation_memory, *key, self.MAX_INDEXED)
+        future.add_done_callback(lambda future: self._loaded(key, generation, future))
+        return None
+
+    def _loaded(self, key, generation, future):
+        if future.exception() is not None:
+            with self.lock:
+                self.loading.discard(key)
+            return
+        index = MemoryIndex(future.result())
+        with self.lock:
+            if generation == self.generation and key in self.loading:
+                self.loading.discard(key)
+                self.indexes[key] = index
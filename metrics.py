@@ -0,0 +1,125 @@
+"""Timings of the hot paths, ex:
+
+    with metrics.timer("translation_request"):
+        ...
+    metrics.observe("db_commit", seconds)
+    print(metrics.to_prometheus())
+
+Every metric keeps its most recent samples to compute the percentiles,
+plus a count and a sum of all of them, the way a Prometheus summary does.
+"""
+import functools
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+class Summary:
+    """Durations of one metric, percentiles are computed over the last samples"""
+
+    def __init__(self, window=1000):
+        self.samples = deque(maxlen=window)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        self.samples.append(seconds)
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+
+    def snapshot(self):
+        samples = sorted(self.samples)
+        quantiles = {
+            quantile: samples[min(int(quantile * len(samples)), len(samples) - 1)] if samples else None
+            for quantile in QUANTILES
+        }
+        return {"count": self.count, "sum": self.sum, "max": self.max, "quantiles": quantiles}
+
+
+class Metrics:
+    """Thread safe registry of Summary per metric name and labels"""
+    PREFIX = "translategui_"
+
+    def __init__(self):
+        self.summaries: dict[tuple, Summary] = {}
+        self.lock = threading.Lock()
+
+    def observe(self, name, seconds, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            if (summary := self.summaries.get(key)) is None:
+                summary = self.summaries[key] = Summary()
+            summary.observe(seconds)
+
+    @contextmanager
+    def timer(self, name, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def timed(self, name, **labels):
+        """Decorator timing every call of a function"""
+        def decorator(function):
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                with self.timer(name, **labels):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def reset(self):
+        with self.lock:
+            self.summaries.clear()
+
+    def snapshot(self):
+        """[{"name", "labels", "count", "sum", "max", "quantiles"}] sorted by name"""
+        with self.lock:
+            items = [(name, labels, summary.snapshot()) for (name, labels), summary in self.summaries.items()]
+        return [
+            {"name": name, "labels": dict(labels)} | snapshot
+            for name, labels, snapshot in sorted(items, key=lambda item: (item[0], item[1]))
+        ]
+
+    def to_json(self):
+        return json.dumps([
+            metric | {"quantiles": {str(quantile): value for quantile, value in metric["quantiles"].items()}}
+            for metric in self.snapshot()
+        ], indent=2)
+
+    def to_prometheus(self):
+        """Prometheus text exposition format, every metric as a summary in seconds"""
+        lines = []
+        typed = set()
+        for metric in self.snapshot():
+            name = f"{self.PREFIX}{metric['name']}_seconds"
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {name} summary")
+            for quantile, value in metric["quantiles"].items():
+                if value is not None:
+                    lines.append(f"{name}{self._labels(metric['labels'] | {'quantile': quantile})} {value:.6f}")
+            lines.append(f"{name}_sum{self._labels(metric['labels'])} {metric['sum']:.6f}")
+            lines.append(f"{name}_count{self._labels(metric['labels'])} {metric['count']}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _labels(labels):
+        if not labels:
+            return ""
+        return "{" + ",".join(f'{key}="{escape_label(value)}"' for key, value in labels.items()) + "}"
+
+
+def escape_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# Shared by the whole application
+metrics = Metrics()
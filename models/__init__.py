@@ -1 +1,7 @@
-from .languages import LibretranslateLanguage, libretranslate_languages_from_dict, libretranslate_languages_to_dict
\ No newline at end of file
+from .languages import (
+    LibretranslateLanguage,
+    LanguageRegistry,
+    AUTO_LANGUAGE,
+    libretranslate_languages_from_dict,
+    libretranslate_languages_to_dict,
+)
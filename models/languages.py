@@ -1,37 +1,12 @@
 from dataclasses import dataclass
-from typing import Optional, List, Any, TypeVar, Callable, Type, cast
+from typing import Optional, List, Any
 
 
-T = TypeVar("T")
-
-
-def from_str(x: Any) -> str:
-    assert isinstance(x, str)
-    return x
-
-
-def from_none(x: Any) -> Any:
-    assert x is None
-    return x
-
-
-def from_union(fs, x):
-    for f in fs:
-        try:
-            return f(x)
-        except:
-            pass
-    assert False
-
-
-def from_list(f: Callable[[Any], T], x: Any) -> List[T]:
-    assert isinstance(x, list)
-    return [f(y) for y in x]
-
-
-def to_class(c: Type[T], x: Any) -> dict:
-    assert isinstance(x, c)
-    return cast(Any, x).to_dict()
+def _optional_str(obj: dict, key: str) -> Optional[str]:
+    value = obj.get(key)
+    if value is not None and not isinstance(value, str):
+        raise ValueError(f"language {key} must be a string, got {type(value).__name__}")
+    return value
 
 
 @dataclass
@@ -42,26 +17,79 @@ class LibretranslateLanguage:
 
     @staticmethod
     def from_dict(obj: Any) -> 'LibretranslateLanguage':
-        assert isinstance(obj, dict)
-        code = from_union([from_str, from_none], obj.get("code"))
-        name = from_union([from_str, from_none], obj.get("name"))
-        targets = from_union([lambda x: from_list(from_str, x), from_none], obj.get("targets"))
-        return LibretranslateLanguage(code, name, targets)
+        if not isinstance(obj, dict):
+            raise ValueError(f"language must be an object, got {type(obj).__name__}")
+        targets = obj.get("targets")
+        if targets is not None and (
+            not isinstance(targets, list) or not all(isinstance(target, str) for target in targets)
+        ):
+            raise ValueError("language targets must be a list of strings")
+        return LibretranslateLanguage(_optional_str(obj, "code"), _optional_str(obj, "name"), targets)
 
     def to_dict(self) -> dict:
         result: dict = {}
         if self.code is not None:
-            result["code"] = from_union([from_str, from_none], self.code)
+            result["code"] = self.code
         if self.name is not None:
-            result["name"] = from_union([from_str, from_none], self.name)
+            result["name"] = self.name
         if self.targets is not None:
-            result["targets"] = from_union([lambda x: from_list(from_str, x), from_none], self.targets)
+            result["targets"] = list(self.targets)
         return result
 
 
+AUTO_LANGUAGE = LibretranslateLanguage("auto", "Auto")
+
+
+class LanguageRegistry:
+    """The languages of a server, indexed by code and name.
+
+    targets() only returns the languages a source can be translated to, so
+    impossible pairs are never offered nor sent. Servers that don't list
+    targets are assumed to translate every pair.
+    """
+
+    def __init__(self, languages: List[LibretranslateLanguage]):
+        self.languages = list(languages)
+        self.by_code = {language.code: language for language in self.languages}
+        self.by_name = {language.name: language for language in self.languages}
+        self.target_codes = {
+            language.code: None if language.targets is None else frozenset(language.targets)
+            for language in self.languages
+        }
+
+    @classmethod
+    def from_dicts(cls, language_dicts: Any) -> 'LanguageRegistry':
+        return cls(libretranslate_languages_from_dict(language_dicts))
+
+    def __len__(self):
+        return len(self.languages)
+
+    def get(self, code: str) -> Optional[LibretranslateLanguage]:
+        return AUTO_LANGUAGE if code == AUTO_LANGUAGE.code else self.by_code.get(code)
+
+    def sources(self) -> List[LibretranslateLanguage]:
+        return [AUTO_LANGUAGE] + self.languages
+
+    def targets(self, source_code: str) -> List[LibretranslateLanguage]:
+        """Languages source_code translates to, every language for auto"""
+        return [language for language in self.languages if self.supports(source_code, language.code)]
+
+    def supports(self, source_code: str, target_code: str) -> bool:
+        if target_code not in self.by_code or source_code == target_code:
+            return False
+        if source_code == AUTO_LANGUAGE.code:
+            return True
+        if source_code not in self.by_code:
+            return False
+        targets = self.target_codes[source_code]
+        return targets is None or target_code in targets
+
+
 def libretranslate_languages_from_dict(s: Any) -> List[LibretranslateLanguage]:
-    return from_list(LibretranslateLanguage.from_dict, s)
+    if not isinstance(s, list):
+        raise ValueError(f"languages must be a list, got {type(s).__name__}")
+    return [LibretranslateLanguage.from_dict(obj) for obj in s]
 
 
 def libretranslate_languages_to_dict(x: List[LibretranslateLanguage]) -> Any:
-    return from_list(lambda x: to_class(LibretranslateLanguage, x), x)
+    return [language.to_dict() for language in x]
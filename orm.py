@@ -1,29 +1,378 @@
+import hashlib
+import json
+import queue
 import sqlite3
 import os
+import platform
+import sys
+import threading
+import time
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from metrics import metrics
+from segments import align_segments, common_prefix_length, common_suffix_length, normalize_segment
+
+
+# History texts longer than this many bytes are stored zlib compressed
+COMPRESS_THRESHOLD = 1024
+# History limits used until the user sets them, 0 is unlimited
+HISTORY_RETENTION_DEFAULTS = {
+    "history_max_rows": 10000,
+    "history_max_age_days": 0,
+    "history_max_bytes": 100 * 1024 * 1024,
+}
+
+
+def compress_text(text):
+    data = text.encode()
+    return zlib.compress(data) if len(data) > COMPRESS_THRESHOLD else text
+
+
+def decompress_text(value):
+    return zlib.decompress(value).decode() if isinstance(value, bytes) else value
+
+
+def history_hash(source_language, target_language, input_text):
+    return hashlib.sha1(f"{source_language}\0{target_language}\0{input_text}".encode()).hexdigest()
+
+
+def default_data_dir():
+    """Where settings.db is kept, created if missing"""
+    system = platform.system()
+    if system == "Linux" or system != "Windows":
+        data_dir = os.path.expanduser("~/.local/share/LibreTranslateGUI/")
+    else:
+        data_dir = os.path.join(os.getenv("APPDATA"), "LibreTranslateGUI")
+    if not os.path.exists(data_dir):
+        os.makedirs(data_dir)
+    return data_dir
+
+
+def connect(db_path):
+    # Each connection is only used by the thread that opened it, but may be
+    # closed from another one by MiniORM.close
+    connection = sqlite3.connect(db_path, timeout=5, check_same_thread=False, cached_statements=256)
+    # Used by the search triggers and the search without them, which need
+    # the uncompressed text
+    connection.create_function("history_text", 1, decompress_text, deterministic=True)
+    # WAL lets readers and the history writer work at the same time, and
+    # with synchronous=NORMAL a commit no longer waits for an fsync
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.execute("PRAGMA temp_store=MEMORY")
+    connection.execute("PRAGMA cache_size=-8000")
+    return connection
+
+
+def is_draft(previous_text, text):
+    """True when text looks like an edit of previous_text rather than a new text"""
+    shortest = min(len(previous_text), len(text))
+    if shortest == 0:
+        return False
+    prefix = common_prefix_length(previous_text, text)
+    if prefix == shortest:
+        return True
+    # The suffix can't overlap the prefix
+    suffix = min(common_suffix_length(previous_text, text), shortest - prefix)
+    return prefix + suffix >= shortest * 0.8
+
+
+class DatabaseWriter(threading.Thread):
+    """The only thread that writes to the database, on its own connection.
+
+    Writes are functions taking the connection, queued with submit. Deferred
+    writes (history, cache) are committed together every FLUSH_INTERVAL
+    seconds; any other write commits everything queued so far right away.
+
+    A history entry that is a draft of the previous one, written within
+    DRAFT_WINDOW seconds for the same language pair, replaces it instead of
+    adding a row, so typing doesn't leave every partial sentence in the
+    history.
+
+    Errors of a batch fail its Futures and errors of the maintenance are
+    printed, the writer keeps running either way.
+    """
+    FLUSH_INTERVAL = 2.0  # In seconds
+    DRAFT_WINDOW = 30.0  # In seconds
+    # Retention is enforced and free pages are released at most this often,
+    # deleting at most RETENTION_BATCH rows each time
+    MAINTENANCE_INTERVAL = 300.0  # In seconds
+    RETENTION_BATCH = 500
+
+    def __init__(self, db_path):
+        super().__init__(name="database-writer", daemon=True)
+        self.db_path = db_path
+        self.writes = queue.Queue()
+        # (id, source_language, target_language, input_text, time) of the last written row
+        self.last_entry = None
+        self.last_maintenance = None
+        # Set when the database still needs the full VACUUM enabling
+        # incremental vacuum, run once nothing is queued
+        self.needs_vacuum = False
+        self.stopping = False
+        self.lock = threading.Lock()
+
+    def submit(self, function, *args, deferred=False):
+        """Queues function(connection, *args), returns a Future of its result
+        that is set once the write is committed. Raises RuntimeError once
+        stopping, the write would never run.
+        """
+        future = Future()
+        with self.lock:
+            if self.stopping:
+                raise RuntimeError("The database writer is stopped")
+            self.writes.put((function, args, deferred, future))
+        return future
+
+    def add_history(self, source_language, target_language, input_text, output_text):
+        return self.submit(
+            self._write_history, time.monotonic(), source_language, target_language, input_text, output_text,
+            deferred=True
+        )
+
+    def clear_history(self):
+        return self.submit(self._clear_history)
+
+    def flush(self):
+        """Blocks until everything queued so far is committed"""
+        self.submit(lambda connection: None).result()
+
+    def stop(self):
+        with self.lock:
+            self.stopping = True
+            self.writes.put(None)
+        self.join()
+
+    def run(self):
+        connection = connect(self.db_path)
+        running = True
+        self.needs_vacuum = connection.execute("PRAGMA auto_vacuum").fetchone()[0] != 2
+        # Due right after the first batch, so it doesn't delay it
+        self.last_maintenance = time.monotonic() - self.MAINTENANCE_INTERVAL
+        while running:
+            batch = [self.writes.get()]
+            deadline = time.monotonic() + self.FLUSH_INTERVAL
+            while batch[-1] is not None and batch[-1][2]:
+                try:
+                    batch.append(self.writes.get(timeout=max(deadline - time.monotonic(), 0)))
+                except queue.Empty:
+                    break
+            results = []
+            started = time.perf_counter()
+            try:
+                with connection:
+                    for write in batch:
+                        if write is None:
+                            running = False
+                            continue
+                        function, args, _, future = write
+                        try:
+                            results.append((future, function(connection, *args), None))
+                        except Exception as e:
+                            results.append((future, None, e))
+            except sqlite3.Error as e:
+                # The commit failed, nothing of the batch was written
+                results = [(future, None, e) for future, _, _ in results]
+                self.last_entry = None
+            metrics.observe("db_commit", time.perf_counter() - started)
+            # Only report writes as done once they are committed
+            for future, result, error in results:
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(result)
+            if time.monotonic() - self.last_maintenance > self.MAINTENANCE_INTERVAL:
+                self._maintain(connection)
+            # Rewrites the whole database, not while writes wait or on stop
+            if running and self.needs_vacuum and self.writes.empty():
+                self._vacuum(connection)
+        connection.close()
+
+    @metrics.timed("db_maintenance")
+    def _maintain(self, connection):
+        self.last_maintenance = time.monotonic()
+        try:
+            retention = HISTORY_RETENTION_DEFAULTS | {key: int(value) for key, value in connection.execute("""
+            SELECT key, value FROM app_settings WHERE key LIKE 'history_max_%'
+            """)}
+            with connection:
+                self._enforce_retention(connection, retention)
+            if not self.needs_vacuum:
+                connection.execute("PRAGMA incremental_vacuum")
+        except (sqlite3.Error, ValueError) as e:
+            # Tried again at the next maintenance
+            print(f"Database maintenance failed: {e}", file=sys.stderr)
+
+    @metrics.timed("db_vacuum")
+    def _vacuum(self, connection):
+        # auto_vacuum only takes effect on existing databases after a full VACUUM
+        try:
+            connection.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            connection.execute("VACUUM")
+        except sqlite3.Error as e:
+            print(f"Database vacuum failed: {e}", file=sys.stderr)
+        # Not tried again in this run, it likely fails the same way
+        self.needs_vacuum = False
+
+    def _enforce_retention(self, connection, retention):
+        # Deletes the oldest entries past the configured limits, a batch at
+        # a time so a large backlog doesn't stall the writer
+        oldest_first = "SELECT id FROM translation_history ORDER BY timestamp, id"
+        if max_age_days := retention.get("history_max_age_days"):
+            connection.execute(f"""
+            DELETE FROM translation_history WHERE id IN (
+                SELECT id FROM translation_history WHERE timestamp < datetime('now', ?)
+                ORDER BY timestamp, id LIMIT {self.RETENTION_BATCH}
+            )
+            """, (f"-{int(max_age_days)} days",))
+        if max_rows := retention.get("history_max_rows"):
+            count = connection.execute("SELECT COUNT(*) FROM translation_history").fetchone()[0]
+            if count > max_rows:
+                excess = min(count - max_rows, self.RETENTION_BATCH)
+                connection.execute(f"DELETE FROM translation_history WHERE id IN ({oldest_first} LIMIT ?)", (excess,))
+        if max_bytes := retention.get("history_max_bytes"):
+            # length() of a text counts characters, of a blob bytes
+            size, count = connection.execute("""
+            SELECT SUM(length(CAST(input_text AS BLOB)) + length(CAST(output_text AS BLOB))), COUNT(*)
+            FROM translation_history
+            """).fetchone()
+            if size and size > max_bytes:
+                # Assumes entries of average size
+                excess = min(int((size - max_bytes) / (size / count)) + 1, self.RETENTION_BATCH)
+                connection.execute(f"DELETE FROM translation_history WHERE id IN ({oldest_first} LIMIT ?)", (excess,))
+        if self.last_entry is not None and connection.execute(
+                "SELECT 1 FROM translation_history WHERE id = ?", (self.last_entry[0],)).fetchone() is None:
+            self.last_entry = None
+
+    def _clear_history(self, connection):
+        connection.execute("DELETE FROM translation_history")
+        # Built from the history, it goes with it
+        connection.execute("DELETE FROM translation_memory")
+        self.last_entry = None
+
+    def _write_history(self, connection, added, source_language, target_language, input_text, output_text):
+        input_hash = history_hash(source_language, target_language, input_text)
+        values = (compress_text(input_text), compress_text(output_text), input_hash)
+        last = self.last_entry
+        if last is not None and last[1:3] == (source_language, target_language) \
+                and added - last[4] < self.DRAFT_WINDOW and is_draft(last[3], input_text):
+            # Written again under a new id rather than updated, so ids keep
+            # the order of the timestamps and pages can follow the ids
+            connection.execute("DELETE FROM translation_history WHERE id = ?", (last[0],))
+        entry_id = connection.execute("""
+        INSERT INTO translation_history (source_language, target_language, input_text, output_text, input_hash)
+        VALUES (?, ?, ?, ?, ?)
+        """, (source_language, target_language, *values)).lastrowid
+        # The same text translated again only keeps the newest entry
+        connection.execute("""
+        DELETE FROM translation_history WHERE input_hash = ? AND id != ?
+        """, (input_hash, entry_id))
+        self.last_entry = (entry_id, source_language, target_language, input_text, added)
+
 
 class MiniORM:
+    """Settings, history and caches stored in SQLite.
+
+    Safe to use from any thread: reads go through a connection per thread,
+    writes are queued for a single DatabaseWriter thread and return a
+    Future. submit_read runs a read on a small pool of reader threads.
+    """
+
     def __init__(self, data_dir, db_name="settings.db"):
+        self.data_dir = data_dir
+        self.db_name = db_name
         self.db_path = os.path.join(data_dir, db_name)
-        self.connection = sqlite3.connect(self.db_path)
-        self.cursor = self.connection.cursor()
+        self.local = threading.local()
+        self.connections = []
+        self.lock = threading.Lock()
         self._create_tables()
+        # Started on first use
+        self.writer = None
+        self.reader = None
+        self.closing = False
+        # Bumped whenever translation_memory loses or gains rows outside
+        # of save_translation_memory, so loaded copies know to reload
+        self.memory_generation = 0
+
+    @property
+    def connection(self):
+        """The connection of the calling thread"""
+        connection = getattr(self.local, "connection", None)
+        if connection is None:
+            connection = connect(self.db_path)
+            self.local.connection = connection
+            with self.lock:
+                self.connections.append(connection)
+        return connection
+
+    def submit_read(self, function, *args, **kwargs):
+        """Runs a read method, ex. get_translation_history_page, on a reader
+        thread and returns a Future of its result.
+        """
+        with self.lock:
+            if self.closing:
+                raise RuntimeError("The database is closed")
+            if self.reader is None:
+                self.reader = ThreadPoolExecutor(max_workers=2, thread_name_prefix="database-reader")
+        return self.reader.submit(function, *args, **kwargs)
+
+    def _writer(self):
+        with self.lock:
+            if self.closing:
+                raise RuntimeError("The database is closed")
+            if self.writer is None:
+                self.writer = DatabaseWriter(self.db_path)
+                self.writer.start()
+            return self.writer
+
+    def _write(self, function, *args, deferred=False):
+        return self._writer().submit(function, *args, deferred=deferred)
+
+    def _execute(self, sql, params=(), deferred=False):
+        return self._write(lambda connection: connection.execute(sql, params).rowcount, deferred=deferred)
 
     def _create_tables(self):
-        self.cursor.execute("""
+        connection = self.connection
+        connection.execute("""
         CREATE TABLE IF NOT EXISTS api_settings (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             api_url TEXT NOT NULL,
             api_key TEXT NOT NULL
         )
         """)
-        self.cursor.execute("""
+        self._add_missing_columns("api_settings", {
+            "max_concurrency": "INTEGER NOT NULL DEFAULT 4",
+            "chunk_size": "INTEGER NOT NULL DEFAULT 2000",
+        })
+        # Every server requests are spread over, in the order they were
+        # entered. api_settings keeps the first one for older versions.
+        connection.execute("""
+        CREATE TABLE IF NOT EXISTS api_endpoints (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            api_url TEXT NOT NULL,
+            api_key TEXT NOT NULL,
+            weight INTEGER NOT NULL DEFAULT 1
+        )
+        """)
+        connection.execute("""
         CREATE TABLE IF NOT EXISTS language_settings (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             left_language TEXT NOT NULL,
             right_language TEXT NOT NULL
         )
         """)
-        self.cursor.execute("""
+        # How often every language pair was selected, by code
+        connection.execute("""
+        CREATE TABLE IF NOT EXISTS language_pair_usage (
+            source_language TEXT NOT NULL,
+            target_language TEXT NOT NULL,
+            uses INTEGER NOT NULL DEFAULT 0,
+            last_used DATETIME DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (source_language, target_language)
+        )
+        """)
+        connection.execute("""
         CREATE TABLE IF NOT EXISTS translation_history (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             source_language TEXT NOT NULL,
@@ -33,71 +382,501 @@ class MiniORM:
             timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
         )
         """)
-        self.connection.commit()
+        self._add_missing_columns("translation_history", {"input_hash": "TEXT"})
+        connection.execute("""
+        CREATE INDEX IF NOT EXISTS translation_history_input_hash
+        ON translation_history (input_hash)
+        """)
+        connection.execute("""
+        CREATE INDEX IF NOT EXISTS translation_history_timestamp
+        ON translation_history (timestamp, id)
+        """)
+        self.fts_enabled = self._create_history_search()
+        connection.execute("""
+        CREATE TABLE IF NOT EXISTS translation_cache (
+            key TEXT PRIMARY KEY,
+            output_text TEXT NOT NULL,
+            last_used DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+        """)
+        connection.execute("""
+        CREATE INDEX IF NOT EXISTS translation_cache_last_used
+        ON translation_cache (last_used)
+        """)
+        # Segments translated before and their translation, per language
+        # pair named like in translation_history. source_text is normalized
+        # with normalize_segment.
+        connection.execute("""
+        CREATE TABLE IF NOT EXISTS translation_memory (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            source_language TEXT NOT NULL,
+            target_language TEXT NOT NULL,
+            source_text TEXT NOT NULL,
+            target_text TEXT NOT NULL,
+            last_used DATETIME DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE (source_language, target_language, source_text)
+        )
+        """)
+        connection.execute("""
+        CREATE INDEX IF NOT EXISTS translation_memory_last_used
+        ON translation_memory (source_language, target_language, last_used)
+        """)
+        connection.execute("""
+        CREATE TABLE IF NOT EXISTS language_cache (
+            api_url TEXT PRIMARY KEY,
+            languages TEXT NOT NULL,
+            etag TEXT,
+            fetched_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+        """)
+        connection.execute("""
+        CREATE TABLE IF NOT EXISTS app_settings (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        )
+        """)
+        # Older versions added a row on every save, only the last one is read
+        for table in ("api_settings", "language_settings"):
+            connection.execute(f"DELETE FROM {table} WHERE id != (SELECT MAX(id) FROM {table})")
+            connection.execute(f"UPDATE {table} SET id = 1")
+        connection.commit()
 
-    def save_api_settings(self, api_url, api_key):
-        self.cursor.execute("""
-        INSERT INTO api_settings (api_url, api_key)
-        VALUES (?, ?)
-        """, (api_url, api_key))
-        self.connection.commit()
+    def _create_history_search(self):
+        """Creates the FTS5 index of translation_history, kept in sync by
+        triggers. Returns False when SQLite was built without FTS5.
+        """
+        connection = self.connection
+        exists = connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'translation_history_fts'"
+        ).fetchone() is not None
+        try:
+            connection.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS translation_history_fts USING fts5(
+                input_text, output_text, content='translation_history', content_rowid='id'
+            )
+            """)
+        except sqlite3.OperationalError:
+            return False
+        # Recreated every time so databases from older versions get the
+        # triggers that index the uncompressed text
+        for trigger in ("insert", "delete", "update"):
+            connection.execute(f"DROP TRIGGER IF EXISTS translation_history_fts_{trigger}")
+        connection.execute("""
+        CREATE TRIGGER translation_history_fts_insert AFTER INSERT ON translation_history BEGIN
+            INSERT INTO translation_history_fts (rowid, input_text, output_text)
+            VALUES (new.id, history_text(new.input_text), history_text(new.output_text));
+        END
+        """)
+        connection.execute("""
+        CREATE TRIGGER translation_history_fts_delete AFTER DELETE ON translation_history BEGIN
+            INSERT INTO translation_history_fts (translation_history_fts, rowid, input_text, output_text)
+            VALUES ('delete', old.id, history_text(old.input_text), history_text(old.output_text));
+        END
+        """)
+        connection.execute("""
+        CREATE TRIGGER translation_history_fts_update AFTER UPDATE ON translation_history BEGIN
+            INSERT INTO translation_history_fts (translation_history_fts, rowid, input_text, output_text)
+            VALUES ('delete', old.id, history_text(old.input_text), history_text(old.output_text));
+            INSERT INTO translation_history_fts (rowid, input_text, output_text)
+            VALUES (new.id, history_text(new.input_text), history_text(new.output_text));
+        END
+        """)
+        if not exists:
+            # Index the history written before search existed
+            connection.execute("""
+            INSERT INTO translation_history_fts (rowid, input_text, output_text)
+            SELECT id, history_text(input_text), history_text(output_text) FROM translation_history
+            """)
+        return True
+
+    def _add_missing_columns(self, table, columns):
+        # Databases created by older versions don't have the newer columns
+        existing = {row[1] for row in self.connection.execute(f"PRAGMA table_info({table})").fetchall()}
+        for name, definition in columns.items():
+            if name not in existing:
+                self.connection.execute(f"ALTER TABLE {table} ADD COLUMN {name} {definition}")
+
+    def save_api_settings(self, api_url, api_key, max_concurrency=4, chunk_size=2000):
+        self._execute("""
+        INSERT OR REPLACE INTO api_settings (id, api_url, api_key, max_concurrency, chunk_size)
+        VALUES (1, ?, ?, ?, ?)
+        """, (api_url, api_key, max_concurrency, chunk_size)).result()
+
+    def save_api_endpoints(self, endpoints, max_concurrency=4, chunk_size=2000):
+        """Replaces the endpoints with a list of dicts with api_url, api_key and weight"""
+        def save(connection):
+            connection.execute("DELETE FROM api_endpoints")
+            connection.executemany(
+                "INSERT INTO api_endpoints (api_url, api_key, weight) VALUES (?, ?, ?)",
+                [(endpoint["api_url"], endpoint["api_key"], endpoint["weight"]) for endpoint in endpoints],
+            )
+            first = endpoints[0] if endpoints else {"api_url": "", "api_key": ""}
+            connection.execute("""
+            INSERT OR REPLACE INTO api_settings (id, api_url, api_key, max_concurrency, chunk_size)
+            VALUES (1, ?, ?, ?, ?)
+            """, (first["api_url"], first["api_key"], max_concurrency, chunk_size))
+        self._write(save).result()
+
+    def get_api_endpoints(self):
+        """The endpoints in order, the one of api_settings when none were saved"""
+        rows = self.connection.execute("SELECT api_url, api_key, weight FROM api_endpoints ORDER BY id").fetchall()
+        if not rows:
+            settings = self.get_api_settings()
+            if settings is None or not settings["api_url"]:
+                return []
+            return [{"api_url": settings["api_url"], "api_key": settings["api_key"], "weight": 1}]
+        return [{"api_url": row[0], "api_key": row[1], "weight": row[2]} for row in rows]
 
     def save_language_settings(self, left_language, right_language):
-        self.cursor.execute("""
-        INSERT INTO language_settings (left_language, right_language)
-        VALUES (?, ?)
-        """, (left_language, right_language))
-        self.connection.commit()
+        self._execute("""
+        INSERT OR REPLACE INTO language_settings (id, left_language, right_language)
+        VALUES (1, ?, ?)
+        """, (left_language, right_language)).result()
 
     def get_api_settings(self):
-        self.cursor.execute("""
-        SELECT api_url, api_key FROM api_settings
+        row = self.connection.execute("""
+        SELECT api_url, api_key, max_concurrency, chunk_size FROM api_settings
         ORDER BY id DESC LIMIT 1
-        """)
-        row = self.cursor.fetchone()
-        return {"api_url": row[0], "api_key": row[1]} if row else None
+        """).fetchone()
+        if not row:
+            return None
+        return {"api_url": row[0], "api_key": row[1], "max_concurrency": row[2], "chunk_size": row[3]}
 
     def get_language_settings(self):
-        self.cursor.execute("""
+        row = self.connection.execute("""
         SELECT left_language, right_language FROM language_settings
         ORDER BY id DESC LIMIT 1
-        """)
-        row = self.cursor.fetchone()
+        """).fetchone()
         return {"left_language": row[0], "right_language": row[1]} if row else None
 
+    def record_language_pair(self, source_language, target_language):
+        """Counts one more use of a language pair, by code"""
+        return self._execute("""
+        INSERT INTO language_pair_usage (source_language, target_language, uses) VALUES (?, ?, 1)
+        ON CONFLICT (source_language, target_language)
+        DO UPDATE SET uses = uses + 1, last_used = CURRENT_TIMESTAMP
+        """, (source_language, target_language), deferred=True)
+
+    @metrics.timed("db_query", query="get_frequent_language_pairs")
+    def get_frequent_language_pairs(self, source_language=None, limit=5):
+        """[(source code, target code)] most used first, only the pairs
+        from source_language when given
+        """
+        return self.connection.execute("""
+        SELECT source_language, target_language FROM language_pair_usage
+        WHERE ? IS NULL OR source_language = ?
+        ORDER BY uses DESC, last_used DESC
+        LIMIT ?
+        """, (source_language, source_language, limit)).fetchall()
+
+    def get_setting(self, key, default=None):
+        row = self.connection.execute("SELECT value FROM app_settings WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def save_setting(self, key, value):
+        self._execute("""
+        INSERT INTO app_settings (key, value) VALUES (?, ?)
+        ON CONFLICT (key) DO UPDATE SET value = excluded.value
+        """, (key, str(value))).result()
+
+    def get_history_retention(self):
+        """Returns the history limits, None meaning unlimited"""
+        return {
+            name: int(self.get_setting(f"history_{name}", HISTORY_RETENTION_DEFAULTS[f"history_{name}"])) or None
+            for name in ("max_rows", "max_age_days", "max_bytes")
+        }
+
+    def save_history_retention(self, max_rows=None, max_age_days=None, max_bytes=None):
+        """Limits are enforced by the database writer, a batch at a time.
+        None is unlimited.
+        """
+        for key, value in (
+            ("history_max_rows", max_rows), ("history_max_age_days", max_age_days), ("history_max_bytes", max_bytes)
+        ):
+            self.save_setting(key, int(value or 0))
+
     def add_translation_history(self, source_language, target_language, input_text, output_text):
-        self.cursor.execute("""
-        INSERT INTO translation_history (source_language, target_language, input_text, output_text)
-        VALUES (?, ?, ?, ?)
-        """, (source_language, target_language, input_text, output_text))
-        self.connection.commit()
+        """Queues the entry, it becomes visible to reads once flushed"""
+        return self._writer().add_history(source_language, target_language, input_text, output_text)
+
+    def flush_translation_history(self):
+        if self.writer is not None:
+            self.writer.flush()
 
     def get_translation_history(self, limit=100):
-        self.cursor.execute("""
-        SELECT source_language, target_language, input_text, output_text, timestamp 
-        FROM translation_history
-        ORDER BY timestamp DESC
+        return self.get_translation_history_page(limit=limit)
+
+    @metrics.timed("db_query", query="get_translation_history_page")
+    def get_translation_history_page(self, after=None, limit=100, preview_length=None, search=None,
+                                     source_language=None, target_language=None, since=None):
+        """Newest entries first, starting after the id of the last entry of
+        the previous page. Ids follow the timestamps, see
+        DatabaseWriter._write_history.
+
+        With preview_length, input and output text are cut to that many
+        characters, get_translation_history_entry returns them in full.
+        search matches words (or word prefixes) of input or output text,
+        since is a UTC 'YYYY-MM-DD HH:MM:SS' timestamp.
+        """
+        text_columns = "translation_history.input_text, translation_history.output_text"
+        if preview_length is not None:
+            # Compressed texts can only be cut after decompressing them
+            text_columns = ", ".join(
+                f"CASE WHEN typeof({column}) = 'blob' THEN {column} ELSE substr({column}, 1, {int(preview_length)}) END"
+                for column in ("translation_history.input_text", "translation_history.output_text")
+            )
+        tables = "translation_history"
+        # The id in both cases, named so SQLite walks the index it searches
+        key = "id"
+        conditions = []
+        params = []
+        if search and search.split() and self.fts_enabled:
+            # Walking the index newest first stops after one page, even when
+            # most of the history matches
+            tables = "translation_history_fts JOIN translation_history ON id = translation_history_fts.rowid"
+            key = "translation_history_fts.rowid"
+            conditions.append("translation_history_fts MATCH ?")
+            params.append(self._fts_query(search))
+        if after:
+            conditions.append(f"{key} < ?")
+            params.append(after)
+        if search and search.split() and not self.fts_enabled:
+            # Compressed texts only match once decompressed
+            for word in search.split():
+                conditions.append("(history_text(input_text) LIKE ? OR history_text(output_text) LIKE ?)")
+                params.extend([f"%{word}%"] * 2)
+        if source_language:
+            conditions.append("source_language = ?")
+            params.append(source_language)
+        if target_language:
+            conditions.append("target_language = ?")
+            params.append(target_language)
+        if since:
+            conditions.append("timestamp >= ?")
+            params.append(since)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        rows = self.connection.execute(f"""
+        SELECT id, source_language, target_language, {text_columns}, timestamp
+        FROM {tables}
+        {where}
+        ORDER BY {key} DESC
         LIMIT ?
-        """, (limit,))
-        rows = self.cursor.fetchall()
-        return [
-            {
-                "source_language": row[0],
-                "target_language": row[1],
-                "input_text": row[2],
-                "output_text": row[3],
-                "timestamp": row[4]
-            }
-            for row in rows
-        ]
+        """, (*params, limit)).fetchall()
+        return [self._history_entry(row, preview_length) for row in rows]
+
+    @staticmethod
+    def _fts_query(search):
+        # Every word is quoted so user input can't form FTS syntax, and
+        # matched as a prefix so results show up while typing
+        return " ".join('"' + word.replace('"', '""') + '"*' for word in search.split())
+
+    @metrics.timed("db_query", query="get_history_languages")
+    def get_history_languages(self):
+        """Returns (source languages, target languages) present in the history"""
+        sources = [row[0] for row in self.connection.execute(
+            "SELECT DISTINCT source_language FROM translation_history ORDER BY 1"
+        )]
+        targets = [row[0] for row in self.connection.execute(
+            "SELECT DISTINCT target_language FROM translation_history ORDER BY 1"
+        )]
+        return sources, targets
+
+    @metrics.timed("db_query", query="get_translation_history_entry")
+    def get_translation_history_entry(self, entry_id):
+        row = self.connection.execute("""
+        SELECT id, source_language, target_language, input_text, output_text, timestamp
+        FROM translation_history WHERE id = ?
+        """, (entry_id,)).fetchone()
+        return self._history_entry(row) if row else None
+
+    @staticmethod
+    def _history_entry(row, preview_length=None):
+        input_text = decompress_text(row[3])
+        output_text = decompress_text(row[4])
+        return {
+            "id": row[0],
+            "source_language": row[1],
+            "target_language": row[2],
+            "input_text": input_text[:preview_length] if preview_length else input_text,
+            "output_text": output_text[:preview_length] if preview_length else output_text,
+            "timestamp": row[5]
+        }
 
     def clear_translation_history(self):
-        # Execute the DELETE statement to remove all records from the translation_history table
-        self.cursor.execute("DELETE FROM translation_history")
-        self.connection.commit()
+        # Goes through the writer so entries still queued are deleted too
+        self._writer().clear_history().result()
+        self._memory_changed()
 
+    def save_translation_memory(self, entries):
+        """Queues (source_language, target_language, segment, translation)
+        entries, replacing the translation of segments already present
+        """
+        return self._write(self._save_translation_memory, list(entries), deferred=True)
 
-    def close(self):
-        self.connection.close()
+    @staticmethod
+    def _save_translation_memory(connection, entries):
+        connection.executemany("""
+        INSERT INTO translation_memory (source_language, target_language, source_text, target_text)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT (source_language, target_language, source_text)
+        DO UPDATE SET target_text = excluded.target_text, last_used = CURRENT_TIMESTAMP
+        """, [
+            (source_language, target_language, normalize_segment(segment), translation)
+            for source_language, target_language, segment, translation in entries
+        ])
+
+    @metrics.timed("db_query", query="get_translation_memory")
+    def get_translation_memory(self, source_language, target_language, limit):
+        """[(id, segment, translation)] of a language pair, most recently used first"""
+        return self.connection.execute("""
+        SELECT id, source_text, target_text FROM translation_memory
+        WHERE source_language = ? AND target_language = ?
+        ORDER BY last_used DESC
+        LIMIT ?
+        """, (source_language, target_language, limit)).fetchall()
+
+    @metrics.timed("db_query", query="get_translation_memory_matches")
+    def get_translation_memory_matches(self, source_language, target_language, segments):
+        """Returns {normalized segment: (id, translation)} for the segments found"""
+        found = {}
+        keys = list({normalize_segment(segment) for segment in segments})
+        for start in range(0, len(keys), 500):
+            batch = keys[start:start + 500]
+            found.update((row[0], row[1:]) for row in self.connection.execute(f"""
+            SELECT source_text, id, target_text FROM translation_memory
+            WHERE source_language = ? AND target_language = ? AND source_text IN ({", ".join("?" * len(batch))})
+            """, (source_language, target_language, *batch)))
+        return found
+
+    def touch_translation_memory(self, ids):
+        return self._write(lambda connection: connection.executemany("""
+        UPDATE translation_memory SET last_used = CURRENT_TIMESTAMP WHERE id = ?
+        """, [(entry_id,) for entry_id in ids]), deferred=True)
+
+    def prune_translation_memory(self, max_rows):
+        future = self._execute("""
+        DELETE FROM translation_memory WHERE id NOT IN (
+            SELECT id FROM translation_memory ORDER BY last_used DESC LIMIT ?
+        )
+        """, (max_rows,))
+        future.add_done_callback(self._memory_pruned)
+        return future
+
+    def _memory_pruned(self, future):
+        if future.exception() is None and future.result():
+            self._memory_changed()
+
+    def import_history_into_memory(self, max_length):
+        """Fills translation_memory from the history written before it
+        existed, once, with the segments up to max_length characters.
+        Returns a Future of the number of segments, None when already done.
+        """
+        if self.get_setting("translation_memory_imported"):
+            return None
+        return self.submit_read(self._import_history_into_memory, max_length)
 
+    def _import_history_into_memory(self, max_length):
+        entries = []
+        # Oldest first, so the newest translation of a segment wins
+        for source_language, target_language, input_text, output_text in self.connection.execute("""
+        SELECT source_language, target_language, input_text, output_text FROM translation_history
+        WHERE source_language != 'Auto'
+        ORDER BY id
+        """):
+            entries.extend(
+                (source_language, target_language, segment, translation)
+                for segment, translation in align_segments(decompress_text(input_text), decompress_text(output_text))
+                if len(segment) <= max_length
+            )
+        self.save_translation_memory(entries)
+        self.save_setting("translation_memory_imported", "1")
+        self._memory_changed()
+        return len(entries)
 
+    def _memory_changed(self):
+        with self.lock:
+            self.memory_generation += 1
+
+    def get_cached_translation(self, key):
+        return self.get_cached_translations([key]).get(key)
+
+    @metrics.timed("db_query", query="get_cached_translations")
+    def get_cached_translations(self, keys):
+        """Returns {key: translation} for the keys found, in one query"""
+        found = {}
+        # Stays under SQLite's limit on the number of parameters
+        for start in range(0, len(keys), 500):
+            batch = keys[start:start + 500]
+            found.update(self.connection.execute(f"""
+            SELECT key, output_text FROM translation_cache WHERE key IN ({", ".join("?" * len(batch))})
+            """, batch).fetchall())
+        if found:
+            self._write(self._touch_cached_translations, list(found), deferred=True)
+        return found
+
+    @staticmethod
+    def _touch_cached_translations(connection, keys):
+        connection.executemany("""
+        UPDATE translation_cache SET last_used = CURRENT_TIMESTAMP WHERE key = ?
+        """, [(key,) for key in keys])
+
+    def save_cached_translation(self, key, output_text):
+        return self._execute("""
+        INSERT OR REPLACE INTO translation_cache (key, output_text)
+        VALUES (?, ?)
+        """, (key, output_text), deferred=True)
+
+    def prune_translation_cache(self, max_rows, max_age_days):
+        return self._write(self._prune_translation_cache, max_rows, max_age_days)
+
+    @staticmethod
+    def _prune_translation_cache(connection, max_rows, max_age_days):
+        connection.execute("""
+        DELETE FROM translation_cache WHERE last_used < datetime('now', ?)
+        """, (f"-{int(max_age_days)} days",))
+        connection.execute("""
+        DELETE FROM translation_cache WHERE key NOT IN (
+            SELECT key FROM translation_cache ORDER BY last_used DESC LIMIT ?
+        )
+        """, (max_rows,))
+
+    def clear_translation_cache(self):
+        return self._execute("DELETE FROM translation_cache")
+
+    @metrics.timed("db_query", query="get_cached_languages")
+    def get_cached_languages(self, api_url):
+        row = self.connection.execute("""
+        SELECT languages, etag, (julianday('now') - julianday(fetched_at)) * 86400
+        FROM language_cache WHERE api_url = ?
+        """, (api_url,)).fetchone()
+        return {"languages": json.loads(row[0]), "etag": row[1], "age": row[2]} if row else None
+
+    def save_cached_languages(self, api_url, languages, etag):
+        return self._execute("""
+        INSERT OR REPLACE INTO language_cache (api_url, languages, etag, fetched_at)
+        VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+        """, (api_url, json.dumps(languages), etag))
+
+    def touch_cached_languages(self, api_url):
+        return self._execute("""
+        UPDATE language_cache SET fetched_at = CURRENT_TIMESTAMP WHERE api_url = ?
+        """, (api_url,))
+
+    def close(self):
+        """Waits for the queued writes, reads that haven't started are dropped.
+        The MiniORM can't be used afterwards.
+        """
+        with self.lock:
+            self.closing = True
+        # Readers first, they may still queue writes
+        if self.reader is not None:
+            self.reader.shutdown(cancel_futures=True)
+            self.reader = None
+        if self.writer is not None:
+            self.writer.stop()
+            self.writer = None
+        with self.lock:
+            for connection in self.connections:
+                connection.close()
+            self.connections = []
+        self.local = threading.local()
@@ -0,0 +1,170 @@
+"""Performance window, imported the first time it is opened"""
+from PySide6.QtCore import QTimer
+from PySide6.QtGui import QIcon
+from PySide6.QtWidgets import (
+    QFileDialog,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QMainWindow,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from metrics import metrics
+
+# Tells whether the time goes to the server or to the client
+DESCRIPTIONS = {
+    "gui_translate": "Reacting to an edit, cache lookup and queueing",
+    "gui_render": "Updating the target pane",
+    "translation_job": "From queueing to the whole text translated",
+    "translation_queue_wait": "Chunks waiting for a free worker",
+    "translation_chunk": "One chunk translated, failover included",
+    "endpoint_request": "One request to a server",
+    "db_query": "Reading the database",
+    "db_commit": "Writing a batch to the database",
+    "db_maintenance": "Retention and vacuum",
+    "db_vacuum": "Full vacuum of an older database, once",
+}
+
+
+def format_ms(seconds):
+    return "" if seconds is None else f"{seconds * 1000:.1f}"
+
+
+class PerformanceWindow(QMainWindow):
+    """Percentiles of the instrumented hot paths and how often the caches
+    answer, refreshed while visible
+    """
+    REFRESH_INTERVAL = 1000  # In milliseconds
+    METRIC_COLUMNS = ("Metric", "Labels", "Count", "p50 ms", "p95 ms", "p99 ms", "Max ms")
+    ENDPOINT_COLUMNS = ("Endpoint", "State", "Weight", "In flight", "Latency ms", "Last error")
+    CACHE_COLUMNS = ("Cache", "Hits", "Misses", "Hit rate", "Fuzzy suggestions", "In memory")
+
+    def __init__(self, get_client, cache, memory):
+        """Args:
+        get_client (callable): returns the current EndpointPool, or None
+        cache (TranslationCache)
+        memory (TranslationMemory)
+        """
+        super().__init__()
+        self.get_client = get_client
+        self.cache = cache
+        self.memory = memory
+        self.setWindowTitle("Performance")
+        self.setWindowIcon(QIcon(":/img/icon.png"))
+        self.resize(760, 460)
+
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        self.layout = QVBoxLayout()
+        central_widget.setLayout(self.layout)
+
+        self.metrics_table = self._table(self.METRIC_COLUMNS)
+        self.endpoints_table = self._table(self.ENDPOINT_COLUMNS)
+        self.caches_table = self._table(self.CACHE_COLUMNS)
+        self.layout.addWidget(QLabel("Timings"))
+        self.layout.addWidget(self.metrics_table, 3)
+        self.layout.addWidget(QLabel("Endpoints"))
+        self.layout.addWidget(self.endpoints_table, 1)
+        self.layout.addWidget(QLabel("Caches, since the start"))
+        self.layout.addWidget(self.caches_table, 1)
+
+        self.export_json_button = QPushButton("Export JSON")
+        self.export_json_button.clicked.connect(
+            lambda: self.export("JSON (*.json)", "metrics.json", metrics.to_json)
+        )
+        self.export_prometheus_button = QPushButton("Export Prometheus")
+        self.export_prometheus_button.clicked.connect(
+            lambda: self.export("Prometheus text (*.prom *.txt)", "metrics.prom", metrics.to_prometheus)
+        )
+        self.reset_button = QPushButton("Reset")
+        self.reset_button.clicked.connect(self.reset)
+        self.buttons_layout = QHBoxLayout()
+        self.buttons_layout.addWidget(self.export_json_button)
+        self.buttons_layout.addWidget(self.export_prometheus_button)
+        self.buttons_layout.addStretch()
+        self.buttons_layout.addWidget(self.reset_button)
+        self.layout.addLayout(self.buttons_layout)
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+    @staticmethod
+    def _table(columns):
+        table = QTableWidget(0, len(columns))
+        table.setHorizontalHeaderLabels(columns)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        table.horizontalHeader().setStretchLastSection(True)
+        table.verticalHeader().setVisible(False)
+        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        return table
+
+    @staticmethod
+    def _fill(table, rows):
+        table.setRowCount(len(rows))
+        for row, values in enumerate(rows):
+            for column, value in enumerate(values):
+                table.setItem(row, column, QTableWidgetItem(str(value)))
+
+    def refresh(self):
+        snapshot = metrics.snapshot()
+        self._fill(self.metrics_table, [
+            (
+                metric["name"],
+                ", ".join(f"{key}={value}" for key, value in metric["labels"].items()),
+                metric["count"],
+                format_ms(metric["quantiles"][0.5]),
+                format_ms(metric["quantiles"][0.95]),
+                format_ms(metric["quantiles"][0.99]),
+                format_ms(metric["max"]),
+            )
+            for metric in snapshot
+        ])
+        for row, metric in enumerate(snapshot):
+            self.metrics_table.item(row, 0).setToolTip(DESCRIPTIONS.get(metric["name"], ""))
+
+        client = self.get_client()
+        endpoints = client.stats() if client is not None else []
+        self._fill(self.endpoints_table, [
+            (
+                endpoint["url"],
+                endpoint["state"],
+                endpoint["weight"],
+                endpoint["in_flight"],
+                f"{endpoint['overhead_ms']:.0f} + {endpoint['ms_per_char']:.2f}/char" if endpoint["samples"] else "",
+                endpoint["last_error"] or "",
+            )
+            for endpoint in endpoints
+        ])
+
+        cache = self.cache.stats()
+        memory = self.memory.stats()
+        self._fill(self.caches_table, [
+            ("Translation cache", cache["hits"], cache["misses"], f"{cache['hit_rate']:.0%}", "",
+             cache["memory_entries"]),
+            ("Translation memory", memory["hits"], memory["misses"], f"{memory['hit_rate']:.0%}", memory["suggested"],
+             memory["indexed"]),
+        ])
+
+    def export(self, file_filter, default_name, render):
+        path, _ = QFileDialog.getSaveFileName(self, "Export metrics", default_name, file_filter)
+        if path:
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(render())
+
+    def reset(self):
+        metrics.reset()
+        self.refresh()
+
+    def showEvent(self, event):
+        self.refresh()
+        self.refresh_timer.start(self.REFRESH_INTERVAL)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.refresh_timer.stop()
+        super().hideEvent(event)
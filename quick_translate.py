@@ -0,0 +1,245 @@
+"""Quick translation of the clipboard, turned on from the tray, ex:
+
+    quick_translator = ClipboardTranslator(window)
+    quick_translator.set_enabled(True)
+
+New clipboard (or selection) text is translated with the cache, memory and
+scheduler of the main window, into its selected languages, and shown in a
+small popup next to the cursor. The main window stays hidden.
+"""
+import time
+
+from PySide6.QtCore import QObject, QPoint, QTimer, Qt, Signal
+from PySide6.QtGui import QClipboard, QCursor, QGuiApplication
+from PySide6.QtWidgets import QFrame, QHBoxLayout, QLabel, QPushButton, QVBoxLayout
+
+from detection import guess_language
+from models import AUTO_LANGUAGE
+from segments import join_segments, normalize_segment, split_segments, translate_pieces, unique_segments
+
+
+class QuickTranslatePopup(QFrame):
+    """Frameless popup showing one translation, hidden after HIDE_DELAY
+    unless the mouse is over it
+    """
+    HIDE_DELAY = 8000  # In milliseconds
+    WIDTH = 420  # In pixels
+    CURSOR_OFFSET = QPoint(12, 16)
+
+    open_requested = Signal()
+
+    def __init__(self):
+        super().__init__(
+            None, Qt.WindowType.Tool | Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint
+        )
+        # Doesn't take the focus from the application text was copied in
+        self.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating)
+        self.setFrameShape(QFrame.Shape.StyledPanel)
+        self.setFixedWidth(self.WIDTH)
+
+        self.title_label = QLabel()
+        self.title_label.setEnabled(False)
+        self.text_label = QLabel()
+        self.text_label.setWordWrap(True)
+        self.text_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        self.open_button = QPushButton("Open")
+        self.open_button.clicked.connect(self.open_requested)
+        self.open_button.clicked.connect(self.hide)
+        self.close_button = QPushButton("Close")
+        self.close_button.clicked.connect(self.hide)
+
+        self.buttons_layout = QHBoxLayout()
+        self.buttons_layout.addWidget(self.title_label)
+        self.buttons_layout.addStretch()
+        self.buttons_layout.addWidget(self.open_button)
+        self.buttons_layout.addWidget(self.close_button)
+        self.layout = QVBoxLayout()
+        self.layout.addLayout(self.buttons_layout)
+        self.layout.addWidget(self.text_label)
+        self.setLayout(self.layout)
+
+        self.hide_timer = QTimer(self)
+        self.hide_timer.setSingleShot(True)
+        self.hide_timer.timeout.connect(self.hide)
+
+    def show_text(self, title, text, move=False):
+        """Shows text, next to the cursor when move or not shown yet"""
+        self.title_label.setText(title)
+        self.text_label.setText(text)
+        self.adjustSize()
+        if move or not self.isVisible():
+            self.move_near_cursor()
+        self.show()
+        self.raise_()
+        if not self.underMouse():
+            self.hide_timer.start(self.HIDE_DELAY)
+
+    def move_near_cursor(self):
+        cursor = QCursor.pos()
+        screen = QGuiApplication.screenAt(cursor) or QGuiApplication.primaryScreen()
+        area = screen.availableGeometry()
+        position = cursor + self.CURSOR_OFFSET
+        # Kept on the screen, above the cursor when there's no room below
+        x = min(max(position.x(), area.left()), area.right() - self.width())
+        y = position.y() if position.y() + self.height() <= area.bottom() else cursor.y() - self.height()
+        self.move(x, max(y, area.top()))
+
+    def enterEvent(self, event):
+        self.hide_timer.stop()
+        super().enterEvent(event)
+
+    def leaveEvent(self, event):
+        self.hide_timer.start(self.HIDE_DELAY)
+        super().leaveEvent(event)
+
+
+class ClipboardTranslator(QObject):
+    """Translates new clipboard text in the background and shows it in a
+    QuickTranslatePopup.
+
+    Clipboard events are debounced, selections change on every mouse move,
+    translations start at most every MIN_INTERVAL seconds and text already
+    translated or shown is ignored, so copying the translation doesn't
+    translate it back. Only the last text is translated, an older job is
+    cancelled.
+    """
+    DEBOUNCE = 400  # In milliseconds
+    MIN_INTERVAL = 1.0  # In seconds
+    # Longer texts are left to the main window
+    MAX_LENGTH = 5000
+
+    open_requested = Signal(str)
+
+    def __init__(self, window):
+        """Args:
+        window (GUIWindow): whose languages, caches and scheduler are used
+        """
+        super().__init__()
+        self.window = window
+        self.enabled = False
+        self.popup = None
+        self.pending_text = None
+        # Normalized, so whitespace differences aren't new text
+        self.last_text = None
+        self.last_translation = None
+        self.last_started = 0.0
+
+        # The translation being shown
+        self.text = None
+        self.title = None
+        self.job = None
+        self.pieces = []
+        self.translations = {}
+        self.suggestions = {}
+        self.scheduler = None
+
+        self.clipboard = QGuiApplication.clipboard()
+        self.clipboard.dataChanged.connect(lambda: self.clipboard_changed(QClipboard.Mode.Clipboard))
+        if self.clipboard.supportsSelection():
+            self.clipboard.selectionChanged.connect(lambda: self.clipboard_changed(QClipboard.Mode.Selection))
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.translate_pending)
+
+    def set_enabled(self, enabled):
+        self.enabled = enabled
+        if not enabled:
+            self.timer.stop()
+            self.pending_text = None
+            self.cancel()
+            if self.popup is not None:
+                self.popup.hide()
+
+    def clipboard_changed(self, mode):
+        if not self.enabled:
+            return
+        text = self.clipboard.text(mode).strip()
+        key = normalize_segment(text)
+        if not key or len(text) > self.MAX_LENGTH or key in (self.last_text, self.last_translation):
+            return
+        self.pending_text = text
+        self.timer.start(self.DEBOUNCE)
+
+    def translate_pending(self):
+        wait = self.MIN_INTERVAL - (time.monotonic() - self.last_started)
+        if wait > 0:
+            self.timer.start(int(wait * 1000))
+            return
+        text, self.pending_text = self.pending_text, None
+        if text is not None:
+            self.translate(text)
+
+    def translate(self, text):
+        window = self.window
+        scheduler = window.translation_scheduler
+        source = window.registry.get(window.left_language_combo.currentData())
+        target = window.registry.get(window.right_language_combo.currentData())
+        if scheduler is None or source is None or target is None:
+            return
+        if source is AUTO_LANGUAGE:
+            # Clipboard texts are short, the server detects the ones the
+            # local guess can't tell
+            code = guess_language(text, set(window.registry.by_code))
+            if code is not None and window.registry.supports(code, target.code):
+                source = window.registry.get(code)
+
+        self.cancel()
+        self.last_text = normalize_segment(text)
+        self.last_started = time.monotonic()
+        self.text = text
+        self.title = f"{source.name} → {target.name}"
+        self.pieces = split_segments(text)
+        segments = unique_segments(self.pieces)
+        self.translations = window.translation_cache.get_many(source.code, target.code, segments)
+        missing = [segment for segment in segments if segment not in self.translations]
+        self.suggestions = {}
+        if missing and source is not AUTO_LANGUAGE:
+            remembered, self.suggestions = window.translation_memory.lookup(source.name, target.name, missing)
+            self.translations.update(remembered)
+            missing = [segment for segment in missing if segment not in remembered]
+        if missing:
+            if self.scheduler is not scheduler:
+                # The window replaces its scheduler when the server changes
+                scheduler.send_job_progress.connect(self.handle_job_progress)
+                scheduler.send_job_finished.connect(self.handle_job_finished)
+                scheduler.send_job_failed.connect(self.handle_job_failed)
+                self.scheduler = scheduler
+            self.job = scheduler.submit(source.code, target.code, missing)
+        self.show_translation(move=True)
+
+    def cancel(self):
+        job, self.job = self.job, None
+        current = self.window.current_translation
+        # Identical work is shared with the window, which may still need it
+        if job is not None and (current is None or current.job is not job):
+            self.scheduler.cancel(job)
+
+    def show_translation(self, move=False):
+        if self.job is None:
+            translation = join_segments(self.pieces, self.translations)
+            self.last_translation = normalize_segment(translation)
+        else:
+            # Segments still in flight are shown with their suggestion, or untranslated
+            translation = "".join(translate_pieces(self.pieces, self.suggestions | self.translations))
+        if self.popup is None:
+            self.popup = QuickTranslatePopup()
+            self.popup.open_requested.connect(lambda: self.open_requested.emit(self.text))
+        self.popup.show_text(self.title + ("" if self.job is None else " …"), translation, move)
+
+    def handle_job_progress(self, job, completed):
+        if job is not self.job:
+            return
+        self.translations.update(completed)
+        self.show_translation()
+
+    def handle_job_finished(self, job):
+        if job is not self.job:
+            return
+        self.job = None
+        self.show_translation()
+
+    def handle_job_failed(self, job, error):
+        if job is not self.job:
+            return
+        self.job = None
+        self.popup.show_text(self.title, f"Translation failed: {error}")
@@ -0,0 +1,2121 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.8.1
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x82\x1a\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\xe4\x00\x00\x00\x80\x08\x02\x00\x00\x00\x94PR\x96\
+\x00\x00\x81\xe1IDATx\xda\x9c\xbdkv\xe4\xc8\
+\x8e4\x083\xb8\x93!e\xf5c\xb61{\x98\xfd/\
+gn\xdf\xaa\x94D\xba\x036?\xe0d\x84\xb2\xb2o\
+\x7f=:u\xaaTJ\xa5\x14A\x82x\x18\xcc\xcc\xf1\
+\xff\xfc\xdfN\x12N\xba\xa7\xd1\xcc\xcchfR\xd8\xf5\
+\xd1\x9a\xdf\x9f\xc3\x9e\x9fg\xa6\x99\x01\xa8\xbf\x85\xf5A\
+w\x02\xa0\x01f\x04I\x12 \x09\x12\xcd\xcd)SH\
+ff\x80\x11l\x0dt\xb6\xbem\x8f}\x7fkm#\
+\x9aDz\xdb\xf6\xc7\xe3\xf1x\xec;\xdda\x06Rt\
+\x03H\x9a!S0\xf4m\xdf\xb6\xadw73IJ\
+I\x96\xa1\x0c\xa5R&\x80\x80k\xbd7Ai\xd0z\
+;\x80\xa4LI\x12\x0c\x80\x08\xc1\xea\xdf\xf5\xa1\xac\xb7\
+%PH\x99X\x97\x08\xb2\xccT\x0a\xc4\x9c\x93 \x9d\
+\x00F\x04\x80\xba\x1e\xf5\x9d\x0933\xcaH\x1a2#\
+\xcf\xf3\xd4\xf5\x11\x19cL$\xb6\xd6s\xcc\xe38\xce\
+\xf3\xcc\xcc\xcc\x9cs~~~||||\xfc\xfc\xf8\
+\xf8\xeb\xe7?\xfe\xf1\x8f?\xff\xfc\xf38\xce\x19q\x8e\
+8\x8ey\x9e\x83\xf0\xbe\xf7\xf7\x1f?z\xdf\xe6\x1c\x9f\
+\x9f\x9f\xc7q\xc6\x14\xc0\xde\xb7\xd6\xfa\xe6\x9bds\x8c\
+1F\xe4\x94R\xaa\xb7A\x18\xd6E\x93\xea>\xd6\x05\
+\x01\x94R\x9a2Su\x97\xef\xbbn2\x13\x00\x82f\
+2\x08\x00\xe0\xaf\x7f.\x09\x84\x99)e\xdf?\xea\xfe\
+p}\x7f\x9a\x99!\xaf\xcf\x09sIf\x96\xaa\xff~\
+\x8b\xb4\xf6\xf2c\xf8\xfa\x8a\xee{if\x11I\x19\x08\
+\xd5-\xfa\xfe\xa7W\xb0\xaeH\xad\xff\x95\x94\xf5\x0e\x95\
+f\x062M\xb2t\xa1~\x8d\x93\x02\xe1\x0e'\xc8\xd6\
+\xfa\xf6x<\xde\xde\xdf\x1e?\xb6\xedm\xeb;\xbd\x83\
+\x8d\xf4\xe6NwI2\x19\xa8\xf5+ \xd5\xc5@F\
+\x8cqF\xe0\xba\xe20\xc1dJ\x93I\x96\x92\xa1^\
+7L\x92i\x9a\xe9z\xc5\xbc\xae`\xa6d\x84\x89u\
+\xaf\x9eWJ0K\x0b3\xa4\x1b\xccd\x16&R\x16\
+\x19fFQRZ\xe6L\x82\xb24\xa3\xad\x1f\x10f\
+\x94\x19e3\xd3%\xb3\x8cL\x83\x01\x80\xad_\x84f\
+\x96p\xe7\xdb\xf6\xfex<\xe6\x1c\x11\x11\x11s\xc6\xbe\
+\xef\x8f\xc7\xe3\xb1=\x1e\xdb\xee\xcd\x1f\x8f\xfd8\xc6\xc7\
+\xc7\xe7_??\xc9\xb39{\x7f<\xde\xde\xbc\xb5\x19\
+s\x8c9\xc6\x98s(\x8dlu\xc3#fF\xce\x19\
+\xf5j\x01\xd6-\xca\x90R\xf5JH\xdeQ+i}\
+j\x02`\xe4\xf7\xdb\xae\xbaz)\x99\xc9\x94\xeb\xad\xbc\
+D\x85$K\x03A\xa7RY!\x9fy_\xf0\x5c\x91\
+(\xbb\x22\xe4\x8a\xd7\xbf\x85`\xa5\x18\xf25XY\x17\
+\xfd\xf9+\xc9\xd7_OYe\x08\xba\xdb\xf5\xca2\xd3\
+t\xa7\xa8\xba\x0a \xf1|\x88*\xa9(\xcd@\x89h\
+`wo\x95M\xd9\xba\xbb\xc3\x9d\xcd\xb7m\x7f{\xff\
+\xb1\xbf\xbd\xb5\xbe\xf7\xb6o}g\xdb$\xcb4e\x8e\
+\x88\x95\xbciu\x7f\xebN\x9bQ\xb2\x88\xccLY\x9a\
+\x0c\x84\x19\xcc\xb0\xd2\x06L0H\x86\x15}\x90\xa1R\
+\xc2\xf5\x1a+\x15k\xbd\x1d\xd4=J|K\x06/\x8f\
+9V>0\x9b\xb12\x07\xfdy\xa7\xc3B\x04!\x08\
+\x06&V\xfe\x0837\xaf[\xee\x86L\x110K\x83\
+\xb9\xbb\x0c\xe6\xe6`\xe6\x84D\x93L \xbc;mk\
+\xb4\xee|<\xfa\xe3m;\xfe\xe3\xdf\xcfs~||\
+\xfe\xd7\x9f\x7f\xfe\xfc\xf8\x1a\xe7\xe9\xde\xfb\xb6E\xe6\xc7\
+\xc7\x07)\xc0Zk\x92\x99\xb9\x99\x22\xc6L)\x94)\
+\xb3\xac\x1a'Qu\xe1$|O{/\xefX\xeb\xd9\
+\xfe\x96S\x8dU\x8bV\x84\xc9L2\xc3u=\x7f\x1f\
+k\xbf\xf9\xc8\x97\xcf\xfd5,\xed*\xd3i\xf1\xfau\
+)\xdb\xcbw\xf05_\x9aP\xf9\xf9\x8eT3c\x92\
+\xb4\xfc\xdd+\xba#\xf5~\xc8\xf0|\xd3\xa6\x94\x00\x90\
+\xbe5\xef\x1d\xf4\xb6m\xado\xadu4o\xdb\xf6x\
+\xbc?\xde\xdf\xb6mwv\xf7\x0e6\xc9$efd\
+\x84\xa2\x9e\x02\x18%\x98\xcc\xbd\x12#\xa5\x8c\x0c\x92U\
+~L\xab\x1b1YF\x82\xa8\x07\xb0.z\xbd\x12(\
+V\x9e\x05*\x0dT\xc0V\xc8\x9b !\xed\xd7\x02R\
+9v\xbc\xde\xbc\xb0\xca\xe5w\xc9\xab\xbb\xc8\xd6\x92F\
+3)r\xd58\xa3,,\x1a\xbaYf\x86\xcdL3\
+\xfaz\x0d\xee\xdd\xcc\xa0L\xc0|U\xa7\xbb\xcb\x02\xb0\
+m\xdb\x8f\x1f?\xfe\xf3?\xff33\xbf>\x8f\xaf\xaf\
+\xe3\xcf\x9f\x7f\xfd\xf9\xd7\xcf\x9f?\x7ff\xd8\x98\xf3\xe3\
+\xf3\xd3\x902\x19\xac\x8a\x91\x04\xa52\xe7\x1cS)\x82\
+t\xafnJ\x95\xfc\x9aU\xb1\x5cwI\xcf`\xb5\xeb\
+\xeb\xdf+x\xa5\x81\xfa\xb3\xfb\x99\xcf\x7f\x11\xa2\x19\xeb\
+-8\xdc\xe9w\x1b \xe5/\xa9\xf3\xea\xb8\xa2\xe2\xe8\
+w\xdfc\xedj\xbfHQWR\x04`\xb6\xd2v=\
+6 H73z\x03\xac\x9a\xbc\xfa\xf5w\xa2~)\
+\x05F:\xc9\xf5|\x82\xd5\x16\xf7\xed\xd1\xfb\xce\xe6\xde\
+\xb6\xd6{\xeb\xbdo\xbb\xb7\xde\xdf\xde\x1eo\x8f\xd6\xbb\
+\x0csf\xcciH]\x97@\xeb\x81&\xd8d0\x99\
+\x80\x10P\x17\x8f\xa4T\x09\xfe\xd9\x84T\xc2#uU\
+/\x82\x91\x11!dJ\xc3L\x7f\xbf\xb2\x82\xc9,\xd3\
+253\xd3\x0c\x04R$\xef\xc7U\x91Wpg\xf3\
+U\x97\x22\xc6k\x19\x9dJ'I\xa73#^\x8a\xa7\
+\xc6\xca\x16\xb9\x9e\xe4\x80\xcc\x9cJ\xc2\x0d\x00\x1b)%\
+i\xde=\x13\x992\xe7\xde[U\xf39\xa7d\xfb\xb6\
+\xbd\xbd?\x1e?\xf6\x1f\x7f\xbc\x9f\xe7\x7f\x8e\x11\x7f\xfd\
+\xf9\x17\xffa1\x8e\xe3\xf3s\xd0\x9cx\xec\xbb\xcc\x8e\
+\xe3<\xbe\x82H\xb455\x00\xc2\xfa\xdd\xb8B\xed\x19\
+B\xaf\xd5\xfc[\x9b\xf7\x92qgT\x13\xf5KF\xce\
+\xeb]\x82\xd7_\xacn\xfe~\xfb\x15O\x922\xe3\xfb\
+u\xa7\x99\x00\x07h\x9c\x95\xf1\xcc\xec\x9a\xa0\x9e\xd1\xdc\
+jF\x91!\xa1j\xb7\xab\xf1L\xb1\xda\xdc\x97Y\xc1\
+\x8c^\xd5\xab\xda\x98\xdfu\xae+p\xddW\xb0\xc2\x08\
+:\x9b\xb3\xb5\xbeom\xdb\xda\xb6\xf5\xbe\xf7}o\xad\
+{\xef\xf4\xc6\xb6\x81\xcd\xe02\xcc\x08\xe5$\xdd\xdd\x01\
+\x08&\xc1\xc4\x5c\xd9@\x02Lf\x0a\xd8\x9a\xe1^\xae\
+\xae\xad\xa7\x0b\x80U\x9fP\x19\xdeRygy\x80\x99\
+\xf3{q\xaf\x8b\x86\xea[\xa2\xca_M\x19\x91\x90\xcd\
+\xcc\x88\x88L\xbct\xfej\xfa[\x01\xbd\x9a%8\xe9\
+wI\xe2\x1a&\xab\x0d\xc8*s\xb62+#\x0d5\
+\xdcA\xd7w\xc2\xcc\xdc\xdd}\xb5[5\xc9\xd5Gk\
+\x8d\xee}\xdb\xde\xdf\xdf\xbf\xbe\x8e\xf3\x1c\xdb\xd6\xe8\xac\
+ l\xcd+\x8f\xcc\x99\x80\xe8VO\xf8\xaa\xdeW\xd9\
+\xbfk\xc9\x8a\xc1\xf54Uco\xbfD\xed\xff\xe6\xa3\
+\xda`\xab\x90\xad\xcc\xfa\xed\x16\x914\xfb5^\xff\xcf\
+>V\xb5\x95\xa4LT\xefeL 5c\xbd1\xd0\
+\x9b\x09p\xd6\xfcq_\xeb\x95PWw\xfb|Y\xee\
+to\xab4\xb3\xad\x8f\xde\xbc\xefm\x7f\xec\xfb[\xdf\
+\xf7\xdewo\x1dt\xc1\x8c\x0e\xb8\x84\x14\x8c\x0e\x90\xde\
+j\xa8J\xa5,\x05\xc9d\x99\x02jpcA\x16\xeb\
+!z6\xa0\x95\x10M+Re\x95A$!\x95\x91\
+\x09\x89Xw\xdf\xbe\xe7\x92\x94\x12&X\xc2R2\xd6\
+4\x96\x9a3fF\xc4\x8c\x0a\xa6tC2\xe7\x9cw\
+G\xe4W\x8b_W\xa32(\xb9\xa6\xc9\xbah\xeey\
+\x07+\x88\xbapt\xb9\x0c\xa0\x00\xcabu703\
+\x07WJ\xd3\xaa\x15\xab\x92\x16\xca\xd0\xdc\x93f\xe6\xcd\
+\xcdr\xce\x191eA\xb71b\xce\x18\xe3\xcc\x1cR\
+\x14\x8e\xb2J\xfd5u\xde\xbd\xba\xbe?i\x82=\x07\
+\xa6\xff_\x11[\xa3u\x1aau;\x9e\x99\x84\xbc\xd2\
+\x8b\xf8/\xdbY\xbc\xf6\x06/m\xc0\x05\xc4<\xd3$\
+\xf1\xf2[/$\x8b\xcf\xaf_C\xff\xc2\xa4^0\x80\
+\xd7\xccJ\x92i\xe6\xad\xb7\xbe\xb5\xdeZ\xdb\xd8\xb7\xb6\
+\xed\xdb\xe3\xd1\xb7\xc7\xb6?@\xafD\x97@\x1a\x01\xc2\
+\xe0\xacg\x925\xeb\xa0\x9aH\xe3\xea9\xef!\xb2\xea\
+\xc0\xcb\x0cjf\xca\x0c\xc5J\x0d\x86\xd57Bf\x90\
+\x90iRAM\x82\x19\xd7(\xf6\xbcB5\x83\x5c9\
+&\xab%5i\xce\xc8\x88H\x8b\x19 \x01&\x04s\
+{^\x12\x8b\xcc;d\xabO\x952\xd2\x94\xbcg\x88\
+\x15\x13\xd5\xc5\xa65\xb05\xaez@U\x9f\xbd\x9a\x19\
+\x01@\xe4\xcc\x1b\x8a3+\x5c\x0c\x80\x81\xb2\x9c\x99@\
+>\xde\x1e[$\xc9\x884\x13)w\xff\xfa:\xbe\xbe\
+\x0eI\x91I\x9fY\x8fi\xa6\x0cZ\x19\xda$d\xe6\
+\xf7\xc1\x11\xdf\x0b\xd4\xfa\xc2/\xf5\xe7\xef\xd3\xca*^\
+\xbf\x0ej\xf9=\xda\x10\x99)U\xd7\xf6/?x\xbd\
+\x92_\xbf\xaf9;i\xde\x9a\x93\xdev3\x0bKI\
+$\xb7m\xfb\x16\x0a\x12\x00o\xa8\x12\x7fU\xea\xeb;\
+\x92\xa8)\x18L\x98;\xd9\xba{\xa3\xd3\xb7\xde\xb6G\
+\x7f\xecl\xdd[\xebmwo\xc9\x82\x0f\x08\x122\xd8\
+\x1a\x85PqX\xe1(3\xd5w\x5c`\xc7\x1a\x02\x04\
+&\xaaw\xb6\x0a\xe55#]\x99\x22M\xcfXf5\
+\xdc\xa1T\x1a2Q\x13\xad\xfe>$j\x01\x8bY\xc5\
+wf!\x0d\xa9\x5c}\xfa\x88\xb8z\x9c\x9a\xce\xcc\xa8\
+\x1b9\x11R\x96\x19a\xa8\x88\xa0\x0ak\x86!33\
+\xeeI\xcd\xe90\xe5L\x01bZ\x14\xfe\x95\x96\xba\xd2\
+\x00\xef~@\xba\xbe\x08\x92\x14,\xc5F\x8b\x82$L\
+[\xf7\xc7\xdb\x16\xb1{\xfb\xbf\xde\x7f\xfc\xf8\xf8\xf9\xf9\
+\xd7_\x7f\xed\xfb\xb6o\xed\xf3\xf3k\x8e9\xc7\x1cc\
+Dd\xc0\xc2\x94\x191\xf3\xbe\x00B\xcd\x18m]\xfe\
+Thaz0\xa3A\xb2\xd4\xea\xbe\xb42F%\x19\
+\xd6\xf8\xad\xe7c\x7fW\xa4JDM\xcaU\x94\x99\xb2\
+\xc8\x90\x19\xc8\xfe\xdb\xa8\xdf|\xaf\x97E(\xb0@\xe8\
+\xbb\xf7m)Y\xc0l&Pu\xbf:EC\xde\xd9\
+R\xaa\xa7\x04\x15\xc4WK\xea\xee\xac\xf7\x04\x90\x02e\
+F\x1a\xb3\xbb\x83n \x80\xde{\xdfw\xef[k{\
+\xdf\xf7\xfe\xd8\x9aw3\x1a\x9b\xc0\x142e5\x07\xa5\
+\x00\x9ax?\x1b\xcf\x86X\xc6\x0a\xd3\xaa_&3\xc2\
++\x0d\xb32\xc4\xf5\xaf\x95\x8cL\xba{\x95\x08\x03f\
+E\x9dLlO\x10\xe0\x05\xbb\x00\xc0\x981b^\x01\
+\x9a\x99\x19\xa6B\xbc%Q\x05\x22\xa6\x12iy\xbd\xb6\
+\xf5sn\x94\x0a\xd4\x9a\xec\x00\xd2\x95i\x8a\x972\x90\
+\x94Y*af\x22q\xa1\xa1\xb8+_=-$[\
+kx\x01\x0a\xd3\xb2rIJ\x91qw\x9c\x99j\xad\
+\xfd\xf8\xf1c\x9f1\xe7\xfc\xf1\xfe\xfe\xf6\xf6\xd8\xb6\xad\
+\xf7\xd6\xfa\xcf\x8f\xbf>b\xc6\xdd\xa7V\xdf\x88\x86\xc8\
+\xb8\x92=\xb4\x06 ^\x08\x89I\x06\xacn\xa1\xee\x08\
+\x0c`_\xfd-^@\xae\x97\x16\xe2\xd9\xf2\xae?I\
+\xc8+\x8d1\x99\x82!\xa44\xe4\xdf;\x01\x99\xc5\xb5\
+d\xc9\x1b\x19\x07\x8dy\xb5\x01\x84\x80\xaa\xf89'\xe9\
+\xa2\xc1\xe0\xfd\x19\xfbp\x820\xc0\x0d$\x0b\xa5_\x1b\
+)\x92t\x80\x1d\x8d  \x10t\x07Y\x08\xc2\xe3\xfd\
+\xd1\xf6\xcd[g\xdf\xfa\xf6h\xad\x83\x94\x01\xf4\x10\x14\
+\x0b\x8cG5J\xb0\xd7\xcd\xc4\x13WJ\xa5\xc2tO\
+\xe2\xd5\xff\xd4\x00\x12\xcf\x89\xe7\xa5\x15\xc3k\xfd\x92E\
+\x01S\x15\xc5\x86;\x17>\x9b*\x99\x85E\xaa\x22u\
+\xc5\x81\x01\x86F738XC\xd7\xaa\xfe\xc2\xea\x9b\
+\xed\xca\xb0O\x14\x8f\xb0T\x9a\xc9r\xe2\x058\xa3\xae\
+\xf2\x96\xf1\xdc\xa1\xc1\xab\x92\x02\x88\xd4\xdd\x80\xb9\xbb\x19\
+\xdc\xfd\xea\x9d\xaf\x8bQ\x9f\xe7\xb3S7`\xdb\xb6}\
+\x7fd\xe4y\x8e1\x06\xe9\xee\xad\xf7\xcd\xbd\x99\x941\
+\xa5\xa8\x0biJ\x93\x0c\x22 \xc3\xc2\xa3\x9c, \x8d\
+\x0eQ\xa1\xc2\xea+\xcb\xd9\xea=L\xb2\xd5\xb0\xe0\x86\
+\xa7\xa5\x0b\x9e\xab\x1c\x03\x85\xd6z\xa5\xe0-\xd6\xde\x10\
+0Z\xe6\x1d\xe8\xc8\xdfA]\xebq\x86\xafy\xb0\xae\
+\xa7\x0a\x0d\xe8\xbd\xfd\x82\xd1\xd2I\xa0\xb7Va\x930\
+\xa7_\x9bT\xb8\xb7;R\xe9\x0e:\xdd\xe9m\xf3\xcd\
+\xaf\x0e\xd6\xea\x1a7gk\xfbc\xef\xdb\xc6\xd6\xd06\
+\xd4|`w\xce\x5c\x0fqJ\xd7\xc2'C\xa2\xf1\xb9\
+XJeF\xa1\xadRVvH\xe1\x06)\x16\x8c\xe7\
+\xde\x9a[\xb5}\xb0\xb5\x19\xfa]s\xa4\xd4\x11\xc3^\
+vn\xcf|\x97iF\x83\xddU\xf8\x9e\x9f\x00\xb8U\
+S\x9d\xacr\xff\x0b\xda\x5c\xa1\xb3 \xc8Z\xee\xe8\xee\
+e/\x04\xc0\x9f\xbb\x9a1\x0b\x94.x\xd0\xb9\xde\xf2\
+\x95\xff*\x0e`\x1a\x19\xf1\xbatPV\x8b\x83\x0b\x8b\
+\x8dJ&\xde\x9a\x84i\xd1\xba\x0c\x16\x99\xef\xb2\xd6\xfa\
+\xb6mNr=\xdc\x07\x8fs\x8c1\xe7\x8cxi\x0a\
+\xb1\xae!\xdd\xe9D\xd8TF\xdc0\xb9d\x15\xd8\x5c\
+Kt\x00f\xb2(\xbc\xf2J\xd8\xeb\x8eE\xd4\xd7j\
+\xd2\xe5/X\x18\x8dk#h\xf9\xfb\x06X\x04\xe1\xe4\
+\x8cy\xf5\xb0^\x17\xbb\x85\xa9\xb3\x11\x9e\xd2\xde\x9a\x08\
+#\x01\xb8\xb7\xd6]\xc4\xea!\xdcI:\xe9\xd7g \
+[\xdb\xe0\xee\xde\xbd\xb5\xdd\xb7\xadu\x92\x99\x99\xb0\xe6\
+\xdezgk\xbdwo\xde\xdc\x0dLP@\xcaR\x8a\
+8\x0d4#\xc9\xbc6\x81v5\xac\xb8VU\x91\xb5\
+w\xac\x15\xb523#\x0d\xd6\xbc\xd1\x1d\x04\x0c\x84K\
+\x8a\x08)\x81b\x02 \x95\x8a\xf8-\xb4d\xb5\xbfY\
+\xb3T\xbd^8\xe5`.\x1e\x00\xae&\xe4\xdb\x0f\x90\
+\xae&\xf2\x15\xa7\xab\x10-\x98\x06k\x80\xa8\xc7\xdc\x0a\
+8\xba\x92N\xc6\x02\x1a#\x2235g]R\x9a\xe0\
+\xad\xb5\xda\x09\xf0Z\x87\x9ae\xce\xf3\x04\xe9\xee\x06\xdc\
+\x99\xf5ndW\x05\x01R\x99\x11d\xa3\xa1\x81\xf4\xe6\
+\x0f\xfe\xd8\xdf\x8f\xf3\xa0Y\x8ep\xb4\xc7\xe3\xfd\xeb\xeb\
+\xeb8\xce\xaf\xaf\xe3\xeb\xf3\xeb8\x8f\xeaw\x04\xc8h\
+\xb2\xd6\xbc\xb5ffcFT\x86X\xbb{\xc8\xccA\
+\xb6v?Q\x00\xe9\xbdR\x9bs\x01\xb1\xa9\x1c\xf3\x04\
+3\xc6\xd0*\xe3O\xca\x88Y\x8d\x18\xe6^\xe3\xe0\xef\
+b\xd5=%!\x13\xe8m[\x05\x8e\xb00\x92\xad\xb7\
+\xde\xddY\xeb,o\x04j\xf0\xf7\xb6\x16\xf7\x96\xb9\xa6\
+\xfe\xd6\xdc\xe9\xa0\xbb\xc3Iz\xdfvo[k\xcd\xdb\
+\xd6\xbdw6\xba\x9bq\xdb6o\xde\xda\xfa{kz\
+\xaf2\xbd\xe2\xa6\x86\x93\xea\x8dt\x97\xfb\x1b=\xce\x98\
+\x19\xab\xa4\xafhU\xea\x02\xa7d\x0a\x8f\xd6\x1a\x9c&\
+\xd0\xc2\xdd\xdd\x1d4e\xd6\x0f\x8b\x19\xaf\xfb\xfd_\xd0\
+\x99\x1bY\xb8.$*\x1a^\xbf\xf3\xee\xc6\xf0K\xcc\
+^9\xc1\xf1mU\x13\x99U\xda\xea!\x91\xa2\x88\x01\
+\xaf\x98\x0e\xd0\x7f\xedp\xa4\xcaCs\xd6o\x8bg\x1b\
+-\xcb\x94bf\xa4xo\xc8^\xaa\x7fa\xd0W\xe0\
+:{\x8d~\xee\xdeZ\x87\x81N\x18\xb6\xbe\xfd\xc7\x7f\
+\xfc\xc7\x18\xf38\x8e\xaf\xaf\xaf\xcf\xaf\xcf\x9f?\x7f~\
+\xfc\xfc\xf8\xf8\xfc8\xbe\x8e\xc84c\xa4e\xa4\x94\x11\
+9#\xd3\xd2X(!*1\xad\xa4\x8b5Q\x5c[\
+~\x92\xec\xcd\xdd\x5c\xcaTxks\xceA\xc6\x18\x99\
+\x89k1\xbe\xc08\xba\x19\xa4\xf8}Z\xb5o\xcc\x95\
+\x0a\x1e\xaf\xe1\xd8\xd7\x9b\xea\x0e6\xd2\xcc\xba\xb7\xaa\xae\
+\x22\xe0`\xab\xd2\x07\xefW\xe9w\xa7\xd3I\xb2\x91\xce\
+\xb6\xb1\xb7\xb6\xed\xbdm\xceF8\xbd5\xefooo\
+\xde\x9c\x04\xef\x15\x98r\xd6\x150\xa3!\xa4\x99\x8a\xcc\
+\x95c\xd22\x17\xe1\x01\x09\x93E\xe4\x9ca+\x07\x87\
+\x94i\xa9g\xd9\x82`32GJ\xd9\xe8\xfb\xbe\x9b\
+\x99fV\xe7W\xd9\x0b\xfaM\xb0J\x16\x17\xf0^U\
+,\xb3X1Q\xcbz\x80\xf9\xc2\x18\x12\xbe\x07k\x8d\
+E\x8b\x98&\xb3\xb5kS$$\x83\xa4,j\x95D\
+\x13\xc7\x88\x1b.Q\xcal\x00\xed\xf5\xa7\xa5\xacz\x01\
+&#\xf3{\xc7\x92\x19\xb12=^\xda\x00\xe9\xc9j\
+\xb8\x835E\x8e\xaa\xfbf\xf7:Z}s\xfa\xdb\xbb\
+\xde$\x1bc|}}}}~\xfd\xfc\xf9\xfe\xcf\x7f\
+\xfes\xff\xb9}~~\xcd\x88L\xcd\xa91\xc6y\x8c\
++\xe7\xc1hU\xf4\xd9\x1aj\xc5\x03X\xd5\xdd\xb5T\
+4\xd6\xba\x89h\x0e\x13G\x1a,\x11w|b\x81\x88\
+\x10.\x9a\x01e\xff\x1a\xb9\x22\xea\xda\x15W\x08\xe4\xea\
+'\x9b{+\x80\xda\x88\xeem%BR\x5c4\x02\x10\
+\x91j$\x9cX\xf1Jc\x03\x1d\xf4\xb6\xf5\xde\xf7}\
+{l\xdbN\xd64\xd0\xb7m\xafZ\x7fU\x0b\xbb\x98\
+t&)aQ!\x981g\xc4\xac\x16@*\xc8'\
+2f\xe6\x8c\x8c{\xaf\xb9&\xa6\x0aV\xac\xc5O\xf3\
+\x5cx\xa4\xa4\x90}}}\xad\xfe\xc9\x8a\x95\xf5\xdf\xf5\
+\xacx6\xcb\xc0o\xf74\x05IWD\xa4%\xb3\xee\
+\xfc\xb7\xa0\xaf\x7f\x8f\x18\x95_\x177-\xc3,\xdd=\
+\xd7\x90T\xdf\x7f\xef\x1b\x8b&F\x83\x11-\x14\xf5\xb6\
+p-\xdbD\xbb!\xd5\xab\xaf\x8d\x19\xb3r\xcc\x1d\xac\
+\xf9\xcbe\x91n\xba\x9b_\xa5ba\x17\x5c\xdd\xce\xbe\
+\xef$#\xc2\x1d\xbd\xfb\xfb\xfb\xe3\xed}\x7f\xbcm\xfd\
+\xffm\xfb\xb6\xa7\xec\x9c\xe3\xf8:\x8f\xa3\x11.}\x01\
+JC*\xeb\x81\x06Iov\xfd4\xa7\x9b\x94\x19Z\
+@;\x0d6\x95\x96\x9a\x11\x111\xc6\x983R\x82T\
+\x84\x8e;}\x90\xcc\xb56\xe3\xff\x98\x5co\xcc\x9e\xad\
+m['\xbdy\x118a\xe9\x1a1\xd8\xbd9\xe00\
+\xd1\x00\xb2\xbd\xed]0sG\xd1^Y\x9c\x84\xbe\xef\
+\x8f\xd6\xf6m\x7fl\xfb\xc3\xe9\xd5l\x91\xc5vR\x9a\
+$D<\xa93\xc5\xf0\x8b\xc8\x19sf\xc4\xcc9c\
+\x16q-r\xceZ\xc1\x14\xb0y\xd5\xbb\xda\x5c]\x03\
+\x07\x00o\x0ddd\xc4\x08g\xb5\xc2\x98s\x81\xf9$\
+\xbd\xb9\x89Rf\xce\xcc\xa8\xf4\xe9\xde\xb8V\xc6@\xe2\
+\xc9|\x83\xc9bm\xe9e\x82\x93\x0d\x80\xa5\x9c\x9e\x12\
+D\xc0\x5c\x94\xc5Z\xf2\xa1I\xa2Y\xe65B\x99\x99\
+\xa9wwz\xa4)\x11\x0b)t\x00N\x8f\xeb-y\
+\xf3H\xb3L\x13\xab\x17\xab\xb0\x9ff\x995b.\x08\
+I\x12\x0d\x19\xb3>\x9fc\xa6\xa5\x81\x92\xe6\x9c\xeb\x09\
+\xcf\x5c\x8f\x1d\xd1Z#\x99\x98sV\x83\x9f\xd5\x17\xb5\
+\xd6\xb6mk\xcd\xdd!\xb5\xc7\xa3\x1bh\xb2\xf3\x1c?\
+~\xfcx{{\xff\xfa:\x22\xe2<\xc6\x9f\xff\xfc\xf9\
+\xd7_\x1f\xe7c>\xde\xbe\xbe\x8es\xa6d\xa8\xd2K\
+w\xad\xad\xca\xaa\x81c\x0c3\xb4\x95\xb3\x8aG\x22\xa3\
+\xc1\xc0\x90l,\xcc\xc5\xc8\x02\xd1\x01eB\xa6\x02;\
+\x8c\xad\xe0\x93\xeb\xc9\xbf\x87\xc5\xe4\xeas\x054\xd2\xbd\
+m\x8f}\xdf\xf7\xfa\x86v\x1cG\xb6\xc6\xde\x80\x84;\
+\xcc\x82FX\xdf6\x92\xee\xbd\xf7\x9e0\xb0U?\x94\
+\xa0\xbb?\xf6\xb7\xc7\xe3m\xeb\x0f\xf7\xeet\x13\xb3\x88\
+Ni\x8aX\xeb\x8f\xabS}\xd2\xe7B\x91\xc5V\xcb\
+\x88<\xc7\x98cfV\xb0\xc6\x8c\x8c\x19\xd7\x0d\xba\xe7\
+\x12\xdc\x1cK@9\xc6\xfa\x03\x82\xc00\x02\x5cO[\
+%\xcd x\xa1\x1eZ\xccq\x17\x9c\xe6p\xe2\xe6g\
+\x1b\x14E\x1e\xe4j\x1c\xf1\x0b\xe0w\x7f~\xc1\x99i\
+O\x12\x8a\xd5ds\xb3<kt\xcd\xc8P\x8c\x11\xb8\
+i#k\x03l$\xe7x\x82\x01\xbf\x10*\x8ag]\
+Av\x03g\x19\x83\x02\x09:\x17\x14]\xb8|F\xcc\
+\xb9x!0\x90+\xfbJ\x95A\xc7\x18\xfb\xbe\xef\xfb\
+^\xdc\x02w\xef\xbd\xa8\x1a\xc57\xf2}\x9f\xdb\xb6=\
+\x1eo\xc7q\xce9\xbf\xbe\xbe\xb6}\xdb\x1e\xdbq\x8c\
+\xf7\xf3\xfd\x1ccf\x8af`\xb15\x8ec\x8e#2\
+r\xd5\xb8\xc5\x85;\xbd\xf5\xc6\xbeF\xfc\xaa\xa4\xcd[\
+\xef$\x14\xd3\x22\x89\xc2\xcdjZ\xd3+\xe3\xef\xef\x8c\
+\x99\xbf\xe5T\xaf\x22\x99\xb0VK\x81s\x8e4\xeb0\
+'Zk\xd5\x08\x93,\xb2D\xb1Ih4\xb8\xe0\x82\
+;\x1ch\xf0\x0e\xdf\xbd\xef\xa4\xa7lF\x22\xd7\x04\xcd\
+o\xec\x12\xbd\x00\xe7U\xf6\x161\xc5L\xc5L\xaa!\
+q\xb1g\x80\x90F\xcc\xfa\xde\x22@\xad\xb4z\x8fe\
+0\x10\xcd[sO\xcb\x90r\xddR\xd0\x9dl5\x86\
+\xde\x80\xaa\xa5%\x14\xca\x06\xe3\xdd\xe0\xe7\x22\x0d@I\
+Y\xbddM\xdd\x11\xf6z\x05\xe5\xcfM5p\xf1\x94\
+,_\xb7\xd7U\xee\xa72\xe6\xcc\x10\x80\x95\xf9\xae\x9f\
+\x93\xdf\xfbQ\xff\xdeZ,&|kW\x19\x9d\x15\xc2\
+d-gp\xe3\xffs\xce4%,q\xad\xd9+\x84\
+\x22\xaee\xa6Zk7\xbd\xb0~x&\x0d\xc2\x82\xba\
+B\xa6\xd6\xfc\xed\xed\xad\xb7m\xc6\xdc\xfa\xe6\xf4\xc7\xfe\
+8\xe7<\xc7,\xaa\xd7\xcc\x1c1??>\xff\xf1\xe7\
+\x9f:\xc6\xd09s\xa5\xc3\xa913\x01Ja\xe9\xad\
+\x01tS\x02\xee@\x97\xe6ic5\x06\x99\x91Zw\
+\xe9W6\xeb\xc5\xae\xba\xf9\x02\xfc\x0d\xf1?\x93\x99\x95\
+\xff\xda\xcc\xa4)aN\xbcRc\xd0\x1a\x1c%5\xb8\
+\x16\xf74#{wv\x13\x95:\xcfQ\x9d\xcc\xddL\
+\xa5\x16\x9f\xf4\x02R\x9f\x81\x9bV\xb3\x81\xfeO\x18=\
+\x85\x15\xcc9\xcesT\xa0\x9b\x04\xa37\x87\xd3\xe5S\
+3\x22\x00\x88\x96\xb9PD\xc2\x18\x86d\x95h\x81\xa6\
+\x90\xa1iUW\xca\x00K-\x8c\xb1\xe4\x04np\x80\
+\xc2\xcc\xf9\x1a\xac7\xdaj\xe6F\xd1<\x11\x0b\xa5\x81\
+\xc9l\xce\xe05\xb67\xf7\xfb\xadU \xde\xf4\xfb\xdf\
+~\xacp\xbc\xdelU\x931F\xe6\xc2\xea$A9\
+\xe7\x8a\xd1X\x93\x16%\x8d\x19\x95\x86\x0dx\xe5K/\
+H\xe4J\xea\xd5\x1bH:\x8ec\x8c\xd3\x9bW\x8bY\
+\x0d.\x9d\x0d$}\xd3\xf6\xd8\x1f\xdb\xb6\xfd\xf8q\x9e\
+\xf3\x8c\x94\x01\xe7\x8c\xafq\xfc\xfc\xf8\x88\x1c\x8f\xd1\xe7\
+\xec\x91\x99y\xce9Jn\x03\xa2x\xc9\xa2\xd2\xccY\
+J \x99\xb1\xf7\xae9O\xe5\x8ci)\xdck\x88W\
+&F\x01&\xcf\x90\xe3o\x01\x01\x08\xc6i\xa3\x08\xca\
+l\xdb\xb5\x97\xf3\xde\xbd5w\xef\xbd\x9b\x13\xb8W\xc6\
+\xdd\xcc\xd9\x9a\xfb\xe6l\xee\x9b{k\xad\x99\xf9L\x9b\
+\xe7Y\x14\x8au\xc5S\xe0\xeb\xe0\xf2\xc2t\xac\xc9\xb0\
+\x08Q\xb0\xca\x95\x00\x8d\x10%\xa6\x89h\xc6\x08\xa6\xad\
+-M\xedz2\xe6\x0c\xc2\x9c\xcf\xa7OfE\x1fR\
+B\x8225\x13\x93\xdej,\x80@\x83\x00\x86\xcea\
+l\xee0\xa3\xae=\x82\x19dB\xedY\xae\xd4\xcev\
+\x13pkS\xb4\x22\x8f\x109\x95\xdezZ\xa5\xb0\x00\
+\x80v\xedbdQD<\x10p\x5c\xf3M\x5c@\xef\
+\x85\xce\xd6O\xce\x9b\xd9YT/\xe6\x0d&'\x80\xc8\
+\x88\x8c\x22\xd7\xdd3\x15W@OI\xe3\x9c\xf97m\
+\xd3\x22q\x93\xbc~\xb2}k`\x84\x81\x82*\xdd\x9d\
+\x8b:\xe7l\x8b\xdf\xe4\xedm\x1bm\xccm\xc4<\xce\
+\xf3\x88\xaf\xc8\xd3l6\xb7m\xf3\xbe\xc1O\xc1c\x9e\
+G\xa4|k\xfb\xfep\xdfdP\xf5\x88\xbdC\x96\x19\
+\xaaW_k\x14\xb2\xe0\xf3\xe2\x1c\xe5/\xc9(\xd7\x12\
+\x0e\xc4\x8c\xb9&\x90\xbb\xd1ZH\xdfz\xf6B \xbd\
+=\xde\xdfz\xef\x15\xa3k\x83\xd9\x9b\xb7\xc6\xe6\xa4;\
+\x1b\xd9\x9a7\xe3\xd6|\xa3{\xf3\xad\xa6\x10\xc9\xc6\x8c\
+9\xe6\x8cy\x0d\xaaYj\x8d\xe2\x07-:\xca%<\
+\xb8\xa8m\x954\x8b\x97z\xed\xe8S\x04D\xa3\xd8{\
+\x07\x10\x910K\xcf'gT\x17\x18r-\x87\xea]\
+\x092Z\xa4E\x86\x09Th\x05+\xcc\xdc['D\
+\xa4 \xa8\xa45\x0bR\xa9g*\x8bY\xbcRT%\
+\xd4\xb5\xf3d\xd1\x05\xcd\x22\xb3\x92\xe5\x88Y\x1c\xdf\x04\
+\xd7f\x98d\xf1\xee\xf2\xdb\x00\x1b7\xe4\xf4\x84\x99J\
+\x90\xf8\x5ck\xe9\xda\xac\x86\x22\x22\x94\xbas\xea\xda~\
+?\x87~\xcd\xeb\x8b\xbf\xb0p/}\x1f*\xad\x96\x16\
+\xa0(\x99u7\xcd\xac~\xe4\xea\x8c\xc7Tf\xd1/\
+\x8butc\xc0\xa4\xbc\xc1\xe8`\x97\xedP:\xcd;\
+\xd9\xd9\xba\xbf\xbd=~~|~|\x1dk\x0f\x01\x97\
+!\x12\x95\xa0Rai\x19\xb9\xda\x981b\x86\xea\x19\
+#\x90\xbcV\xfd\xf7\xb0m\xc5/\xf9\x85\x04b/\xed\
+\xc1\xcbk[\x90J{\xbc\xbf\x17t\xea\xad\xf5jT\
+[\xf3\xd6\xe0${A\xaa\x80\x83]\xbcK\x8cj\x87\
+n\xa6\xb0\x98\x9a\x19E\xbfKe&\xe0V\xbci\xd6\
+B\xea\x85\xa0\x9d\xc5\xe2Y\xc9\x8d\xb8\x17z7 \xb3\
+\x0a\x99\x0b\xee\x22\xcc\x81\xa0OX\xe8\x05\xb4\x93!\xab\
+o[\xf4~\xb3\xb0\xa8\xcdu\x0d\x93\xb9\xa21\xaev\
+\xb4\x88\x86\xa4\x91i^\xfc\x84E\xd8!\x8b\x02\xa9\xa8\
+\xd5c\xf1\x86\x08\xb06$\xee+\xa1\xc3RI\xd2\xcd\
++%TzF2\xd7\xfc\xc3\x97\x95\x0dj\x9f\xb7\x16\
+\x19\x92\x88\x22\xb4g\x04\xc0\xcc(\x16\x9f.\x10$\x22\
+\x22c\x11\x05\x89|2N\x0d\xc4\x12NUo\xa5\xa7\
+\xb8\xef\x19\xa97\x22C^\xb9\xe3\x09t\xdd\xf1\x1a\x01\
+2\xdc\xfd{\xf1U\xf5\xb2\x82\x91\xb6?\xbaQ>\xfb\
+\x1e\x8f\xfdq\xee\xfbc\xce\xf9o_\xc7\xcf\xcf\xcf\xf3\
+\x1c1\x15a\xe7\xc8\x19\x0aid\x8e\x19f\xc5Y\xab\
+\xad\xb8\x914\x99\x90,B\xde\xd5\x05\xb0D\xa7\xfe\x84\
+\x0eq\x91\x89e\xe6\xf6\xa4'?\x95\xa7\x99\x9eIf\
+\xf3\xe6\xb5\x98\x06\xd0zo\xbey\xf3\xe6-a\xce\xe6\
+\xee@[\x0c\x96Z\xf3d\x11\xd34\xe6,|h\xcc\
+\x11\x114\xd4\xe5\x01\x08\xce\xebWVd\xddO\x8c`\
+\xe6\xa5\xeaDQ\xa7\xb0ZdC\xa6\x22\xb2\xaeu\xeb\
+\xee\xbd\xbb\xb7\xd6F\xc4,F\xe9\xcd\x95^w\xb12\
+\x9f\x0a\x0f\x11\xa1\x84e-\x05\x0a\xbev\xa0\xa0\x15\xad\
+E\x9f,Ra\xa9f$\x9d\x22\xcdai`\x16M\
+kmaM\xa60\xa3\x89\x96.\xc4\x1cf\xe9\xcd\x89\
+\xe6\x0d\x80_\x98\xc2\xcd\x9fz\xca\x04DT\x9d\xfd\xb6\
+\x17\x952$\xde\x84\xb2\xacH\xcd\x88\xb5S\xce\x88(\
+\x80B\xa5\x0e}\x9d\x9f\xbf\xd5}]\x17\xf7)(X\
+Y\xeab~`\xcey\x1cG\xe5\xe9\xcc0S\x95\xbb\
+\x05l\xad%\xe9\x0bs\x14)%\x1c\xbc\xa2a\xdf\xf7\
+\xeda#R?\xb1\x0a\x05a\x8e~\x9cJ;\xcf\xcc\
+\x8f\xc3\x90\xb2\x84L6-\x91\x11\xa5\xc9\xa1\x03h\xc1\
+\xd0\x10\x12\x5ct\x8d5\xa1\x1a\xd0\x9aKq\x0f9y\
+S\xe4\xf4;\xe1AV\xa2\xb1\xb6\xfbN'\x9c\x00\xb7\
+\xfe\xe8}\xaf\xb1\xe0\xb1m\x19\x9a\x99\xca!&\x90\xb0\
+$y\xce\xa3D\xa7s\xceP\x8e1\xd6\xa0\x03f\xd6\
+\xb6I\x5c\x0a\x8b\xcc\xef\xe3T\xcc)\xd56\x99\x97P\
+\xae\x10\xb1\xfag\xa1N\x92\xdcLJ\x87\x99\xbb\x93\xe0\
+\x9c\xc3.=\x9f\xa5,d\xb96\x8e%\x04SB$\
+dV\xc0mQY\x22Gqo\x8b\xd0X(\x01\xc1\
+\xb0J\x81|\xa5\x8e\x03O\xfc\xaa\x02Q\xb04Y\x84\
+\x83R\xd2h\xdd2\x0cH\x5c\x11\x19\xd0M\xd5\xcej\
++\x12\x06\x8fR\x88,\xae\x12$\xf3%{\x06\xe8s\
+\xce\x8cXs\xc6\x93MeW\xc6\xcc\x9b\xd5\x5c\xf1\xe7\
+W\xd7\xab\xd2U\xdcT]_;mVgu\x8d\xff\
+5\xae\xcd9\xaf/}\xa3h\x15\xbfq\xd5s\x18\x09\
+)#'\x09w\x94\x0c\x09\xee\x09\xce9e\xd6\xfb^\
+\x90\x9a\xd3c\x7f\xcc\x88\xe3\x9c\xa2\x8e\xaf\x81C\x99\xe9\
+6\x0b\xee\x85|\x90\xc3p~\x1d\x86\x04\xdd\xe8\x86U\
+xX\x88\xb6\xa0H\xb2%\xb2\x08LN\x84\x89\xb2\xe2\
+\xb3\xf1b*\x82(Fe#\xba\xa3Ug\xe7[\xb1\
+\xb0\x1b\xd9\xd6\x0c[\x1b/\xb3\x14\xe6y\xa6\xa0\x84\x12\
+\xb3\xa0\x88\xd0y\x8e\xd05\x19H\x06.\x14\xce\x16;\
+\xee\x12<\xe1\xb7\xf2\x08\xa7{\xf3\xde\xfb\xbe\xef\xad-\
+<\xf5\xbe\xa0k\x1c\xae-\x83Dq\xf5\x10\x17]G\
+\x179\xfd\xfe/\x0a\x81\x5c\x8b\xdcH3\x0c\xac\x0d\xb1\
+\xfb\xb6mf\xbe\x9a\x0f^N\x16\xd5\xa2^A\xfaM\
+~M\x00\x08\x93\x17\xd1\x93wRO/zk\x0a\x17\
+\xc5:\x95$j\xe3#Sf\x5c\xd5\x18s\xc6/3\
+\xd0+\x5cu\xf1\x22\xb2\xd6E\xbf$\x96\xa5\xc7x\x05\
+\xd1\xaer\x84\x97\xf6\x8eWa\xbc\x97Y\x85p=Y\
+\xdb\x17$\xa3\xef\xfb\xe7j\xee\xab\xab\xa8\x0aN\x82\x8e\
+\xd6\xdc\xadA.\xd0\xc4\xbdo\xcd\xd7\xab\xed\xbd\x1f\xc7\
+q\x1c\xc7\xe4\xdc\x9ag\x8b\x0cS\xc0\xb6f\xb2\xd6\x1a\
+\x04\x85\x06\x12n4\xbf\xa0\xe8\xc2]\x8aN\xac\x94\xb9\
+AJ\xc3}YX\x88lF\xd6\x92\xe1\xe2q\x12\xb4\
+[\xca\xd6\xce9\xb85\x17\x95\x89\xf2\x95h\xad\xf6\x80\
+\xb9\xc8\x1e\x19a\xb3\x8a\xf1\xcc\xf3\x8c\x981#\xbe\xce\
+cF\xd4\xf6,\x22\xce\x19\x11\xa9BO\x17#[\xbf\
+D\xa9\xbb\xf3\xa6\xed\x10\xad\xb5\xado1c\xdb\xa24\
+[$!\xa8\xb2_\x8d\x07|.\xc4\xf3%\x9c\xb1\x1a\
+]\xab\xe5\xca\xc5\x92\xe1b\xc1G\xa4\xb2\xb0\x8c\xcc{\
+\xf5\x98\x17\xab\x86\x17\xa3J\xb4Y\xd3\xbf\x19pQ\xd1\
+j\xfc\xaay|()\x13\xbd\xf6\xa8\xbc\xc4\x1a\xb9(\
+\x05KA\xbf8\xc2Z\x1b\xb2\x8b\xaf\x89o\xaa\x19x\
+\x05\xc9\x88y\x0fJ\xf5\xf6\x88\xb5\xf7\xfa\xed\xbe\xf1\xd6\
+\x88\xea\xde\xb6\xbcD\xf4\xeb\xa7\x80RS\x89WV\x13\
+\xad*\xfe\x0b\x81f\xf5\xd0\xbauBuu\xab\x82G\
+\xb8\xab\xc3]F\xe9\x1a\x11L\x96r\xd8\xde[\xa3m\
+[{l\xfd\xa3\x7f}8\xbe\xa8F\x9bS$\x94\xa4\
+\x1bi\xa0f$[\xa3\xaaO\x95Uf\xab\x89\x0ff\
+0\xf2\x89\xf7Q\x90lZ\xde\xf81\x094\x02\xc2\xa5\
+\xe7im\xdbZ\xdb{\xef2:[Y\xff\xdc\x14\xa4\
+\x22m\x9c\xe7\x1cc\x1e\xc79\xc7\xfc\xf8\xf8\x9c3\xce\
+\xf3\xfc:\x8f\xf2\xe2\xc8\xcc1\xc69#2yYn\
+\xbc\xaa\xf2\xbf\xa5\x16\xc2\xe9t4\xa7\xb7v\xb6s\xce\
+\xe8\xfd\xac\x11\xd6\xdd+{\xd0\xd9z\xef\xea\x00\xd2\x8a\
+4\x10\xba\xc6\xc2{H\xae\xeem\xfd\xb7V\x0d\x95-\
+\xe2\x17r\x9aJRr[\x22\x88\xae\x9aSK\xeeT\
+\xabB\xde$b4\xb2\xd4\x9fL\xd5\xec\xbc \x08\x5c\
+\x82\xbe4\xbdL\xe8 \x8a\xf5\x19,*P\x8d\xf9\xfa\
+ED_c\xcf\x1c\xa3\xf1E\x95eL\xcd\xa7\x97\xc9\
+\xdd5e\xd4\xd3\x0b\xad\x07\xe0\xb7\xf1\x5c\x9d\xf0-\x87\
+[\x15`\xb1\xff*\xe3\x86]fP\xb7L\xb6\x14\xbf\
+\xb1\x18\xd9Q\x9c\xd4B\xab\xfb\xd6\xfa\xdc\xe9.P\x06\
+z\xb1\xdb$\x89tG\xd2\xe1p\xd7\xd6d\x0f\xf7\xf1\
+x\x8c3\x8e\xe3\xac\xcdAt\x8f\xadE\xce\x92$\xf0\
+B\xf7 b\xf2\xbaA\xb3\x9e\xc0\x97\x22\x91fYK\
+\xa25A\x95\xd2\xaaa\xef[o\xad\xf7\xde\xf6\xb7\xf7\
+\xc7\xdb\xdb\xb6=\xe0N6%f\xael!\xc3\x88\xfc\
+:\x8f\xcf\xf3\xf8\xe7\x7f\xfd\xf9\xe7\x9f?\xc7\x98\xe7y\
+\xde\xcd\x90\x11\xd7*@\x09*5e\x0bf\xb9\xea\xdc\
+\xebe-\x8c\x0c\x08`\xad\xaf\x9a\xb7\x8f\x8f\xaf\xbem\
+\xdd\xb7\xde{\xeb\xedb\xb8\xb5\x191[\x00\x04)\x13\
+\xe0\x8e\x95Z\xb2\xc4x\x95\xae\x96\xdbH\x11\x08)S\
+\xde|+\x14\x91\x9cJ\xcd1\x93\xc9J\xed\x19i1\
+\xcd\x00\xb4V\xcf\x97\xdcP\xd7\xb5\x1a%E(\x93`\
+\xad\x99\xa5L\x19\xd0\x9c\xed6\x02\x8b\x0bB\x0603\
+\xeez]\x8c{\x89s\x86l.\xd4\xb8\x04\x90\xd5\x80\
+\xb6\xb6\xb4V\xb2(/\x99\xcb#\xe3\x17\xfe\x91]\xcb\
+\xad\xc2\x07\xb1\x16\x8a\xb8\xf88V\x1c \xb1\xe4F.\
+\xa9D\xe6\x99y\xf1\x84F\x8dQ7o\xe0\xd6]\xcf\
+\x88\x19\xf3\x0aV\xe1\xe2\xd4\x14|\xd9z\xf7\xe6t\xdf\
+\x1f\x8f\xb7\x1f\xef\xfb\xbe\xbb/\x09\x0e\x8cF\xf4\xeeo\
+\xde\xf5f\x99\x9as\x9eg\x1c\xe3<F\xfc\xf5\xb1\x7f\
+|\x1e\x9f_GF*P}\xa2E\x8c1A\x01\xfe\
+\xf55#\x0d&j\x020\x87;\x91\x96\xc1\x9aUL\
+\x09\xb0R\xf2\xe5aC\xc8\xda\xb6md/\x0e\xb5\xdd\
+\xf0\x92\x98s~}~}\x9e\xc7\x9cc\x9cc\xceq\
+\x1c\xe7\xd7\xd7\xd7\x1c\xc5\xcd\xcde\x9bs\xf12g\xce\
+\xc8\x82\xe8\xf5\x8d\x8aR\x0e^\xf8FR,\x8d\x0e\x1d\
+\xde\xdc\xd9\xfc\xeb\xdc\xf7\xfd\xed\xf1\xc8\xdc\xc0R\xce4\
+o\xcd\x99\xa4\x972\x02\xa4\x91O\x0e\x93)2gD\
+Q\x0dsI\x04q\xb3T;\xdd[\xaf\xc77\xaf\x85\
+m\xe6\xd3\x8b\xe5b\xe1-9\xb7\x0c\xbe\xd2O\xd4\x03\
+\xc1\xda\xd5*-\xa3\xb5v\xdb\x22\xadNRvM\x96\
+\xb5\xd4M#\xef\xa5\xe8\xeb\x1a\xa6\xda$I\xcb\x12\xeb\
+;k\xb6\xc8.E\x8c\x9c1\x09\xfe\xcd\x07%3\xab\
+w\xfb\xd6\xd2^\x8a\xb4\xd5\xa1\xce1*\xd6*T\x8f\
+s\x8e1\x16Qh\xd6\x1ax\xd6\xcb\xb8\x01\x85\x191\
+^\x82\xf5j$\xea\x19n\xad7\x90}\xeb\xef\x7f\xfc\
+\xf1\xc7q<\xde\xf6\xe6\xeel\xb5\xe8vz\xa3\xcb\xd6\
+Rm\xef}\xdf\xf31\xf7\x99\xfa\xb7\x7f\xff\xb7\xafc\
+\x1c\xe7\xf9u\x8c\xaf\x9f_\x1f\x1f_\xe7yFX\xc4\
+\x84\xb5\x82\x9f\x16\xdb\xac\xae\x0c\x17\xde>1\xcb:\xec\
+\xd5\x8c\x82\x80\x93\xa9\xa4\xd8\xd0\xba`\x99\xa6EE_\
+>\x08\xe7\x1c_\xe3\xfc\xfc\xfc8\xcf\xf3\xf3\xe3\xf8\xfa\
+:#\x86!\xcd\xe4\xab\x17\xccZ\xfcVf\x8d\xac\x98\
+(\xcb\x9a\xa7H\x084=\xb7\xc2\xaa\x9cT\xe1qI\
+cf\xef[\x86\xc5\xd4\xbe/\xe8\xca\xdbl\xde\xbcM\
+g+\x04\x0adA\xea\x0bX\xbd\x9d\x85j\xf9|m\
+\x9ePjn\x07\x1b\xbc-\xce\xef\x12\x1bZ\x96e\x92\
+\xaeB\xf3\xe4\x91\x18)\xcb\xda\x0c\x14\x00\x97rw\xd0\
+#\xd3/\x8c\x22b\xc61=\x8a\x14\x82\xbaP\x17\xf3\
+\x88wv\xd4\xea\x8a\x93\xd4,\x9a\x83\x85\x84\xa8\x1d\xb0\
+=\xb7\xd3\xd53\xe55*\xf2\x09\x83[\x19!\xbd \
+\xf6K\xc1\x5cu\xfc\x0e\xdbz\x8ab\xe6\x88\x82\x10\xd7\
++8\xcfs.&[\xc4\x18s\xccY>o/\x14\
+\x85\xa2\xbb\xbdL\x04\xc5\xca\xa7\xd7\xa2\xabw:\xfb\xd6\
+k\xa0>\xcf\xb2j\xec}\xdb\xba\xf7\xee}\xdb\x9d\x0d\
+(\xc4\x0f\xe8j\xde=\xd3\xce9*\xa8K\xfab\xb4\
+}\xf6\x8c\xe4\x7f\xfc[5j1b\x8eQN\x89U\
+\xa8\xcb\xea\xc6\xc9\xea\x94\xca\x10$%\xea\xead`\x09\
+k\xb4\xa6\xb4c\x0c\xd6f\xec\xe2\xa3\xd4x\x91\x91\x9f\
+\x9f\x9f\x99VT\xe9q\x9es\xaa\xe8WKP\x9f\xb7\
+\xe6xq\xde\x9e\x00 \xb9\x88\xc1\x97\x15\x90\x16gg\
+\x01\x05$\xbcy\x86\xc5<f\x8b\x1a\xe1Z\xeb\xad5\
+\x9f\x19M-\xd4\x9b,\x81\xb8Dz\x15\xac\xf7 \xed\
+%R\xbcL\x11\x96\x86q\xf91\xa5\xb2\xa1\x81\xb7\xc2\
+\xfb6l\xba\x05\xbakQ^?\x1c\xc5\x96\xbfdP\
+\xbeT\x9aO\x0eJD|\x0b\xa1J,f\xb4\xd5\x06\
+\x5c\x16\x96\xe9\xe6\xe0\xd3W\xb1\xc6\xdf\xcc\x80\xf8\xe2\x04\
+\xf7\x5c<\xae\xb9\xbey\xe6/^i/\x04K\xe5\x02\
+\x95W\xd7s-\xd0\x81\x8c\x1cc\x1c\xc79gTa\
+\x1bepYSq\x05\xeb\x9c1\xe3\x1b\x1e\x80'R\
+\x96\xd7/.&\xb8\x8fl[\xc2\x19\x19\xde\xbd\x14$\
+X9)\xb1\xc9\xc1\x98'Z+\xf3\xca\xda4;<\
+S)'\x1c\x84,{o_\xfb(\xa9\xbd\xa3\xde;\
+\xce\xf3\xfc\xfc\xeb\xf3\xe3\xc3\x8e\xe3\xa0\x83\xc1\xcb\x18O\
+5\x1b\x9b\x99\xbb2af\x0ck\x99N*\xd5\xbc\xf5\
+\xdb\xd8BR(C\xc8\x8cc\xcccL\x19\xdf\xde\xfe\
+\x98s\x16\xec\xdcz\x1f\x9f#3CA\xaa\xdc\xaf\x22\
+-\x97Tw\x19v\xf6\xc6*j\xb9\xe0\xee\xab\xc4,\
+Zd\xc1&\x05\xdfD\xb0\x10\xa49Fl]\xbd\xa7\
+\xfb\xa4\xb3mm\xdf\xb7s\x8e\xa2\xb1z\xe9\x01\xafe\
+k\xd6'a\x06\xe6M\xf3\xa6t\x89\xd9k\xabc\x02\
+\xf32\x92\xd0e\xd7J\xbb]9n*k\xd9{\xc1\
+\x0b}eF\xc9c\x02$\xace\xd8\xb4\x94\xe4\x8e\xc8\
+\x90\x8b\xf4\xda\xaf\xd1\xa0\xc8b\xb3Q6\x8aw\x9e*\
+\x0d\x99\xc2r\x91\x1e\xa3\xf7f\xd5\xaf\xd0\x8c\x9e\x99\x81\
+\xccH'2\xcd\xe0$F\x8e\xb2B0-\x7f\x0c^\
+\xcc\xee\x8c\x9cq\x07\xdc*\x0bq\x9e\xa9\x8c\x98\xc7q\
+~}\x1es\xcezZ,\x15s\x9e\xe7y\x1c\xc7\x9c\
+\xcf\xee\xfaE\x94\x02\xa9\xacn\xea\xd6\xb1\x16P\x10\x1c\
+L\xd9\x18a\x91\x99\xa1\xcc\xf3\xf3\xeb\xeb\xf1x\xec\xdb\
+c\xdf\xf6\xc7\xe3\x8f\x1f\xe9f\xb0\x84\x82}\xdb\xb6\x87\
+\x19\xef'\xc8\xbd\x99\xa97\xe3\x1b\xe6\x9e\x7f\xe0G\xe1\
+\xa6c\x84\xa4s\x9c\xf9\xe7i-\xd1\x94#\xc3f\xc4\
+X\xf4<\x82~O\xf6Y\xab\xf2\xf56M\x84\xb5\xb2\
+\xd7\x5c4\xfe\xc8\xcc\x98/sCePk\xad\xa8\xbc\
+\xdb\xf6\xf8\xc9\x8f1\xc6\x98\xe7\x98 \x87\xd4\x96\xe6\x22\
+\x9f\xc3\x1d\x0c2\x114\xafG_\xb9t\xe0\xb8\xf6\x7f\
+E^6P5\x83W\xa6\x8e\xd0\x18\x93\xce\xd6[\xcf\
+-S\xad\xbb\x93+{\xbb_F\x80Ri\x9dQ8\
++T;\x0b8o\xdf\x8dT\xce \x10HV\x8bY\
+\x05\x19\x10\xd2\xccs\xe1yZ\x0e\x1d\xd5\xa1.\xf9I\
+^\xba\xf7\xa5\x83S\x18\xea\xf9\xe6\xcb\xf6R\xc5\xa7\x7f\
+\x8a\xbd\x14\xa9\x08\xa4j[\xfe\x0b\x06\xa5\x99\xdf6\x9f\
+\xca;\xe8\xdc\xf1JC\xbe\x7f\x9a\xf1r\xda\xad\xc7\xbe\
+(wy\x0b\x104\xe2\xac?9\x8e\xf3\xce\xac\x91\xd5\
+\xce\x97\x7fp\xe1xx\xc1nk\x8bP\xed\xae^\xdc\
+,o\x11\xe5\x13r\x8b\xc8\xe383\xe68\xce\xaf\xde\
+\xde\xde\x1f\x7fD\x94\xd2\xde,\x81\xdd[\x8b\x19\xbch\
+ ,c6gU\x89\xed\x1a\xeae\xfa\xf8\xf9\x15\x11\
+2\xf7\xcdK<J\x06a\xdb\xd6R\xc8\x0cSC9\
+0D\xe0\x1a\x000\x86\x93m\xf7\xc8hEB\xcb\x95\
+btS3\x01\xefm\xa78\xc6D\xcc\xe5y-n\
+\x8f42\xcdR\xc3\xcb\xd4(\x8d\xba\xd8\x02\xa5\xf3,\
+\x87\x0e\x02\xe6L\x8b\x18\xa6W\xe5\x10\x9e\x90\xe9%)\
+\xcb\xe5\x13\xa2\x89$\xc91\xfb\x8c\x88\xd8\xa2\xb5\xde[\
+\xa6I\xeey\xf5\xac\x8b9\x82\x85\xe6rqSk\xbf\
+e5\x8c\xc8\xa2\x82\x10e\xeb\xb6\x1c\x99\xcd`6\x22\
+\x94\xf1lX\x90~c\xf2\x0b\x824Q\x06S\xa69\
+\x22&\x00\xc9K\x5cE\xb9{\x84\x18\x97\xd2f\xe5\xd3\
+\x0cK\xf1\xc56\x9b\xc9T\x91]\x22\xae\xee\xfaV\xba\
+.)\xab\x9e|\x94o\x9e\xb0k\x7f*\x14\x14vY\
+\xf8f^\x8e\x1e\x99\xc7X\xb6\xc3\xc7q\xce9j\x7f\
+\x9bET\x9bq\xb1Z\x1d\xfc\xae\xdc\xb9\xd4\xb3/k\
+\x88\x95\xda\x16|\xf6\x9d\xc6\x992\xcb\xb0)\x1eX\xae\
+<\x0dt\xf4m\xbf\xcc\x89k\xbb\xc0\x92wd\xfd4\
+/\xd5u\xcdQ1\xc6\xd7y\x8e\x88\x19q\x12\x02\x05\
+\x987\xc0=B5\x04\xa2\xb5\xcbX#\x81\xb6\x96z\
+3\xdbn\x00[FM=zQ\x18/gjg\xf9\
+Z\x0c\x0c\xcf\xcc+\x1f\x97Q\x14\xd9:e\x96\x89T\
+\xa6`\x82\x10\x8a\xdb\xe6\x93\x97j\x19\xc0\xabx\xe9\xa2\
+\xe1=\x85P\xd7\xe2\xa7lk\x00\x00\x13\x91a\xabd\
+\x13\x80\xc6`q@\xb1\x22Ak\xf5! \xcdT\xec\
+[I\xf4R\xcf\x95\x1a\x10F\x9a\xf8t\xa2\xaeM\xd5\
+\x85\x82-\xa0\xbd<^\xea\xd1\xc9\xa7SK}6\xc6\
+\xac\xbe\xa5\xb5\xe5\x9b\xf2\xaa\xc7\x02Q\xaa\x97\x1a\xb0\xf8\
+\x1bo\xde\xb5\x13\x8b\x98\xf7fc\x01#\x06\xa7\xdb\x8b\
+\xdb\xfdo\xc9\xbeJ\x9d\xc79\xe6\x88Y\xaa\xacr\x8b\
+\x9b\x999\xa2\x84Oq\x9e\xe38\x8e\xb8\xecdrf\
+\xd9hH\x15\x82\xfc\xee\x1e\xf5\x1b\x86a\xcd\xbbw\x82\
+/j\xda\xda\xc4/\xa7\xca\xcc\x8c\x19\xc7q\xfav\xf4\
+}\xdb\x81t\xb7j\x87PS-\xd9\x0dS\x19\xeb~\
+*f\x8c1\xe7\x1c3\xe2\x1cg\xcc\x19\x11\xa0\x01\xe5\
+\xe1S\xf8Ia\x16QZ\xd1\x88)\xc9}\x01#\x18\
+c\xcepom\x84\xf2\x12>\xbd\xb2\x09o~\xbb\xd2\
+B6#gj*}\xeb\x09t\xb0\xc9\xfa\xb6\xcf\xc8\
+\x98\xf3\xeb8\xccd\xa2\x85e&\xc1\x82B\x85rW\
+\x96\x99\xb5\xc6\xcc\xb5\xf8\xb9\x8c\xe8\xf1\x0b\x8b\x1e@\x99\
+\x03\xd0\x80\xb09}\x8eFL\x5c:\xbe\x02\xb0\x16\xd3\
+NW\x0bPJ$o\xde\xe4\xad\xd1\xac(*\xd5\xf5\
+\x0b\xa5_\xc4\xb2\xd5\xba=q\xb0V%\xe5Np9\
+\x87X\x09i\x93\x8b\xa6\xe8\xa0e\x16\x87!S\xa4n\
+\xcd{\xf3\xad\x22\xd5n\xba\xd0Z\x80A\xa9\x8c\x8c\x8c\
+\xd6\x9a\xa6V\x1e\xad\xdf\x98&\xa9o\xfdJZY\xc4\
+\x83\x8a\xa7\xde\xbb\x99E,e}f\x8e9\x8e\xf3<\
+\xcf\xf3\x1c\xe7\x1c5\xd5g\x84bfu\x943\xe6q\
+\x9c5QeF\xb5X\xcbh\xe5z\x8b7\xab\xb8@\
+Z=\xa7C\xbel\xbf\xbe\x01j\x04\x17A\x86f\x16\
+F:\xd1\xc0\xcd[3ZH\x91q\x8e\xe9\xc3wg\
+\xf3E\xe9IK[\xb6\x1d\x84\x141r\xcey\x8c9\
+2G\xe6\x18s\x8cyJE\xbd\x9cc\x1e1s\xce\
+e\xea\x91P\x7f8\x03s\xe4\x92\x868}\xeb\xb52\
+hc\x8e\x8cJ\xafO\x96t.3\xde\xa5+H3\
+\x94\xe4\xcc\xb6\xdez\xef\x11\x91\x19\x16*2F\xf4m\
+\x9fG\xc4\x8c\xd3\xcf\x888\xce3KH\x9f\x8b\xcb\x02\
+XD\xae\xce\xbe\x9ck\xfe{\xbd\xc0\x85\xc3\xaa\xe4A\
+\x11\x11\xd9\x1bi2,\xaa;W\xe9\xaf\x14\xa9,\x81\
+|\x9d/A\xb0\x81\xf7\x03\xb1\xbc\x8c\xdd\xadd\x05\x86\
+\xc5\x18\x9d\xa9\x17}p\x9aL\xc9\xcbOG\x81\xa9\x80\
+\x8c\xa9\xdeZk\x97\xcb\x95\x0a\xffR\x8dG+u=\
+\x0d\x08\xc0\x92\xc5e\xf1\x14T\x13\x0f\x00C\x92\x96B\
+\x19\xe3\xf0\xb50\xff\xaaG\x22\xa02\x0d*\x1avd\
+\x8c\xb2V\x1b\xe3<\xc7k\xb0\xa6i\xc6\x12[.d\
+[\xb7\xc9\xca]\xcc\x17\xfa|-j\xf1m&y\xb1\
+\xa5\xbb\x17\xbc\xb5M\xbc\x0cW\xe2N\xf0\xabo\xbe\xa0\
+\xae|z\xb6\xe4\xb5\xeb\xe7w)q\xd2\xcd\x1b\x0cn\
+\x96c\xb0\x1e@Y\xda\xc5!\x95\x02\x84\x03\x99p\xf3\
+Z\x8a\xb7\xd6\xe6L\xc2K\x5c\xfe\xb6\xf7}\xdf\xdbq\
+\xce'\xed\xf1\x9b\xc5\xa6\xb1\xec|e\x19**NA\
+\xe7n-c\xadeJ'\xb5\xf7\xf1\xd9\xce\xf3\x1c\xe6\
+,\xd7R\x9d\x966\x0dfQ\xf3\xc7S\xc7\x08\xd6@\
+\xff\xabY\xfd\xd3\xc5\x13\x04\xd6\x0e\xa6$\xda\x99\xd1\xdc\
+\x094\xef\xa4\x1b\xb2\xfc\x95\x0a\xb4\x84\xb2\xb6[Nw\
+\xb0/\x02\x97\x97Z\xabh\x06\xd5\xe3\xe7\x1a\xeb.[\
+b]\xbd\x0a\xcd\x8d\x84\xdb\xf2\xdez\xe29)y\x9a\
+\xb4|\xe62'\x00\x83;\x9b\x94)\xf0\xf60+X\
+\x0bpGB5\x22d&Y\xcc\xdd\x1a\xb7W\xd3\xe1\
+\xbf*^\x9ej\xaeZx_\xecm\xccL\xe7\xb2P\
+\xb8vN\xb8i\x82J\xd3\x22\xd16\x98\xa1H>W\
+\xbe_\x82Y\xe8Vn.\x8b\xe5\x22\xf2\xbe\x90\x87\xea\
+\xf8\x85\x97,\xfb\xdc\xbe\xac\xc5[\xc1\xca\xa9\xc2\xe1\xea\
+\xd0\x9b2MTD\x98[/\x89h\xda\x8bO\x7f\xa9\
+\xfaZ\xe3\x9c\x13PD\x8blR\xcf\x19\x99-\xb3g\
+Fn\x1b\xe0J\x8c\x111\xe6\xcc\x88\x18\x99\x06\xd1`\
+\x8e\xd6.\x10\xb0\x9d\xe7y\xb3\xd4^iG\x95\x0co\
+\x97]S\xb0H\xd1\x19\xbe\x5c\x85\x8b\x95g\x00\xdd\xf3\
+\xed\xf1Vd\x949g1\xd5\xcf\xf3,\xdex\x1d\xa3\
+C\x96\xceX\xffZ\x86u;\xa4\xe8\x22\x1cf\x91\x03\
+\xdc\xdd=\x9bZ\xebN_\x9d\xabj\x09\x15\x97\x8bV\
+y\xb8\xdb\x92\x22be\x0fU\xecgD\xeaL\x9d9\
+\xefE\xba{[F\xaf\x8b\x9b\xc6R\xa5d\x84\x81\x86\
+\x04\x95/<\xa7X\x98_\x86\x12\x96\x15\xa9\x8b\x89@\
+\xa4Y9\x10I\xca\x9c\xcb\xb6cYfd\xc5q\xbd\
+\xa3\x7f}\x05\x0a\x00\xbeE\x7f\xf7F0#\x0b\xba\x92\
+\xac\x9a\xd3s\xc4\x12\xb3\xdf\x09\xe7\x97\x1f]=9n\
+w\x19{q)\x8doi\xe2\xe6=gZ\x8a\xb7M\
+$j\x0eK,\xd7 \xab5H\xc1\xbe\xf5\x8f)M\
+\x13j\x92Y!\xaf2#zo\xdd\x9a\xd4%\x95\xe0\
+\xf6\xfd\xfd\xfd8\x8eq|\x9e\xe7\xe3\xeb\xeb|\x7f?\
+\xcb|s\x8c\xf8\xfc8~\x8eY,\xdf\xf3<3\x8c\
+N\x87\x1amP\xa4\xb5\x11\xba\x0a\xeb\xaf6\xf1\xa1o\
+V\xbdE\xd0t4\xcd\xc5\x930r\x89\x03\xbc\xd3\xb2\
+7\xb8\xf72\xff9\x1f\xe7q~\xce1\xcfsD\xbc\
+\xd54P\xdc\xbf93#gf\x5c}c\x85\xce\xea\
+\xa6\xb5H\xa4\x8b\xc1\x99\xb9\xa0Y\x93,g\x9e\x9aS\
+\xad\xd3\x9b^\xd8v\x04ME?g^k\xc7\xb5\x7f\
+\xad\xfb\x92\x16\xa9\x11\x059J\x09\xad\x03k.S\x13\
+3\x95U\xf5B\x22\x1dn\x82\xdc\xd4\xdc\xc7\xc8\x11\x83\
+@%\xf80nl\xadw\xa4\x16=\x01i\x22\x923\
+\xd3a\x991r\x94\xaf\x84\xc5\xb2\xc7\xaf2e0s\
+\x0b\x8b\xbb\xd3\xc5\xcbT\xe6F\x02\xa9\x9c1#\xc6\x9c\
+#\xe7\xc89+$2\xeb\x9fe\xb04g\x8cs\xcc\
+\x99\xcb\x85\xa9<ia\xbf\xf1\xef\xb8N\x12\xb8\xe6J\
+\x95\xb9\xcc\xcd\x8b\xab\x13\xb1*\x9b\xcc\x99\x83\xa3w\xef\
+\xa8\xb3Y&\x09\xa7\x9a\xb3\xe4\xcf$\x1f\x8f\xfd\xdf\xfe\
+x\xdf\xf7\xbd;\x94sd\xce\xe1\xdew\xef\xbb\xf7R\
+\x9e\xc0\xdc\xdb\xb6U\x9d\xcb\x8cs\xce\xf7\x7f\xfb\xe38\
+>?\x7f\xfe<\x8f}\xcey\x1c\xf3\xdf#3\xed\xeb\
+\xf3\xeb\x9f\xff\xfc+f\x1e\xcd\x15\x9e\x9c\x01\xb5\xee\xa4\
+w\xb7\xee\xd6\xdc\xa0\xd1\xd6\x92\xd0~s\xb8\xd6\xef\x0d\
+\xf3\x0bD\xc9\xbbN\xae\x9e\xd0,\x0d\xc9L\xf6n\xd8\
+\xda\xd9Z\xf3\xcc\xa8\x8e\xba>\xae\x83\xc82#\xcf9\
+\xc6\x92J>\xc1\x81\xef\x1eS\xf6\xba\x18\xb4\xe5Y\x81\
+\x09d\xaa\xb5\xd5.\xd8}\x86@\xbd\xaa\x8c\x8c(\x8e\
+\x9a\xf328_\x9b$\x92\x9d\x9ak\x86\xbc\x9d__\
+l\xda\x09U\xd3\xb0\x8e\xcea%\xa5\x84=O#\xca\
+\x14\x89\x8c\xb0Y\xdb\xe3\xca\xafZF\x18\xc5q\xc9\x19\
+\x1a\x92f\xe9\xfe\xea\xe4&\xf3\x82\xb1\x96\x0b\x8e\x99\xfe\
+w\xc7\xf1|;\xea\xe8[\xe3v\xd9/\xff\xab\xbfr\
+\x9b\xcb\xbd:\xb2\x7f\x87 \xf0\xf4\x02\xb5\x94\xe6\x9cu\
+\x12\x91\x09k\xbbB\xb6\xbe/v\x9ew\xe7:\x0a/\
+\x22d\x0a\xc3\xe6N5S\xca\xe8%S[\x1d\xed\x12\
+\xfdn\xdbV\xe2\xa59c\xdbr\xcee\xb3\x10i\x8a\
+<\xbf\x0eK\xcd\x19\xdb\xb6Fpoe\xf5+P\x0d\
+\xacm~\xfe\xcd\x16\xde\xbe{\x80\xddH\xf5uR\x97\
+\x19\x1b\xadV\x1d\x18\xad53q\x1d\x5c\x03w\xdf\xf7\
+Gfn[Y6\xc5\x15\xb8\xa3\xc2\xf3\x9c\xe3\x1cc\
+\x9c\xe7\xaa\xf5R\xc67\xa7\xd5o'\x80\x15\xe7MV\
+<c\xd9\x19\x19%\x01(\x7f\xadzc\xd5\xe6Z\x0b\
+\x92\x06\xad\x13P\xae\x1a\xe7\x0eA\x16\x08\xbd\x9c\x7f\xf4\
+\xb2\xdd\xe4:\x8a\xa0\xe8\x04\x17\xf7\xaf\xac\x06\x114\x1a\
+1\x95.\xd3\x80\x91\xa7\x1d\x909j\xe6\xba\xf9z\x1a\
+*3\xd4\xb2i\xc6M\x8eQ\xa4\x89\xd5Zy:\xc8\
++\xe3\xca\xfe7gN<\xcfB\xbam\xda\xb02\xe5\
+r\x8e\x87\xbdf\x9fW;\xb7\xefb\xe7\xe5\xb0.\xa4\
+.+\xab\xca\xc00s3\x16\xba\xdf\xbc\xf5\xb6\xef\xed\
+\xf1\xe8\xefo\xfb\xfb\xfb\xfb\x8f\x1f\xef}\xdf\xa7\xec\xf3\
+\x1cK\xb9\xefmq\xe4\xcf\xd3\x08\xb7f\xe6\xc5\xb3!\
+\xc9\x8d\x04\xab\x9bt\xf7\xc7\xe3\xb1\xf7\xaa\xc0\x8a\x99\xe3\
+\x98\xc76:[\x87+\xf1\xd1\xff\xea\x8f~\x1c\xc7\xf9\
+u\x98\x19Z\xa9-\xd2\xccZEjMv\xbf\xcd\xac\
+\x97\x08S7)\x13\x97\xef\xe6qD\xc4\xbd\x86\x09Y\
+\xd9\xda\xd3^\xb4l\xb7H\xc8\xcc\xf6}\x99Og\xe6\
+\x98g1/\x223\xe6\x82\x09\xc7\x9c9\xa3N\x83\xba\
+\x9a\x82\x95w\x0b\x8e)\xeb\x1e\xb3\x191KH\xe4*\
+\xbfB\x5cj\xb8\xc9tKF\x98\x13^r~{\xe2\
+\xba\xc5\x10}\xb5\x97\xb8\xf9\xea\xeb|\x18\xd3\xd3+3\
+\xd7\xce\x1a\xed\xae\xe3\x9a\xe74\xcb\x06\xba\xcc\x0d\x01-\
+T\xfc^\x9d)\x8a\xf1\x83\xdf\x1c\xd9\xb8\x1c\x9fk\x89\
+'K\x90\xd7\xe3\x02\xb3\xff\xc1\xb4\xec\x97\xccz\x1f\xfc\
+\xf1\xdf\xa5\xd2\xbf\xe7\x1a\xbe\xd2w\xf26\xe4Zg\x0d\
+\xdd\xba8\xc2Z\xd9\x95:\xb7\xad\xff\xf8\xe3\xfd\xed\xed\
+\xf1\xd8\xb7\xc7[\xef\xde\x1f\xfb\xb6\xf5>c\x9eq\x8e\
+1Mz<\xde\xfa\xb6\xa7\xc1&t\x98G\xacs!\
+\xcfA\xf7-{\xbb\xa0:\x87\x97\xbeZR6\xa9[\
+\xf3A\xa7Y\x82\xa0\xe3\xe7\xfb\xdb\xe7_\x1f\x9f\x9f\x1f\
+\xff\x95\xff\x90\xf4<_Rj#\xe7\x12\xe9F\xbc>\
+\xdcn\xf8f\xf2\xb8\x16#\xe9\xf0uROJ\xe0\xed\
+u\x13qm\xe9W/\x88\x17\x9f\xc7\xa5\xb7l\xdee\
+V 6\xdb\xbei\x8br\xa2I\x9bc\x9e\xe7y\x9c\
+\xa7\xe2b5g\xd5\x88Y\xec\xf2k\x822\xdct\xff\
+\xa2g\xb5\xd6Z\xbb\xe0)'\xbd\xee\x08I\x89\x91f\
+\x90\xd3\x9c\x05\x9e\x0a|\x9aN\xaf\x9b\xb3x\x11\xb5\xa8\
+\xd1\x0d\x8e\xdf\x87\xf9,\xa1\xa6\x94\xe3>\x83\xa5F\xbc\
+\xeaA\x8a\x1fh*\xc8J![&\xdd\xd5\xfb\xde~\
+A\x85\xa4\xb2\xf6\x0f\x90\x99\xdc\xa8\x9c\xf9\xa2cY*\
+\x19\x89n\x1d-c^\xfd\xe8r\xf2\xa5\xa1\xd1\xc7\x85\
+^\xbb\xb3\x96\xa2\x05\x09^\x22\xafo\x87[\xf0%\x9e\
+\xf9*4{1f\xac\xb3\x04`f\x0ao\xfex<\
+\x1e\x8f\xc7\xdb\xdb\xdb\xbeww\xef[\x7f<\xf6\xde\x9b\
+\xd3\x8d\x98\xa9<'\x08c\xeb{\xab\x1c\x90\x97r.\
+\xc6\x8c1\xa7\xbb\x91\x82z\xebf\x8f\xba\x8c C\xb1\
+\xecA\xeb\xbc\x10\x15/>\xb7\xcd\xc1w%\x9a\xb7\xbd\
+\xb9l\xc6x;\x8ec\xf9\xbe\x10\x09k\xff\xd3Y\x1c\
+\xb6\x1c\xb3\x0a\xe4_gv-rV1_\xa5\xb5\xf3\
+\x7f\xf5`{\x8e\x9cK\x8d\xc4\xcbPt5\x09!\x00\
+\xd6\xbb?\x05\xab\xcb\xfe\xf2y\xe0\xd3\x9cq|\x9d\xe7\
+y\x8e9\xee\x95\x13\xd6\x1c\xaa\xbem\xa5\x8e\xe7b.\
+\xb4\xd7#<\xd7\x89+\xaa\xb3g\xefa\xf9>R\xf8\
+\x15\x18\xbd\x8eCb\xb3\xf2\x89X\x88h\x92\xa8\x0e\x15\
+2\xaf5n\x01W\xe5\x02u\xb5\x10\xc5\x0f\xbc#U\
+\x17=\xd4\xee\x03u_Z\xde+v\xdb\x8ba\xf4S\
+\x8cu\x9fUre\x812\xf5n'\xe7K\xd6,\xc6\
+\xf5s\x00^,mI*\xbf9\x03\xe1\xf5\xbc\xe5E\
+\xc3\x80\xe1\xbb\x8bQ^\x22\xb6Z\xb3\x90|<\xb6\xc7\
+\xe3\xf1\xfe\xfe\xfe\xe3\xc7\x8f\xb7\xc7\xa3o[k\xde{\
+e\xb7B`n\xe9\xaf\xd6\xb3}\x1d\xa4[\x08\xea\xd3\
+\xbev\x8c\xba\xca\xd1C\xd2\x8ch\xcde6\xa3@\x9e\
+\xa8\xd9\xe0v\xf0\xaa\x91b\xeb\x0d\xa9\x93Gg\xab\xee\
+\xb6Dl\xb5\xc5l\xa4\xdf\x87\x85=\xb5>)<\xd9\
+\x99\xa5\x18^[gj\x05h\x09\xe1\xbf\x1d\xd4q\xd5\
+\xb8e\x9dY{x\xfc:\xa8-G\xb8r\xafa\xbb\
+\xe8\xd8OSR-\x1f\xe1\x9c\x11\xdbv|}\xf9\x18\
+\xad\x0c\x07\xd6\xa9_\xf5\xd2\x0b\xcc\x92f\x06\xff\xb6e\
+\xa8I\x87Z\x91\x149\xcb:;\xae\x93\xc3\x16\xd1\x98\
+(+\x80\xf2H(_o]\xae\x15(\xa2\xab\xad\xd3\
+\xad\x99\x06_\xc1\xfa\xcb\xb9\xa6\xf9\xb4\x8f+T\xd5X\
+\x077\xd7\x09X\xcb\xb90o'rZ\x1a\xee*\xbc\
+\xd0\xfc\xfa\xd5QGnEd\xa2v\x0aU@\xa2G\
+\x8f\x969\x22d\x98p\xb1\x001\xae\xde\xf3\xd6:?\
+\xcdP+\x10\xbd\xce&\xaf\x9d\xe8\x13\x86\xbby\x92E\
+?\xdd\xb6\xed\xed\xed\xf1\xf6\xfex{\xbcm\xdbVG\
+\x9b\x83\xec\xbd\xd7(\x9b\xb7\xfe\xe3\x22\x15,\xb2\xbb,\
+R\x19\xd3l\x96\x04\x11(P\xd3\x16\xdf\x85\x90\x14\xad\
+\x03\xcb\xf223\x09\xd5\x93\xbc\x84\xafl[3\xbe\xdb\
+t\xb7\x0c\xc5\xa4%\x94Gy\xd0\xd6A\xc3c\x8c\x12\
+nG\xcc\xeb\xe8\x95W\xb8u\xb9\xeb,;\x86\x94\xd5\
+\xe0/\xfc\xed\xc4\xd8\xa7\x81\xfc\x0b\x1d\xbdZ^\xbe\x1e\
+\xd7[\xde\xe4\xad5\xd5\x00\x84\x97)*\xa5\x88\x95\xc3\
+W\xd7k\xee\x94\x9a\xaf3\xc3\x0d@\xdf\xb6\xbe\xce\xe7\
+\xd0\x8c\xb0\x17\xf7{\xb7_\x0c\xcf\x8c\x5c\x96\xd9\x15\x1c\
+0\xd8\xe5\x06q!\xe4\xf7\xb1\xc5\x8b:xA\x14W\
+./}\x85\x19\xcd|)\x0d\x12\xd6^\xde\xe9\x02\x8f\
+\x961*\x9c\xc8u\xac\xdcm\xcd+\x83.\x01-\x96\
+\xec\x10\x5cnD7\x88[\xcdOq\xa5\xaf\x15\xa0e\
+\x8e\xb2V\x8d\xf0\xcc\xfa7d\xaaH\xcb\xa5\x8d]\xc4\
+\xde\x17\xe9\x1b|\xe5\x02\x02+.\x97\xd0m\xa9\x8c\xb6\
+}\xdb\xd7\xf1\x8f\xbd\xb7\xd6.\x19\x80\x83O\xaek)\
+\xc9#t\xb7\x16%[\xbe-h/\xad\x86^\xfc\xff\
+\x1cK\xff\xce\x0c\xa5\x1d1\x93\x9c5\xbd\x94\xf4HW\
+Mk\x17_\xb3\xb9\xd7\xfeo\x7f\xf4\x1f\xf1\x98\xe7Y\
+\x1a\xdd92\x94\x09k\x86\x15\x1af9^4\x91\xd2\
+\x9aN\xe6\x98\x8a\xc8Y\xb8\xe0u\xe6\x1dj\xabs\x9d\
+\xad\xb2\x0e|z-\xc2\x8b1\x89\x92\xbcX\x1d\xcb\x9c\
+\xe4rRV\x06\x1d\x92\xc5%V\xbe\x9a\xc6ra\xd3\
+\xe5\x09\xc5m\xdbz\xbfN\xe5\xbbN\x87\x0a\x9bs\xce\
+9\xa26\xc8\xb5\xa9Y\xa7\x0c@\xa6P\x1a\x1c\x06\xc4\
+\x93\x0e^fwf\x89\xe6\x9d\xa0\x11e1Yg\xd5\
+\x99a\xce\x9c\xb7\xf1\xb3\xad\x03\xe3\x14)\x83\x96=\xa6\
+\xd6\x19\x1b\x98\x95\xe4\xef\x93M\x0bFe\x12\x99\xd7!\
+\x81V\x19\x9aZ\x07\xa3\xf8e\x8cS\x8d\xf2Tuo\
+\xba\xf3k*\xa7b\xe4\x18\xf3X\x0e'\xb1\xba.G\
+\xec\x1b\xbb\xbf\xed\x8f\x96\xf9\xbe\x0eZX\xc7\x87\x98{\
+\xab]tk\xed6\xa6nmk\xad\xc7eQ\xd8Z\
+[g\x99py\x0f\xcb\xb0\xdc\xdcx)\xbf\xef\xf3\xc6\
+\x01\x03j\xd5;\xd7\x8c\xab\xd0\x1a\x08.\xdd\xbb\xd6X\
+\x1b\xf3\xb5r2\xd6\x01\x14\x93$\xbd\x87\xa9[\xf3D\
+\xb7r3\xac\xbc\xa3H3;s\x02(\x13\xd6~\xab\
+a3\x8f\xcf\xf3<\xcf92p6\xdf#\xa2\xa9\x8e\
+h\x82Y\x92\xcf\xd3D\xa8\xd4:e\xd9Y6*\xd5\
+\xe3\xc0\xf2\xdb\x8e\xee\xf2b\x05a\xf2\x17\xfb\xad\xd7\xa5\
+\xd8\xd3\x85\xb42PD\x9a\x8d\xf2\xad\x0a\xa5{#\xbc\
+~\xdfU\xa5.\x8a\xfd\xedv\xf4j\x96\xb1V\xe6\x11\
+1s)\xb0\xb1\x8e{\x8edd\xae\xe1\xfc^k\x99\
+\xf2\xda\xfb\xa3\x9a%\xba\xf3i\xd5~\xf9a'\x16\x08\
+u\x89\xb5EP\x96E\x86\xac\xf3u\xd6\x99\xdbO\x93\
+\xa0\xd5\x0d\xdeC\xbace\xe2\xe7\xa9\xad/g\x95\x88\
+\xb8\x0f\xbaG\x18\x89{\xe0SI\x824\x0c\x13\x14R\
+e\x1e\x02\x13\x8b\xb2C\xa8\xa1Y\x97u\xd8\xe5\xc4n\
+2\xa0\x91\x85\x9b\x92\x9e\xcb\x10\x9b\xcd\xbb{\xabzR\
+\xee\xc2\xbc\x9d\xf3\xcd\xf2:V\xa6\xd6\xae\xba\xce\xc3\x81\
+\x16\xaf\xe2yl\xec\xaar\xbcPiI9cj\xd9\
+\xd7\x86\xae\xfd\xd6u\xf3\xe8\x1e\xa4\x0b\xed>\xa4\x19e\
+\x99TR\xd3W\x03\x1b\xa9\x16\x9f\x90:[\xdd\x93\xe6\
+\xdb\xbe\xef\x8f\xc7\xe3<\xa7\x0e\x1d__1g+C\
+\xbc\xea\xe3\xdaM\x1d\x12\xd8\xbd\xce\x9e\xf2\xc6\x98\x13\xa2\
+\x19\x15\x89\xac\x13\x08\xb3\x14\x95\xcf@4\xcb\xc544\
+C\x96\xd3\xb4V\x8a\xadR\x925\xc6\x97tk\x19\x0e\
+\xac%d\xc3\x9aXJ\xe4\x0e<\xcf\xe8\xc9K\x80\x98\
+d\xf9\xa0]\x84\xc7KV\x5c\xcf\x8c\xe0e\x83\xf3\x0b\
+6\x8e\x9b\xaeU\x82`\xb0y+F\xf0\xbd\x8f\xbd\xd9\
+\x80~EV\xb5\x80lDQ\xecr\xe1PJA\x96\
+H\xcbd\xe3\x8bg\xe5\xf3\xf4\x94o+\xffK[l\
+\xb5\x86\xbcnT\xcd\x0d\xcaP\xe4\xb5[\x12e\xa9\x80\
+\x92&/=\xb8\xc0\xb0H\xcbL_}E\x1d%\x05\
+G#\x96};\xb0\xce\x1e\x03a\x86:iEB-\
+\xc0\x97\x07^A\xd4\xd7\xb1\xa0\x95b\x947j\x01\x99\
+\xe6\x98\x97\xdb\xe6\xed}\xf4\xfc\x86B\xe7#b\xceQ\
+\x96DR.&\xca*2\xd7\x89\x0b\x84\xd2\xe1\xa2k\
+\xc5\x05\xa1i\x09\x95d\xed\x9b)~\xf9\x1e\x86\x9d1\
+\xc5jp\x01\xe0\x8f\x1f\xff~\x9e\x93\xfc\x981\xe7\x98\
+\x91\xd9\xc2V`\xe1\x92\x10\xe0B\xaa\x85\xe5\x1cU\xa8\
+;\xc5DX.\xfd\xdd/\xd9n\x94\x03\xf9\x12\x09J\
+\xb6< \xd6\xc9T\xcb\xfd\x84\x17\xed\xb0\xf4wQ\xc1\
+ZI4/\x93\xf2\x15{\x842#\xe7\xa5\x10J.\
+\x96\xd0\xba7\xab%0\xa0\xa8\x1f\xb6(\x01\x0b|\xb8\
+\xed\x0b\xcc`\xf0\xd5\xcc\xdbu\xd8\xe4\xfa\xeb\xe2RC\
+,\xbb\xd3+\x1d\x12v\x11\xea\xcd\xcd\xe0F\xa5\x22\x0a\
+o\xa8z1\xc6X\xc9\xf2B*/e\xd67\xe3\x99\
+\x17\xcbK\xfd\xe2\x94K\xfa\xb2cY\xbc\x86\xb5m7\
+\x8bU\xe5\x96\xf3\xf2b]\xae\xb1H\x97N\xccJ\xfe\
+\xaf5\x8f\xa3\xb1VJ\xeb\xaf\xaeK\x0d\x98\xcaXt\
+A\xe6(\xae\xe9k\xa3Y3n\x1d\xf8\x96\x19/\xc1\
+\xba\xce\x94\x04`\x16\x91\xe5\xa2|%\x11\x93)\x8be\
+\xbb4\xc9\x05\x1a&/\x0f\x0d\x193P\xab\x13\x89\xd0\
+Rx\xf8s\xf5\x96`G.\xedg\xd0Y\x13|!\
+hu\x9eG\xa9\x1d\x1b\xdaVg\xeb\xdd\x0e\xcf\xcb5\
+(\xd2\xd6n\x90\x04\x94\x98\x96V\x8cz,\x0c\xb2\xfa\
+\x9c\xc5\x97+\xb6@\xa10\xcb\xe1I\xafs\xd5kA\
+\x87\xc3\x12\xad\x95!\x95U\xd3\xc4:\xf8\x84\xd7\xd4c\
+\xb2\x06\xa4\xd5\xa1\xa3u\xaa]\xf9}r\x91\xe8|!\
+\xac\xee\x06\x8b\x0c\xc1\xaam\xa5\x03~\xb9n\xdb\x1an\
+\x16\xa3\x03\xbc\xcc=\xcb\x98F\xdf\x87\x03\xabB\xefk\
+\xa5-H\xde\xe8\x06X\xb257f\xc6\xd4L\x89v\
+\x93D\x9f\xc0Z\x1dMc\x97\x9d\xc7\xeb>\xf3\x95\x15\
+\x08Xd*\xb2\xbc\x03\xea\xfd\xd2\xd5A\x90\xe793\
+\x82\x95z\x97\x8a\x85\xed\xb2R[Qh\x97Z C\
+B\xb6&\x132\xd6y\xab\x02\x0a\xf2T\x16\x15\xac\x5c\
+\x05V\xf6Oi\xb9I?\x85Y\xa5k*^U\xfd\
+\xe4\x8bC\x88\xeb\x04\xe6e'o&w\xdc\x81`\x96\
+\xeb\x08J\x05\xb0\xa8\x01\x00\x94!K\xb2CYf\xa3\
+v\x1d\xdfx[\xb0\x83Hq\x9ec\x9d\xfck\x11\xb3\
+@C\xcf\x8c\xd6\xe8\xce}\xdfG\xc4W\x8e\x96\x05\xba\
+\xae\xd3\x08n\xa3\x87JE\xab\xdf\xb8\x00U\x18(\xe4\
+\xd5\xf9}s^q\x87{\xc728\xc1\xab\xea\xfd\x9a\
+\x1aqo\x10\xac\x0e\xd4\xb8\x94\x9dW;\x81:\xac\x1a\
+\xdf\xceZVk^\x12s\xc0\xe8\xde\xbc\xf5\xde\x8b{\
+V\xed\x17\x8d\x06\x9b\x163\xf3^\xd1\xac\xdc\x80\xf5\xc9\
+\xf5\xd5\xdb\xcc\xba\xc0\xe0\xf5N\x16\x00\xa9B\x9b.\xd3\
+6\xd9\xe5\xa0\x12\xe6\xee\xb4\xb9\x8eyX\xa2\xd6V\xe7\
+\xdb\xbct\x81\x97\xc8|5*aQ\x99\xd5~\xcf\x01\
+\xa8#L\xd3\x16\xa9\xa0\xc2n\xa1\x85R\x8ey\xde\x97\
+\x8bd\x9d\xc3]\xeb\xe6B6\x8a\xa2\x09e\xe5\x8c\x98\
+\xa1\xe5YTZT\xeay\xe0\xd6,r\xe3u\x8a{\
+\xa9\x8bxwI\xf7I\x8e\xaf5\xf3\x0a\xd9o6\x08\
+R\x82w\x0eR\x1dp!^;\x8b*[ \x88\xcc\
+,\x9dqI\x86.\x82\xa6e&\x96yO\x15l\xff\
+\xff\x08{\xb75In#Y\xd7\x0f@dU7\xa9\
+\x99\xfd\xfe\xaf\xb8fI\xe2\xa1+3\x00w\xdb\x17\xe6\
+@D69Z\xba\xd0'Q\x14\xbb*3\x02\xf0\x83\
+\xd9ob\x9a\x9aZN\x1f\x888Q)fv\x1c\xfd\
+8\x9a~\xa9\xaa\xd10\xb8\xfc\xc1\xaa\x99\xd2\x98\xe3D\
+\xe5?[\x04\x95\x141\xd3\x04\x14N\x97\xea\xf6\xb3\x8b\
+(\x0c\xd2\xe4F~\xbb\x06\xf3\x8a\xdcz\xe0D=\x13\
+5\x07\xad\xc9\xccr\xaf\xdd\xc1\x9c\xd7B\xd4<,2\
+%\xb3\xe0\x0b\xad=\x1e\x8f\xa3\x1f\xfb\xb3c\xe96\x91\
+3\x83|<3\x16X\xceC\xbeT-4j\xeb\x85\
+\xd9a\x02l\xad\xa9T\x89\xc5\xb4\xda\xf4T@e\xaa\
+:\xc4\xd5\xcc\xb5\x14\xed\xe48\x17Id\xc1\x9a\xeb\x94\
+]'){\x96\x9fR\xcca\xa9R\xb6\xc4\xfa9*\
+\xb8\x8e\xb2\xbc\x92@\xcc\x993s\x05&\xf2}\xd8\x84\
+\xf5\xb5l\xd3\x9a\x1f\x9a\xabj\x92\x02\x18\x99J\xe3X\
+e\xe8\x961`\x11\x1d\xaf\xcb\x8d\x02\xf3\x02\x1c\xe8=\
+\x83\x98V*\xfe\xb9\x7fim\x89\xb7ev=\xc9\xe5\
+\xf5eU\xd7(Z\x01j\xe6F\xb59\xef\xc9\xe4\x9b\
+\x15E\xbd\xa2b\xa8^\xf2\xc4\xb2Q\xe8J\xb6\x12\xaf\
+\x88us-\x8a\x0f\x85,\xa8\x04\x1fP\xbc\xa1TX\
+\x9b5m;\xeb\x11\xc8\x06Y\xd2\xa3\xbc\xcfb7\x86\
+\xed\x96\x11\x95z]x(\x07\xb5\x88@\xcd\xdbM\xa5\
+\xa2(x\xce\x05\xb5\xcb|\xbb\x94W\xcaui6\xe8\
+Xr\xf7\xd69\x12t\xae\x9aHu\x9a\xc8\x993P\
+\xa2\xe5\x5c5\xb8\xf2a5\xd3\xb63\xf2\xec2\x99\x90\
+\xc1v\xf3'\xc8z\xdc\xc8\x1f\xe1\x81\xe1\xa2\x90\x80Z\
+D(\x04\xea\x8d\xd5\x8b\xe9\xca5v\xca\xbbDS\xb3\
+\xaa\xd3M\xacg\xe4\x88\xcazR\x91\xaeF/3\x91\
+\xdf\xf5\xf8\xcb*?LcZ$\xd4\xc4\xdd\xdc;\xcd\
+\x05\x15\x99Nv\x1d\xca\x895\x22F\x9c\xa1\xa8\x19|\
+)\xdbs\xb9#9\x83K\xdb\x5c\xe2\xb7\xce\xf3J\x91\
+\xb0\x95T\xb4j\xe3\x9f\x82\xc3\x17y\x83\x14Fz4\
+\xb4\x96+\xbcm\x89\xc2%\x19IU-\x17\x8e}F\
+z)=\x08\xaa\x17\xd6PV6\x06,Z'\xc5\xe7\
+\x9a\xe5$f\xef\xe4+\xca\xb1\xa5Z\xc5h\xd1d\xc7\
+$Lof\xad\x14\xa53]\x15@\xe3\xdc\xbb\xe1\x0d\
+p\xc7?;Q\xcf\x0dKp\x11\xa3\xd9\xdf\xb5r\xbc\
+\xebth\xfb9p\xef\x17?\x82L\x8a,\x1bq\xe4\
+\x06A\xd40E\xa8Q\xabHnB\xe2\x17#\x9b\x96\
+\x11EJN\xa6Z#I?`\x1d\xa9\x8b\x0b\xb9\xac\
+\x8b5f\xd4+\xa0\xb3\xba\x91\x19\x83]O\xb3&\x92\
+j8Zs5I5H\xa6N\x99\xadyu\xda\x9c\
+W \xf8\xe8#M$\x12\x94\xd1u \x8dbP\xe3\
+7\x94E\xfb\xd5\xbab\xacb\xef=I\x1e\x00\xd8r\
+\x00\xd1]\x1f\xdd#\xdb\x08\xbf\xf6\xfb\xde\xf8\x8d\xf6\xde\
+\xb7\x94ZU\xcfs\xda\x182T\xc60sQ[H\
+6Wi\xd7\xaaB\x0c\x9a\x95\x9fY\xa2\xd7r\xaf\xad\
+\x87\xce\x89\xf1\xda7\xa2\x5c9\x9b\xb88\x1b\xba\xe6$\
+\xb5\xfc$UD9\xe3\xc9\x1c,\x229\x8d\xd0\x1a)\
+6\x16\xb4\x925\xf8\x82J\x0d\x0e\xcaXzM:\x9b\
+I3\x17\x15dP^\xef\xae\xde\xf4\xd1,\xbd\xb5Z\
+\xbcB\xc5\xa9\x88\xb9m\x80\xb4\x19D<U\x8c\x11<\
+\x89\xb8'\x18]\xd4w\x15\xc2\xafw\x88\x81j%\xbd\
+\x97\x1d\xb5\x90\x855\xbcqkZ\x83\x1cP\x03\x11\x19\
+\x80'\xc2\xf3\xc6l\xdfm\xf2\x86\x95R\xd6{\xb7\xc5\
+V\xc3K4\xa3\x86z*q\xd5os\xa4\x9f-\xb6\
+\x15\x81\xb9\xfb\xa24\x97\x87=\xa8\xe0\xe9LG\xb6\x22\
+y\xe9\x0d\x0cq\xbbCt\xc6\x90u>\xb8\xb9\xaa\x1b\
+Dd2\xa1\x93Ossg\xa6+\x00s\xad\xdct\
+of$L\xfc\x5c\xc7\xba\xbb\xb9e\x0c\xcb\x169o\
+Y\x05\xd7%\xdeZ[A`\xda\xfb1#>hw\
+\x09\xf6H\xb5m\xca\xe4\xa9_\x02y\x86\xfauo\x94\
+@\xc0Dn\x0f\xeb\xf2\xfbB\x08\xef\xaaO\xf4\xfa\xe4\
+\x14o\x9c\x01e\xb2\xa9y\xe3\xbc\x8c\xd1\x81D]\x90\
+\xd3W\x10&)_t\x99\x1f\x90\x96\x81\x9c+\xd0y\
++Q\xad\xbal\xaf\xb8\xf3E\xf10\x97\xe6\xed\xe3\xe3\
+3S[\xe6Pq\xbe\xaa\xea&\xc23)[\xa6\xc8\
+0\xf35\x08\xc9\x5cS\xa8\xd4[ \xf4\x1d\xe2\xc0G\
+\x8fh1S1\x17\xf5\x9d\xf9\xadZ\xa6\x9f%\x18]\
+\x22\x90\x5c\xf8?%ty\xedI\x05?\xe5\x9clD\
+\xf5\x9b\x00Y\xd6\xb2e\x17\xb9\x22\xa6\x8d8\x83\x9f\xe2\
+{\x12W\x16E\x8d\xd0\x17F\x98@X\x814\xe3\x18\
+\xd6\xafc\xe5\xaer^\xad\xd0\xaa\x7fl\xcb\xc3\x9d\x13\
+\xc4l*\xa9|\x17M]\xcc\xdc\x12s\x0f/\xcd\xf8\
+K\xa5\xdc\xf2-\xee\x91C\x84Pg\x86\xdc\xbcP\xa6\
+v\x05_\x9a_\xec#\xf5\x83q\xcc\x99u\xba\x05f\
+\x16\xa4\x00P\x82vI2\xdb\x1f\xe9\xba\x17\xa8\xd4\x92\
+\x8a:\xde\xcd\x9c\xd4p\x1f5y\xd9\xa2\xca\x1a\xacj\
+\xc1\xc6\xc2\xb4z)\xa8\x9a\x80\xda\x96L\xc99\xe9\xc0\
+\xe3\x5cD\x16\xe3\x95^\xd4Rz\xdaRE\xdb*B\
+\xe8\xefom?\xc4j\xda\xbc{\xe3\xd81[\x8eP\
+\xc6]-\xfe\xb1*\xc3x\xa3\xb7\x83\x15ej\xe2r\
+\xfc\xddt\xbd\x0a5\x934\x914w\x95[\x0b\x09\x8d\
+\xad{^\xba\xb4\xc6\xfe\x861\x9b\xdeIC\xdet\xb1\
+\x0a\x02\x90e\x95\xbe\x87Z\x8b\xae^\xe1\xba\x9eV\xeb\
+\xba\xc3\x0c\x81\x88\xc4\xd4\x9a*\xfc\xc56ZC\xf0,\
+\x81\xab]\xf2\xb8-L\xd1=\xbf\xe4\x8d\x90H\x11\xad\
+\xbc\x8a\xfc\x09\x12\x98\xc8\x9f\xec\x0c\xee\xbae\x06\xac1\
+3\xc3\xbdYk\x19\x99\xc9\x97\xffZ\xd0\xe5\x7f\x92V\
+c[\xc3\xf8\x11\xf1am\xad\xf5\xde\xcc\xdc\xca)a\
+\xb2\x121\x98(N\xe4O\x14`\xd0\x00\x95:bW\
+\x96\xf3\x9a~\xdf\x1fV\xfb)\xb5\xeb\x8a\xb8_d\x90\
+\x12\xfc\x87^\x92\xc2R32\x8dA\xaa\xe6\x11\x15h\
+k\xa6\x12\x01o\x0a\xf2\xb3\x97\xeb\x9d_\x81\x1f\xad\x82\
+\xef`[\x04\xb7b\xb0\xebQ\x84Ji@\xbd=\x1e\
+\x0f [1\xef\x05fT8\x1b\x961\xf9<_\xd3\
+\xcd\xa5\xc6=\xba\xf8\xc9\xa6\xf7i\x86\x98\x1bH|\xbe\
+\xec\xff\x97\x00\x8f\xfb(Ny8\xe0\xdc\x00\x85\x05V\
+\xa8\xa9\xc7\x8a\x1c\xbaP\xd7\x8b$\xaa\xf5\xb0\x16g\x1d\
+\x90\xcb\x8dK\xdb\xe5\x9c!\x19L\xe2^t\xc3\x95V\
+\xb5\xaf\xef\x84\xc9\xca<a@:\x109}w]\xe6\
+U4\xbf^\xd2\xb2\xfe/\xa0\x1d%v\xc0\xdf~O\
+\xbc\x9e\xcd\xedw\x0e\xa4\x10\xf8\x931}\x9d\xbb1\x87\
+\x04\x15\x02H\x19\x22E(\x03\xe6\xf6\x07\xdd\x06CT\
+\xf5[Q\x8e\x84\xa1\x87\xd66>_$c\xf2\xad_\
+\x8f~\xc9)\xf8\x1d=\xda\xc3\xcc\x05\xcaz\x809\xb1\
+?\xe5f\xbdE\xc1\xcb\xa5J\xe2\xdcIR\xc8\xd2\x88\
+\x0c\xac\x04\x9bB\xc9\xc3u\xd5\xc1\xd5\xba&\xa2ls\
+*i@F\x0e\xee;\xcc$\xa4f\xb7w\xcd\xa8\xaa\
+e\xce=\xf6I\x96\x0c\xc8\xa6\x22SU\xd5z\x13\x15\
+\x85\x8fHQ\xff\xe5\xbf\xfe\xfb\xf8\xfc\xf6\xaf\x7f\xfd\xb3\
+\xf2/\x055\xde\xdf\x00\xc6@\xd6\x1aL\xb3n\x81\xbc\
+\x22o\x5cn)\xa8\xb6-\xa9\xb6\x05\xa3|n\xbc\xb9\
+j\x91\xb2\xae\x93\xbe\xb5\xadG\xe1__\xe7mix\
+\xf66Zk\xe8\xc9\x83]\xd7\xd4\xe2f\x10ND\xca\
+\x98)\x97\xcbx\xcdk\x09\xdc\xab\xbf \xb6LZ\x0a\
+h\xd5e\xe2K\x1a\xc0\xc5\x01\xc12\xfc2\xc9a\x94\
+\x84C]\xafC\xfe\xaa\x95\x7f\xa2Z'g :\xc6\
+\xd9l\xffty\xd7\xa6AR2E\xc7j)\xeb\xcd\
+\xc7\x8a\x19Z\xbf{@\x12\xf9\xb67\xbe\x93\x99U}\
+\x85\xb5\x86[c\xe7@}\x94)y\xa4\xcd\xdd\x01\x89\
+\x89\x0cQkmQ\xf0oi\x8fe7\x0a\xd4\xf2{\
+7\xfe*\xda[\x9b<\xa4s\x22C\xb9\x9e\x98\x8a\xa8\
+\xaf{\xbf\xb7df\xdb\x85{\xc7\x9b\xa48\xa1\x22\xde\
+\x5cE\x7f\xb2N\xad;*D,\xa1\xc8\xb4\xcc\x99C\
+U\xbbY\xeb-\xa1M\x9c\xece3\xfb\xf6\xed{\xab\
+D\xa5\xbf1\x0cF\xa0\xa6\xe8\xb1@#\x22\x22i.\
+:9Y3\x0dIK3\x133%\xac\x93\xd5Fk\
+\xd6\xbb\xf9\x0a\xd2\xf2\xf5\xbc2S\xeczXwZ\x0a\
+U\x98\xd4%\xa7ju\xdc5!qN\xade\x8fQ\
+\x0a\x99\x1b\x91#&\xdd\xc8\xc55\x02\xb7\x0f\xa60+\
+WRq.%+d\xbb>\xd7\xbc\x0d^M\xd4\x8c\
+\x15-}\xbd\x5c\x95ifB\xd3.\xc2\xec\xbdh^\
+\xff\xd9t1\xde\xcesd\x8e\x90l\xea\x92a\xbd\xdb\
+\x8d\xd4b\x0b\x80G~\xd6\xd2\x0ar\xa4@\x93\xc2\xce\
+5Z\xc8\xe75\xbeM\x5c\xdc\xa2&~C\x8b\x87\xad\
+p\x8e\xc2\xd8ZE\x97\x9b:\x1eZ9\x0f;\xd3\xcd\
+\x9d}N\xd6\xabQ\xa8\xb7X\xbc\x7f\xd4p<\x19<\
+\x06uqW\x81\xa4\x87\xe5*/dFh\xf1\x8d\xa3\
+\x8ei\xfd\x19\x98T%\x96W\x1b\xb2DN\xb8Ec\
+\xdaR\xf0\xf1\xe9\xc7\x14\x839\x841\xb1\xac\x07\x92\x93\
+\x8a\xde\x1e-x\xafi\x89\xa6\xa5\x08\x14\x86\x0c[\xdc\
+\xfbuO\xf1\x0d\x0e\xada\x0d\x92t\x1dIIS_\
+\xf2Is*\xd5\x9b7uk\xdd\xcd\xcd\x97\x8cRM\
+\xdd\xad\xb5V\xa8\xe1\xea\x9b\xac\xb06PHBRE\
+%-\xd7/\x0f\xb2\x0ew`_\x82\xf0G\xc2\xc7\xb8\
+$\xfb\xcf8\x02\xbc\xb9\xec\x92\x1d/\x18J\xcf:g\
+m\xd2o\x13\xf2\xa5\xe3\x18\xaf\xed\x96\xde\xf1\xc17&\
+\x14'h\x18s\x8e\xf9\xd2\x8c\xee\x9a\xad\xf1'\xee\xde\
+\x8a\x88\xa2\xe5\xe5\xb8\xc87u\x94\xce\xf7\xb8\x0bj\xdb\
+\xaf\xf4a\xbe\x9b\xf7c\xc9=\xa5\xb26u\x19f\xc8\
+\xf8Tu\xe3\x8dO\xfd\x84\x19qJ\xba\x95\xca{\x83\
+*@\x8e\x8b`\xaeK-\x99\xc8\x9c\xf7\xac\xb7\xd82\
+\x17j\xd5#\x8a\xa2\xba2u\x97\xb5\x18\xabn^R\
+\x10\x15\xe1\xe6\x15\x04\xf8\x94\xc6\xea\xefrzA(g\
+\xcbH\xe05\xc7\xd0'\xa7\x94\x8dc\xfb\xf3\x9c\xcf\xe7\
+W+\xd8_u_tL\xa8H\xbakJf\xa4\xaa\
+5\xfa\x90$5\x91!\x81\xe9f\x8d\xc0\x16\x85)\x9f\
+?\xe3\x94\x1e\x80Z\xe3o_\xb6\x13%\xf2L\xccL\
+Ss`.#+\x93QS\x83T\x02\xae^\xc8\x12\
+\x80\xc0\xcd\x13\xdc\x14`\x9egFP\xdc\xbe\xbdY;\
+\xed\x1d\xb53L\x019O\xd4\xcd\x95.\x9d\xf3\xc1\xf5\
+\x00\xaa\xa9E\x8c\x94T\x05fJ\x13\x0d\xca/\xa4\x88\
+\x92\xeb\xebe~CfjF*\x95\xd4j{\x1e)\
+\x8a\xac\x19\xea\x989\xe7@\xa4\xab\xcc\x08\x11\xf1\xe6\xaf\
+\xd7+}\x90\x0a\x03D\xb3\xea|\x91\x19\x847&\x19\
+&q7\xb7d\x8e\xcaq%\x80\x18Q\xf8\xa3U8\
+\xd5\x9d2\x99\xe9\xea\xbc\xfez_U\x9bB5\xc3\xd2\
+=\xdd\xba\x98\x9bI3\xe3B$2g\xb1?\x85\xab\
+\xd3,C\x0e\x07&\xca\xa8u\xbd\xe6}\x86\x88s\x9e\
+c\x8c,\xba\xf9\x86\x06I\xb2T[\xc4zY\xcd\x84\
+\x88\xd4/\xa5\x85\xd6\x16\x91 r\x99\xb2\x98\x9a\x03(\
+\x8f\x19\x82q\xe8~\x11\x11\xb8\xa9\xaa\xa3I\x22\xd52\
+F\xc4\xcc\xcc6\xc6\x5c!*\x22!\xa9bP\xaa\x0c\
+\xd5\xd4\xcdH'\xe1D\x83\xb5\xbf\xadR\xb0q\x8aR\
+\xaa\xaf\xa5-O\x0d\xc9,\xf9.l\xf9|\x04\x86,\
+\xa7p\x14-Pn.M\xbd\xf7\xa1[\xf1\xbe\xbaH\
+5[\x86\xb6[\x8a.\x95c\x05$\xaa\x102~R\
+5\xca\xc1Z\x90\xec\x8d\xb8B\xa9\xd5PQT\xa0\xb1\
+J\xa8\xecD\xcb5\xf7\xc0v\xf8\x10\x8d(LE\xb3\
+\xcc\x10\xb1\xac\x8e\x0a\xae*\xd2\x00\x98531\x15\xbf\
+\x0d\xd6&\x18\xddM\xcc\x90tm\x5c\x97\xb0\xe0#\x8a\
+\x19\x10\x80\xd0\x8f\xdc)\x04|X+\x88-\xd3\xd7Z\
+\x88\xd3#\x9e\x09\x5c\x90\xf39\x8b\x88\xd6\xba\x99\xab\x9a\
+*\xa3\x10u:\xd4\xbc\x19G\xed~E\x0b\xa1\xa8g\
+f\xc6[\xablJ\xa6\xc0\xdb\x98\x824jR\xb3\xc7\
+\x18\xb8\x1d\x10\x9b\x15\x8fD\x8e,\x22\xb3\xea_\x1a\xb9\
+\x1a\xad\x8c\xc0\xf3|\xa9\xea\xe38x\xcd\xc2\x1d\x99!\
+\x0b\x05\xc4\xa1\xc2Z\x87\x93n\x12\xc8\x19\xc1\x8dJC\
+\x84U0\xb0\x08R\x99#X\xb9G23\x18^R\
+\x06\xcdD\xa9\x86Q\x06\xd3\xfdC\x8d\x19\x9603$\
+\xc3\x8c\xabd\xb7\xc3\xe8V\x83\x82\x08\xf5\xfa\x98\x8a\x9f\
++\x84\xc2]\x99\xb9{Qi\xc6\x01 \xd7\xbf\xe6\x9e\
+\x0b\xac\x17\x97\xe5#\xdf9\x8e\xac\x87\xb0\x18\xa6|\x0e\
+dU\xaak\xc0\x8a\x95u\xc3Z\x16\xa5\x17\xab\x87\xf5\
+\xb6I@b\xeb\xff$M\xd7X\x95N\x9a`\x9f\xa2\
+|\x99\xa8\x8ah\xc8\x99\x02 \x06\x15U\xb4\xb8!M\
+\xe4\xf18\x98\xdc\x94\x80\x9a\xc5b\xfe'\x22b\x00L\
+\xdb)\xb93\xd5\xae\xb62-\x12iu{\x90\xab*\
+Y\xa3\xd3J\x18\x98\xc8\x9e\xa8\xdd\x84f\x18\xd2S\x19\
+\x8b\xa0\x1a\xd3Zo\x0cq\xbef\x07\xd0\x9d\xce\xb4\x91\
+\xb0D\xcb\xfd\xb5\x80\x22f+&\xa3q\xca(w=\
+\xac\xb3\xd2\xc6Z\xebWR\x88\x88\xab\x157N@.\
+\x98\x8a\xccsL\x9b\xc5+\xcd\x0c\xd1=\xb9o\xdeD\
+N\xb7\xae\xc5\xa7\xa2\x8eh\xfe\x98\xe3\xf5z5\x8e\xeb\
+\x5c\xd4\xcd\x93\xa4?\x94g\xa8\x16\xa7YCc\xa91\
+\xae\xdf\x97\xca\xc8L\x15\xe8u\xc2\x03\xe0@\xd1\xd1\x99\
+\x13\x0e\xe7\xd8\xb8\x88\xb8\xd4\x12$_\xe8md\xd9\xf3\
+\xffL\x85P\xc0'D\xe5\x08D$*\x18'!`\
+hNu\xc4\x97e\xb1\xb8X\xcbh*y\x8f\x95\xbe\
+!\x9e\xb1R{jD$\xae\xb5\x8a\xcc\xbb\xa7\xcc\xb1\
+\xb6\x5c\x7f]4\x159Y\x89\x1e\x89\xccf\xae\x99\x81\
+\x881\x5c!:]\xa1\xa9\x91P\x835C\xea\x18\xe7\
+\x9c\xd6\xbc\x8a\xa5\x8c\x18s\xceyF\xce\x88i&.\
+\xdc\x9a\x95K7\x03\x1c&\xe9O,\xb0\xd5\xee\x12{\
+_\xc2\xb6Y\x10ZU\xa4\xd4>\xddjB\x97\x11\xca\
+a\xa03~H\x96;\xe7Nl+f\x1cL\xef\x19\
+\xdf\xbbU\xc0\xa6\xb7\x15\xfe57]P\x96\x9f\x5co\
+4J\xca\x04v\xce7\x88\xe1\xe1\xa88S\xf6\xa0\x13\
+\xb6IP\x92\x91\xady\xb0e\x045\x121\xc6x\x8d\
+s\xcc\xd1Zo\x15=\x0f\xba\x11,\x811\xa7\xb8\xd7\
+\x0cK\xc4\x001\xb8\xa3y7\xf0\xd8\xe42?\xdcl\
+\x92\xac\xc5i\x17\xa8\x16\x00\xbdu\xba\xe8=b\xa5\x1d\
+F\xa2\xa4`\x81\x95>{E\x08\x96\x06@\x0c\x96\x22\
+\x93w\x107\xe1\x19\x15-\xb6\xed\x91\xb7O\xa4\xd6\xf4\
+\x90b\xa21\xb6\x8ac!\xc5\x9e#\xd5!\xc9\xb8\xe6\
+J\xbcb\xfeZ,\xe0\xe5:\xa8\xa95C\xe6\x88p\
+q^\x0eLj\x5c\xe3M\x83J\x84J\xcc\x08h\xb6\
+\x09 Fb\x8a\xa5o(F\x06BR\xb3y\x8b\x99\
+\xe610\xb14R\xecT2#c\x8a\xa8\xbb\xd4\xc3\
+\xb7\xaa\xe3\xd2_\x97\x02Ll\x81}\x91\xa1\xd6\xbc\xb9\
+@\xd3\x90\x02\x9a\x06\x97\x94\xe9\x1e\xcc\xcd\xbd|\x9e\xaf\
+s\x8c\xb1F\xe6[Uv\xdf\x08\x16\x0d\x02kl\xc2\
+\xe1N\xec\xed90\xe7X\x8e\xa29\x17\xf8I+\xc8\
+K\x90\x92c\xcf\xbfj\xd8B\xeb\xbde\xcc\x99\x95\x14\
+\x17\xe1\xee\x91\x08ADZ\xab\x05\x8aT\x03#\x8a`\
+R\xe1\x1cs\x8c\x9c1U\xfd\xe8\xdez\xef\x92p^\
+\xfdK-\xdf\xd4\xf3=\xd4\xde\xea\x1d\xc4\xb6\x982\xca\
+6W\xedO\xa0\xb6\x02f\xc2\xb4$\xf3+.\x96n\
+\xc9\xff\xd4\xaa\xd7\x16.5Y\x81\x98\xa82\xc0\x85\x9f\
+\x9c2(\x1a\x7f\x9d\x8eH\x15*P@\xe2\xaa\x7fw\
+8\x19J\x93/\xcc=Z\x94o\x0a\xfb\x10!E\xc1\
+c1\xf0v\xa2px\x95b\xa5\x9cZ\xe3\xd5\x5c\xff\
+\x88\xd5\x90\xcdH\xaa\xa9!Q!\x04nH4{\x0f\
+\xb6\xac'-\xf7.\x80,{Q\x9e\xa9\xb5\x98\xdd\xec\
+\xe9-\x0dS\x95\xcd\x05\xbe\xcf\xd7E+\x13G\xa0$\
+\xd4\xa84.\x0cD\x84\x17\x90\xe9b\x98n\xc3\xa3\xa5\
+\xfaE\xa1[\xeb\xbf\xd8\xb3kl\xa6\x00\xf7\x91;\xb2\
+\xcb\x1b\x92\xaa\x98\xd2\xb9\x06\xc0\xa5\xeb=\xac\xbe\xd6Q\
+\xdb\xf2\xa4\x02\xd3\xde\x9b\x9a\x06reN\xa9A\xc4\xad\
+N\x15\xfa5\xaa\x12\xe7^\xc5\x12\xf0\xe6\xe6F2a\
+kj\xa5\xf7Yp\x19WM\xa0\xd9\x9b\x0a\xa4\x02\xa5\
+\x09\xe7\xac<\x12\xccL\xed\xddD\x9a;L\xe8\xbaw\
+?\x9ays\xef\xa4\xa2j\xd5]\x8b\x02_$\x1f\xdc\
+2\x17P\xde5 \x114\xa6V,@-/U\xb9\
+\xfc\xde\x94w\x94\x8d]\xef\xa9A4r\x90\xc5E%\
+s2\xa3\xa2\x98\xacYjj`n\x81\x5c\x8a\x0cE\
+BS\xaa3N\x15\xafr\x5cS4\x22\x0c\x16[\xc8\
+BQHb\x19\x8e*g=9G\x8c\x91\x8053\
+m\x94\xd4\xee\xe5\x1f\x83\xbf\xd7\xeao\x1a\x05\x11\xdc\xb3\
+\xc5\x80\x09=j\xd45\xde]\x97\x11\x91\xaa\x0ePH\
+Z\xbb\x1b\x88\xda_\xb4\xdc\x91\x92i\x16\xfc\xb8\x0a\xa3\
+\xa8\xf5\x8ep8\xb5\x8aq\xd3\x22\x96\xbanJ\xd3.\
+\xf57\x96\x14\xcb\x8dT\xfa$\x06\xde$\x81<\xecb\
+i=\x0ah\xcc\xd8\x1e\x98\x9a\x02\x99S\x9ea\x22)\
+&\xcd\x9a\x9b\xd7d\x00\x06c\x1f>\x13f^\xa7L\
+B\x04i)b\x19#C\xa2^\x1bW\xb5\xf6\x13{\
+\xa2\xa4.B\xc1T^\xf4\xb2m\x17^\xf1\x82X\xf7\
+T\x99\xc1\x15\xe6\xda[\xefW$\xfbe\xea\xf8\xeb\x04\
+ty\x9aq]AW\xc3D\xb1\xe6r\x11\xadQ:\
+\xabS\x0e\x97\xb7\xd5)\xebPNEF\xcc\x91c\x8f\
+]\xf7\xaa+2\xc6\x0c\x1ej\xf4zq\xd7\x90\x0ci\
+G&\x14*\xb0Zq.\x8e\x92\x1a\x14Qi\x0aU\
+\xffE\xc4\x9cHx\xb3\xcdSY\xd3\x83\x90\x0c\x11\x19\
+#\x90)\xdd]TJ\xc8I\xe7\xf1t\xff9\xa0\xd5\
+Ta~\x9dA\xe5_O~\xd4\xfb:\x02S\x97W\
+Pt!6\xd6p\x9d\x9fb \x98\xbdW\xb9\x0b\x0c\
+\x94\x17\xad\x08$\xb7B!\x95\xc2\x8ag\x99\xadu\x8f\
+\x9a\xd1\xd1ci7I1\xa9K\xaaf>\xe7DD\
+zf\xa6\xa5m\x00Od\xf2:\xb9\xbb\x98(\xe8\x5c\
+\xaaz\xbe\x0e\x96)\xdeTU\xbb\x1bi\xf3\x090\xc4\
+\xc6Uo\xf8\x87:\x93\xce1\x9e_\xe7\xeb\xf5\x22$\
+\xa0\xa9;\x90\xa6\x8d\x98\xa0\xc9#\xda\x9b@\xc5\xcdE\
+\xa9m#!eF\x9c1\x5c\x95\xf3g1\x8c\x1c\x18\
+z\xc8q\xb4\xd6\xadw\xf7\xbe6\xabb\x12\x99*\x92\
+\xb3\xe8g\xe5#\x1d\x1b\xe9\x7f1\x0aHJ\x08F\xe2\
+\x96\xeb\xd8\x8a\x19\xcf\xbd\xdd\x8d\x96\xcd\x16\xb6\x16/I\
+|JFL\x9a\x89\x913#\xd8\xd8J9\xbf\xe7\x8c\
+!+\x98\xbe\xb5u>*\xf3\xb8\x0c*)\x86d^\
+\x86\x19\x97\xfb\xde\xc4\x98g\xbe\xda[\xa0\xf5\x96\xae\xcb\
+Mn\x8a\xc9\xf9\xa8\xa9\xc6\x8a\xb6SmS\x04\x12>\
+=\x1aT\xb5\x09D\xf3h\xce\x81\xbf\x88\xe2\x96<\xd4\
+\x9a\xd5\xe9#\x9e\x19j\xc2\xcan:sOg\x22M\
+\x90\x82\xd6:h\x92%\xcf\x11\xee\xaaP0\xfcJ\x18\
+\xe7&\x95\x04&e\xd2A\x8a\x84\xaa\xa7!Q3#\
+\x01\x80\xd6zob\xee\xdaJ\xf4\xbd\x83`n*M\
+\xe5\xb7\x0f\xc0D\xd1\x10\x13fh\xdd\xa0\xf6:\x07f\
+\x22\x059\x13\xc9T\xe8\xae\xbd\xbb\x1aR%]\xdau\
+\xccY\xae^\x11\x82\xe8\xae\xa9}ft5\xaem-\
+\x01\xe4y\x16\xd8~\x8c\xf8\xf3\xcf?\xff\xf8\xe3\x07\xc1\
+\xc2\x22\xd2\xd8\xd3\xe5\xd6\xff\xd7\x06\x05\xaa\xear\x1d\xae\
+X\x19\xea@\x86\x98@\x9c\xffQn\xc0u\xeaRK\
+\xfd\xc9\xc3d\xcbw\x88\xcb\x8c[\x0a\xd4\xb5\xf9N\xd0\
+\x93\x9c)\xe5w\xe0\x1b]\x1e-EH\x86\x96\xab\x92\
+s\xe4{\x1e&\xf3=f\x0cDHr\xacU\xf9\xbb\
+5\xca\xa5T\xde\xcc\xdc)\x15\xe4\x12\xabh#\x96\x9b\
+\x89fb&\xe2\x90v\xc9[\xd46\xca\xb9<q\x98\
+H\xb3\xe5\xba\x07\x99\x87;\xc7\x9125\x15\x95\xd4\x98\
+\x93\xb3\x864q\xb8-\xa6\x15\xd4\xf4o)\xf5\xec\xcc\
+\xa2D\xa1\xd8\x95\xd0\xf2\x08\xc8}\xac\xc1Y,\x8d\xaa\
+\x15e\xbf\x08*+\xd1\xa6$J\xbbs\xd8\x1aI\xa6\
+= \xc5\xdc,\xbc\x1fG\xd1\x84\xbc-=\x0dk\xd0\
+\xe0A\xbf\x18\x8d\xf3BI\x05K' r\xcc\xc1,\
+s>\xf4{\xbbkf|\xe1\x22cRnq_\x5c\
+\xa5FD\x88\xcd\x9c\xb1\x98@c\x8c1G\x86\xbc^\
+\xaf1\x82\x0c\x94B\xb6 \xb2\x9a\xdc\xd5\xc4\x95\xadL\
+S\xd5\x9a9\x8fj&\xbe\xbaU\xf4\xb39\xa9I\xb4\
+\xf7-e \x8a\x1c\x90\x99\xe6\x9e\xe5\xaaP\xdc<0\
+zi\x08\xf7\x8e\x98a*DZV\xeb\xb2\xdc\xc65\
+\x09I]\xb83\x0e\x8bP\x8a\xa9\xd5\x97\xce1FF\
+ \x021\xa3\xc0\x04Y\xce\xa0U\xf5\x9a\xc19\xb5\xa1\
+u\xae\x9e\x02\x06\xb9\x98\x18'\xa9\x1c\x09hm\x1a\xd5\
+\x12\x86\x9cE\xa7\xe2<\x09\x98\x98@:\x9fQ\x9a\x81\
+\x99\x82D\xd3\x98\xb8Q\xdf\x87T\xfa\xf2\xd45\x17\xc0\
+{=\xdf\xb7\x06\x91c\xec\x5c\x8cA^q\xa5\x8eP\
+\x13K)z\x18\xf7\x1d4\xea\x88&\x1f\x98R\xff\x00\
+\xd0mj+R\xb2\x02\x02K\xf5\xe5\x82#Xe\xb5\
+\x89\x19\x12\xc1i& \x22\xbd5.\x02\xd7\x5c`\x09\
+krEz\x03\x88\x82\xd3St\xe5\xee\xc84\xe9,\
+\x0e\xbb\xb7\xc7\xe3\xd1[K\x95\x99\xa1\x01\xaa\x0e\x22c\
+\xe6\xf8\xc9\xe4\xcc\x87ur,\xb0\xd6\xcb\xe7y\x9e\xe7\
+\x8cYbZo\xae\xa1\xe2&\x22\xad\xd2\x94\x89f6\
+\xa7\xa0\x90\xb3\x1b_\xf2~\xbeH\x9c\xf7F\x06\xc1\xbc\
+\xeb\xe8\xb9\xc5\xe3\xf2\x0e\x12\x81\x15\xc7\xee\xa7J5\xef\
+;g\x5cs\xa2Z\xd9\xd40\xba\xd2\xd2\xf5\x82\xba0\
+\x87\x06\xcc:/!\x08\xcf\xc7\xe2\xb2D\x09\x88\xe6\xcc\
+\x98\x88\xa8\xb3\xa6f\xf5\x15\xa4\x95\x19s\x96U\xbd\x14\
+\x09\xa6\x142\x88f\xb9\x03\xeb\xea\x0c 3,\x83\xcf\
+\xae)$\xcaA\x05\x8a?\x80\xd0\xa6\xcb{\x03\x95b\
+7\xf8\xc2\xb6\xd5\xfa4%$\xd4\x90)c`\x93\x13\
+nc\x071_\xb3\x89z\x9e\xf4\xce\xcb\xd8`\x84\x1a\
+T\xb3\x965\x8az\x0c\xb2\x96\xf4\xcb\x9d\x99+\xd9\x5c\
+\xd6\x1c\x96q\x9f\x99\x9e\x09w\xdb\xb3Zvo\x92\xb5\
+\x96&\xcfG\xdf\xa0\x8b\xcb\xac\x01\x11\xe4\x9cE5\x5c\
+\x0c\xe2\x844\x90\xb2/\x9d\xa7\x06\x11\x9c\x94\xaf&\xf2\
+\xf5|\xde\x10`v\xf3\xf5\xa6\xa9\x85I\xa6\x8c\x08R\
+\x8f\xa8=o\xde\xd1\xdcM\x0a\xb7\xa1\x1eR\xcb\xf9\x96\
+u\xcc\xba\xaa\xce\x19\xa5e\x11\xf1\xa6g\xbc(E\x8d\
+Ky\xed\xbd\xb9\xb9\xb2\xb133\x183\xaa\x16\xc8\x86\
+\xb0\x08\xa1\xee8\xa5\xa0C;\xb3F\xf7\x12N\x17\xac\
+\x83`G]\xd9\xe5\xb5\xb9*H)c\x07c\x96\x1b\
+k\x19b7koN\xda8\xe6\x9c\xb1\xd4\x02\x19\x93\
+\xd1\x98\xaaN\xb9|\xa9\x93o\x19:+jYT\x13\
+&\x0c\xf72\xb5\x09;\xdc[sSENI\xadr\
+P\xc4E\xb3\x9e\x8dH\x15`\xc6i\x91C\xc4\xdc<\
+n\xc7Fw^\xdbLBv\x22\xea\xcb\x80\x8f\x5cY\
+\xeb\xb9\x84v!\x9a\xee\xde\xdc \x95MHe\x1d\x9f\
+~~\xc5\xdb\xd7J\xc2!\x22h\x0ci\xc4>D\xec\
+LW\x81\xee\xe18{\xfb\x9bu\xb4T\x9a\x15o\xdd\
+\x1e\xcd\xdb>G^?\xbe\x9e\xf8q'\xb7\xe9\x0a\xca\
+-\xbd\xb6U\x0b1A)\x97\xf52\x96\x96\x8d{\xce\
+)\x10q\x9b\x19\x94/Y\xc78\xcf\xcc,\xc3\x9cU\
+\x9d\x90\xa4\xdf\x9d\x13*4\x02D\x06\x121\xc1h\xcc\
+1\xf2\xf5\x1aX_5\xcf\xfav\x9e'7\xb1\xb4\xfb\
+\xa6d\x8d\x81\xa3\xa6\xd03f\xbe\x85&:m\xe3\x1b\
+\x1d\x90\xa2\xa5\x17\xe1\x90\xdf\x84k\xe8=c\xd2\xb7\xb5\
+?*\x82\x9c\xff\xf6\x96\x12\xc6B4\x02\xb9@\x0e \
+\xa5cf\x860\xc2*+zk\xce\x88\xe4\xc3\x9as\
+2\xf89\x93\x1a\xdc\x94b\x0d\xc9\xbb\x97\xab\xfe\xa0\xd6\
+M\xb0\xe8\xbbH\x11\xcd\x9c\xa9\x92b*\x1e\x0a\x09\xc4\
+\xa4\xc2\x95L\xc1p\xd1Ts\xae\xe1\xa8\xdb\xc5\xb6_\
+\xbfY\x06\x0c\x82\xe4\xd5\xa2\xa0\xd13\x91\x81\x17^-\
+T\xd5\xe6\x9cf\xda\xbas\xd3\x119\x131\xdd\xa7+\
+\xa7Y\x9b=Z5\x8cmm\x97c\xc3\xad6\x0aN\
+\x10\x14\x16\x80\x85\xba\x0a8\xa6P\x96\x01\x5cm`\x87\
+7\x88\x98{?\xfb\xd1\xfb\xa3\x9dG\x7fP\xbb\xb9\xcf\
+\xda\xd7\xf9b\x5c\xdb\x0d\x85p\xb5\xb6,G!\x92\x11\
+\xa9\xca\xae\x01\xb2D\x05\xad\x01\x19H\x17\xaf\xfcN\xd3\
+\xe3\xf1(G\x18\xe9\xe4(<A\x06F\xcc9\x09\x0b\
+\x9cg\xcc90\xce\x09`E|\xde\x10\xdf)\x0by\
+I\xc5\x09\xcd\xaf!\x0c\x19\x08UwA\xad\xb6\xcb!\
+\xe9\x1e\xb3ik\x96\x8d6=53\xf5\x1a\x8b\xb0\xa5\
+a\x91\x1a\x82BL#E\xdf\x02\x02v\xb3\xb9\xbd\xa6\
++\xc2\x80\xc5\xfa\x8c\x98\xba\x86Y\xab\xdc!^U\x02\
+\x99\x19s\xcc`^\xd2\x8cu\xc4\x8e9f\x19\xee\xd4\
+\x0cF\xab\xec\xf5\xb0\xaeQ\xac\x1a\x84@\x10if\xd6\
+\xbd\xa5IXr\xe2&\xd0\x98s\xbeN\x859\x16\x11\
+V2T]4L\x9b\xba\xf0lKm\xa6{\xda\x19\
+yn\x10[\x8cX^H=gb&$d\x22\x9b\
+\xaa\xda\x1cCMs\xba\x92\xd1\x87\x08\x093\x1b\xca\xde\
+\x00\xeb\xfc\xd3\xc6\xc8\x84V\xacb\xbe\x08d\xcb`s\
+F\x96\x1c\x0fb\xc9\x11\xa3U\xe6\x8d2I\xca\x14\x99\
+#qF}D\xa2\x22_\xa2\x10\x87=Z\xff||\
+\xf4\xde[\xef\xbdwV\x80\x03\x93V\x1f+{t\xd9\
+\xfc\x13\x98#\xe6d\x15\x84\x9832'\x12\x0a/E\
+A\xde\xdd\xde\xe4\x05i\x22\x05##\xe7\xa8\xc6M\x10\
+\x19\x02\x993\xcfs\x9c\xe7\x1cc\x9cs\x8c\x11s\xa4\
+\x88E\xe4\x9c\xdb\x13\xb2\xc2d\x08\x19\xdd\xa9\xf7c\x0e\
+\x11I\xbc\x96\xeb\xd7U}\x15D\x92*\xee\xde\x9ay\
+\xd3G{\xe4\x91\xc7qd\x89\x9a\xb5Yg\xd0gU\
+-J\xcc\x88\xcc\x0c\xdc\x9c\x99|Nu\xa3\xc7\xcd\xb9\
+\xc8`\xf9@Ll\xc4\x94\xf5\xb0\xce9\xf9\xb0\x0e\xa6\
+\xbc \xaf|\xe89\xb3\x04\x03d\xc5-\xcb?\x0b\xa6\
+\x897\x83\xe0~XE<\x17m\xb5>W\xcd\xa0\x88\
+\x18\x0a\xcd\xc8\x1cS\x82\x06e\xd6\xb4j\x92\x10\xb7\x94\
+\xd4\x00 \xa9@\x9eK\x0d\x14\x99Z\x8br\x88H\x9c\
+\x11R\x91\xee\x11Y$\xae\x10D\xaaf\xc4P\xb58\
+\xa7\xb98#\x88\x13\xe9\xc1\x86\x87033\x03<\x22\
+auIdNe\xa4\x87Y^i\xdabR\xa9\xcd\
+\x9c0\xa8\x13\xf4W\xf6\x7f\x8e\xf5\x965\xde4-b\
+\x85\xebr\x1a54\xe7\x9f+>`u\xf0\xcb\x98Y\
+\xf2:E\xaa\xa4J$\xce1\xc7\x9cu\xb8\xe4\xce}\
+\x96sr\xe0\x08Qq7W\xd9\x03\x873&;\xa6\
+\xc8Z\xcb\x0b\x84\xa9\x0d\x15s\x16W\xfe2\xa7\xc9f\
+\xd6Z\x1d~\xab\xd1S\x11\xe1\x9cB\xc5.)\x09\x19\
+f\xaa:\x13\x00C\x16\xf7\xf8\xc0U\x9bh;9,\
+\xd5\xf4t\xf1J\x95\xc8\x88\x19vr\xfb\xb9\xd7\xab\xb1\
+\x89,o\xa6\x87\x92\xd7kJ\x99Lx\xacr\x5c\xa2\
+1\x83\x1a\xf6\x88\x98\x993c\xe4\x1c1\x22c\xc6\x98\
+s\x22\x81\x99sD\xcc)@o\xad\x08\xce\xcexW\
+u\xb3\x98\x1cU\xd7\xbd\x909\xd5\xe8\x15S\xa8\xe4\x1c\
+\x02K\x18%K+\xf9W\xdcLU\xaci\xe1\xd9\x08\
+\x10N\xc9\x18\x13h\xeas\x95\x87&\x0b\xe6\xaaT\xc2\
+,\xda\x03\x05\x09\x92\x08\x11\xa2\x14.\x8c\x862sP\
+\x0d\xa5\x014uS\x09\x81\xa6\xf3h\x8au#\x88e\
+\x94E\x00\x91*\x0au5\xd3\x22'\xa8\xcdp\x9f\x90\
+\xca\x1ea\xdfK\x07\x8b\xa8\xb1\x98G\xa0n\x08\x22\xe6\
+J\xc4EQ\x9aDF\x00\xcfq\xfa\x93\xb0{\xa7\x82\
+WE\x1e\xad\xbbY.\x0cg\xaaL`\xcc\xc0\xce\x0b\
+\xa16\x9fw\xba,J& !#\xa7\x99E\xe69\
+\xc7n-j@S\x8b\xa4\x06\xc0\x05\xee\xee\xbd\x9f\xe3\
+\xecsBL\xd0\xe2N9Ieq\xc3-k\xbbg\
+1\xbe\x19hlCH\x1d0\xa0\x04\xed\xd4M\xabC\
+\x00?\xc8D\x11\x08\x02!r\x85\x12\xdeM\x9f\xf2\xb7\
+\xb1\x05(\x7f\xf5Z\xc2\x90\xda\xcb\xb3r\xf9&\xb7O\
+(s\x8c\xf3y>G\x8c\x99+\x0dub\xce@F\
+\xf3f\xee\xbd\xf7V+Mnx\xa10\xa8j\xeaz\
+\xc4\xa3\xc6X1\xbdi\x98\x98\x97\xb1&\xa1\x99\x122\
+T$\xd60\xc4VX\xa6[\xb9\xe44\xf3\xdc\x1b\x9a\
+r\x86RS'\x9a\xa9XaL\xb0\xa8!\xbf\xa0t\
+ U\xf2\xb9\x22s\xc2\xcc\x5c\x9b\xbb55w\xae\x88\
+\x19I\xaf))\x89\x99\xb1A\x99\x15P\xc8I[\xa8\
+\x99F\xaa\x19\x98\x09b\x0b\xf2'\xe6\xd6\x8b\xc5^\xbb\
+(1k\x0d6s\xa6$\x7f\xa3\xa5\xefKD\xce\xc8\
+I\x95.0\x80\xdd\xfdT\x05\x02\xa49!n\x5c\x1c\
+\xf2V\xc7\xcd\x85\xb6t/\x18\x93\xe3-\x96\x0c\x9b\xe8\
+P\xaa\x82\xed}\xbf\xebCl}W\xdd\xf4\xf18B\
+`\xe6\x82\x161\x13(.I=9\x86T\x85\xb4\xe5\
+\x83\xf2;t\xbc\xb2\xe8\xaf\x19\xc7,d\x8d@5\x17\
+_r\xa5+c\x9f\xf9\x7f\x93\x9b\xa5\xb7\xad\xc1\xdd#\
+\x8f\xd8\xd1\xa9K5\x0d>\xac\xd4\xc9\x17\x13s\x8c\xc1\
+\xb0\xc7s\x8c3\xea#QU\xb7r\xc8\x88\xd9\x83\xcd\
+m\xef\xe4-l\xb5\xafjM\x82\xf4\xaa@$Yc\
+\xa5\xa5\xc1]\xeb(\xa6\xe5\x95=\xe2\xe21QN,\
+\xc2\x10\xac\x8ag\xaf<\x0cr\x86\x9d\xb3\x8e(12\
+\xf3\x85\xa5\xd6\x81K\xbb\x9c\xb6\x0c\x95\xa5\xddJ0\xa0\
+U\x12q\x8e9\x06\xac<\xf5\xa4\xdc\xa6\x5cI!\x1b\
+=\xb4\xd2\x8ai\xb9\x84Ic\xb5\x5c.Lw\x11k\
+\xde\xdc\x9c?s\x04\xc3\x08\xd7\x96 \xc1lBD\x22\
+&VD\xf4Z\x98\xd4\x12\xce\x0b\xb3\xec\xd2:G\xea\
+n~4'\xc6B\x9b\x81\x22\xbb\xc8\x88x\xbd^\xfc\
+v\x000}x\xc3\x97\x9a\x15\x80\xc6\xe9\xea1\x15\xa0\
+e\x02[,Q['2\xfd&\xa2\xabX\xeb\x00\xe6\
+4\xcd\xa2\x9a\xd6\xa1\x00~\xaf\xd6\xe6\x98\xaa\x9a\xb7\xf9\
+\x08\xef\xac\x99!u'\x16;334\xec8|\xa3\
+\x16j\x90\x02[\xd3c\xfc\xd53\x86\x19\x7f\x1b\x08\x93\
+\x11l\xd1.\x01\xd1\xee\xfdk\xd2\x1f\x15L\x18A\xb9\
+xJ.z\x14D\xb4\x99\xeb\xe3\xa0\x8c\xc6[[\xf8\
+@\x94\xa9\xf2\xdd\x80\xb1\xd3P\xa9Q\x14\x09:_\x9a\
+\x08\xf5!\x8a4\x9eW\xd5\xc6cUl\x12\xbc\xa1n\
+\xea36\x86l\x09/#G\xac\xa0\x10\xdb\xc1\x01\xe5\
+\x16r\xcas\x81\xaa\xc1t_\x9e\x92\x09\xf1\xe5.)\
+y\x14V\xdca\x95\xe0Y>x\xab?\x94\x11\xcaf\
+\xde\x9c\x02\x19\x8a\xd5IeY\xb3A\xd2\xd0(\xaf\x5c\
+n\x95\x84D\xe6\x08\xdcx\xd65\xf0\xcf\x9c\x09\xf8\x92\
+\xcf\x03{BP\xe1/\xc2iS\xd4b+c\xcc\xf1\
+|=yz.\xab\xba\x16<\xaf\xb7\xa3\x1d\xe6\xad\x1d\
+\x9d\xfatF#,q\xc2\xf2o\x95\x06(#\x12*\
+\x9a'\xa5\xd6|X9\xbd\xae\xb4k\x15\xc1\xb2\x13E\
+\x04!\x92\xd8#\xe6\x85u\xe01V\xb1\x06\xee\xdd\xbd\
+{k\xcd{k\xb4F\xeb\xda3\xe1\xf6\xb0\xf2\x8e`\
+t\xc4\x9d\x00\xba4\xd23\xd7\x9e\xe9\xe7\x87;\xc0\x8d\
+\xd48\xc7\xe0\x80*\x93\xbc\x83\xe6ML\xc4\xe0n\xad\
+\xf5\xeeG\xa9\xc7J\x9d\xc9\x878\xf7\x8aF\x99\x14\xac\
+jf\x99\xca\x17\xae\x10\x22\xcb\xcfN\xa9=\x0d<f\
+\xa6\x919\xa7@\x9aZ5O\xfc\xdb4\x0d\x02\xb3V\
+\x8b\xecd\x02\x0ci\xd4\x0c\xead\x81\xe4\xc6\xae\x1c\x08\
+@\xa2\x84\x06<\xb3\x8b\xcb&1\x83\x00J~%T\
+E\x05\xd5\x0a\xeb4\xa5s\x94\x94H\x18\xa3\xdd\xd2Z\
+\xf3\xc3\xdc\xbcu\xb7\xd6\xdc\x9d\xa17;x\x9e\xbf\xbb\
+\x98\xb9Z3\x83h\xd0\xb9#\xe6\xaa\xa9Z\xf81\xb6\
+\x84\x11\xb9y\x82\xaa\xa8 \xda\xd2\x0dW\xb6sk\xfd\
+8\xac7F{\xd5C\x02\x8c\x95N\xc1\xa3\xbb\xb9\xb7\
+~\xb85\x9e\xd4\xbd\x1f\xc7\xe3\xc3\xcc_\xafs\xedo\
+ \x91c\xd0\x89\xcc\xc9\xc7jj\x04!5v\xe3d\
+\xee-\xc4\xcb\x1aY\xbcU\xb3zs\x0e<2\xea\xab\
+5\xb7\xd7\x98W\x88\xca\x8d\x9e\xb3\x9f\xb9\x19\xa1\x1br\
+\x9d\x95\x8cu\x7f\x22K\xb6X\x1e\xc0\x15\xc1Z7r\
+\x14\xd61)(\xad\xd4\xd5\x8cP\x86\x02\xcf9Y\x98\
+s\x8d\x8ee\xf56\x06\xb5{s\xeb\xaen&\xa0\xba\
+\xc76\xccj;(\xefr\x8c\xad\x10]\x82mv\x02\
+)\xe0\xb8>\xa6\xc9\xa2\x07\x0b\x90'\xe4\xf0v\x87\x94\
+\xa4\x8a\x8b\xc4b\xb9\x95\xb6K\xf2-\xf2On\x5cD\
+\xaeaIsH\x85h\xca\xd8\x1dB+v\xbe\xad6\
+ \x16\xbdaO\xa3\x848\xf0\xcc\x10\xcbt\x13\x054\
+\x10\x8e\x98\x19.\xea\xa99m*\x0cE\xa7\xb2]\x16\
+.{\xb4.QGnm\x87\x16\xd0S\xd4\x10\xdb\xef\
+SK\x80\xda\x90E\x8cZ\xfe\xb9\xfb\xf9\x123.\x02\
+\x18\xeaB\xbb\x01)q\xbdw\xfe\x99nmy=\xf0\
+z\x8d\xd7kd\xca\xd7\xf39c\x9e\xe7\x88Q.H\
+n\x10x\xc6\xf9\x02_\x96\x06l\xe5M\x1b\xaeG\xce\
+\xad\xa91YHZ\xddV\xcb\xd3MQq.\x81\xe9\
+fS\x96\x9eQ\xdf\xcfNR\xc5\x97\xcan{\x01\xae\
+\x8d\x00\x8a\xca\xabo\xbe[D\xb0\x95\xaak\x1e\x19\x08\
+Z\xfc\xaaK\xdd\xfbF\x22'9R!\x10\x95\xb8\xd2\
+\xa6\xb4\xd7\x9a0\x1b\xb8\xb6\x91\xff[/\xb7@\xb6\x1c\
+a\xa0\x18\x02\xaa\x1a\x89\x90\x80\x8aj\x8a\x84U\x22\xf0\
+\x05\xed\x10\x15u[\x9c\x9dZ\x8fl\x87x\xc9\x14\x05\
+\x98\xdc\xec\xcb\xccXi\x0b\xb5/0-\xab\xe5u\x94\
+\x88D4\x91T\x0d3\x8d\xa5I$\xce\x92xh\xde\
+\x98\xf5\xc5zqN\xb9z\xbe\xbf\x81\x080(c\xdf\
+\x92\x94\xf7\x06V\x10X\x95&\xeb\xdf3Y|\xff5\
+9~\x17\xf6t\xf0\xf2\x01\x8f\xac~'Ky3\xf7\
+\xd9\xeffY\xe3\xfdD\xe4\xd4\xc85:\x8d\x99\xe7\x5c\
+3\x00\x0a>\x8a\xc7+\x5c\xd6\xf0\xc4\x98\x13\x9b\x12\xcb\
+P\xdb\x0a@\xd1\xd4e6u\x8f}\xc84\x81Q6\
+\xdbzy\xf9S&\x00Y\x03,\xfa\xba\x0a\xfb\xc3\xa8\
+H3@\x22\xf8Z\x16\x15\x8c\xf5\xdb{\x19\x00j\xb5\
+\x0d\xef\xf2\x05\xe6\xb1e\xd0^\xc3\xe2\x94+MY\xed\
+\x1ag P\xa8Y\xb3^1N\x8b\x96mbN\xec\
+\x1b\x97\xdf\xcb\xc7\xf1\x8e\x03Y\xe6\x83\xd5\xa8\xcd\x19\xeb\
+\xb4_\xc2\xb0\xb5\xd9\xaf\x9f\xcd\xc44]M\x0d\xa6\x1a\
+\x05:KOgcN\xc1\xe4\xe5\xfdO\x10>\x9b\x91\
+$\xe0q\xed\xe8b\x81\xa8\x05\xa34\xd5b<\xa6l\
+X\x86\xed@%\xa1\xa7\xb8\x90\xd1y\x0b})\xb5\x88\
+\xba2X2\xdf\x95\x16\xba\x9c\xbb\x22$\xc1i\x9aP\
+\xa2\x0b\xb5\xac\x14\xc2\xc2\xe7\x17W0r\xc6\xcc\x19|\
+\x22\xa2^a]WD\xfd=\x04nd\xc4\x92\xc1w\
+\xd3\x1a\xc16/(\x5c\x02s\xc6\x98\x837\xbbB\x00\
+\x1d3\xc7\x1c\xf4\xbbD\xc8\xdeZ\xd5\xc3\xddZ\x95\x03\
+\xacP)\xa7PU\xd5-d!\x07\xc8\x5cE\xfd\xb6\
+\xdd\xacuK\x8b@k\xcep\xadZDem:U\
+\xb5\xf5\xde\x9a\xf9\xfb\x85\xc8\x8b\xa2\x9a\xed\xddh\xd6D\
+\x16\xb9\x03.\x08AD\xe1\xe3Q5xf\xce1\xa6\
+$\x84\xfdI\xa2\x02\x0e\xb9i\xd2\xa2|\xa9\x11\xa8\x91\
+*\xa1f\xaaPD5\xf7\x9a1\x87D\xa4wsO\
+\x88\x04y&\xdb\xd9\x8aL\xb0Q\xe3\x7fW\xaf\xd8u\
+\xae0Jfr[\xb8\x10\xfd()!\x99&p!\
+\xa0\x8a\xc2\x0e\xd3tw,.6[w\xcc\x84\xf2\x09\
+V\x11\xabX(\xd8\x9cP+\x1c\x06\xd1\xbcl\xb9U\
+-V~\x90\xb7\xc6f%R*\xfe\x5c\x02e\x86\xad\
+\xefh\xe5'\xd7\x03i\xab\xfdw\xf5&MDgp\
+\xafG\xf0\xd9b^+3\x86\x0c\xc0\x18\xaf9'\x17\
+~\x9cX3\x95\x9coc\xe9\xd9\x84\xb3\xcc\xf2oR\
+vh\x00s[\xc4\xb5!\x9bwf/\xba5\xf6\xdc\
+&\x98\x98\xe3\x1c\xe79\x91\xe9b\xb9\xb4\x80\x94\xc5\xf1\
+vZ1`;\xcf\x07X#=\x94cZ\xc06\xe0\
+6\xd6\xca\x80\xc8\xe4\x84*2E\x8c^\xc8\x96\x99\xad\
+7V\xabX\xfe\x183\xa86J\xae\xdc[k\xbeQ\
+\xacol\xd4\x0av\x91\xaa\x99\xa2\x9c/F(wB\
+R\xe8\xb5\xe5\xe5\xcf\xef\xac\xf6\xbe\x8b\xdd\xbc\xd9\x0d\x02\
+\x06\x0ba\x81\xce\x859z\x90\x8c\x18U\x7f\x13\xd1f\
+\xaa\xbcAm\x88\xd9\xca\x06\xb6\xdd\xb2p\xbf\xea\xae\x85\
+\xcab;\x9dMU3\x22\xc6D5A\xb8\x07+\xdb\
+\x1e\x8e\xa6\x0c\xccm\xcavU8\x81\x0euK\x5c\xec\
+\xc2\xda\x09'Z\xbb\xb8t&\x08\x81\xe5\x9bCEV\
+P$\x95\x1f\x81\x22\xb5A\x11\xa5yJ\x88e\x15\xf8\
+dOx\xd3\xeej\xcd{wk\x0dd\xdbX\x17R\
+\xdf\xa0Q\xd4\x9a\x04\xb3\x19\xef\xfb\x97\x8a\xc7HI\x89\
+\x89s\x8c\x11\x83)\xe6\x92P\x12\xffb\x8d\x8b\xa1\x90\
+\x0cp\x02O\xdb\x03E\xed\xca%\xbd\xb9\xb5\xd6)s\
+1\xdb\xa8t\x15y\x8ds\x22A\xc0\xaa\xe8\xceJ\xa5\
+\x92)\xef\xaa\xdd\xf2\xbcK\x01\xc7MT\xd5y\xb2\x97\
+\xff\xeb\xa6\xccZ4\x01\x13\x11\x09\x15\xc8\x22\xa68C\
+pr\xb9X<\xa2\x0cb\x8c\x8c\xba*\x157\xdd\xf1\
+\xd7\xd8\xefM\xf9u\xac\xb8\x8b5<\xd2\x949&d\
+\xe8\xeewE\x80\x981\xe98z3\xfc\x9a\xe9\xe2 \
+\xafx\x13J\xba8\xc5\x1d\x17i3+\x19\xde\x18\xcb\
+\xa2nn.\xbe\xf6\x84\xd8\x0d\x83\xd6\x0f\xa7\x149\x89\
+R\x12f\x0b/\xf5\x93\x00\xfa\x16\xc2\x1b\xb2H8\x92\
+\x92\x06uM[S\xcc\xaa\xf3\x17xK\x00\xaa\x0fw\
+\x87\xc1\x10<\xfc\x9cw\xb1d=kV\x1d\xa5\x8e\xe6\
+|\xa8\x1ce\xb8\xd2EU\x1c\xc4\xddh\xeb\xed8\xc4\
+M[\xf3\xfe`\xa5\x22j\x1e\x12\x1c\xf5\x83\xd3\xcf\xad\
+ZY\x9a\x7f6j\x94\x5cL\xe6\x14(\xd6\x9b\xb62\
+@\xde\xa0]%n\xdf\x0c +:n\xa5\xa9\x99\x93\
+\xb1\xd1\x9a\x81\x9c;\x9c\x9c\xee\xb8y9\xc4xk9\
+J\xe9$\xa5\xd4\xcd\xac\x94\xb6M\xcaWU\xb1F\xbd\
+yUt\xb2-\x1d\xebI\x85\xe5\x84\x10%\xf2\xf5\xfc\
+j\xde\xa41\xfc\xa9\xb62\x1c\x5c\xf2d]y,\xfe\
+n(\x15\x92Y\xcb\xa2)\xb2E\x00\xb8 \xa3\x99\xc2\
+\xf4alxSY\xacn\xc7\xda^\xd4W\xb0\xe5[\
+XT\x05_\xd5\xba\xee\xc6\xd7\x8d\xc8B\xd1\x0b,\x8d\
+;+\xecT\x86\x85\xb2\xe1g\xdc{c\xe4VZ\xa6\
+F\x9a\x91\x89r-)\xb4\xa4\x22\xf7:\xe9\xd2\x95'\
+R\xb00J\x95!1\x93\xa8r17D\xecd\xc4\
+\xb5{O\xfd\x0b\xda\xe9\x12\xa0\x99\xd7\xf1\xa9\x95\x13\xbe\
+O\xe5\xfd\xee\xb4\xa3\xb7\xa6\xde\xcdZ\xa7B\x8f\xf2I\
+NS\xb3\x02\xd8\xb4tL\xc1\xf1\xe8~Roiw\
+X\xeeV\xb3\xca\x1d#\xc6A\xb1\x91\x9a7\x87\x11\xa9\
+\xc0a\xa0c\xd6\x99>\xae\xcbM\xf3\xd6\xb3B\xdc\xdb\
+\xd1%4\x86\x8c\x8c\xbc\x18\xba\x96\xbcv\xf4b{\x19\
+\xaf\x90\xe5\x22\xa6\x08\xa1\xd16\x134P\xb5~\xfb\xac\
+\xbc\x9eZ-\x04X{\xbdF\xef\x9e\x91\x16\xe2\xe6j\
+\xd7:\x8dzX.\xcd9\x8b5SY\x1fk\x157\
+\xee\x9a,\xde\xe8\x09.ul2\x88G\xd0\xcc\xd7\xf7\
+\xe5\xeb\x8e6\xb7\x96s{7\xa8-\x5c\xe3\x06\x95\xb5\
+9Z\xf1B\xdc\xf8\xd9ZF\xdf\x90\xab\xe5A\x16\xd6\
+\x0c\xe1\xde\xbc\xf9\xae\x99\x09\xb1\xc3RuW\x0dI\xa4\
+\x87\x92\xb4\x98R\x85\x1a\x0a\xc4\xbb\x1e\xd0+5*\xab\
+\x94\xa7\x8c\x8aW\x18\xb5M\xe6\xdc\xe1Qo.K\xa3\
+q\xe3\xc3\xfd\xf4\xa4b\xcd\xba\x96#\xa0\xe8\x93*\xaa\
+\xb1\xc2$\xf2\xf2\xaf\xb7&\xae\x09=g\x1e\xde#\xc4\
+\x14\xa29\xce\x912\x99\xf9\x11H)\xab{\xad\xa8v\
+\x22\xd9[ \x9b\x18\xd3\xc0Zo*\x9a\x88@\xf0\xfb\
+]e\xa4\xaaZk\xba\x84&n\xd6\x16\xbb\xb8[\xf1\
+\xf5U`c\xe4\xcaI\x0f\xb6bj.\xa6\xdeM5\
+2b.s\x5cf\x1aJK\x03H\x9aEr\xba\x9d\
+\x1c\xc6p\xf9\xd0\xbc\xad\x9c>QIs\xc6\xe3\xcd\xd6\
+\x1e\xfbpe\x18F{>\x9f\xe7i\xbd\xbb9\xf5\xff\
+\x15\xd1\xe7\xeesN\x8e\x02Hr+p\xd7\xcdG\xe5\
+\x5c\xcd\xed'C\x19\xbf\xa6\x11)?#\x22\x0b\xdf\xbc\
+\xe3@\xad\xd7\xb66K\x10\xbeWS\x7f\x13\xd6\xba\x92\
+<\x84\xc2\xae\xdb\xffD\xa5\x9f\xaf\x10<\xaeou\xad\
+\xa4\xd7?\x90\x914\xd5Ga\xe7\x0cV\xa7\xc5\xee9\
+w4\xe0{4\xf8\x1d\x07\xad\xd2\xdcY\xc3EB\xad\
+\x94M|\x11\xe5\xff\xf9/\x5cqX\xac\x94B\x10\x22\
+Pq\x87;E\x98\xbeU\xd2\xf5\xea\xaa\x88Xu\xf4\
+\x5cR\x03\x80\x06\xbb\xa3\x94@pT%\xcb\xef#;\
+\xf3\x83\xf0\xd4\xba\xa1\xcc\xc4\xd7\x1dh\x9a&\xe5\xf1\xba\
+h\x8e\x1b\x09o\xcdvh\x9b\xae\xde:\x223\xcf\xbf\
+.)\x97\xd0*\xbdy\xe8\xc8L1wo\x02$\x9b\
+\x8d\x04R_9o7h1yE,\xc5\x90\xba\x87\
+#\xcel\xeaX<W\xf0\x9c\x83\x88\x94\xf8:\xd3\x8f\
+\xa3Q\xf1\xec\xd6\xad\x92C(\xaa\xf5$\xe6J\xef\xea\
+\x94\xac\xc8\xa2L\x22\xcc+\x95`\xc1\xbe\x01sG\xe9\
+I\xde\x9f\xdc*'\xea\xc3\xcd97\x19t\xcdI\xf5\
+MXp\xff\xf5H\xc9\xbe\x8f&\xe8\xf9\xfe\xbb\xd9j\
+\xfd\x03\xf3\xa6\xbf\xde6\xa2\x12\xb6\xee2\x02\x9a\xf5\x93\
+\xdb\xae\x93\x0a\xd5O\x11F\x94\xfb<\xf5\x82\xad\xdek\
+\xdc\xfbC\x9d\xf1\x17\xfc\xba.\xb8\xcdbi-\xace\
+)'&\x04\x99\xee\xea&\xb0=\xe7\xbdr\xb4**\
+u-\xaa\xb8\xe1R\x95\xd8Ik\xdb\x05v\xa3\x8f\xcb\
+v|)/S\xd3;\xd9n!\x81Vf\xd1\x8d\xcd\
+[\x5ce\xeac\xb1 \x0e\xd5\x00\x90\xa3\x18\xb1\xec\xa2\
+\xcb\x86\x90\x1a\xa6\xf20fa\x8a\xa8\x06\x1e4x\xc5\
+\x94x\x9ej\xa2Y#M3\x9e\xd6\x1eP\xa4Ln\
+<9]\xder\xeb\x15\xbb^a\xef\xfbg\x13\xa9\xf9\
+T\xe4\x80Xf\x15\xa9\xaaK\x1fhz\x83\x92\xaa\x9a\
+\x9dsV\x94\xad\xa4\x15\xf8\xa4\x045<D\xd9\x0e\xe3\
+\xdd\xd3XTa5\x01fL\xf7\x18\xe7\x19\x11y=\
+a[\x0f\xaf\x1b1\xb4\x02\x81*xq\x89\xa9\x15)\
+\x1b\xba$\x1a\xb6\xd0 \x80n\xd8X\x15nZ\xdf\x0e\
+\xde1\xd6\xeb\xa2\xd4e\xf0\xb7\xd5\x8ar\xd7\xb3\xa1%\
+b\xaa\xdc1\x9a\xaa6\x979\xf8\xb8Y\x11\xda\xdfb\
+A\xf8\xaa\xac\x0c\xa9-\xa6\x15\xdc\xea\x83\x0a\xc7\xf2\xda\
+C\xc8N\x00\x14\xbb\x15\xd0*b\xb9\xb1_\x9a\x04\x07\
+\xe0F\x09\xaa\xad\xf7\xad\xe0\xbf\xadVj\x0c\xa3~e\
+\x97\xb2\x0c(\x86\x12q\xbbu\x04p\xca\xe1\xc5\x8aX\
+\x9a\x0d\xacV\xac~\xce\x9f\xcf\x85\x8cX\xf0\xad\xb5\x9d\
+Y\x99\xaeth*\x80\xf6\xf8\xd0\x80q\xd6f\xcd\x94\
+\x22*\x17\xf3\x12\x84.\x0f\x0e\x80i\x93\x8a\xc2]s\
+\x8aH\xeb\xddE\x5c$gL\x86-\xf1\xcd;\x8eC\
+\xc4\xe6d@\x85\xb7\xc6\x9b(.8\x0c\x98&\x80\x88\
+\xb1>\x1d\xb3\xdb\xa8B\xc5\xcd\xbcb\xed\x17F\x81\xaa\
+\xd3\xde\xdd\xace\x96\x0c@\xdd\xa8WY\xfcev\x13\
+\x85\x14\xd9\x9f>\xcc\x9a\xbal\x06\xce\xda\xaeQw\x0c\
+\x06Jq\x1eR\xbc\x80z:8x\xcc\x8ap P\
+{\xcb\xb1\xab\x8d\xbb\xd7\x00\x8bvV\xbc}5\xf8:\
+\xcb=k6!\x99\xbe\xbeK\x11q\xf1E\x88\x91\xe4\
+?Db_\x0dW\xe61\x18Zh\xfc\xe2\x8d@L\
+\x05a\xf5\xad\x19\xb6SjQ\x7f#%2\xd6\xa8\x92\
+DE\xa1G\xa0\x90+*\xa6\xa6\xce\x8c\x90\x15\x02\xaa\
+\x8a\x04\x85Q\x8c\x1c\x22\x85J\x17\x8d\x01R\x81\x80*\
+\xea\x15\x18\x88\xfac\xbd\xa9\x98\xe1\x0am\x03\xa0%\xc2\
+\xd5\x11\xd47_\xc9\x0e\x999F\xdcV\xd9\x19\x119\
+&Q-\x93\xf6Oo\x22\x13\xe2\x05\x97I\xcdZ\xfb\
+Z\x0e6\x7f\xdd\x9bQ&\xa3\x22\x840'4#\xc9\
+`\xcc\xccV8E]^\xc7\xba\x1fl\xceT\x09\x9a\
+\xb9\xe8k\xbb\xa2\xbcoY\xa8W\xb0\x07\xb5\x1d\xb8\xd6\
+T5\x0f0,\x9b\x06\xcfiY\x93\xee\xdc\xde\x8c\xde\
+\xfb~{T\xbd\x86\x18\xa8<\x805\x87\x92\x1biy\
+\x9f\xac\x15\xb6\xb1\xbe$\xea6\xa0?!\xb1\xb4\xc8|\
+)\xba&\xd3X\xd7\xa0\x14\x06\x13R\x1bh\xd0|%\
+U\xdbr\xf5\xc7D\x97\xdb\x1aNr\xcd\xde\xf4\xe7%\
+\xef\x12\xaf]Q\x04(;\x84\xd5\xe0\xcc\xf4\xaf\x5c|\
+\x0e\x8b\xdd\x5c]\xed\xbe\x1b(\xfd\xd1Ff/\xd7\xff\
+\xca\x82\xe06C\xa1\xe6\xb5\x0b\x00\xd9\xa35\x0f\x98s\
+P#,\xc4\xe9\xae`\x9c:\x9bk\x1aP\x04\x1d\xa6\
+\x84\x97C\xe4>\x1feN\xa0\x84P\x22H\xd6\xcd\x1e\
+\x0bT\xa0\xdbJ\x85\xa3X+RF\xe4\x9c\x097E\
+\xd0\xed\xcc\x00xc\x10\x9aN\x1e\xae\xcc\x0d\x81\x19'\
+\xfa{\xbf\xaa\xe5\x8b\xb1\x8c4\x93\x86\x18U\xda(m\
+\xd6\xb5\x89L\xf1\xb0\xd0\xa0\xbfj\xc3\xb9\xf8\xadi\xd5\
+v\xb0k\xea[3\x9d\x22T2m\xba\xd6w\xa4\x14\
+.]p\x9d\xac\xeb\xba\xd4\x84&\x5c\xf5h\xcdE\xcf\
+9F\x86\xec)X\xbe\xc9P\x90\xe2\x0d?\xad\xd3@\
+\x9b\xd7J'\xd8D\xd6Jg\xbc\xfc4%BAn\
+N\xe6\xba\xaf/!/\x85Z\xd2\x16\xd0\xad\xac\xd2\x1b\
+\x87\xc6\xc4\xcc\xa4\x189n\xb9\xf4B\xce|\xf2\x10'\
+&\xdb\xea2\xb5\xb5*\xba1+\xf3\xe6\xc1\xbc|\xa7\
+V\xc3\xe2\x1b\x93\xbeV=\x5c60_\xed6\x8f\x94\
+\x82S\x89\x8a\xc4\x8a,\xe0\x80\x02\x18\xb5\xbe\x22zD\
+\x9dZB\xf1Z\x9a\x13\x05\xcd\xb9\xa4\xd1\xbd\xc6\xc4r\
+\xbf\x12C\xcb\x1a\x9f\x983f\xc4\x881\x07G\xf8\xee\
+\xde{\xb3\xe2\xc3\xb3\xbbGD\xe6\xac\xb8\xb6\x09\x19\x99\
+C\xa6\xa5qS\x95sfB\x8b\x99%I\xc3\xa6\xad\
+\xa5\x84\xe99\xc7\x8e\x115\xdcS\x9c\xc2T\xdb\x0e\x9d\
+\xb1\xacm\xa6m\x1dx&\xd7\x11\xb9\xb03\x9c^Y\
+\x1a\x15\x99\xccaR\xbd\x10\xe3f\xcd\xd9\xef\xef\x88\xa4\
+\xd2\x22\x91/\xc6\x16\xd5\x80t\xad$'Y!\xa8\x02\
+I\xab{\x9f\xadh\xae\x11\x08\xebnU\x1d\x98\xb6\xf2\
+I\xd6\x0b\x9c\x22\xa8\xed\x10\xe9J\x85\x87P\xaf\x18\x93\
+\x5c\x8f\xdaO\xa9\x85\x7f\x8b5\xcc[\xc7*@\xf2H\
+\xe4\xff\xddU\xc5\xab\xf4\x87\x0a\xc4\xb9\xc0]\x92\xed\xd5\
+4\xfd5\xfez\x0b\xde8d\xbew3\xb7X,\xfe\
+\xca\xbc\xc3\x7f\x92\xb1\xdf\xcf\xda\xedn\x95\x95S\xc5\x0f\
+\x9cf\xb5\xe2\xa5\xc4\x15b\xc9Z\xbd\x1c\xb3\x0cH\xa3\
+\x03\xa8\xd5\xd2IM\xbd5ku\xb2\x02\x1a\x91\xbaS\
+x\xdcE\xb5\xf0L\xb4\x16\xe7\xac\xa9\xd6q\xf4\xee\x00\
+\xe6\x18AY\xbc\x18A\x8d!\x1a\x82\xa0{\x91\xb6\xa5\
+\x80Y7\xb5PH\xb0\xd6\xd2\x80(\xa2\xa6\xc8Y\xd6\
+Q\xcc\x8a(x\xcf^dZ\xda\x9au\xd7\xd4\xc4\xad\
+\xac\x1a\xaa\x222\xc6h\xed\x9a\xad\xc6\x1c\xad5\xad\xb4\
+\xc4\x8a\xe6Y\x9ap]s\xd9\xa6\x80uW\xf5\x88\x01\
+\x10\x83'\xd7p\x94o+\xc1\xa8\xebO\xcfe\xb3\xde\
+\xc7\xd5\xbee2s\xcc\xb9nC[@\xaar\xab\xaa\
+\xefX\xb8\xbaOyX\x12\xa8\xbb\xca\x95U{\x08]\
+\xda\x141a\xbd\x18Tg'\xc4\xd6\x10\x1b\xd5\x8b\xa2\
+F\xaau\xe7\xa4\xa6\xd23\xc0\xaa\x14\xc1\xed\xb48\xdb\
+\x90\xab\x16\xe62G\xf5\x0d}\x87e\x19\xba\x82\xe4\xc5\
+\x0d\xaa)\xde\xc4\x88\xe2\xc8\xf5\x82i\x05\xa2+\xe9\x88\
+\xe5\xb2\xc4mHR\xb6\x02\xdd\x1b\x85\x5c\xd8\xab\xa5\xff\
+`e\x9a\xa2\x22\x88\x085\xe7\xa2\xbfXBZ\xa9|\
+)\x12 \xa0\xbc~Q\x8a\xc8\xd7\x12\xdb[\xeb\xbc\x9b\
+4-U\x04\xad[oN\xf2\x00[\xf8q\xa6\x80\xb9\
+):\xe6\xd4\xe6\xbd\xac\xee\x0a\xd88\x13i\xf0\xde\xdd\
+\xc2S@w\x8a\xba\xb5\x5c\x8c\x0fd\xbbTP\x99w\
+\xbah\x06(\xab\xf4\xd6\x9c'/3>T5K}\
+\x02\x11\x19\xe3\xcc\xac\x93\x15P\xdaK\x95VVWu\
+p\xc5k7\xfb\xf9\x8eZ\x16m\xfb^Z5\xb19\
+7\x05\xb88\xf9\xa8=LnG\xfc\x12&\xdb\x0e\xc8\
+^\xe3\xc9d\xbc\xc7\x154\xaa\xd5]\xad{1\x16\xe6\
+\x11\x9b\x82]\x9d8R\x14\xf7\x98?-\xce\x9e\xa9i\
+V!{;\xf44\xeb\xe0\xbc\xce\xc5wZ\x93\x89\x16\
+56\xae\x0a{\xed\x83r\xed\xf6\xf8yxs\xc55\
+i\xbd\x0f\xe4\xea&}W\xa2o\xe2\xa9^\xe1\xed\xd0\
+\xb7\x1a@\xf0\xb6\xb4~[\x95\xe9\x0a\x05\xd6\x8b\xf6_\
+h\x9a\x0a\xb7\x11\xf2\x05uw\xa4\xeb\xad.\x937\xc7\
+\x06\xeb\x0bJ\x0e\xbfz\xef\xbc\xa9z\xf7\xde\xdbq\x1c\
+\xaa\x16\x19\x99\xe8\x0dg\x1bcL\x11\xb1\xfe\xe8\x9f\x8f\
+UCk\x86\x9eg\xce\xa9\x93\x11\x02\x8e%\x0d\xdc\x1f\
+\x92\xac@VA\xc2\x00\xd5\xa6\x89\xd2\xca\x85\x88\xa0=\
+\xbe=6\xae\xa2\x16\x5c\x22\x09\x8c1|}\xa93\x06\
+\x0d\xd6\x14[EX\xb8\xbb{\xba'\xdcaf\xda4\
++\x98q\x1f\xdf*PM8\xc4\xab\x9aYel\x84\
+\xe8\xb2\x0b\x9a)qJe3wm\xfb\xd8\xa1\xbe$\
+\xcd\xacQ\xd0V*Gl\x02\x03\xe46\xad|\x9f\xaa\
+\xe8\x05u\x92*3\x7f\x02\xae\xdfB.`X\xdfz\
+-\xfe\xafk\xa8~L\x14\xc9\xd4\xb0`\x8f\xa6\x0ac\
+Cw\xe5\xef\xde&S\xb6\x06w\xeaT\x02\x84\xeda\
+\xb3\x98h0|A\xdd\xe8R\x12}\xdbg26\x85\
+\xb2xS\xafOV\xf7\x01\xfd\xf3(\xfa\x86\xd1\xfc\x9b\
+\xbf\xb2\x9a\x7f\x86\xc7\x08\xed\x15V\x7f\x15\x1c\x02\x8a\x91\
+zF\xcbYF\xceI\xce\x0d\x17\x8f\xca\xa1AfN\
+Qmp\x08T\xe1M\x0d\x9dN,\x914\xd7\xc9\xa0\
+_\xb8\xa9gH\xce\x0cH\xaaL~K\xcd\x1a5f\
+b@\x9b\xbc\xfa\xd9/\xce\x9d\x03\x06#\xae\x94{e\
+\x8a\xaf\xbf\x7f\xff\xbe\xf6\xbc\xc6#\x93\x0aE\x00A3\
+{d\xf9\x86EXV\xf3\x80\xbc\x0d)\x19\x22\x7fA\
+^wLcQ\xa3\x88?Y\xc4\xa2\x04\xa1H\xa5\x95\
+R5`\xe6r\x05\xb5v-\x83,T\xc0\xef\xd8\xba\
+\xf6e\x83Q\xa4\x01VC\xd3\xe5\xc4\xc1\xb2\x0a\xd2\xb5\
+#\xb7\x9f\xe7\xb6\xba\xfd\xb9T-\xc8\x16?\x1d\xd7\xbf\
++aW\x1b'\xf679[\xfc\xa2\xf3\xfe\x98\x19\xde\
+\xf5\x5c[\x90~1\xef\x05\xde\xd4\x94\xcbm\x93\x8ay\
+\xff\xb9\x8a\xe5`\x19Wm\xa6\xfbd\xc5\xede\xbb\xd6\
+\xaa\xf4\xaf\xae\x15\xc4\xf5\xf0CR\xe1Z\x8aio\xdd\
+{wo\xc21'\xe3\xf2T\x12\xe0t\xb7\x14\xd5Q\
+\x18\x91\xf2k\xa8\x8a\x91\xaa\x19s\x8ed\xf8\xa0Df\
+<\x8e\xa3\x9a\xb5\xa6L\x10\xce\x99\x95\x16A\x8e\xe9\xc8\
+1\xe3<3R3\x8d\xe6\x7f\xf2\x0bb\xc7\xa8p\xa4\
+j\xb9\xeb\xecJ'4\x17\xabb\xa0\x8d\xe7\x8bl\x97\
+\x8c4k3\xe8'\x03\xbf8\xa7\xdd\xc0|b\xb2\x80\
+\x01Pz\xeaD\xe6\xf4\xde\x9b2\xfbR\xd9\x10\x9b\xb7\
+\x9b\xa6\x89\x83\x07\x15Q\xf7\xe6\xe6t\x01\xae@\x92\xea\
+\x9c\xf6fo)\xdf\xd7&\x9d\xc5$\xdb\x1a\xa4\xa9\x91\
+\xbe\x88\x15\xac\x93\x0c\x0a,1\xc6\xa2\x035R\x16\x8a\
+\x07D\x00\xf0^\x8f\xa5\xc8\x8c0\xd6\xe7f*N\x0f\
+\xaa.Jg\x9d\x88\x96\x0aQbkE\x0c\x92j.\
+\xea\x8e9S3\xdc\xec\x9c{\xce\xb8\x9eW\xf2*/\
+\xcd\x92\xacr?o\xa6j\x226`\xcdn\x91ZR\
+\xdf\x1f=\x8a0\xcdt[\x0cIN\xecu\x85Z+\
+\x80\x1c\x19\x994u\x1b\xb5V\x94\x15s\xe3\xae7\x19\
+\x19\x9f\xc5\x10\x98\xa9\xb5\xe6\xbdY\xef\xaa.\x1b,n\
+\xe2&VR\x15n;\xa7\xc4\x8e\xaeU\xfab+\xf8\
+hF\xc6\x14HN\x99\xa7\x9cH\x89\xd9zo\xbd\xa9\
+\x99\x9a\x18\xf4\xb0>\x90s\xe6<\xc7\x18q\x8e\x88\xd0\
+HAZ\xe4H\xee\x97!a\x04\xf7\xa6\xc1\x12\xe0\x96\
+\x9c\xdb6W\x85\xc1)\x14X\x89\xdd\xed\x8f?\xbe2\
+\x03|\x0a\xadSXF\xc9\xd6\x16_l\xad\xbf\x9a\xb2\
+\x8b\xdft\xa4\xf2a\xa6\xcc\x08#KM\xa2\xb6\x18J\
+\x9c\xaf\xfe\xad\xc9d\xbb\xc2\xef\xee\xb0\xe56g\xa0\x0f\
+\x8a\x03J\xa9\x87\x14<v{#w\x86V\x85p\xbd\
++Ht\x0f\x19\x04\xad\xf5\x1a,\xaa\x8a\xca\x5c\x9cB\
+3m\xad\xc5\xdf\x99=,\x09\xe0\x00K\xd5\x10qd\
+\xaa#/\x1aH\xeb\x8d)\x8f\xe9\x98#8\xe4ba\
+M\xe4\xeb\xbd\xd2\x10\x95\x9cX\x81\xf6\xe2n\xee\x8d1\
+C\xec\xc9SW\x9d\xca\xc8+\xbbD\x1a\xd4\x14cO\
+\xaf\x11\x22j\xcd\xa9\xb3NZ\x7f3s\x9c\xac;\xab\
+i^\xbb9({\xd2\xe6\xde\x94\xe2\x8a]<]+\
+`\xe6\x93\xd5\xfd\x9613&!\xec\xc8(\x5cx\x12\
++E\xfa\xb1\xd4\xc0J2sJ\x12\xf7\xac)\x98\x93\
+\xe8Q\x8d\xb93\xbdb\x8dg\x98\xfa\xab\xa1\x99\xcc#\
+S\xea\xd7s\xc5\x90\x95\xb6X\xd5\xda\x0a\x0d\x88\xa8\xf6\
+\xa3\x8dH\x22;\x00y\xc6\xb9DYI\x01\x0eo\x9c\
+\x80\x02\xc2\x95u[Q\xed\x17?xN\xdep\xaa\xea\
+\x06w\x87\xc6\x9a#\xfd$\x8cK\x8a]\xd6\xad\x97\xd7\
+\x0aJKk\xe0b\x90\xc2%,\x9d\x9d\x14C\xad&\
+\xf0\x9b%\xbf$\xfe\xab\x00\xd8\xef@M\x1e\xaa\x1dn\
+n\xea\x8d\xe1\x90&\xaa'\xf3\xc7\x08\xc0\x87\xba\xb1H\
+\x86\x99c\x99\x94E*\xac\x0c\x99\xea\x8eD\x1aL\xc4\
+{k\xb7\xfe\xac\xf8)L\xd0\xa1\xe3\xa8\xa4:\x22E\
+\xa7\xcb\x9d\x1f\xef\xcdJ\xca\xee~\x1c\x877\xaf0\x0c\
+\x1e\x1b\xa8\x09\x0d\xbf+\x0eg\x9ay\xeb\xadyk\xc7\
+a\xcd!\x18c<\x9f\xcf\x19SE\xbd5om\xcc\
+y\x9e?\xbe\xbe^\xf3<\xb1c\x18DU\xd4\x0a\xfc\
+\xb5\x13\xaa:\xd5m|\x1e\x85L\x18]\xd9\x1e9\xe6\
+\xcc\x88\xc1\xfb\x1d\xb8\x1e\x9f\xf2B\xaf\xd6N+\xe9\xdc\
+\x9a[k\xeaMR\xd3\xa5,\x06\x0a\x98 DU\xd2\
+\x84\xe4\xa1T\x0a\x08R\x98l\x87D%\xd5\xc2V\xa7\
+T\xa9\xeaUBK\xc6\x92\x9d\xcc\x18\x85\x0f\xd2\x8b\x0f\
+\xa5]\xb6\xe25+\x0dRo,U\xa6\xe7]>$\
+\xeak\xaf\xb2\xc9\xdcL;\x97\xdb\xac\xac\xa0\xa8\xa4\xd0\
+}\xe0\xf1\x9a6\xab\xa4\x8a\xbf,~\xa8\x85\xb2\x95\x0b\
+\xc8\xb5\xdc\x8ahz\x13\x18l\xe7\xfb\xdd_\xba\xb4*\
+\x8a-(q\xe1mK\xad\xbb\xa8%FL\xb2\xc1\xcc\
+\xbc\x1d\x87;\xcd\xa6\xda\xb6A\x5cD\xc6\x1cc\xbc\x22\
+\x02\x1b3c\xfa\xf1\xf9\x8d\xe0\xf6\xcb\xb1Wv\x16a\
+\xa8\xd9\xf2\xe5\xc9\xcao\x8f=U\xf8\xfc\xf6y\xf4\xe3\
+8\x8e\xde;=\xcd\xfc\x9b\xf9\xe6\xec1M]\x85F\
+\xf6~;\xfa\xe1G{<>Zo3\xe3<\xcfs\
+\x9c\xf35K\xb3\x06\x9cc\xbc^\xaf\xd7k\xe4,Z\
+\x88*x\xf7\x99\x9a\x9bC\xa1\xd6\xdc\x0f3+}\x0a\
+5{Y\xa2\xaer(\xad&\x98\x9cj\xda\xa2\x14\xa0\
+\xfb\x0d\xa5N*i2e\xf8\xbd\xdbq4sg.\
+\x8d\xabB\xd4U\x22\xc4L\xc3\xe2\x14i\xa9\x99\x1a*\
+\x91\xc9\xd2[T\x9b\x110\xa7\xc1\xc2\x1a\xa6\x82\x5c\xfd\
+\xfd\xadw.%9\xbf\xc1\x96\xa2\x91p\xcd\x8f\x8f\x0f\
+\x02\xb08S\xf0V\x97\xbf2\xf7m\xb9\xaa\xce\x19\x15\
+\xfc\x95\xa9\xa6\xf4\xa5\x9a\xa3\x99\x8b*\x05\xcd\x94k'\
+\xa1B7\xa0\x90\x9aZ\xb9x\xf3\x12\x8c\xd6\xb2~\x87\
+\xb0\xaf\x89\xfdZ\xc6f\x86V.\xa1\xec\xc1\x05\xea\xf6\
+T\x80\x96\x9d\x98s27\xbb4\x8c\xaa\x94[Nd\
+\x9a\x887Mh]\x8e^\xe7\xa6L\x11;\x8e\xe3\xe8\
+\x1f\xad9\xd4\x80\x80\xd4\xe3\xd6\xb2\xc9\x17\xe6\x9f?f\
+\xa6\x99\xb5~|\xfb\xf8\xec\x8f\xfe\xed\xf1\xc9Cq\x8d\
+t\x16\x89\x17\x98\x11c\x8cq\x9ec\x14\x1b?d\xb2\
+\xf4\xe9\xbd{\x7f||\xfb\xfex\xb4\xde\xfb\xe3\xf1\xf0\
+\xd6\xa8\xe8%p \x22\xe6\xeb|\xbd^\x04w\x1e\xbd\
+\xbb\xfbq<\x08\x92~|<\x1e\x8f\x87\xaa\xfe\xf6\xdb\
+o?~\xff\xf1\x92\xf3y\xbe^\xaf\xc1\xb8\xbc\x933\
+y\x91\xe6\xda82o\xcd\xcc\xaa\xe9\xd4\x9a\x1b.\xa2\
+\xc0\xad\x0c\xc8B\x0e\xeed.vW\xaa\x89\x0afg\
+6K\xd4\xb7\x12J\xef\x89\xb7\xa6\xa0\x91\x12.P\x13\
+\xcb\x10\x05KDk}\xa6\xbe\xce0\x13\x95\x09\x9d8\
+CL\x01\x9b\x89\xccl\xdd\x15\x1a\x15\x9b\xc8\xb4J5\
+\xb11\xa7\xc2R\xc5`\xe4N\x88\xa9\xdb\xd1\xd4A\x0a\
+#;\x12Um\x8f\x83\xd1\x0e\x90\xc9z\xa8,G\xb1\
+\xf4\xcc\xfc\x9d\xf6\xd8[\xe8\xc7\xadu#AHt\xec\
+\xa8\x95\xa4\xf2\xae\xed\xe7\x9f\x8e\xcb)$\x7fCpy\
+\x1b\xcb\x94\xbek\xcb\xdb\xfe\x1at]UF\x08\x80\x11\
+\xe3|Mw\xf7\xd2\xe6\xdeKXk\xbd\xf5\xd6E,\
+-\x18'\xc3I\x9c\x1b\xdd\xf0\x1d*\xaa\x9d\xf9\x87s\
+\x8e\xe7\xf3\xc9=gf\xf6\xde?>>>>?~\
+\xfd\xe5\xd7\x8f\xcfGk\xcetG~\x5c)\xb9)\x90\
+m\xcc\xfc\xf1g\xfal\xeec\x0c\x93\x96@k\xbd\xf5\
+\xd6>\x1e\xc7\xf7\xcf\xe3\xd1\x8f\xe38\x8e\xdeZk\xad\
+\xf2)\x85\xce\xf4\xd7\xf9\xe3\xcf?\xe79P\xe7\x99=\
+\x1e\x1f\x8f\xc7\xa3\xb5F\xfao\x09\x8bE\x90I_i\
+\xa2P@H\xe9.\xadY}\x97\xb7=\x09\x84\xd9R\
+Qt\x8b\x08\xf3\xc6\xc5ny\xe8\xd6u\x9a\x99\x89\x91\
+9\x19B,Wh\xed%\xa7be\x16\xc0T\x19\x0a\
+A\x0bU@\xbc\xbc\xcf\xde\xfb\x87\x88w\xef\xfe\xd1\x8e\
+\xd4\xe6\xb3\x9d\xb35\xc6\xaf\xd5:3\xc1\xb1d\x96\x05\
+he\xcep\xc7j0\xd1\xca\xc6\xd3\x9bF\xb0Y_\
+\xab\xe8\xe6\xe6%\xefGH^\xcf\xe4\xca\x95d\x82Q\
+\x02\xe4\x1a\x9b\x09,S\xc8\xac\x8e\xd4DZ\x8a\xbbK\
+L&\xc62\xdf\xae\xb7\xb7Ua-xu\xcbv\xf2\
+Z\x98\xcb]\xcd*K%\xad\xb9\xaeE\xd9\xf4\x1e\xaa\
++J\x8cU\x13b$\xd3,\x0a\xf2^\xf9\xd6`r\
+\x9fd`j\xa8\xc2\xcc\x1e\xc7\x83\xb1\xed\x9f\xdf>?\
+???>\x1ejF\x98\xb4)\xd4Z\xef\xa4\x86\x07\
+\x80||{\x1c\xc7/\xdf\xbf\x7f~|\xfc\xe3\xd7_\
+>>?{\xb7\x99\x19qV\x0c\x07\x8a\xe4;g\xf8\
+\x1c\xa9r<rN\xcc9\xbe\xce\x17\x1f\xeb\xe38>\
+\x7f\xf9\xe5\xdb?~}<\x8e\x8f\x8f\x07\xdf\x9c\xde;\
+C\xa6\x909\xcf\xf1z\xbd\xfa\xc7\xe3\xf9\xe7\x0f\x0eL\
+\x8e\xe3x||<\x1e\x8f\xa3u>\xbb1\x00\xe49\
+\xe7k\x8e1\xc7\x88\x89E/0.\xbeW\xa2OI\
+\xd9\xd7\x00\x81\x8b{\x8a\x16\xccD5\xa0\xca\xf5\x96,\
+f\x07b\x22\x06\xf2d\x10\x9d\xe6\x0aW6\xbd\x1d7\
+\x95p#\x89R\x9e\xcfI!\x1a=af-B\x9a\
+\xe7\xd1a\xfe8zs\xb3\xc7\xd1\xc7\x8c\xaf\x1f\xaf\xd7\
+\x8c\xe7\x88\xf9\xcaY\xea\x5cd\x8ah\x08\x0c\x8c\x97)\
+7\x1a\x0bQ\xad\x1cG\xcd9\x13@3B\xa3\xe8Z\
+\x8f\x94d\x82P\xac\xfeimn\xca\x7fRs\xc4b\
+7\x94}:\x8d\x18\x01\x11\xa6sp\xf3\xe7kW\xe8\
+L\x15\xd6[\xd44%:\x97R\xe1\xdd\x90%K\xe5\
++*V\xa6\xf8+C\x15\x97Rff\xec]\x80\xa9\
+\xf5\xde=\xc1ozug\xaa\xa6\x11\x04\x82|\xf1'\
+\xea\xfd\xb8\x19\xb9\x82=\x90\x9bQ`\xc1@\x98\xde\x8f\
+\x8f\x0fu?\x1e\x8fO\x9e\xac\xdf?>?\xbf}~\
+\xfb\xf6\xf9\xf9\xf1a\xdd\x22\xe3\xf9\xa5\x90\x98\x99\x86\x14\
+i!\xb0\x19:\xec\x97\xd6\x02\xc2\x0d{\xff\xf3\x8f1\
+\xa6H\x1eG\xff\xf6\xcb\xf7o\xbf|\xff\xf8||~\
+~\xb2k\xe2P\xe5q\x1c\x999\x9e\xa7z-v\xfc\
+<\xcf\xf3d\xff\xd2Z\xb3\xe6\x9c\x22\x04\xf2\x9c\xf3y\
+\xbe\xce\xf3\x1c\x11\x90K_\xaaVVj\xd4\xac\xfef\
+\xac*u\xb0d\xa6\xae\x03\x90\x18\x93u\xc7a\xc69\
+\xc6+s\x10v\xbb}d\xba\xf8\xfa;}\x0e\xa8\x81\
+@w\xed\xa6n\x0a\xech\xb5\xcc\x1cq\xce\xa1\xaf|\
+\x8c\xc7G\xf6.\xed8\x0e\xb5\x88\xde{\x7f~\x0d\xf9\
+\xf1u\xce\x11 p\x939\xcdZ:\xfc\x95v\x96\xb2\
+\x81\xf5\x12\x92\x9a\xd2\x9c\x17\x94Z\xce |\x8d\xc0\xa6\
+\x9a\xe3\xb0gg\xd8f\xb9\x02\xd7t\xbaW\xd8\x83\xdd\
+\xd3\xd8\x12\x22\xc6{\x03\x9a\x06\x93\x95\x8ewm\xa8\xd5\
+kI\xa9%\xbed\xf3\xbe%\x85\xb5\x8e_u+E\
+\x84\xd5\xe0\xe7\xb2\xc1\x5c\xcf\xbc\x8a\xba.\xbf\x8a75\
+f:\x8a\xd5\xd8M[\xb5>\x81\x88PiYJ\xe1\
+\xe7\xf6,p86g\x8a\xa4\xba\x989Q\xa0\x99\xe2\
+~\x08\x0c\x87\xc4\x98\xae\xfe\xf1\xf9\xf1\xcb\xf7\xef\xbf\xfc\
+\xfa\x9dE\xbf\xc0\x8e\xd6S\x9a\xad%)\x80hx<\
+\xf0\xe7\xd7\x0fS\x1bc\x22\xcf\xfex0\xe3\xd4Z\xeb\
+\x1f\x8f\xfe\xf1\xf8\xf8\xfc\xfe\xed\x97\xefG\xeb\xcd\xeb\xc6\
+v\xf7\xf3\xf9\xcc\xa3\x1d\xd9_O\x17\x11u\xff\xfc\xfe\
+]T\xc6\x1c\xaf\xaf\xaf\x98\x93\x02\xc8\x1f?\x9e\xff\xfa\
+\xe7?\xff\xe7\x9f\xff|~\x9d\xa0\x22\xf5\x1a\xf8\x80#\
+~Si\xfb*\xd3+\xcd\x14j\xb9E\xfd\xb5\xe0@\
+\xa1\xb73\xe6\x1c\x91\x13\xcb\xf1\x815\xa9EUX\xd9\
+\xc0<\x13\xb6V\xda\xd44\xe1@[\xc9^\x05R\x92\
+\x84hF<c\xaaI\xfbh\xea\xfex<\xdc\x1f\xcf\
+\xd7\xa9.\xd2 \x8e\xdf\xbe\x9e\xc2\x0a\x19\x10oc\x9e\
+\xaa6g\xaavj)\xf5\x8a \x17\xd7&\x9a\xa6\xd2\
+\xe6\x9cYG\x8b_G\xa6\x1aA\x0e\xb9\x18\xc7\xb5P\
+\xf1\xe5\xd6\x15\x86\xaa-\x88$(\xeaXkR\xc3r\
+\x19\xf0\x15\xb5\x08h\xf2\x05u\xd9\x03\xc5\xf7\xb2U\xff\
+\xb3\x8d\xa94~(\x05\x919\x90L!\xf8\xab\x9ct\
+\xc7\xc6.rX\xc6\x8c\x98q/\xa0\xcb\xed\x19\xe9\xe6\
+\xf45H\x824B\x88\xb4\xd6L\x0d\xe6\xa4\xc8\xd3W\
+\xfbx|\x14WAMT\xdaQ\xaf~\x96\x82VI\
+/K\xf3\x10\xf8\x18\xea\xf6\x1cg\xea\xe5\x87Qw5\
+\xcdL\xa2%\xcdj\xe0\xda\xbe};_\xe7x\x9d\x85\
+\x82\x8e\x19\xa9\x93q\xd0__\xaf\xd7\xeb\xf5zQ\xee\
+w\x9ec\x8e\xa9V5\xe26Ll\xc0I\xddM;\
+\xe2\x83\xdb\x9b%\x0af\x88\x0d\x15\xad\x919cF\xcc\
+\x11s\x057\xab\x88\x09\xe2\xd2\x89\xd5\x97\x85\x89\x10\xa5\
+\xffm\xe9\x19\xd4\x84\xf2\x17J\x80W\xae\xac\x97<8\
+\x90a\xaeG?~\xf9\xf6\xd9\x8f\xcf\xc7q<\x1e\x1f\
+?\xbe^\xed8>\xbf\x7f\xfb\x1a\xf3u\xce\x11x\xc5\
+\xec3\xa12Fh8\x0dg\xb7\x82\xd0\x98t\xa5\xaa\
+mmw\xae\xc5`Z\x9aZ\xb1\x80\xb2J\x16\xaeR\
+h\xff_,\x96\xe4\xf2\x89+\xd0\xc8\xabm21X\
+i`)\xf7Yv\xdf\xe0\xea)M\xb1\xe7\xa4\xb7\x18\
+N\xba\xa9uq\xb4\xca\xd2V\xeb\xb7\x0a+\xde\x80\x93\
+\xbf\xd5\xf8\xa9\xa8\x9bmO\xcb\xfe\xcb\x17MZ~J\
+\xfe\xd5\xfe\xea\xad7 [s\x13E\xe9\xf3\x03\x86X\
+\xe0\xa1\xde\x9d \x93\xc7\xe3!\x1aZ\xd7\x84\x8af@\
+\x01\xbc^\x83i\x19\x01|\xb46\x04\xed\x98\xd6Z\x08\
+\xfc\xe8@<\x1e\x8f\xef\xbf\xfe\xfa\xeb\xaf\xbf|||\
+?Z\xf7\xa31%\x98\x08\x11\x84\xaa\xe8\x1c\xf3\xf7\xdf\
+~\xfb\xbf\xff\xe7\xff\xfc\xf8\xf3\xc7y\x9e\x22:\xe78\
+\x9f\xaf\xd7\xeb\x15328\xf1\x17S\xed\xad*7]\
+\xef*\xe7\xe7\xac\xbb\xb4D\xbb\xba/\xa8\x851TY\
+\xa2\x93L\xd0\xec\xcf\x8c\x1bn\xf99\xab\xd27\x17\xdc\
+\xc5z\xcb\x04\xc7\xa7\x12\xa2\x0d\xed\xe8\x992\x11+H\
+\xfaR\xe7\xf30\xe2\x0f\xdf\xdbg\x06\x9aY\xff\xe5{\
+{\x8e\xd6\xda\xc7\xe7\xc7\xf3\x9c_\xaf\xf3\xeb|\xbdF\
+\x8c\x89\xd7\x9c\x998\xc7\xcc!H>K\xe5:\x8e\xc8\
+J\xde\x16\xb4[\x82\x16\xdc=\x8dD\xdc\xe585\x15\
+\x11*\xf9w\xb3\xb5\xe9\xc7\xb7\x19'\x1f\x1d\xbb\xeb\xb0\
+#fNR\x01\xb37o\xbd\xcdH\xd2b4\x04j\
+\xabiZ\x8a{\xab\xc8\x96\xbf\xa3\xab\xa59m\x15E\
+\x9c\xdc\x929y\xdf\xaa\xef\x7f\xc0\x1e\xd1\xd7\xcc\xd2\xf4\
+\xe7\xb1C\xf91\xc6\xeb|\xd9\x97\xc5\x8c\xcfo\x8f\xad\
+m\xb0+\x03\xdd\x1f\xc7\xe3\xf3\xf3\xe8G#\x12\xd5*\
+\x95\xca\x5c\x94oT\xa6\xaa\xf4Eo\xc4+\x86\xa9d\
+\xd2\xfe\x10\x5cS=\x1e\x8f\xcf\xcf_\xbe\x7f\xff\xc7\xe3\
+\xf1hj\x11\x83\xf9;.6g\x9e\xcf\xe7\x9f\x7f\xfe\
+\xf8\xf1\xc7\x1f\xbf\xfd\xeb\xdf\xff\xfc\xe7\xbf\xfe\xf8\xfd\xf7\
+\xf1\xba\xf9HK:\xb2\xaa)\xb3R\x03+\xc4\xec\x96\
+\x5cn\xba3\x0e\xe3\x02\xfega\xbfx\xc4\xb0\xbc\xd4\
+L\xe4\xac\xd4\xf6Y\xb0\xd8zLI#\xda\xa6|,\
+\xdfZ\xea:`D!:#s\x86\xbb\xb6\xe6\xac\x5c\
+\xcb\x14\x8d 9h\x9c\xe3\x8f\xdf~\x8b,\x04\xd3\xf7\
+\xef\xbf\xf4\xde\xcd\x1e=\xc2\xbd\xf5\xde?\xe6\xf15\xe6\
+\x98y\xbe\xe6\xc88_c\xb6\xaa\xd9\x22d\x8e\x11d\
+\xe5&\x90\xa9$\xcf\xed\xeb\x92n\xb8+a\x16\xe2\x15\
+\x1a\xbf\xd7\x9fo\xc7\xd3^\x99R\x22d;r\xd2\x18\
+\x18\x95K\xbb\xa7!@L\xb7f\xe5\xfd/\xea\xf9U\
+\xb3&$\xc4\xccZ\x9d\x17\x8a\xdb\x1f\xa6\xcbA\xb5\x22\
+\x10w\xb7F\x19\x09\xde`l\xdc\x990\x0aay\x11\
+4Yo\x95qr'\x1b\x9f\xe7y\xbe^\x7f\xfc\xf1\
+[\xef\xfd\xdb\xe3\xc3\xdc\x91y\x1c\xc7\xc7\xc7\xb7k\xfa\
+\xdb\xd0{/\x01\x11\xd1K\xaabB\xbd\x84zwR\
+\xfe\xc4\x9c\x92\xfeh\x18\xa7\x0a>\x8f\xcf\xf9\x9a\xa7\x8c\
+\x9c\x13\x96\xf35\xbf~\xbc\x5c\x5c\xbb\xcf1\x81\x1c\xf3\
+\xf5G\xfc>\x9e\xaf\xd7\xd7\xf3\xc7\xef\x7f\xfc\xcf\xff\xfc\
+\xcf\xef\xff\xfe\xed\xf5\xf5\x1c\xaf\xd7\x0a\xef\xc3\x983\xa6\
+4\xab\x15\x7fM\xcb$)l\xe4:c\x87aT\x17\
+q\xdb\xda\xc4\xfaT\x92:\xd7%\xc3\xcc\x0b\x86$\xaa\
+J2~m]U\x8aXX\x99aEO\xd4\xd5i\
+\xa9\x0aRBBT\x90\x92\x83u\x85\xa9jD\x08;\
+\xda9#U\xc7\x8c\x80\xa4\x00\xfa\xfd\xfb\xb7\xff\xfe\xf5\
+\x17\xed\xfe\x1cs\xcc\xf9|\x8d1b\x02c\xcc\xaf\xe7\
+\x18#\xbe^c\x8ex\xbd\xe6\xeby\x9e\xe3l\xd6c\
+\xe6\x10\x0d\xccP(\xb5\xaeV\xd1\xf3r\x7fX\xa9G\
+fS\x05\xa2w\x15\xf2\xbfL:3\xd9\x96\x1aW\xc5\
+\x19Q^\xc8r\xd6\xa7\xd6\xa0#\x91e\xc3Z\xbc\xb2\
+k\x05\xa5%\xcd\xe7\xc9\x19w\xc8\xeb\x9e\x12\xdc\x16<\
+N\xb7\xc5\xff\x22\xf8\x97\x8d\x90/6X\x81\x05\xea+\
+\x97\xdbT\xee\xcc9\xe6|>_\xcf?\x7f\xf0\xe5q\
+w\xb3~-K\xdd\xfe\xf1\x8f_~\xfc\xf8\xf1\xfb\xef\
+\xbf\xff\xe3\xbf\xfe\xf18\x1e\x9f\x8f\xa3\xf7\xd6\x8f\xc3T\
+\x91C\xd5\x8f~T\x1aeF\x8c\xa1\x89\x9c\xf3\xeb\xeb\
+\xeb\xcf\xdf\x7f\xff\xe3\x8f?\xbe\xbe\xbeD\xe4\xf7\x7f\xff\
+\xfe\xdb?\xfe}\x1c=\xc6\x9csH\x0e\xfe\xab\x92\xa0\
+\xc6\xfc\xf3\xb7\xdf\xe6y\x9e\xafWF\x9a\xf9\xc2\xa4\x89\
+\xf9\xdbo\xa9\xb4\x9ar\xbdy\xb7\xc5\x11\xf8\xac\xc6\x10\
+f\xeeKUJn\x9by\x9fp\xab\xec\x98\x97\xf5\xb6\
+\xe3\xba\xf7\x15[\x9evYV\x95\xb6\xb4T\xa9;\x1f\
+\x92\xa2\x96\xa0\xad\xbc\x96\xe7\xa2\x08!\xcbL!\xae&\
+\x89\xf9z\x9d\xaf\x1f\xe7\xf9L\x99\xdf\x1e\x1f\xad\xb71\
+gk\xed\x8c\x89\xb4q\x8e\xa3\xcf\x88\xfcx\x9d__\
+\xaf\xa3\xf9\xa3{\xc6\xc7\xd7\xf3\x1c\xe7|\xc9\x0cg>\
+<\xfbe\xbe%\xef-Nk}\xf7\xe9\xf4\xaf\xae\xf1\
+\xac\xbd\x95\x88\xcb\xbdt!\xb5\x12{\xa3\xaf\xccP\xcb\
+dZx&\xcc\xf6F\x14f\xb6\xce\xaa\xe5I\xa94\
+I+\x97\xc7m\x9b\x9a\xc5\xda\xaf\x16\x89*\xa9\xe5Y\
+\x93\xbf\xe5\x8d\xd2%\x92U\xa2\xe4\xe5+Z\xda\x1aS\
+\xf3\xc6@\xbf\xa8Fd\xc2\xdc\xc6\x8c\x8c\x91+\xd3T\
+]\x9e\xcf\xe7\xbf\xff\xfd\xfb\xe3\xd1\xbf}\xfb\xf6\xf9\xf9\
+\xf9\xeb\xf7_>?\x8f\x15\xfem\xaa\xca\x9d\xd6\xcc\x9c\
+\x08\xa2j\xc7y~=\x9f\xff\xfa\xe7\xbf\xbe\xbe\xbe^\
+\xaf\x17\x90\xad\xf7\xc7\xe3\xa1\x8a\x183#\x14D&\x87\
+77S\x17\xcd\x08&\xc3T\xc2\xed\x0c\x11q\xbd\xa4\
+\x8b\x9b\xcb\xcc\xf2\xa9`\xb5\xc5\xbd*\x8fy\xf9\xf6n\
+/$\x87\xff*\xc8\xd4\xd0\x0cB\x0f\xeb!~\x075\
+\x94\xf9\xf0.n,Z\x0bw\xe5\xcc3\xae)\xc1\x92\
+ \x96\xb0\xbf&\xb8\x17\x13-Sb\x06\xf0\x8a\x8c\x94\
+\xfc\xfc\xf8\xf8\xff\xfe\xfb\xbf$?Y\x07\xab\xa21\x0a\
+\xe7\xe8f&\xaa\xfd\xe8\x8f\xee\xe3\x8c\x19y\xbe\xe6\xc7\
+\xa3?\xbf\xce/\x7f\x8d1T\x1f\x19\xd2va\xba\xd3\
+\x8fv\xfa-\x07w\xdbwjf\xff\xa1ag+\xb6\
+$p\xc5\x07\x91\xe0\xceJ\x82@}\xfe\xca\x86m\x80\
+YJx\xddb\xcd9g\x05\xdc,T\xd3{cT\
+^?S\x88J\xfc\x95&\xb59\xd5\xba\xb6.\xab\x8d\
+\xbbV\xbb\xb8\x1f\xbe\xa8s\x97u\x1e\xea\x9dl\xadg\
+\x82p\xf7H\x8c3\xe6\xfc\xf1|\xda\xef\xbf\xfdi\xce\
+0\x94\xd5M\x18\xb6\xf7C(\xaa0=\xcf\x93\x13\xc0\
+\xcd\xfb\x16\x91\xf3\xf9\xfa\xfa\xe3\x87\xae\x94\xe1\x8b\xdb\x96\
+\x13&\xe2Wf5Uo4\xa4m(\xael`\xd2\
+&\xa8P\xf1Z\xfe3\xc5\x5cI\x02+H\xa5\xa6\x13\
+\xc5\x15B\xbc\xad\x0e\xe5=\x9f\x0c7\xa5\xe2\xc5\xe5 \
+\x80\xd7\x0d\xa5\xde\xb9\xddo\x10D\x19\xcdK\xd0\xbdq\
+\xd4\xec\x1c(\xdc$\xe2\xf4\xf5\xf5\xf5\xf5\xfc\xf1:\x9f\
+\xe78\x09ET\x95L\x83\xf9\x9c\x98\xe1f~\xf48\
+\xbb\x8f1#\xf2\xf5\x1c\xe7\xa3?{{\x1c\xed\xf5\x1c\
+\xaf13\xa4\xb9\xf5\x82\xb1\x19\x8c\x06\x5cMl*\x84\
+V\xf7\xb7\x9f\xd4\xff\xedy\xa5\xb1\x0e*\xff\x7fcg\
+\xb7\x1b\xc7\xb1\x03\xe1\x22\xbbG2\x92\xbc\xffk\x1e$\
+@b\xed\xee\x90u.\x8a\xec\xe9]\xaf\x90\x00\xbe\x12\
+d\xcb\xd0\xf6\x0f\x9b\xac\xfa\x0aC\x0c\x81\x02\xdbV\xa7\
+\xfaLw3\x8b\x171\x7f\xfb\x84*\x1d\xe7\x8cL\x8c\
+\xc4p\xce\x16K+'!EH\xe4\x22\xde\x98\x88\x98\
+\xb9P\xe9\xaa\x22\xbcG6\xe6F\x83\xa59\xbb\xb0V\
+'.\xc31\xac\xc2b+yZ))\xc3'\x0c\xa9\
+\xa4\xa4|tt\x06f^\x8c\xcfxDt\x0c\xb6\xb7\
++6\x0d\x92\xadJ\xe6\xe7S\xf98-xs\x8ci\
+\xc3\x0b\x8a\xae\xcaeH\xfa\xefl\xf2\x0a\xe4\x9c\x8a\xcd\
+<C\xc2\xbc\x0cg2\xc6\xad\xcb\xaa\xaeh\xb7\xe38\
+\xcc\xda\x131Ff\xdc\xef\x0f\xa5\xf3T\x1f\x80k\x07\
+\x9at\x0f\xbd\xe7\xd3\x04\x0c\xe8p\xda\x8d\xc6l\xd7\xc2\
+\xac\xae\xb7\x92\xa0JM\x0f\xd8\xf4\x12\x22Fk\xdc\x12\
+>\xea\xb5\xdc\xcf<\x07h\xc7\xc7\x017\xb8g\xe4\xfd\
+\xebv\xde~~\xd8\x8fC\xe3n\x03I\x09\xe22\xd3\
+\x86\xfb\xe7q\x0c\x7f<\x1e\xc7\xf0\xc7G\xbdp\x22A\
+\xf3\xdb\xed67I\xbc\xed\xf4\x9b=9\xf7\xfb\xd6'\
+_\x92K\xdf\xf3\x9d\xa8\xa0(\xeei\xbf-\xf7\xa1\xbc\
+>\xd5\x87)+\xfb\xd8\xe2B\xd5\x006[\x81\xa5(\
+dk6\xd6\x7fY\x11w\xaf\xfd\xca\x9f\xde\x8f\xe7\x12\
+\xa7eg\xcf\x9a\x0b\xb1\xd6|\xd4\xc4\x1e7\xa7\x8f*\
+\x97\xc7\xdb\xc4\x94\xd3y\xd9:\xbe\xd2\x02\xba!%\x0a\
+\x04,R\x92:\xf5\xed\x05\xaeT8\x8cl\x1d\xaa\xe7\
+\xac\xb8[\xbb\x05\x09\x19[\x95\xfe\xdd5V=\x94\x0b\
+9\xb3R?\xaf\xbf\x5c\xb5\x93,)\x0e{\xc9\xcck\
+d\xc6\xd6=\xdc\xa7\x89\xc9\x9d\xbd\xd9C\x1f\x02\xa3z\
+a')H\x9dJ\x94\x07i\x88!\xdc\xc6\x1c\xa8\xac\
+\xc3\x22<k\x0d\xdc\x1f\xf7\xf3qF\xa4%\x8f1\x87\
+Yxd \x0d\xc3-\xe9\xe7\xa0\x9d\xaa\xc5\xc7\x89\x88\
+\xc0t\x8c9\xe7q&y\xe41\xd3;!\xa4\x97]\
+=9\xf9\xc4E\x03\x1d\xf8/\xec1\xbf.\xeb\x0eH\
+\xec\xb4a\xbe \xf5\x84;\x11\x92\xb8\x1ci\xe6\x05~\
+\xdfQ\xa5.\x11wb\xe1\x84\x8a\x96\x82\x174\xfb\xd3\
+z\x15\x02\xc0\x11\xcbV^\xa9}\x9ad\x97<V?\
+Y[\xa4\xb3\xf3\xfa\x89\xd1\x9c\x01C:\xebBV\x0d\
+\x98\x8b\x13\xc4\xe6\x0f\xf3\xa2\xa8[\xc7z\xb1\x14\xca\x06\
+\xa4q\x00\x02\xf3\x0b\x97\xc7\x8a\xad3\xf8\x93\x1cbk\
+\x0e\xfb\xfaS\xfbe!\x06\xbc\xd9*\x9b<2i\xe0\
+(M9+\x8b\x86`\xe8eQ\x86\xfd\x8dmH\xbb\
+\x8a\x8a'H\x18\x96\x04\xa3\x8c\xc8\xdar\xe6\xf0\x84d\
+\x85\xa2\xbb6\xd7\xac\x8a\xb1\xa4%hL\x9b\x0e\x12\xae\
+\xa8eX:\x0c\x8f`T\x9e\x92+\xd7\xc5\x00\x1bd\
+\x84\xca\xec\xe1\x9e\x8e9\x95v=\x0e\x1a~s%\xe9\
+\xdc\xbe\xe26nsqs\xac\xad\xc9*y\xec\xbf`\
+\xf1\xfe\xedX\xedSU\xc7\xa1=\xa5Ss\xd3\xb06\
+\xa3b\x91m2\xfb\x0e2\x1f6\xbc\x10&l\xc8D\
+\x81]\x92\xf9m7`\xe9\xadZ/\xb3\xcf\x02p\xd1\
+\xcc\x9a'gV\x22\xe1g\xad\xc2\x130\xf6\x05\xc2&\
+?\xf9\xe2\xc6a\x01\xdb\x0a\x22\xf4\x14\x22\xc7P\xa5\xdd\
+\x9c`\xab\x11\x9a\xd5\x9d\xa6\x86\x8c\x0f\xbf\x88\xc9\xec\xfc\
+@\xd5\x01\xbeNT[\xda\xdf\xde\x83I\xf2qF\x89\
+ki\x91\x8c\x0a\xe6\xda\xf4\xa1\xde-\xc9\xfe\xc22\xbe\
+r\xfbb\xe2:g\xca\xbc\x17X\x12<}Z\xf2\xe6\
+\x18\x90\x8e\xaaT\xea\xdb\x91 \xce\xa0+\xecB\xfec\
+\x02\xd0\x1c\xee~\x7f\x1c\xc7\xfd\xef\xbf\xbf\xf4\xdfc[\
+\x1a\xfa\xa4\x18\xee.\xd6\x90\xcf\xcf\x8f\x93\xc7\xc7\x8f\x7f\
+\xbe\xee\xb7\xcf\xc7\xcf\x7f\xc6<d\xbc\x0co\x13<\x0c\
+\xeadm\xb1\xe4\xe3=\x22O+U\xbfe\x95k\xa3\
+\x00\x85\xa3\x1c\x00\xe8r}\xbb\xfaw\xfe\xa3n07\
+\x17\xd2>\x18\x84\xaee\x05K\xdb\xe8X\x992\xb6h\
+\x98P)\x06\xd9\xc9\xac\xf6\x92\xba\xbd\x92T\xe6\x98\x09\
+z\x04|T\xf7;\xd3\x80\xe3\xe3C\x16\x1a\xb6\xa1%\
+\x17xOP2\x83[\xdd\xf7CK\x99t<\xa9\x1b\
+}{G?\xef\xedD\xdd\x8f\x1a\xf9\xf0\xca\xc1a\xe7\
+\x81T\xa6M\xe8\x8c\x1d\xd3\xe70\x90\xea\x9b\xaeM\xb5\
+<\x95\x8eKE\xb5n\xedE\x00\x91\xffDy\xd5\xd9\
+\x99\x81\xa2\xfb\xd7s\xd7\xea\x87\xfe\x02\xd8\xf3\xeaa)\
+R{\xf9*-\xd5\x150\x08\x85\x85\x92^\x15y\xa8\
+Rm\xd5$\xa8\x13\xfc\x22\xb8\xb0\xd9d\x01w\x8f\x0a\
+\x80\x9b\xe7\xf9\xbf\xbf\xfe<\x8e#3\xe2$\x80P\xc0\
+\x15\xaf\x81\x86\xbc\xa5\xc2\x10\xfe\xf8\xfc\x8c\xc4\x11\xfc\xfc\
+\xfd\xf3\xf6\xf5\xf8\xfd\x8f\xdff\x94p\xf85\x09\x84\xdb\
+z\xdd\x17\xe8\x85\xec{\xf3!\xedv{\x5c\x91\xe9\xf4\
+\x0bY\xb59M/\x98\x9eLV\xa4\x19\x12\xe7\x19!\
+\xe2\x92\xda\x02};\x16J\xa9\xdf\xc2 \x8c2H\xd3\
+\x9e\x94\x00\x22\xfb\x81\xed6V%\x90Z~\xd6\xcf\xff\
+v\xd0\x83g\x9c\x22Jn3\xe9i._\x1aZ\xf8\
+\xafN\xf8~\x8e\x97\xc1\xf6j|\xbe\xad5\xafR{\
+C\xdb_\x10\x0a\x81\xd1\x86\x97$\xda\x9c[\x05\xbb\xed\
+C7{\xedp\xa7L\xc8I\x96\xba\xbf\xf2\xa5K\xd9\
+\xa7\x8a\xe7\xc5~\xbe\x0d\x1dk\xec\xcf_j\xd9&+\
+UW\xab\xa2\x10\x9a\x16R\x07{-V.*b\x92\
+\xda\xdd59\x13\xf0\x1d\xd2\xab\xd2\x87'\xb8&\xb1?\
+o?\xc7\x98\xb53\xd7\xf0\x05\x03ux\xd9\x18\x15e\
+:\x1cp\xc7\x8fc\x0c\x9b\x89@Ekl\xe5R\x9d\
+5\xfe\xcd\xbd\xfe\x02\x1e\xf7\xb7\xf6\xe5\xebV\xa8\x9c\x96\
+E\x0e\xd9\x0a'\xf1oq\xd1!\x99\xa7\x99Fk\xa6\
+\x89\x88\xb4\xfd^\xa2\x80\x05\xb5Sw\xd1\xf7>\xe1j\
+\x0c\x83J%*\xd6\xb6\x03\xa1\x0c\xdc\x0ap*\xa3i\
+RI\x14a\x19\xd6xS\x9d\x97\x0e\xb3T\xcdj\xea\
+\xd0\xa8\xb6,^\xcb\xf5\x5c\x86\x1aq{\xdd\xe9\xaf;\
+v\xb5\xd3v]\xb9\xae,\x0c\x87O\x1fSb\x9a\x92\
+\x1b\xad{\xa8G\xac5\xd7\xef^wA\xae\xafU\xfb\
+\xab\x9cg;*\xde\x1d(l@nA0\x9e\xbf\xad\
+\xe4B\xc5\xc2\x0b\xb8-8+\xdc@\xa7|\x87\xdcd\
+w5`\xd8\x18\x1cK\xe7\xea\xea\x8a\xeb\x0au?[\
+\xd6-Bpq\x17\x13\xb4\xab)af\x91g\xadL\
+\x94\x04p\x16`\x8f=+\x13n\xed\xa5Ds\x7f_\
+\xb0\xe6\xdb\x82\xd5\xc1\x8ei*\xffW\xf9\xe2u\xe9\xbc\
+k)\x5c\x95\xfe\xc2\x5c\x128#*\xb0\x12\x1cB,\
+T\xbc\x84\xa9X)\x959\xf7\xdb\xff)<\xa9\x9eV\
+\xa0Rk\xbbWe\x0b\xcd'}\xc2\x1cS`\xa6\x15\
+\xd9\xda\x12^f\x84]a\x0d\xae\x00f-\xc4\xdc6\
+\xca\xc0X\xad\xd3@|s\xd5\xf8Fn\x82\x99W\x5c\
+\xc3\xb09}N'\xe0u\xc16!k\xc5\xd0\xd0w\
+\xc9\x1f\x99\x8b+S\x8e\xb7j\xbb\xd2\x08\xc2#\xfb\x0c\
+\xff\xa5\x91\xd0\xff\x82\xd6\xa8\x1a\xf4\xafP\xc3>U\xac\
+\x9a\x92u\x92\xd2Q\x99\xae\x14\x08[\xa2o\xb7\x92\xd5\
+\x14J\xb7\x81_\xea\x03\x06\xab\xf7q\xbdKP\xd4\x08\
+\x15\x90\xc1\xb4\x10'\xd4\xf5;\x10\xd3\xf2L3\xa4I\
+,\x9d\x99\xf1\x7f\xe0\xa8M\x85k\xe0p\xff\x00\x00\x00\
+\x00IEND\xaeB`\x82\
+"
+
+qt_resource_name = b"\
+\x00\x03\
+\x00\x00p7\
+\x00i\
+\x00m\x00g\
+\x00\x08\
+\x0aaZ\xa7\
+\x00i\
+\x00c\x00o\x00n\x00.\x00p\x00n\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x0c\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x94\x9b\xcb\xf6\x98\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -0,0 +1,183 @@
+import itertools
+import math
+import queue
+import threading
+import time
+
+from PySide6.QtCore import QObject, Signal
+
+from metrics import metrics
+from segments import chunk_texts, split_long_segment
+
+
+# Lower values run first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 10
+
+# Queued instead of a job, the worker taking it opens its connections
+WARM_UP = "warm-up"
+
+
+class TranslationJob:
+    """A set of segments to translate from one language to another"""
+
+    def __init__(self, job_id, priority, source, target, segments, chunk_size):
+        self.id = job_id
+        self.priority = priority
+        self.source = source
+        self.target = target
+        self.segments = segments
+        self.cancelled = False
+        self.submitted_at = time.perf_counter()
+        # Segments longer than a chunk are translated in several parts
+        self.parts = {segment: split_long_segment(segment, chunk_size) for segment in segments}
+        self.chunks = chunk_texts(list(dict.fromkeys(text for parts in self.parts.values() for text in parts)), chunk_size)
+        self.remaining_chunks = len(self.chunks)
+        self.started_chunks = set()
+        self.translated_texts = {}
+        self.translations = {}
+
+    @property
+    def key(self):
+        return self.source, self.target, tuple(self.segments)
+
+    def add_chunk(self, texts, translated_texts):
+        """Records a finished chunk, returns the segments it completed"""
+        self.translated_texts.update(zip(texts, translated_texts))
+        self.remaining_chunks -= 1
+        completed = {}
+        for segment, parts in self.parts.items():
+            if segment not in self.translations and all(text in self.translated_texts for text in parts):
+                completed[segment] = " ".join(self.translated_texts[text] for text in parts)
+        self.translations.update(completed)
+        return completed
+
+
+class TranslationScheduler(QObject):
+    """Long lived pool of translation workers fed by a priority queue.
+
+    Jobs are split into chunks that the workers pick up in priority order,
+    so typing is never stuck behind background work. Every worker keeps its
+    own keep-alive connection through LibreTranslateClient.
+    """
+    send_job_progress = Signal(object, object)  # job, {segment: translation} completed by a chunk
+    send_job_finished = Signal(object)
+    send_job_failed = Signal(object, str)
+
+    def __init__(self, client, max_workers=4, chunk_size=2000, latency_estimator=None):
+        super().__init__()
+        self.client = client
+        self.chunk_size = chunk_size
+        self.latency_estimator = latency_estimator
+        self.queue = queue.PriorityQueue()
+        self.lock = threading.Lock()
+        self.job_ids = itertools.count(1)
+        self.sequence = itertools.count()
+        self.pending_jobs: dict[tuple, TranslationJob] = {}
+        self.workers = [
+            threading.Thread(target=self._work, name=f"translation-{i}", daemon=True)
+            for i in range(max_workers)
+        ]
+        for worker in self.workers:
+            worker.start()
+
+    def submit(self, source, target, segments, priority=PRIORITY_INTERACTIVE):
+        """Queues segments for translation, returns the TranslationJob.
+
+        An identical job that is still pending is returned instead of
+        queueing the same work twice.
+        """
+        with self.lock:
+            key = (source, target, tuple(segments))
+            if (job := self.pending_jobs.get(key)) is not None and not job.cancelled:
+                if priority < job.priority:
+                    job.priority = priority
+                    self._queue_chunks(job)
+                return job
+            job = TranslationJob(next(self.job_ids), priority, source, target, segments, self.chunk_size)
+            self.pending_jobs[key] = job
+            self._queue_chunks(job)
+            return job
+
+    def warm_up(self):
+        """Has the workers open their connections, behind any queued work"""
+        for _ in self.workers:
+            self.queue.put((PRIORITY_BACKGROUND, next(self.sequence), WARM_UP, None))
+
+    def estimate(self, chars):
+        """Expected seconds to translate chars characters, None until measured"""
+        if self.latency_estimator is None:
+            return None
+        chunk_latency = self.latency_estimator.predict(min(chars, self.chunk_size))
+        if chunk_latency is None:
+            return None
+        chunks = max(math.ceil(chars / self.chunk_size), 1)
+        return chunk_latency * math.ceil(chunks / len(self.workers))
+
+    def cancel(self, job):
+        """Drops the chunks of job that have not started yet"""
+        with self.lock:
+            job.cancelled = True
+            if self.pending_jobs.get(job.key) is job:
+                del self.pending_jobs[job.key]
+
+    def shutdown(self):
+        with self.lock:
+            for job in self.pending_jobs.values():
+                job.cancelled = True
+            self.pending_jobs.clear()
+        for _ in self.workers:
+            self.queue.put((float("inf"), next(self.sequence), None, None))
+
+    def _queue_chunks(self, job):
+        # Re-queueing after a priority bump leaves duplicates behind, the
+        # workers skip chunks that were already taken
+        for index in range(len(job.chunks)):
+            if index not in job.started_chunks:
+                self.queue.put((job.priority, next(self.sequence), job, index))
+
+    def _work(self):
+        while True:
+            _, _, job, index = self.queue.get()
+            if job is None:
+                self.client.close()
+                return
+            if job is WARM_UP:
+                try:
+                    self.client.connect()
+                except Exception:
+                    pass  # The next request reports it
+                continue
+            with self.lock:
+                if job.cancelled or index in job.started_chunks:
+                    continue
+                job.started_chunks.add(index)
+            chunk = job.chunks[index]
+            try:
+                started = time.perf_counter()
+                metrics.observe("translation_queue_wait", started - job.submitted_at)
+                translated_texts = self.client.translate_batch(chunk, job.source, job.target)
+                seconds = time.perf_counter() - started
+                metrics.observe("translation_chunk", seconds)
+                if self.latency_estimator is not None:
+                    self.latency_estimator.record(sum(map(len, chunk)), seconds)
+            except Exception as e:
+                with self.lock:
+                    failed = not job.cancelled
+                    job.cancelled = True
+                    if self.pending_jobs.get(job.key) is job:
+                        del self.pending_jobs[job.key]
+                if failed:
+                    self.send_job_failed.emit(job, str(e))
+                continue
+            with self.lock:
+                completed = job.add_chunk(chunk, translated_texts)
+                finished = job.remaining_chunks == 0
+                if finished and self.pending_jobs.get(job.key) is job:
+                    del self.pending_jobs[job.key]
+                # Emitted under the lock, otherwise the progress of another
+                # worker's chunk could arrive after finished
+                if completed:
+                    self.send_job_progress.emit(job, completed)
+                if finished and not job.cancelled:
+                    self.send_job_finished.emit(job)
@@ -0,0 +1,154 @@
+import re
+from bisect import bisect_right
+
+
+# Line breaks are kept as their own pieces so the output can be
+# reassembled with the exact layout of the source.
+SEGMENT_SEPARATOR = re.compile(r"(\n+)")
+SENTENCE_END = re.compile(r"(?<=[.!?。！？])\s+")
+
+
+def split_segments(text):
+    """Splits text into paragraph segments and the line breaks between them"""
+    return [piece for piece in SEGMENT_SEPARATOR.split(text) if piece]
+
+
+def strip_segment(piece):
+    """Returns (leading whitespace, segment text, trailing whitespace)"""
+    core = piece.strip()
+    if not core:
+        return piece, "", ""
+    start = piece.index(core)
+    return piece[:start], core, piece[start + len(core):]
+
+
+def unique_segments(pieces):
+    """The translatable segments of pieces, in order and without repeats"""
+    return list(dict.fromkeys(piece.strip() for piece in pieces if piece.strip()))
+
+
+def translate_pieces(pieces, translations):
+    """Replaces every segment in pieces with its translation, when known"""
+    output = []
+    for piece in pieces:
+        prefix, core, suffix = strip_segment(piece)
+        output.append(prefix + translations.get(core, core) + suffix if core else piece)
+    return output
+
+
+def join_segments(pieces, translations):
+    """Reassembles pieces, replacing every segment with its translation"""
+    return "".join(translate_pieces(pieces, translations))
+
+
+def normalize_segment(segment):
+    """segment with its runs of whitespace collapsed to single spaces"""
+    return " ".join(segment.split())
+
+
+def align_segments(input_text, output_text):
+    """(segment, translation) pairs of a text and its translation, empty
+    when their line breaks differ and the segments can't be paired
+    """
+    input_pieces = split_segments(input_text)
+    output_pieces = split_segments(output_text)
+    if len(input_pieces) != len(output_pieces):
+        return []
+    pairs = []
+    for input_piece, output_piece in zip(input_pieces, output_pieces):
+        segment = input_piece.strip()
+        translation = output_piece.strip()
+        if bool(segment) != bool(translation):
+            return []
+        if segment:
+            pairs.append((segment, translation))
+    return pairs
+
+
+def common_prefix_length(first, second):
+    # Binary search over slice comparisons, which run in C, large texts
+    # would take seconds character by character
+    low, high = 0, min(len(first), len(second))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if first[low:middle] == second[low:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def common_suffix_length(first, second):
+    low, high = 0, min(len(first), len(second))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if first[len(first) - middle:len(first) - low] == second[len(second) - middle:len(second) - low]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def splice_segments(previous_text, text, pieces, offsets):
+    """How the pieces of previous_text change to become those of text.
+
+    Returns (start, end, new_pieces): pieces[start:end] is replaced with
+    new_pieces. Only the changed part of text is split again, with one
+    unchanged piece on each side so merged or split line breaks are seen.
+
+    Args:
+        offsets (list): Where every piece starts in previous_text
+    """
+    prefix = common_prefix_length(previous_text, text)
+    suffix = min(common_suffix_length(previous_text, text), min(len(previous_text), len(text)) - prefix)
+    if prefix == len(previous_text) == len(text):
+        return len(pieces), len(pieces), []
+    # The piece before the one the change starts in, and the piece after
+    # the one it ends in
+    start = max(bisect_right(offsets, prefix) - 2, 0)
+    end = min(bisect_right(offsets, len(previous_text) - suffix) + 1, len(pieces))
+    text_start = offsets[start] if start < len(pieces) else len(previous_text)
+    text_end = (offsets[end] if end < len(pieces) else len(previous_text)) + len(text) - len(previous_text)
+    return start, end, split_segments(text[text_start:text_end])
+
+
+def split_long_segment(segment, max_chars):
+    """Splits a segment longer than max_chars into sentence groups that fit"""
+    if len(segment) <= max_chars:
+        return [segment]
+    parts = []
+    current = ""
+    for sentence in SENTENCE_END.split(segment):
+        while len(sentence) > max_chars:
+            # No sentence boundary to split on, cut at the last space instead
+            cut = sentence.rfind(" ", 0, max_chars)
+            cut = cut if cut > 0 else max_chars
+            if current:
+                parts.append(current)
+                current = ""
+            parts.append(sentence[:cut])
+            sentence = sentence[cut:].lstrip()
+        if current and len(current) + len(sentence) + 1 > max_chars:
+            parts.append(current)
+            current = ""
+        current = f"{current} {sentence}" if current else sentence
+    if current:
+        parts.append(current)
+    return parts
+
+
+def chunk_texts(texts, max_chars):
+    """Groups texts into chunks of at most max_chars characters each"""
+    chunks = []
+    current = []
+    size = 0
+    for text in texts:
+        if current and size + len(text) > max_chars:
+            chunks.append(current)
+            current = []
+            size = 0
+        current.append(text)
+        size += len(text)
+    if current:
+        chunks.append(current)
+    return chunks